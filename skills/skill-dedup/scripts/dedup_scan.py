@@ -16,50 +16,60 @@ import json
 import os
 import re
 import shutil
+import sqlite3
 import subprocess
 import sys
-import tempfile
-from collections import defaultdict
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
+from functools import partial
+from itertools import combinations
 from pathlib import Path
 
-# Optional neoskills integration for resolution
-try:
-    from neoskills.core.workspace import Workspace
-    from neoskills.mappings.resolver import SymlinkResolver
-    from neoskills.bank.store import SkillStore
-
-    NEOSKILLS_AVAILABLE = True
-except ImportError:
-    NEOSKILLS_AVAILABLE = False
+from neoskills.core.checksum import (
+    blob_list_digest,
+    git_blob_id,
+    is_intrinsic_rel,
+    iter_intrinsic_files,
+)
+from neoskills.core.similarity import content_features, estimate_jaccard, tokenize
+from neoskills.core.similarity import tfidf_neighbors as _tfidf_neighbors
 
 
 def sha256(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return hashlib.sha256(text.encode()).hexdigest()
+
 
+def _fingerprint(files: list[tuple[str, str, os.stat_result]]) -> str:
+    """Stat fingerprint (paths, sizes, mtimes) of a file list: changes when any file does."""
+    h = hashlib.sha256()
+    for rel, _, st in files:
+        h.update(f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
 
-# Files generated by neoskills or build tools — not intrinsic skill content
-_SKIP_NAMES = {"metadata.yaml", "provenance.yaml", ".gitkeep", ".DS_Store", "__pycache__"}
-_SKIP_SUFFIXES = {".pyc", ".pyo"}
 
+def _checksum(files: list[tuple[str, str, os.stat_result]]) -> str:
+    return blob_list_digest([(rel, git_blob_id(path)) for rel, path, _ in files])
 
-def _is_intrinsic(rel: Path) -> bool:
-    """Return True if this relative path is intrinsic skill content."""
-    if rel.name in _SKIP_NAMES or rel.suffix in _SKIP_SUFFIXES:
-        return False
-    return not any(part in ("__pycache__", ".git") for part in rel.parts)
+
+def scan_dir(dirpath: Path) -> tuple[str, int]:
+    """(checksum, file count) of a skill directory's intrinsic files, in one walk.
+
+    Files and checksum are those of neoskills.core.checksum.checksum_tree
+    (SHA256 over each intrinsic file's path and git blob id), so they agree
+    with what neoskills records for the same skill.
+    """
+    files = iter_intrinsic_files(dirpath)
+    return _checksum(files), len(files)
 
 
 def sha256_dir(dirpath: Path) -> str:
-    """SHA256 of intrinsic skill files in a directory (sorted by relative path)."""
-    h = hashlib.sha256()
-    for f in sorted(dirpath.rglob("*")):
-        if f.is_file():
-            rel = f.relative_to(dirpath)
-            if _is_intrinsic(rel):
-                h.update(str(rel).encode("utf-8"))
-                h.update(f.read_bytes())
-    return h.hexdigest()
+    """Checksum of the intrinsic skill files in a directory (see scan_dir)."""
+    return scan_dir(dirpath)[0]
 
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
@@ -73,12 +83,88 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
 
     try:
         meta = yaml.safe_load(content[3:end]) or {}
-    except Exception:
+    except yaml.YAMLError:
         meta = {}
     return meta, content[end + 3 :].strip()
 
 
-def find_skills(base: Path) -> list[dict]:
+def _skill_info(
+    skill_id: str,
+    default_name: str,
+    skill_file: Path,
+    skill_dir: Path | None,
+    cache: dict[str, dict] | None = None,
+) -> dict:
+    """Skill info for a SKILL.md in skill_dir, or a standalone .md (skill_dir None).
+
+    Besides checksums the record carries the MinHash ``signature`` and
+    winnowed ``winnow`` fingerprints of its content (SKILL.md body plus
+    bundled scripts) and the body's term counts (``terms``) for TF-IDF. With
+    a scan ``cache`` (see DedupDB.scan_cache) it also carries a stat
+    ``fingerprint``, and a skill whose fingerprint is unchanged is returned
+    from the cache without reading or hashing any file.
+    """
+    location = str(skill_dir if skill_dir is not None else skill_file)
+    files = iter_intrinsic_files(skill_dir) if skill_dir is not None else []
+    fingerprint = ""
+    if cache is not None:
+        if skill_dir is not None:
+            fingerprint = _fingerprint(files)
+        else:
+            st = skill_file.stat()
+            fingerprint = sha256(f"{skill_file.name}\0{st.st_size}\0{st.st_mtime_ns}")
+        cached = cache.get(location)
+        if cached is not None and cached["fingerprint"] == fingerprint:
+            return dict(cached)
+
+    content = skill_file.read_text(encoding="utf-8")
+    if skill_dir is None:
+        dir_cksum, file_count = sha256(content), 1
+    else:
+        dir_cksum, file_count = _checksum(files), len(files)
+    scripts = [
+        Path(path).read_text(encoding="utf-8", errors="replace")
+        for rel, path, _ in files
+        if _is_script(rel)
+    ]
+    info = _record(
+        skill_id, default_name, str(skill_file), location, content, dir_cksum, file_count, scripts
+    )
+    if cache is not None:
+        info["fingerprint"] = fingerprint
+    return info
+
+
+def _record(
+    skill_id: str,
+    default_name: str,
+    path: str,
+    location: str,
+    content: str,
+    checksum: str,
+    file_count: int,
+    scripts: list[str],
+) -> dict:
+    """The skill record for SKILL.md ``content``, wherever the files were read from."""
+    meta, body = parse_frontmatter(content)
+    signature, winnowed = content_features("\n".join([body, *scripts]))
+    return {
+        "id": skill_id,
+        "name": meta.get("name", default_name),
+        "description": str(meta.get("description", "")),
+        "path": path,
+        "dir_path": location,
+        "checksum": checksum,
+        "content_checksum": sha256(content),
+        "content_length": len(content),
+        "file_count": file_count,
+        "signature": signature,
+        "winnow": winnowed,
+        "terms": dict(Counter(tokenize(body))),
+    }
+
+
+def find_skills(base: Path, cache: dict[str, dict] | None = None) -> list[dict]:
     """Find all skills under a directory. Returns list of skill info dicts."""
     skills = []
     if not base.exists():
@@ -86,44 +172,19 @@ def find_skills(base: Path) -> list[dict]:
     for item in sorted(base.iterdir()):
         if item.name.startswith("."):
             continue
-        skill_file = None
         if item.is_dir():
-            candidate = item / "SKILL.md"
-            if candidate.exists():
-                skill_file = candidate
+            if (item / "SKILL.md").exists():
+                info = _skill_info(item.name, item.name, item / "SKILL.md", item, cache)
+                info["is_dir"] = True
+                skills.append(info)
         elif item.is_file() and item.suffix == ".md":
-            skill_file = item
-        if skill_file:
-            content = skill_file.read_text(encoding="utf-8")
-            meta, body = parse_frontmatter(content)
-            if item.is_dir():
-                dir_cksum = sha256_dir(item)
-                file_count = sum(
-                    1
-                    for f in item.rglob("*")
-                    if f.is_file() and _is_intrinsic(f.relative_to(item))
-                )
-            else:
-                dir_cksum = sha256(content)
-                file_count = 1
-            skills.append(
-                {
-                    "id": item.stem if item.is_file() else item.name,
-                    "name": meta.get("name", item.name),
-                    "description": str(meta.get("description", "")),
-                    "path": str(skill_file),
-                    "dir_path": str(item),
-                    "checksum": dir_cksum,
-                    "content_checksum": sha256(content),
-                    "content_length": len(content),
-                    "file_count": file_count,
-                    "is_dir": item.is_dir(),
-                }
-            )
+            info = _skill_info(item.stem, item.name, item, None, cache)
+            info["is_dir"] = False
+            skills.append(info)
     return skills
 
 
-def find_bank_skills(bank_root: Path) -> list[dict]:
+def find_bank_skills(bank_root: Path, cache: dict[str, dict] | None = None) -> list[dict]:
     """Find skills in the neoskills bank (canonical copies)."""
     skills_dir = bank_root / "LTM" / "bank" / "skills"
     skills = []
@@ -135,97 +196,191 @@ def find_bank_skills(bank_root: Path) -> list[dict]:
         canonical_dir = skill_dir / "canonical"
         canonical = canonical_dir / "SKILL.md"
         if canonical.exists():
-            content = canonical.read_text(encoding="utf-8")
-            meta, body = parse_frontmatter(content)
-            dir_cksum = sha256_dir(canonical_dir)
-            file_count = sum(
-                1
-                for f in canonical_dir.rglob("*")
-                if f.is_file() and _is_intrinsic(f.relative_to(canonical_dir))
-            )
-            skills.append(
-                {
-                    "id": skill_dir.name,
-                    "name": meta.get("name", skill_dir.name),
-                    "description": str(meta.get("description", "")),
-                    "path": str(canonical),
-                    "dir_path": str(canonical_dir),
-                    "checksum": dir_cksum,
-                    "content_checksum": sha256(content),
-                    "content_length": len(content),
-                    "file_count": file_count,
-                    "source": "bank",
-                }
-            )
+            info = _skill_info(skill_dir.name, skill_dir.name, canonical, canonical_dir, cache)
+            info["source"] = "bank"
+            skills.append(info)
     return skills
 
 
-def find_repo_skills(repo_slug: str, clone_dir: Path | None = None) -> list[dict]:
-    """Clone a GitHub repo and find all skills recursively."""
-    skills = []
-    if clone_dir is None:
-        clone_dir = Path(tempfile.mkdtemp(prefix="dedup_"))
-
-    repo_dir = clone_dir / repo_slug.replace("/", "_")
-    if not repo_dir.exists():
-        url = f"https://github.com/{repo_slug}.git"
-        result = subprocess.run(
-            ["git", "clone", "--depth", "1", "--quiet", url, str(repo_dir)],
-            capture_output=True,
-            text=True,
+MIRROR_TTL = 3600  # seconds a repo mirror is used before it is fetched again
+_STAMP = "dedup-fetched"  # touched in a mirror after every successful fetch
+
+
+def _git(*args: str, input: bytes | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], input=input, capture_output=True, check=False)
+
+
+def repo_url(repo_slug: str) -> str:
+    """Clone URL for a GitHub ``owner/name`` slug; URLs and paths are used as given."""
+    if "://" in repo_slug or repo_slug.startswith(("/", ".", "~", "git@")):
+        return os.path.expanduser(repo_slug)
+    return f"https://github.com/{repo_slug}.git"
+
+
+def mirror_path(mirrors_dir: Path, repo_slug: str) -> Path:
+    return mirrors_dir / (re.sub(r"[^\w.-]+", "_", repo_slug).strip("_") + ".git")
+
+
+def refresh_mirror(url: str, mirror_dir: Path, ttl: float = MIRROR_TTL) -> bool:
+    """Create or update a bare, shallow (depth 1) mirror of ``url``'s default branch.
+
+    A mirror fetched less than ``ttl`` seconds ago is used as is. Otherwise an
+    existing mirror is updated with an incremental fetch and a missing one is
+    cloned. Returns whether the mirror can be read; a failed fetch keeps the
+    previous contents (with a warning).
+    """
+    stamp = mirror_dir / _STAMP
+    if stamp.exists() and time.time() - stamp.stat().st_mtime < ttl:
+        return True
+    if (mirror_dir / "HEAD").exists():
+        head = _git("-C", str(mirror_dir), "symbolic-ref", "HEAD").stdout.decode().strip()
+        fetch = ("fetch", "--quiet", "--no-tags", "--depth", "1", "origin", f"+HEAD:{head}")
+        result = _git("-C", str(mirror_dir), *fetch)
+        if result.returncode != 0:
+            print(
+                f"Warning: failed to fetch {url}, using the cached mirror: "
+                f"{result.stderr.decode().strip()}",
+                file=sys.stderr,
+            )
+            return True
+    else:
+        mirror_dir.parent.mkdir(parents=True, exist_ok=True)
+        result = _git(
+            "clone", "--quiet", "--bare", "--depth", "1", "--single-branch", url, str(mirror_dir)
         )
         if result.returncode != 0:
+            shutil.rmtree(mirror_dir, ignore_errors=True)
             print(
-                f"Warning: failed to clone {repo_slug}: {result.stderr.strip()}",
+                f"Warning: failed to clone {url}: {result.stderr.decode().strip()}",
                 file=sys.stderr,
             )
-            return skills
+            return False
+    stamp.touch()
+    return True
+
+
+def read_blobs(repo_dir: Path, shas: list[str]) -> dict[str, bytes]:
+    """Contents of the given blobs, read in one ``git cat-file --batch`` call."""
+    if not shas:
+        return {}
+    out = _git("-C", str(repo_dir), "cat-file", "--batch", input="\n".join(shas).encode()).stdout
+    blobs, pos = {}, 0
+    for sha in shas:
+        end = out.index(b"\n", pos)
+        header = out[pos:end].decode().split()
+        pos = end + 1
+        if header[1] == "missing":
+            continue
+        size = int(header[2])
+        blobs[sha] = out[pos : pos + size]
+        pos += size + 1  # contents are followed by a newline
+    return blobs
+
+
+def mirror_skills(
+    mirror_dir: Path, repo_slug: str, cache: dict[str, dict] | None = None
+) -> list[dict]:
+    """Skill records for every SKILL.md at the mirror's HEAD, read from git objects.
 
-    for skill_md in sorted(repo_dir.rglob("SKILL.md")):
-        skill_dir = skill_md.parent
-        rel = skill_md.relative_to(repo_dir)
-        if any(part.startswith(".") for part in rel.parts):
+    Nothing is checked out. A skill's checksum is derived from the blob ids
+    of its files, so only SKILL.md and bundled scripts are read, and with a
+    scan ``cache`` an unchanged skill is returned without reading any blob.
+    """
+    listing = _git("-C", str(mirror_dir), "ls-tree", "-r", "-z", "HEAD").stdout.decode()
+    files: list[tuple[tuple[str, ...], str]] = []
+    for entry in listing.split("\0"):
+        meta, _, path = entry.partition("\t")
+        if path and meta.split()[0] in ("100644", "100755"):
+            files.append((tuple(path.split("/")), meta.split()[2]))
+    files.sort()
+    paths = [rel for rel, _ in files]
+
+    skills, pending = [], []
+    for rel in paths:
+        if rel[-1] != "SKILL.md" or any(part.startswith(".") for part in rel):
             continue
+        # A directory's files are contiguous in sorted order
+        prefix = rel[:-1]
+        skill_files = {}
+        for r, sha in files[bisect_left(paths, prefix) :]:
+            if r[: len(prefix)] != prefix:
+                break
+            skill_rel = "/".join(r[len(prefix) :])
+            if is_intrinsic_rel(skill_rel):
+                skill_files[skill_rel] = sha
+        location = f"{repo_slug}:{'/'.join(prefix) or '.'}"
+        checksum = blob_list_digest(list(skill_files.items()))
+        cached = cache.get(location) if cache is not None else None
+        if cached is not None and cached["fingerprint"] == checksum:
+            skills.append(dict(cached))
+        else:
+            skills.append(None)
+            pending.append((len(skills) - 1, prefix, location, checksum, skill_files))
 
-        content = skill_md.read_text(encoding="utf-8")
-        meta, body = parse_frontmatter(content)
-        skill_id = skill_dir.name
-        category = "/".join(rel.parts[:-2]) if len(rel.parts) > 2 else ""
-        display = f"{category}/{skill_id}" if category else skill_id
-
-        dir_cksum = sha256_dir(skill_dir)
-        file_count = sum(
-            1
-            for f in skill_dir.rglob("*")
-            if f.is_file() and _is_intrinsic(f.relative_to(skill_dir))
-        )
-        skills.append(
+    blobs = read_blobs(
+        mirror_dir,
+        sorted(
             {
-                "id": skill_id,
-                "name": meta.get("name", skill_id),
-                "description": str(meta.get("description", "")),
-                "path": str(skill_md),
-                "dir_path": str(skill_dir),
-                "checksum": dir_cksum,
-                "content_checksum": sha256(content),
-                "content_length": len(content),
-                "file_count": file_count,
-                "source": repo_slug.split("/")[-1],
-                "display": display,
+                sha
+                for *_, skill_files in pending
+                for rel, sha in skill_files.items()
+                if rel == "SKILL.md" or _is_script(rel)
             }
+        ),
+    )
+    for i, prefix, location, checksum, skill_files in pending:
+        skill_id = prefix[-1] if prefix else repo_slug.rstrip("/").split("/")[-1]
+        scripts = [
+            blobs[sha].decode("utf-8", errors="replace")
+            for rel, sha in skill_files.items()
+            if _is_script(rel)
+        ]
+        content = blobs[skill_files["SKILL.md"]].decode("utf-8", errors="replace")
+        info = _record(
+            skill_id,
+            skill_id,
+            f"{location}/SKILL.md",
+            location,
+            content,
+            checksum,
+            len(skill_files),
+            scripts,
         )
+        category = "/".join(prefix[:-1])
+        info["display"] = f"{category}/{skill_id}" if category else skill_id
+        if cache is not None:
+            info["fingerprint"] = checksum  # the blob ids change whenever any file does
+        skills[i] = info
     return skills
 
 
-def find_plugin_skills() -> list[dict]:
-    """Find skills in Claude Code plugins (installed and cached)."""
-    skills = []
+def find_repo_skills(
+    repo_slug: str,
+    mirrors_dir: Path,
+    cache: dict[str, dict] | None = None,
+    ttl: float = MIRROR_TTL,
+) -> list[dict]:
+    """Find all skills in a repo through its cached mirror under ``mirrors_dir``.
+
+    The first run clones a bare shallow mirror; later runs fetch into it
+    (at most once per ``ttl`` seconds) and read only changed skills.
+    """
+    mirror_dir = mirror_path(mirrors_dir, repo_slug)
+    if not refresh_mirror(repo_url(repo_slug), mirror_dir, ttl):
+        return []
+    skills = mirror_skills(mirror_dir, repo_slug, cache)
+    for info in skills:
+        info["source"] = repo_slug.rstrip("/").split("/")[-1]
+    return skills
+
+
+def plugin_skill_dirs() -> list[tuple[Path, str]]:
+    """(skills dir, source label) of every Claude Code plugin, installed and cached."""
+    search_dirs = []
     plugins_root = Path.home() / ".claude" / "plugins"
     if not plugins_root.exists():
-        return skills
+        return search_dirs
 
-    # Scan both direct plugin dirs and cache dirs
-    search_dirs = []
     for item in sorted(plugins_root.iterdir()):
         if not item.is_dir() or item.name.startswith("."):
             continue
@@ -241,14 +396,41 @@ def find_plugin_skills() -> list[dict]:
             skills_dir = item / "skills"
             if skills_dir.exists():
                 search_dirs.append((skills_dir, f"plugin:{item.name}"))
+    return search_dirs
 
-    for skills_dir, source_label in search_dirs:
-        found = find_skills(skills_dir)
-        for s in found:
-            s["source"] = source_label
-        skills.extend(found)
 
-    return skills
+def find_plugin_skills(max_workers: int | None = None) -> list[dict]:
+    """Find skills in Claude Code plugins (installed and cached)."""
+    sources = [(label, partial(find_skills, d)) for d, label in plugin_skill_dirs()]
+    return [s for _, found in scan_sources(sources, max_workers) for s in found]
+
+
+def scan_sources(
+    sources: list[tuple[str, Callable[[], list[dict]]]], max_workers: int | None = None
+) -> list[tuple[str, list[dict]]]:
+    """Run every source's scan concurrently; returns (label, skills) in source order.
+
+    Scanning is file I/O and hashing, both of which release the GIL, so a
+    thread pool bounds the total by the slowest source rather than the sum.
+    Skills without a ``source`` are labelled with their source's label; a
+    source that fails is reported and skipped.
+    """
+    if not sources:
+        return []
+    workers = max_workers or min(32, len(sources))
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(scan) for _, scan in sources]
+        for (label, _), future in zip(sources, futures):
+            try:
+                skills = future.result()
+            except (OSError, ValueError, subprocess.SubprocessError) as e:
+                print(f"Warning: failed to scan {label}: {e}", file=sys.stderr)
+                skills = []
+            for s in skills:
+                s.setdefault("source", label)
+            results.append((label, skills))
+    return results
 
 
 def _normalize_text(s: str) -> str:
@@ -286,6 +468,10 @@ def compute_similarity(a: dict, b: dict) -> dict:
     }
 
 
+# Every pair passing the gate has at least this ID similarity
+_MIN_ID_SIM = 0.75
+
+
 def _passes_similarity_gate(sim: dict, threshold: float) -> bool:
     """Check if a similarity result passes the multi-factor gate."""
     if sim["combined"] < threshold:
@@ -293,14 +479,137 @@ def _passes_similarity_gate(sim: dict, threshold: float) -> bool:
     # Must have strong ID match, or decent ID + decent description match
     if sim["id_sim"] >= 0.85:
         return True
-    if sim["id_sim"] >= 0.75 and sim["desc_sim"] >= 0.60:
+    if sim["id_sim"] >= _MIN_ID_SIM and sim["desc_sim"] >= 0.60:
         return True
     return False
 
 
-def find_duplicates(all_skills: list[dict], similarity_threshold: float = 0.80):
+def _skill_key(s: dict) -> str:
+    """Identity of a scanned skill across runs: source and location."""
+    return f"{s.get('source', '')}|{s.get('dir_path') or s.get('path') or s['id']}"
+
+
+def _norm_text(s: dict) -> str:
+    """The normalized inputs of compute_similarity (ID and description)."""
+    return f"{_normalize_text(s['id'])}\n{_normalize_text(s.get('description', ''))}"
+
+
+def _similar(a: dict, b: dict, threshold: float) -> dict | None:
+    """compute_similarity(a, b) if the pair passes the gate, else None.
+
+    SequenceMatcher's real_quick_ratio/quick_ratio are upper bounds of its
+    ratio, so pairs whose IDs cannot reach _MIN_ID_SIM are rejected without
+    the full comparison; the result is the same as gating every pair.
+    """
+    ids = SequenceMatcher(None, _normalize_text(a["id"]), _normalize_text(b["id"]))
+    if round(ids.real_quick_ratio(), 3) < _MIN_ID_SIM or round(ids.quick_ratio(), 3) < _MIN_ID_SIM:
+        return None
+    sim = compute_similarity(a, b)
+    return sim if _passes_similarity_gate(sim, threshold) else None
+
+
+def name_similar_edges(
+    skills: list[dict], threshold: float, changed: set[str] | None = None
+) -> dict[tuple[str, str], dict]:
+    """Pairs of skills (different IDs) passing the similarity gate, keyed (key_a, key_b).
+
+    Each pair is compared in skill-key order, so the result does not depend on
+    the order of ``skills``. With ``changed`` (a set of skill keys) only pairs
+    involving a changed skill are compared.
+    """
+    keyed = sorted(((_skill_key(s), s) for s in skills), key=lambda ks: ks[0])
+    if changed is None:
+        pairs = combinations(keyed, 2)
+    else:
+        pairs = (
+            (x, y) if x[0] < y[0] else (y, x)
+            for x in keyed
+            if x[0] in changed
+            for y in keyed
+            if y[0] != x[0] and not (y[0] in changed and y[0] < x[0])
+        )
+    edges = {}
+    for (key_a, a), (key_b, b) in pairs:
+        if a["id"] == b["id"]:
+            continue  # same-ID handled by diverged category
+        sim = _similar(a, b, threshold)
+        if sim is not None:
+            edges[(key_a, key_b)] = sim
+    return edges
+
+
+class UnionFind:
+    """Disjoint sets over hashable items, with path halving and union by size."""
+
+    def __init__(self):
+        self.parent: dict = {}
+        self.size: dict = {}
+
+    def find(self, x):
+        parent = self.parent
+        if x not in parent:
+            parent[x] = x
+            self.size[x] = 1
+            return x
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a, b) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+
+    def groups(self) -> list[list]:
+        """Sets with more than one member, in no particular order."""
+        members = defaultdict(list)
+        for x in self.parent:
+            members[self.find(x)].append(x)
+        return [group for group in members.values() if len(group) > 1]
+
+
+def cluster_id(anchor_key: str) -> str:
+    """ID for a new name-similar group, derived from its first member's skill key."""
+    return "ns-" + sha256(anchor_key)[:12]
+
+
+def _group_cluster_id(member_keys: list[str], known_ids: dict[str, str], taken: dict) -> str:
+    """ID of a name-similar group whose members are ``member_keys`` (sorted).
+
+    The known ID most of its members had, else cluster_id() of its first
+    member; IDs already in ``taken`` (claimed by an earlier group) are skipped.
+    """
+    counts = Counter(known_ids[key] for key in member_keys if key in known_ids)
+    candidates = [cid for cid, _ in sorted(counts.items(), key=lambda item: (-item[1], item[0]))]
+    candidates += [cluster_id(key) for key in member_keys]
+    return next(cid for cid in candidates if cid not in taken)
+
+
+def find_duplicates(
+    all_skills: list[dict],
+    similarity_threshold: float = 0.80,
+    edges: dict[tuple[str, str], dict] | None = None,
+    known_ids: dict[str, str] | None = None,
+):
     """Find duplicate groups: exact, diverged, and name-similar.
 
+    ``edges`` are the name-similar pairs (see name_similar_edges), e.g. kept
+    up to date by DedupDB; they are computed when not given. Name-similar
+    groups are the connected components of those edges (so a~b and b~c put
+    a, b and c in one group), independent of the order of ``all_skills``.
+    Skills that are exact or diverged duplicates are left out of them.
+
+    Groups are keyed by a cluster ID. ``known_ids`` maps skill keys to the
+    IDs of a previous run (see DedupDB.cluster_ids): a group keeps the ID
+    most of its members had, whichever members join or leave, and when
+    groups merge the larger one's ID survives. Other groups get cluster_id()
+    of their first member.
+
     Returns:
         tuple: (exact_dupes, diverged_copies, name_similar_groups)
     """
@@ -338,28 +647,28 @@ def find_duplicates(all_skills: list[dict], similarity_threshold: float = 0.80):
             diverged_keys.add((s["id"], s.get("source", "")))
 
     # Step 3: Name-similar (different IDs only, exclude already categorized)
-    name_groups = []
-    seen = set()
-    for i, a in enumerate(all_skills):
-        key_a = (a["id"], a.get("source", ""))
-        if key_a in exact_keys or key_a in diverged_keys or a["id"] in seen:
-            continue
-        group = [a]
-        for j, b in enumerate(all_skills):
-            if i == j:
-                continue
-            key_b = (b["id"], b.get("source", ""))
-            if key_b in exact_keys or key_b in diverged_keys or b["id"] in seen:
-                continue
-            if a["id"] == b["id"]:
-                continue  # same-ID handled by diverged category
-            sim = compute_similarity(a, b)
-            if _passes_similarity_gate(sim, similarity_threshold):
-                group.append(b)
-                seen.add(b["id"])
-        if len(group) > 1:
-            seen.add(a["id"])
-            name_groups.append(group)
+    if edges is None:
+        edges = name_similar_edges(all_skills, similarity_threshold)
+    excluded = exact_keys | diverged_keys
+    keys = [_skill_key(s) for s in all_skills]
+    index = {
+        key: i
+        for i, (key, s) in enumerate(zip(keys, all_skills))
+        if (s["id"], s.get("source", "")) not in excluded
+    }
+    clusters = UnionFind()
+    for key_a, key_b in edges:
+        if key_a in index and key_b in index:
+            clusters.union(index[key_a], index[key_b])
+
+    name_groups = {}
+    for members in sorted(
+        (sorted(group, key=lambda i: keys[i]) for group in clusters.groups()),
+        key=lambda group: keys[group[0]],
+    ):
+        member_keys = [keys[i] for i in members]
+        cid = _group_cluster_id(member_keys, known_ids or {}, name_groups)
+        name_groups[cid] = [all_skills[i] for i in members]
 
     return exact_dupes, diverged_copies, name_groups
 
@@ -379,6 +688,9 @@ def recommend_action(group: list[dict], category: str = "name_similar") -> str:
             return "DIVERGED: Bank has richer copy, replace targets with symlinks"
         return f"DIVERGED: Import richer copy from {richer[1]} to bank, then symlink"
 
+    if category == "content_similar":
+        return "SIMILAR_CONTENT: Same content under different names, keep one and remove the fork"
+
     # name_similar
     lengths = [s["content_length"] for s in group]
     if max(lengths) > min(lengths) * 1.5:
@@ -386,6 +698,235 @@ def recommend_action(group: list[dict], category: str = "name_similar") -> str:
     return "SIMILAR_NAME: Minor differences, review and choose canonical version"
 
 
+# ---------------------------------------------------------------------------
+# Content similarity (TF-IDF neighbors, MinHash; see neoskills.core.similarity)
+# ---------------------------------------------------------------------------
+
+MIN_FINGERPRINTS = 4  # skills with less content are too short to compare
+_SCRIPT_DIRS = ("scripts",)  # bundled scripts count as content
+
+
+def _is_script(rel: str) -> bool:
+    return rel.partition("/")[0] in _SCRIPT_DIRS
+
+
+def _skill_terms(s: dict) -> Counter:
+    """Term counts over a skill's ID, name, description and body."""
+    terms = Counter(tokenize(" ".join([s["id"], str(s.get("name", "")), s.get("description", "")])))
+    terms.update(s.get("terms") or {})
+    return terms
+
+
+def tfidf_neighbors(
+    skills: list[dict], k: int = 5, min_similarity: float = 0.0, **options
+) -> list[list[tuple[float, int]]]:
+    """The ``k`` most TF-IDF-similar skills of every skill, as (cosine, index) lists.
+
+    Vectors cover each skill's ID, name, description and body; ``options``
+    (use_numpy, max_cells) go to similarity.tfidf_neighbors.
+    """
+    return _tfidf_neighbors([_skill_terms(s) for s in skills], k, min_similarity, **options)
+
+
+def content_similar_pairs(
+    skills: list[dict], threshold: float = 0.70, max_df: int = 200
+) -> list[tuple[float, dict, dict]]:
+    """Skills with different IDs whose content is near-identical (fork-and-rename).
+
+    Candidates come from an inverted index of winnowing fingerprints: only
+    skills sharing enough fingerprints are compared, and fingerprints found
+    in more than ``max_df`` skills (boilerplate) are not indexed. Candidates
+    are scored by MinHash-estimated Jaccard similarity of their shingle sets.
+    Exact duplicates (same checksum) are left to the exact category.
+
+    Returns (similarity, a, b) tuples, most similar first.
+    """
+    postings = defaultdict(list)
+    for i, s in enumerate(skills):
+        fingerprints = s.get("winnow") or ()
+        if len(fingerprints) >= MIN_FINGERPRINTS:
+            for fp in fingerprints:
+                postings[fp].append(i)
+
+    shared: dict[tuple[int, int], int] = defaultdict(int)
+    for indices in postings.values():
+        if 1 < len(indices) <= max_df:
+            for pair in combinations(indices, 2):
+                shared[pair] += 1
+
+    pairs = []
+    for (i, j), count in shared.items():
+        a, b = skills[i], skills[j]
+        smaller = min(len(a["winnow"]), len(b["winnow"]))
+        if count < threshold * smaller / 2 or a["id"] == b["id"]:
+            continue
+        if a["checksum"] == b["checksum"]:
+            continue
+        similarity = estimate_jaccard(a["signature"], b["signature"])
+        if similarity >= threshold:
+            pairs.append((round(similarity, 3), a, b))
+    pairs.sort(key=lambda p: (-p[0], _skill_key(p[1]), _skill_key(p[2])))
+    return pairs
+
+
+# Record keys stored in their own columns, or (source) part of the row key
+_NOT_STORED = ("source", "fingerprint", "signature", "winnow")
+
+
+class DedupDB:
+    """Dedup state kept between runs in SQLite.
+
+    One row per scanned skill (location, stat fingerprint, checksum,
+    normalized ID/description, content MinHash signature and winnowing
+    fingerprints, plus the full record), one row per name-similar pair and
+    the cluster ID each grouped skill was reported under. A run rescans only
+    skills whose fingerprint changed (see scan_cache) and recompares only
+    pairs involving a skill whose ID or description changed (see update).
+    """
+
+    SCHEMA_VERSION = 4
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS skills (
+            key TEXT PRIMARY KEY,
+            location TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            norm_text TEXT NOT NULL,
+            signature BLOB NOT NULL,
+            winnow BLOB NOT NULL,
+            info TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS pairs (
+            a TEXT NOT NULL,
+            b TEXT NOT NULL,
+            id_sim REAL,
+            desc_sim REAL,
+            combined REAL,
+            PRIMARY KEY (a, b)
+        );
+        CREATE INDEX IF NOT EXISTS pairs_b ON pairs (b);
+        CREATE TABLE IF NOT EXISTS clusters (key TEXT PRIMARY KEY, cluster TEXT NOT NULL);
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(self._SCHEMA)
+        if self._meta("schema") != str(self.SCHEMA_VERSION):
+            with self.conn:
+                self.conn.execute("DROP TABLE skills")
+                self.conn.execute("DELETE FROM pairs")
+                self.conn.execute("DELETE FROM clusters")
+                self.conn.execute("DELETE FROM meta")
+            self.conn.executescript(self._SCHEMA)
+            with self.conn:
+                self._set_meta("schema", str(self.SCHEMA_VERSION))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _meta(self, key: str) -> str | None:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+
+    def cluster_ids(self) -> dict[str, str]:
+        """Cluster ID of every skill key in the last saved name-similar groups."""
+        return dict(self.conn.execute("SELECT key, cluster FROM clusters"))
+
+    def save_clusters(self, name_groups: dict[str, list[dict]]) -> None:
+        """Remember this run's name-similar groups (see find_duplicates known_ids)."""
+        with self.conn:
+            self.conn.execute("DELETE FROM clusters")
+            self.conn.executemany(
+                "INSERT INTO clusters VALUES (?, ?)",
+                ((_skill_key(s), cid) for cid, group in name_groups.items() for s in group),
+            )
+
+    def scan_cache(self) -> dict[str, dict]:
+        """Stored records by location, for find_skills(cache=...)."""
+        cache = {}
+        for fingerprint, signature, winnowed, info in self.conn.execute(
+            "SELECT fingerprint, signature, winnow, info FROM skills"
+        ):
+            record = json.loads(info)
+            record["fingerprint"] = fingerprint
+            record["signature"] = array("Q", signature).tolist()
+            record["winnow"] = array("Q", winnowed).tolist()
+            cache[record["dir_path"]] = record
+        return cache
+
+    def update(self, skills: list[dict], threshold: float) -> dict[tuple[str, str], dict]:
+        """Store this run's skills and return the name-similar pairs among them.
+
+        Removed skills are dropped, and pairs are recompared only for skills
+        that are new or whose ID/description changed (all of them when the
+        threshold changed).
+        """
+        previous = {
+            key: (fingerprint, norm_text)
+            for key, fingerprint, norm_text in self.conn.execute(
+                "SELECT key, fingerprint, norm_text FROM skills"
+            )
+        }
+        current = {_skill_key(s): s for s in skills}
+        settings = json.dumps({"threshold": threshold})
+        full = self._meta("similarity") != settings
+
+        changed = {
+            key for key, s in current.items() if previous.get(key, ("", ""))[1] != _norm_text(s)
+        }
+        stale = (previous.keys() - current.keys()) | changed
+        with self.conn:
+            if full:
+                self.conn.execute("DELETE FROM pairs")
+            self.conn.executemany("DELETE FROM pairs WHERE a = ? OR b = ?", ((k, k) for k in stale))
+            self.conn.executemany(
+                "DELETE FROM skills WHERE key = ?",
+                ((k,) for k in previous.keys() - current.keys()),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO skills VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        key,
+                        s["dir_path"],
+                        s.get("fingerprint", ""),
+                        s["checksum"],
+                        _norm_text(s),
+                        array("Q", s.get("signature", [])).tobytes(),
+                        array("Q", s.get("winnow", [])).tobytes(),
+                        json.dumps({k: v for k, v in s.items() if k not in _NOT_STORED}),
+                    )
+                    for key, s in current.items()
+                    if key in changed or previous.get(key, ("", ""))[0] != s.get("fingerprint", "")
+                ),
+            )
+            edges = name_similar_edges(skills, threshold, None if full else changed)
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO pairs VALUES (?, ?, ?, ?, ?)",
+                (
+                    (a, b, sim["id_sim"], sim["desc_sim"], sim["combined"])
+                    for (a, b), sim in edges.items()
+                ),
+            )
+            self._set_meta("similarity", settings)
+
+        return {
+            (a, b): {
+                "id_sim": id_sim,
+                "desc_sim": desc_sim,
+                "combined": combined,
+                "is_same_id": False,
+            }
+            for a, b, id_sim, desc_sim, combined in self.conn.execute("SELECT * FROM pairs")
+        }
+
+
 # ---------------------------------------------------------------------------
 # Resolution
 # ---------------------------------------------------------------------------
@@ -588,18 +1129,52 @@ def main():
         default=[],
         help="GitHub repos to scan (e.g. neolaf2/mySkills)",
     )
+    parser.add_argument(
+        "--mirror-ttl",
+        type=float,
+        default=MIRROR_TTL,
+        help=f"Seconds before a repo mirror is fetched again (default: {MIRROR_TTL}; 0: always)",
+    )
     parser.add_argument(
         "--threshold",
         type=float,
         default=0.80,
         help="Combined similarity threshold (0.0-1.0, default: 0.80)",
     )
+    parser.add_argument(
+        "--content-threshold",
+        type=float,
+        default=0.70,
+        help="Estimated content (Jaccard) similarity for content-similar pairs (default: 0.70)",
+    )
+    parser.add_argument(
+        "--neighbors",
+        type=int,
+        default=0,
+        metavar="K",
+        help="Also report each skill's K most TF-IDF-similar skills (NumPy if installed)",
+    )
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument(
         "--no-plugins",
         action="store_true",
         help="Skip scanning ~/.claude/plugins/",
     )
+    parser.add_argument(
+        "--db",
+        help="Dedup state database (default: <bank>/cache/dedup.sqlite3)",
+    )
+    parser.add_argument(
+        "--no-db",
+        action="store_true",
+        help="Rescan and recompare everything without reading or writing the database",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Sources scanned in parallel (default: one thread per source, up to 32)",
+    )
     parser.add_argument(
         "--resolve",
         choices=["exact", "diverged", "all"],
@@ -614,17 +1189,12 @@ def main():
 
     bank_root = Path(args.bank)
 
-    # Collect all skills
-    all_skills = []
-    sources_label = []
-
-    # Bank skills
-    bank_skills = find_bank_skills(bank_root)
-    for s in bank_skills:
-        s["source"] = "bank"
-    all_skills.extend(bank_skills)
-
-    # Target skills
+    # Collect all skills: every source is scanned concurrently
+    db = None
+    if not args.no_db:
+        db = DedupDB(Path(args.db) if args.db else bank_root / "cache" / "dedup.sqlite3")
+    cache = db.scan_cache() if db else None
+    sources = [("bank", partial(find_bank_skills, bank_root, cache=cache))]
     target_paths = {
         "claude": Path.home() / ".claude" / "skills",
         "opencode": Path.home() / ".config" / "opencode" / "skills",
@@ -632,31 +1202,39 @@ def main():
     for target_name in args.targets:
         path = target_paths.get(target_name)
         if path:
-            target_skills = find_skills(path)
-            for s in target_skills:
-                s["source"] = target_name
-            all_skills.extend(target_skills)
-    sources_label.extend(args.targets)
-
-    # Plugin skills
+            sources.append((target_name, partial(find_skills, path, cache=cache)))
     if not args.no_plugins:
-        plugin_skills = find_plugin_skills()
-        if plugin_skills:
-            all_skills.extend(plugin_skills)
-            plugin_sources = sorted(set(s.get("source", "") for s in plugin_skills))
-            sources_label.extend(plugin_sources)
-
-    # GitHub repo skills
-    clone_dir = Path(tempfile.mkdtemp(prefix="dedup_")) if args.repos else None
-    for repo_slug in args.repos:
-        repo_skills = find_repo_skills(repo_slug, clone_dir)
-        all_skills.extend(repo_skills)
-        sources_label.append(repo_slug)
-
-    # Find duplicates (3 categories)
+        sources.extend(
+            (label, partial(find_skills, d, cache=cache)) for d, label in plugin_skill_dirs()
+        )
+    # Repos are read from cached mirrors, fetched in parallel
+    mirrors_dir = bank_root / "cache" / "mirrors"
+    sources.extend(
+        (repo_slug, partial(find_repo_skills, repo_slug, mirrors_dir, cache, args.mirror_ttl))
+        for repo_slug in args.repos
+    )
+
+    all_skills = []
+    plugin_sources = set()
+    for label, found in scan_sources(sources, args.jobs):
+        all_skills.extend(found)
+        if label.startswith("plugin:") and found:
+            plugin_sources.add(label)
+    sources_label = [*args.targets, *sorted(plugin_sources), *args.repos]
+
+    # Find duplicates (3 categories), then content-similar pairs
+    edges = known_ids = None
+    if db:
+        edges = db.update(all_skills, args.threshold)
+        known_ids = db.cluster_ids()
     exact_dupes, diverged_copies, name_groups = find_duplicates(
-        all_skills, args.threshold
+        all_skills, args.threshold, edges, known_ids
     )
+    if db:
+        db.save_clusters(name_groups)
+        db.close()
+    content_pairs = content_similar_pairs(all_skills, args.content_threshold)
+    neighbors = tfidf_neighbors(all_skills, args.neighbors) if args.neighbors > 0 else []
 
     # Auto-resolve if requested
     resolution_actions = []
@@ -711,6 +1289,7 @@ def main():
             ],
             "name_similar": [
                 {
+                    "cluster_id": cid,
                     "action": recommend_action(g, "name_similar"),
                     "skills": [
                         {
@@ -722,9 +1301,41 @@ def main():
                         for s in g
                     ],
                 }
-                for g in name_groups
+                for cid, g in name_groups.items()
+            ],
+            "content_similar": [
+                {
+                    "similarity": similarity,
+                    "action": recommend_action([a, b], "content_similar"),
+                    "skills": [
+                        {
+                            "id": s["id"],
+                            "source": s.get("source", "unknown"),
+                            "checksum": s["checksum"][:16],
+                            "path": s.get("path"),
+                        }
+                        for s in (a, b)
+                    ],
+                }
+                for similarity, a, b in content_pairs
             ],
         }
+        if neighbors:
+            report["tfidf_neighbors"] = [
+                {
+                    "id": s["id"],
+                    "source": s.get("source", "unknown"),
+                    "neighbors": [
+                        {
+                            "id": all_skills[j]["id"],
+                            "source": all_skills[j].get("source", "unknown"),
+                            "similarity": similarity,
+                        }
+                        for similarity, j in found
+                    ],
+                }
+                for s, found in zip(all_skills, neighbors)
+            ]
         if resolution_actions:
             report["resolution_actions"] = resolution_actions
         print(json.dumps(report, indent=2))
@@ -765,8 +1376,9 @@ def main():
 
         if name_groups:
             print(f"=== NAME-SIMILAR GROUPS ({len(name_groups)} groups) ===\n")
-            for group in name_groups:
+            for cid, group in name_groups.items():
                 action = recommend_action(group, "name_similar")
+                print(f"  Cluster: {cid}")
                 for s in group:
                     fc = s.get("file_count", "?")
                     print(
@@ -776,6 +1388,26 @@ def main():
         else:
             print("No name-similar groups found.\n")
 
+        if content_pairs:
+            print(f"=== CONTENT-SIMILAR PAIRS ({len(content_pairs)} pairs) ===\n")
+            for similarity, a, b in content_pairs:
+                print(f"  ~{similarity:.0%} similar content")
+                for s in (a, b):
+                    print(f"    - {s['id']} [{s.get('source', '?')}] ({s['checksum'][:16]}...)")
+                print(f"    Action: {recommend_action([a, b], 'content_similar')}\n")
+        else:
+            print("No content-similar pairs found.\n")
+
+        if neighbors:
+            print(f"=== TF-IDF NEIGHBORS (top {args.neighbors} per skill) ===\n")
+            for s, found in zip(all_skills, neighbors):
+                listed = ", ".join(
+                    f"{all_skills[j]['id']} [{all_skills[j].get('source', '?')}] {similarity:.2f}"
+                    for similarity, j in found
+                )
+                print(f"  {s['id']} [{s.get('source', '?')}]: {listed or '-'}")
+            print()
+
         if resolution_actions:
             label = "DRY RUN — " if args.dry_run else ""
             print(f"=== {label}RESOLUTION ACTIONS ({len(resolution_actions)}) ===\n")
@@ -1,11 +1,26 @@
 """Base adapter ABC for agent ecosystem adapters."""
 
+import functools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from neoskills.core.models import Skill, SkillFormat, Target
+from neoskills.core.tracing import span
+
+# Adapter entry points recorded as "adapter.<method>" tracing spans
+_TRACED_METHODS = ("discover", "export", "install", "translate")
+
+
+def _traced_method(name: str, func):
+    @functools.wraps(func)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        with span(f"adapter.{name}", adapter=self.agent_type):
+            return func(self, *args, **kwargs)
+
+    wrapper._neoskills_traced = True
+    return wrapper
 
 
 @dataclass
@@ -25,6 +40,16 @@ class DiscoveredSkill:
 class BaseAdapter(ABC):
     """Abstract base class for agent ecosystem adapters."""
 
+    # Bump when translate() output changes so cached translations are invalidated
+    translate_version: str = "1"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name in _TRACED_METHODS:
+            func = cls.__dict__.get(name)
+            if callable(func) and not getattr(func, "_neoskills_traced", False):
+                setattr(cls, name, _traced_method(name, func))
+
     @property
     @abstractmethod
     def agent_type(self) -> str:
@@ -1,27 +1,119 @@
-"""Adapter factory - resolves agent type to adapter instance."""
+"""Adapter factory - resolves agent type to adapter instance.
+
+Adapters are registered as "module:Class" references and imported lazily on
+the first get_adapter() for their type, so commands only pay for the adapters
+they use. Third-party adapters plug in through the ``neoskills.adapters``
+entry-point group; the entry-point scan is cached in the cellar cache.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import sys
+from importlib.metadata import entry_points
 
 from neoskills.adapters.base import BaseAdapter
-from neoskills.adapters.claude.adapter import ClaudeCodeAdapter
-from neoskills.adapters.opencode.adapter import OpenCodeAdapter
-from neoskills.adapters.openclaw.adapter import OpenClawAdapter
-
-_ADAPTERS: dict[str, type[BaseAdapter]] = {
-    "claude-code": ClaudeCodeAdapter,
-    "opencode": OpenCodeAdapter,
-    "openclaw": OpenClawAdapter,
+from neoskills.core.cellar import Cellar
+
+ENTRY_POINT_GROUP = "neoskills.adapters"
+
+_BUILTIN_ADAPTERS: dict[str, str] = {
+    "claude-code": "neoskills.adapters.claude.adapter:ClaudeCodeAdapter",
+    "opencode": "neoskills.adapters.opencode.adapter:OpenCodeAdapter",
+    "openclaw": "neoskills.adapters.openclaw.adapter:OpenClawAdapter",
 }
 
+_registered: dict[str, str | type[BaseAdapter]] = {}
+_loaded: dict[str, type[BaseAdapter]] = {}
+_entry_points: dict[str, str] | None = None
+
+
+def register_adapter(agent_type: str, adapter: str | type[BaseAdapter]) -> None:
+    """Register an adapter class, or a lazy "module:Class" reference, for an agent type."""
+    _registered[agent_type] = adapter
+    _loaded.pop(agent_type, None)
+
+
+def _scan_fingerprint() -> str:
+    """Cheap fingerprint of the installed-distribution set (sys.path entry mtimes)."""
+    h = hashlib.sha256(sys.version.encode())
+    for entry in sys.path:
+        try:
+            mtime = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            mtime = 0
+        h.update(f"{entry}\0{mtime}\n".encode())
+    return h.hexdigest()
+
+
+def _entry_point_adapters(cellar: Cellar | None = None) -> dict[str, str]:
+    """Adapters advertised via entry points, cached in the cellar's cache/adapters.json."""
+    global _entry_points
+    if _entry_points is not None:
+        return _entry_points
+
+    cache_file = (cellar or Cellar()).cache_dir / "adapters.json"
+    fingerprint = _scan_fingerprint()
+    try:
+        cached = json.loads(cache_file.read_text())
+        if cached.get("fingerprint") == fingerprint:
+            _entry_points = dict(cached["adapters"])
+            return _entry_points
+    except (OSError, ValueError, KeyError):
+        pass
+
+    found = {ep.name: ep.value for ep in entry_points(group=ENTRY_POINT_GROUP)}
+    if cache_file.parent.is_dir():
+        try:
+            cache_file.write_text(json.dumps({"fingerprint": fingerprint, "adapters": found}))
+        except OSError:
+            pass  # the cache only saves the next scan
+    _entry_points = found
+    return found
+
+
+def _resolve_ref(agent_type: str, cellar: Cellar | None) -> str | type[BaseAdapter] | None:
+    # Built-ins and explicit registrations resolve without touching entry points
+    if agent_type in _registered:
+        return _registered[agent_type]
+    if agent_type in _BUILTIN_ADAPTERS:
+        return _BUILTIN_ADAPTERS[agent_type]
+    return _entry_point_adapters(cellar).get(agent_type)
+
+
+def _load(ref: str | type[BaseAdapter]) -> type[BaseAdapter]:
+    if not isinstance(ref, str):
+        return ref
+    module_path, _, attr = ref.partition(":")
+    cls = getattr(importlib.import_module(module_path), attr)
+    if not (isinstance(cls, type) and issubclass(cls, BaseAdapter)):
+        raise TypeError(f"{ref} is not a BaseAdapter subclass")
+    return cls
+
+
+def get_adapter(agent_type: str, cellar: Cellar | None = None) -> BaseAdapter:
+    """Get adapter instance for an agent type (imports its module on first use).
 
-def get_adapter(agent_type: str) -> BaseAdapter:
-    """Get adapter instance for an agent type."""
-    cls = _ADAPTERS.get(agent_type)
+    ``cellar`` is the workspace whose cache holds the entry-point scan
+    (the default workspace when not given).
+    """
+    cls = _loaded.get(agent_type)
     if cls is None:
-        raise ValueError(
-            f"No adapter for agent type '{agent_type}'. Available: {', '.join(_ADAPTERS.keys())}"
-        )
+        ref = _resolve_ref(agent_type, cellar)
+        if ref is None:
+            raise ValueError(
+                f"No adapter for agent type '{agent_type}'. "
+                f"Available: {', '.join(list_adapter_types(cellar))}"
+            )
+        cls = _loaded[agent_type] = _load(ref)
     return cls()
 
 
-def list_adapter_types() -> list[str]:
-    """List available agent types."""
-    return list(_ADAPTERS.keys())
+def list_adapter_types(cellar: Cellar | None = None) -> list[str]:
+    """List available agent types (built-ins first) without importing any adapter."""
+    types = list(_BUILTIN_ADAPTERS)
+    for name in [*_registered, *_entry_point_adapters(cellar)]:
+        if name not in types:
+            types.append(name)
+    return types
@@ -6,19 +6,32 @@ import click
 
 from neoskills.core.cellar import Cellar
 from neoskills.core.linker import Linker
+from neoskills.core.store import BlobStore
 from neoskills.core.tap import TapManager
 
 
 @click.command("install")
-@click.argument("skill_id")
+@click.argument("skill_id", required=False)
 @click.option("--from", "from_tap", default=None, help="Source tap (if not in default tap).")
 @click.option("--target", default=None, help="Target agent (default: from config).")
+@click.option("--locked", is_flag=True, help="Install exactly what neoskills.lock pins.")
 @click.option("--root", default=None, type=click.Path(), help="Workspace root.")
-def brew_install(skill_id: str, from_tap: str | None, target: str | None, root: str | None) -> None:
+def brew_install(
+    skill_id: str | None,
+    from_tap: str | None,
+    target: str | None,
+    locked: bool,
+    root: str | None,
+) -> None:
     """Install a skill (copy to default tap if needed, then link)."""
     from pathlib import Path
 
     cellar = Cellar(Path(root) if root else None)
+    if locked:
+        _install_locked(cellar, target)
+        return
+    if skill_id is None:
+        raise click.UsageError("Missing argument 'SKILL_ID' (or pass --locked).")
     mgr = TapManager(cellar)
     linker = Linker(cellar)
     default_tap = cellar.default_tap
@@ -34,12 +47,14 @@ def brew_install(skill_id: str, from_tap: str | None, target: str | None, root:
             raise SystemExit(1)
 
         dest = cellar.tap_skills_dir(default_tap) / skill_id
-        dest.mkdir(parents=True, exist_ok=True)
-        for item in source_path.iterdir():
-            if item.is_dir():
-                shutil.copytree(item, dest / item.name, dirs_exist_ok=True)
-            else:
-                shutil.copy2(item, dest / item.name)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        store = BlobStore.for_cellar(cellar)
+        if store.can_reflink(dest.parent):
+            store.materialize_tree(source_path, dest)
+        else:
+            # Plain copies: the store would only add a second copy of each file
+            ignore = shutil.ignore_patterns(".git", "__pycache__")
+            shutil.copytree(source_path, dest, ignore=ignore, dirs_exist_ok=True)
 
         # Update source field in frontmatter
         from neoskills.core.frontmatter import parse_frontmatter, write_frontmatter
@@ -69,6 +84,33 @@ def brew_install(skill_id: str, from_tap: str | None, target: str | None, root:
         click.echo(f"{skill_id}: {action.action}")
 
 
+def _install_locked(cellar: Cellar, target: str | None) -> None:
+    from git.exc import GitCommandError
+
+    from neoskills.core.lockfile import Lockfile, install_locked
+
+    if not cellar.lock_file.exists():
+        click.echo("No neoskills.lock found. Run 'neoskills lock'.")
+        raise SystemExit(1)
+
+    try:
+        lock = Lockfile.load(cellar.lock_file)
+        actions = install_locked(cellar, lock, target)
+    except ValueError as exc:
+        click.echo(f"Failed to install locked skills: {exc}")
+        raise SystemExit(1) from None
+    except GitCommandError as exc:
+        # Cloning or fetching a locked commit failed (network, auth, gone upstream)
+        raise click.ClickException(f"Failed to install locked skills: {exc}") from None
+    for action in actions:
+        if action.action != "skipped":
+            click.echo(f"{action.skill_id}: {action.action}")
+    for tap_name, tap in sorted(lock.taps.items()):
+        if tap.commit:
+            click.echo(f"{tap_name} @ {tap.commit[:12]}")
+    click.echo(f"Installed {len(lock.skills)} locked skills")
+
+
 @click.command()
 @click.argument("skill_id")
 @click.option("--target", default=None, help="Target agent.")
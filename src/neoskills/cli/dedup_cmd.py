@@ -0,0 +1,115 @@
+"""CLI command: dedup — find duplicate skills across taps, targets and plugins."""
+
+import json
+
+import click
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.dedup import DEFAULT_PLUGINS_ROOT, Deduplicator, DuplicateGroup
+
+
+def _group_dict(group: DuplicateGroup) -> dict:
+    return {
+        "key": group.key,
+        "canonical": str(group.canonical.path) if group.canonical else None,
+        "copies": [
+            {
+                "skill_id": c.skill_id,
+                "source": c.source,
+                "path": str(c.path),
+                "checksum": c.checksum,
+            }
+            for c in group.copies
+        ],
+    }
+
+
+def _echo_group(title: str, group: DuplicateGroup) -> None:
+    click.echo(f"  {title}")
+    relinkable = group.relinkable
+    for c in group.copies:
+        marker = " (canonical)" if c is group.canonical else ""
+        marker = " → relink" if c in relinkable else marker
+        click.echo(f"    - {c.skill_id} [{c.source}] {c.checksum[:12]}{marker}")
+
+
+@click.command()
+@click.option(
+    "--target", "targets", multiple=True, help="Target agent to scan (repeatable; default: all)."
+)
+@click.option("--no-plugins", is_flag=True, help="Skip Claude Code plugin directories.")
+@click.option(
+    "--plugins-dir",
+    default=None,
+    type=click.Path(),
+    help=f"Claude Code plugins directory (default: {DEFAULT_PLUGINS_ROOT}).",
+)
+@click.option(
+    "--resolve", is_flag=True, help="Replace target copies of exact duplicates with tap links."
+)
+@click.option("--dry-run", is_flag=True, help="Show what --resolve would relink.")
+@click.option("--json", "as_json", is_flag=True, help="Print the report as JSON.")
+@click.option("--root", default=None, type=click.Path(), help="Workspace root.")
+def dedup(
+    targets: tuple[str, ...],
+    no_plugins: bool,
+    plugins_dir: str | None,
+    resolve: bool,
+    dry_run: bool,
+    as_json: bool,
+    root: str | None,
+) -> None:
+    """Find exact and diverged duplicate skills, and relink exact ones to their tap copy."""
+    from pathlib import Path
+
+    cellar = Cellar(Path(root) if root else None)
+    plugins_root = (
+        None if no_plugins else Path(plugins_dir) if plugins_dir else DEFAULT_PLUGINS_ROOT
+    )
+    deduplicator = Deduplicator(cellar, list(targets) or None, plugins_root)
+    report = deduplicator.run()
+    plan = deduplicator.relink_plan(report)
+    actions = deduplicator.resolve_exact(report) if resolve and not dry_run else []
+
+    if as_json:
+        result = {
+            "total_skills": len(report.skills),
+            "sources": report.sources,
+            "exact_duplicates": [_group_dict(g) for g in report.exact],
+            "diverged_copies": [_group_dict(g) for g in report.diverged],
+            "relink_plan": {
+                target: [{"skill_id": sid, "source": str(path)} for sid, path in pairs]
+                for target, pairs in plan.items()
+            },
+        }
+        if actions:
+            result["relinked"] = [
+                {"skill_id": a.skill_id, "target": str(a.target), "action": a.action}
+                for a in actions
+            ]
+        click.echo(json.dumps(result, indent=2))
+        return
+
+    click.echo(f"Scanned {len(report.skills)} skills in {len(report.sources)} source(s)")
+    if report.exact:
+        click.echo(f"\nExact duplicates ({len(report.exact)} groups):")
+        for group in report.exact:
+            _echo_group(f"checksum {group.key[:12]}", group)
+    if report.diverged:
+        click.echo(f"\nDiverged copies ({len(report.diverged)} skills):")
+        for group in report.diverged:
+            _echo_group(group.key, group)
+    if not report.exact and not report.diverged:
+        click.echo("No duplicates found.")
+        return
+
+    relinks = sum(len(pairs) for pairs in plan.values())
+    if resolve and not dry_run:
+        linked = sum(1 for a in actions if a.action in ("linked", "synced"))
+        click.echo(f"\nRelinked {linked} skill(s); replaced copies are in {cellar.cache_dir}.")
+    elif relinks:
+        verb = "Would relink" if dry_run else "Run with --resolve to relink"
+        click.echo(f"\n{verb} {relinks} target cop{'y' if relinks == 1 else 'ies'}:")
+        for target, pairs in plan.items():
+            for skill_id, source in pairs:
+                click.echo(f"  {target}: {skill_id} → {source}")
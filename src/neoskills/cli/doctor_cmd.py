@@ -1,80 +1,60 @@
 """CLI command: doctor — health check for the skill system."""
 
+import json
+
 import click
 
 from neoskills.core.cellar import Cellar
-from neoskills.core.linker import Linker
-from neoskills.core.tap import TapManager
+from neoskills.core.health import CheckResult, HealthEngine
+
+_STATUS_PREFIX = {"ok": "", "warning": "Warning: ", "error": "Error: "}
+
+
+def _echo_check(check: CheckResult, timings: bool) -> None:
+    suffix = f"  [{check.seconds * 1000:.1f} ms]" if timings else ""
+    if check.name.startswith("links:"):
+        click.echo(f"{check.name.partition(':')[2]}: {check.summary}{suffix}")
+    else:
+        click.echo(f"{_STATUS_PREFIX[check.status]}{check.summary}{suffix}")
+    for issue in check.issues[:5]:
+        click.echo(f"    - {issue}")
+    if len(check.issues) > 5:
+        click.echo(f"    ... and {len(check.issues) - 5} more")
+    for note in check.notes:
+        click.echo(f"  {note}")
 
 
 @click.command()
-@click.option("--target", default=None, help="Target agent to check.")
+@click.option(
+    "--target", "targets", multiple=True, help="Target agent to check (repeatable; default: all)."
+)
+@click.option("--json", "as_json", is_flag=True, help="Print the structured report as JSON.")
+@click.option("--timings", is_flag=True, help="Show how long each check took.")
 @click.option("--root", default=None, type=click.Path(), help="Workspace root.")
-def doctor(target: str | None, root: str | None) -> None:
+def doctor(targets: tuple[str, ...], as_json: bool, timings: bool, root: str | None) -> None:
     """Check skill system health (broken links, missing frontmatter, orphans)."""
     from pathlib import Path
 
     cellar = Cellar(Path(root) if root else None)
-    mgr = TapManager(cellar)
-    linker = Linker(cellar)
-    issues = 0
-
-    # 1. Check workspace
-    if not cellar.is_initialized:
-        click.echo("Warning: Workspace not initialized. Run 'neoskills init'.")
-        issues += 1
-
-    # 2. Check taps
-    taps = mgr.list_taps()
-    if not taps:
-        click.echo("Warning: No taps registered. Run 'neoskills tap <url>'.")
-        issues += 1
-    else:
-        click.echo(f"Taps: {len(taps)} registered ({', '.join(taps)})")
-
-    # 3. Check skills in default tap
-    default_tap = cellar.default_tap
-    if default_tap in taps:
-        skills = mgr.list_skills(default_tap)
-        missing_desc = [s for s in skills if not s["description"]]
-        click.echo(f"Skills in {default_tap}: {len(skills)}")
-        if missing_desc:
-            click.echo(f"  Warning: {len(missing_desc)} skill(s) missing description:")
-            for s in missing_desc[:5]:
-                click.echo(f"    - {s['skill_id']}")
-            if len(missing_desc) > 5:
-                click.echo(f"    ... and {len(missing_desc) - 5} more")
-            issues += len(missing_desc)
-
-    # 4. Check symlink health
-    health = linker.check_health(target)
-    click.echo(f"Links: {health['total']} total, {health['healthy']} healthy")
-
-    if health["broken"]:
-        click.echo(f"  Broken links ({len(health['broken'])}):")
-        for b in health["broken"]:
-            click.echo(f"    - {b['skill_id']} → {b['source']}")
-        issues += len(health["broken"])
+    report = HealthEngine(cellar, list(targets) or None).run()
 
-    if health["unmanaged"]:
-        click.echo(f"  Unmanaged symlinks ({len(health['unmanaged'])}):")
-        for u in health["unmanaged"]:
-            click.echo(f"    - {u['skill_id']} → {u['source']}")
+    if as_json:
+        click.echo(json.dumps(report.to_dict(), indent=2))
+        return
 
-    if health["local"]:
-        click.echo(f"  Local (non-symlink) skills: {len(health['local'])}")
+    for check in report.checks:
+        if check.name in ("workspace", "config") and check.status == "ok" and not check.notes:
+            continue
+        _echo_check(check, timings)
 
-    # 5. Check for unlinked tap skills
-    if default_tap in taps:
-        skills = mgr.list_skills(default_tap)
-        links = linker.list_links(target)
-        linked_ids = {l["skill_id"] for l in links}
-        unlinked = [s for s in skills if s["skill_id"] not in linked_ids]
-        if unlinked:
-            click.echo(f"  Unlinked skills in {default_tap}: {len(unlinked)}")
+    if timings:
+        click.echo(
+            f"\nGathered facts in {report.gather_seconds * 1000:.1f} ms, "
+            f"total {report.total_seconds * 1000:.1f} ms"
+        )
 
     # Summary
-    if issues == 0:
+    if report.issues == 0:
         click.echo("System is healthy.")
     else:
-        click.echo(f"\n{issues} issue(s) found.")
+        click.echo(f"\n{report.issues} issue(s) found.")
@@ -21,7 +21,11 @@ def link(skill_id: str | None, link_all: bool, target: str | None, root: str | N
     mgr = TapManager(cellar)
 
     if link_all:
-        actions = linker.link_all(cellar.default_tap_skills_dir, target)
+        try:
+            actions = linker.link_all(cellar.default_tap_skills_dir, target)
+        except ValueError as exc:
+            click.echo(f"Failed to link: {exc}")
+            raise SystemExit(1) from None
         linked = sum(1 for a in actions if a.action == "linked")
         skipped = sum(1 for a in actions if a.action == "skipped")
         click.echo(f"Linked {linked} skills ({skipped} already linked)")
@@ -36,7 +40,11 @@ def link(skill_id: str | None, link_all: bool, target: str | None, root: str | N
         click.echo(f"Skill '{skill_id}' not found in any tap.")
         raise SystemExit(1)
 
-    action = linker.link(skill_id, skill_path, target)
+    try:
+        action = linker.link(skill_id, skill_path, target)
+    except ValueError as exc:
+        click.echo(f"Failed to link: {exc}")
+        raise SystemExit(1) from None
     click.echo(f"{skill_id}: {action.action}")
 
 
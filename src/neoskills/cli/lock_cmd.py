@@ -0,0 +1,59 @@
+"""CLI commands: lock, verify — pin and check skills against neoskills.lock."""
+
+import click
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.lockfile import Lockfile, generate_lock, verify_lock
+
+
+@click.command()
+@click.option("--target", default=None, help="Target agent whose links to lock.")
+@click.option("--root", default=None, type=click.Path(), help="Workspace root.")
+def lock(target: str | None, root: str | None) -> None:
+    """Write neoskills.lock pinning tap commits and skill checksums."""
+    from pathlib import Path
+
+    from git.exc import GitCommandError
+
+    cellar = Cellar(Path(root) if root else None)
+    try:
+        lockfile, dirty = generate_lock(cellar, target)
+    except GitCommandError as exc:
+        raise click.ClickException(f"Failed to lock: {exc}") from None
+    lockfile.save(cellar.lock_file)
+    click.echo(
+        f"Locked {len(lockfile.skills)} skills from {len(lockfile.taps)} taps → {cellar.lock_file}"
+    )
+    for skill_id in dirty:
+        click.echo(f"  warning: {skill_id} has uncommitted changes (not reproducible)")
+
+
+@click.command()
+@click.option("--root", default=None, type=click.Path(), help="Workspace root.")
+def verify(root: str | None) -> None:
+    """Check tap checkouts against neoskills.lock."""
+    from pathlib import Path
+
+    from git.exc import GitCommandError
+
+    cellar = Cellar(Path(root) if root else None)
+    if not cellar.lock_file.exists():
+        click.echo("No neoskills.lock found. Run 'neoskills lock'.")
+        raise SystemExit(1)
+
+    try:
+        lockfile = Lockfile.load(cellar.lock_file)
+    except ValueError as exc:
+        click.echo(f"Failed to read lockfile: {exc}")
+        raise SystemExit(1) from None
+    try:
+        results = verify_lock(cellar, lockfile)
+    except GitCommandError as exc:
+        raise click.ClickException(f"Failed to verify: {exc}") from None
+    failed = [r for r in results if r.status != "ok"]
+    for r in failed:
+        click.echo(f"  {r.status}: {r.skill_id} ({r.tap})")
+    if failed:
+        click.echo(f"{len(failed)} of {len(results)} skills differ from the lock.")
+        raise SystemExit(1)
+    click.echo(f"All {len(results)} locked skills verified.")
@@ -3,14 +3,88 @@
 import click
 
 from neoskills import __version__
+from neoskills.core import profiling, tracing
 
 
-@click.group()
+class _ProfileGroup(click.Group):
+    """Lets ``--profile`` precede the command name bare, or as ``--profile PATH``.
+
+    ``--profile`` followed by the command name or another option is the bare
+    flag; followed by anything else, that argument is its PATH.
+    """
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        args = list(args)
+        i = 0
+        while i < len(args) and args[i] not in self.commands:
+            if args[i] == "--profile":
+                value = args[i + 1] if i + 1 < len(args) else None
+                if value is None or value in self.commands or value.startswith("-"):
+                    args[i] = "--profile=1"
+                else:
+                    args[i : i + 2] = [f"--profile={value}"]
+            i += 1
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=_ProfileGroup)
 @click.version_option(version=__version__, prog_name="neoskills")
+@click.option(
+    "--profile",
+    "profile_path",
+    default=None,
+    metavar="[=PATH]",
+    envvar=profiling.PROFILE_ENV,
+    help="Profile the command with cProfile and write the result to PATH "
+    "(default: neoskills-<time>-<pid>.prof in the current directory).",
+)
+@click.option(
+    "--profile-format",
+    type=click.Choice(profiling.FORMATS),
+    default="pstats",
+    envvar=profiling.PROFILE_FORMAT_ENV,
+    help="pstats file, or collapsed stacks for flame graphs.",
+)
+@click.option(
+    "--profile-top",
+    type=int,
+    default=profiling.DEFAULT_TOP,
+    envvar=profiling.PROFILE_TOP_ENV,
+    help="Hotspots to print to stderr (0 for none).",
+)
+@click.option(
+    "--trace",
+    "trace_path",
+    default=None,
+    metavar="PATH",
+    envvar=tracing.TRACE_ENV,
+    help="Append timing spans for the command to PATH (see 'neoskills trace summarize').",
+)
+@click.option(
+    "--trace-format",
+    type=click.Choice(tracing.FORMATS),
+    default="jsonl",
+    envvar=tracing.TRACE_FORMAT_ENV,
+    help="JSON lines, or OTLP/JSON as written by the OpenTelemetry file exporter.",
+)
 @click.pass_context
-def cli(ctx: click.Context) -> None:
+def cli(
+    ctx: click.Context,
+    profile_path: str | None,
+    profile_format: str,
+    profile_top: int,
+    trace_path: str | None,
+    trace_format: str,
+) -> None:
     """neoskills - Cross-Agent Skill Bank & Transfer System."""
     ctx.ensure_object(dict)
+    if trace_path and trace_path.lower() not in ("0", "false", "no"):
+        tracing.configure(trace_path, trace_format)
+        ctx.call_on_close(tracing.shutdown)
+        ctx.with_resource(tracing.span(f"cli.{ctx.invoked_subcommand}"))
+    if profiling.enabled(profile_path):
+        label = f"neoskills-{ctx.invoked_subcommand}" if ctx.invoked_subcommand else "neoskills"
+        ctx.with_resource(profiling.profile(profile_path, profile_format, profile_top, label))
 
 
 # Import and register subcommands
@@ -35,9 +109,14 @@ def _register_later_commands() -> None:
         ("neoskills.cli.list_cmd", "search"),
         ("neoskills.cli.list_cmd", "info"),
         ("neoskills.cli.doctor_cmd", "doctor"),
+        ("neoskills.cli.dedup_cmd", "dedup"),
         ("neoskills.cli.create_cmd", "create"),
         ("neoskills.cli.push_cmd", "push"),
         ("neoskills.cli.migrate_cmd", "migrate"),
+        ("neoskills.cli.lock_cmd", "lock"),
+        ("neoskills.cli.lock_cmd", "verify"),
+        ("neoskills.cli.validate_cmd", "validate"),
+        ("neoskills.cli.trace_cmd", "trace"),
         # --- Kept commands ---
         ("neoskills.cli.config_cmd", "config"),
         ("neoskills.cli.enhance_cmd", "enhance"),
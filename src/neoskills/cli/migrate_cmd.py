@@ -1,13 +1,92 @@
-"""CLI command: migrate — one-time migration from v0.2 bank structure to v0.3 taps."""
+"""CLI command: migrate — one-time migration from v0.2 bank structure to v0.3 taps.
 
+Skills are migrated by a thread pool. Each one is built in a staging
+directory next to its final place and renamed in, and progress is kept in a
+write-ahead journal in the cellar cache, so an interrupted migration can be
+rerun and picks up where it stopped.
+
+Files are reflinked through the blob store where the filesystem supports it
+and copied directly otherwise. Either way the work is mostly creating files
+and directories, so a first run costs about as much as ``cp -r`` of the bank
+(tens of seconds for 10k skills on a small VM without reflinks); a rerun
+only checks the journal, and ``--restart`` ignores it.
+"""
+
+import json
+import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
 import click
 import yaml
 
 from neoskills.core.cellar import Cellar
-from neoskills.core.frontmatter import parse_frontmatter, write_frontmatter
+from neoskills.core.frontmatter import load_yaml, parse_frontmatter, write_frontmatter
+from neoskills.core.store import BlobStore
+
+JOURNAL_FILE = "migrate-journal.jsonl"
+
+
+class MigrationJournal:
+    """Write-ahead journal of a migration: one JSON line per event.
+
+    A skill is logged "started" before its tap directory is touched and
+    "done" once it is in place. The first line names the tap; a journal left
+    by a migration into another tap is discarded. Workers record concurrently.
+    """
+
+    def __init__(self, path: Path, tap_name: str):
+        self.path = path
+        self.tap_name = tap_name
+        self._file = None
+        self._lock = threading.Lock()
+
+    def load(self) -> tuple[set[str], set[str]]:
+        """(done, started) skill IDs from an earlier run into the same tap."""
+        done: set[str] = set()
+        started: set[str] = set()
+        if not self.path.exists():
+            return done, started
+        with open(self.path) as f:
+            lines = f.read().splitlines()
+        if not lines or lines[0] != json.dumps({"tap": self.tap_name}):
+            return done, started
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a line torn by the interruption
+            (done if entry.get("state") == "done" else started).add(entry.get("skill"))
+        return done, started - done
+
+    def open(self, resume: bool) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a" if resume else "w")  # noqa: SIM115
+        if not resume:
+            self._file.write(json.dumps({"tap": self.tap_name}) + "\n")
+
+    def record(self, skill_id: str, state: str) -> None:
+        line = json.dumps({"skill": skill_id, "state": state}) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+
+def _copy_ignore(top: str, directory: str, names: list[str]) -> set[str]:
+    """copytree ignore: VCS and build directories, and the top SKILL.md (rewritten anyway)."""
+    ignored = {name for name in names if name in (".git", "__pycache__")}
+    if directory == top:
+        ignored.add("SKILL.md")
+    return ignored
 
 
 def _migrate_skill(
@@ -15,66 +94,89 @@ def _migrate_skill(
     old_skill_dir: Path,
     new_skills_dir: Path,
     dry_run: bool,
+    store: BlobStore | None = None,
 ) -> dict:
     """Migrate one skill from LTM/bank/skills/{id}/canonical/ to taps/{tap}/skills/{id}/."""
     canonical = old_skill_dir / "canonical"
-    if not canonical.exists():
-        return {"skill_id": skill_id, "action": "skipped", "reason": "no canonical/"}
-
     new_dir = new_skills_dir / skill_id
 
     # Read existing SKILL.md
-    skill_md = canonical / "SKILL.md"
-    if not skill_md.exists():
-        return {"skill_id": skill_id, "action": "skipped", "reason": "no SKILL.md"}
-
-    fm, body = parse_frontmatter(skill_md.read_text())
-
-    # Merge metadata.yaml fields into frontmatter
-    meta_file = old_skill_dir / "metadata.yaml"
-    if meta_file.exists():
-        try:
-            meta = yaml.safe_load(meta_file.read_text()) or {}
-            fm.setdefault("version", meta.get("version", ""))
-            fm.setdefault("author", meta.get("author", ""))
-            if meta.get("tags") and not fm.get("tags"):
-                fm["tags"] = meta["tags"]
-            if meta.get("format") and meta["format"] != "canonical":
-                existing_tags = fm.get("tags", [])
-                if isinstance(existing_tags, list):
-                    fm["tags"] = existing_tags
-        except Exception:
-            pass
+    try:
+        content = (canonical / "SKILL.md").read_text()
+    except FileNotFoundError:
+        reason = "no SKILL.md" if canonical.exists() else "no canonical/"
+        return {"skill_id": skill_id, "action": "skipped", "reason": reason}
+
+    fm, body = parse_frontmatter(content)
+
+    # Merge metadata.yaml fields into frontmatter (a missing or broken file is ignored)
+    try:
+        meta = load_yaml((old_skill_dir / "metadata.yaml").read_text()) or {}
+        fm.setdefault("version", meta.get("version", ""))
+        fm.setdefault("author", meta.get("author", ""))
+        if meta.get("tags") and not fm.get("tags"):
+            fm["tags"] = meta["tags"]
+        if meta.get("format") and meta["format"] != "canonical":
+            existing_tags = fm.get("tags", [])
+            if isinstance(existing_tags, list):
+                fm["tags"] = existing_tags
+    except Exception:
+        pass
 
     # Merge provenance.yaml source info
-    prov_file = old_skill_dir / "provenance.yaml"
-    if prov_file.exists():
-        try:
-            prov = yaml.safe_load(prov_file.read_text()) or {}
-            if prov.get("source_type") and not fm.get("source"):
-                fm["source"] = prov.get("source_type", "")
-        except Exception:
-            pass
+    try:
+        prov = load_yaml((old_skill_dir / "provenance.yaml").read_text()) or {}
+        if prov.get("source_type") and not fm.get("source"):
+            fm["source"] = prov.get("source_type", "")
+    except Exception:
+        pass
 
     if dry_run:
         return {"skill_id": skill_id, "action": "would_migrate", "fields_added": list(fm.keys())}
 
-    # Copy canonical/ contents to new flat directory
-    if new_dir.exists():
-        shutil.rmtree(new_dir)
-    shutil.copytree(canonical, new_dir)
+    # Build the new flat directory from canonical/ in staging, then rename it
+    # into place, so an interrupted run never leaves a half-written skill
+    staging = new_skills_dir / f".{skill_id}.migrating"
+    if staging.exists():
+        shutil.rmtree(staging)  # left by an interrupted run
+    if store is not None:
+        store.materialize_tree(canonical, staging, skip={"SKILL.md"})
+    else:
+        ignore = partial(_copy_ignore, os.fspath(canonical))
+        shutil.copytree(canonical, staging, ignore=ignore, copy_function=shutil.copy)
+    (staging / "SKILL.md").write_text(write_frontmatter(fm, body))
 
-    # Write enriched SKILL.md
-    (new_dir / "SKILL.md").write_text(write_frontmatter(fm, body))
+    try:
+        staging.rename(new_dir)
+    except OSError:
+        # Replace the skill left by an earlier migration
+        if new_dir.is_symlink() or not new_dir.is_dir():
+            new_dir.unlink()
+        else:
+            shutil.rmtree(new_dir)
+        staging.rename(new_dir)
 
     return {"skill_id": skill_id, "action": "migrated"}
 
 
+def _journaled_migrate(journal: MigrationJournal | None, skill_id: str, *args) -> dict:
+    """Worker: log the skill as started once a worker picks it up, then migrate it."""
+    if journal is not None:
+        journal.record(skill_id, "started")
+    return _migrate_skill(skill_id, *args)
+
+
 @click.command()
 @click.option("--root", default=None, type=click.Path(), help="Workspace root.")
 @click.option("--tap-name", default="mySkills", help="Name for the default tap.")
 @click.option("--dry-run", is_flag=True, help="Preview without making changes.")
-def migrate(root: str | None, tap_name: str, dry_run: bool) -> None:
+@click.option("--jobs", "-j", default=None, type=int, help="Parallel workers (default: auto).")
+@click.option(
+    "--restart", is_flag=True, help="Ignore the journal of an earlier run and migrate every skill."
+)
+def migrate(
+    root: str | None, tap_name: str, dry_run: bool, jobs: int | None, restart: bool
+) -> None:
     """Migrate from v0.2 bank structure to v0.3 taps structure."""
     old_root = Path(root).expanduser() if root else Path.home() / ".neoskills"
     old_bank = old_root / "LTM" / "bank" / "skills"
@@ -87,10 +189,12 @@ def migrate(root: str | None, tap_name: str, dry_run: bool) -> None:
     cellar = Cellar(old_root)
 
     # Count old skills
-    old_skills = [
-        d for d in old_bank.iterdir()
-        if d.is_dir() and (d / "canonical" / "SKILL.md").exists()
-    ]
+    with os.scandir(old_bank) as it:
+        old_skills = [
+            Path(e.path)
+            for e in it
+            if e.is_dir() and os.path.exists(os.path.join(e.path, "canonical", "SKILL.md"))
+        ]
     click.echo(f"Found {len(old_skills)} skills in v0.2 bank")
 
     if dry_run:
@@ -116,18 +220,75 @@ def migrate(root: str | None, tap_name: str, dry_run: bool) -> None:
         (tap_dir / "tap.yaml").write_text(yaml.dump(tap_yaml, default_flow_style=False))
     click.echo(f"{'Would create' if dry_run else 'Created'} tap: {tap_dir}")
 
-    # Step 2: Migrate each skill
-    migrated = 0
-    skipped = 0
-    for old_skill_dir in sorted(old_skills):
-        result = _migrate_skill(old_skill_dir.name, old_skill_dir, new_skills_dir, dry_run)
-        if result["action"] in ("migrated", "would_migrate"):
-            migrated += 1
-        else:
-            skipped += 1
-            click.echo(f"  Skipped {result['skill_id']}: {result.get('reason', '')}")
+    # Step 2: Migrate each skill, skipping those a previous run completed
+    # (unless --restart, which starts a fresh journal)
+    journal = None
+    done: set[str] = set()
+    if not dry_run:
+        journal = MigrationJournal(cellar.cache_dir / JOURNAL_FILE, tap_name)
+        done, interrupted = (set(), set()) if restart else journal.load()
+        done = {sid for sid in done if (new_skills_dir / sid / "SKILL.md").exists()}
+        journal.open(resume=bool(done or interrupted))
+        if done or interrupted:
+            click.echo(
+                f"Resuming: {len(done)} skills already migrated, {len(interrupted)} interrupted"
+            )
+    pending = [d for d in sorted(old_skills) if d.name not in done]
+
+    results = []
+    store = None
+    if not dry_run:
+        store = BlobStore.for_cellar(cellar)
+        if not store.can_reflink(new_skills_dir):
+            store = None  # plain copies: the store would only add a second copy of each file
+    pool = ThreadPoolExecutor(max_workers=jobs)
+    try:
+        with click.progressbar(length=len(pending), label="Migrating skills") as bar:
+            futures = {}
+            for old_skill_dir in pending:
+                skill_id = old_skill_dir.name
+                future = pool.submit(
+                    _journaled_migrate,
+                    journal,
+                    skill_id,
+                    old_skill_dir,
+                    new_skills_dir,
+                    dry_run,
+                    store,
+                )
+                futures[future] = skill_id
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:  # noqa: BLE001 - an unreadable skill fails alone
+                    reason = str(e) if isinstance(e, OSError) else f"{type(e).__name__}: {e}"
+                    result = {"skill_id": futures[future], "action": "failed", "reason": reason}
+                if journal is not None and result["action"] == "migrated":
+                    journal.record(result["skill_id"], "done")
+                results.append(result)
+                bar.update(1)
+    finally:
+        # On an interrupt, drop queued skills; the journal has them as not done
+        pool.shutdown(cancel_futures=True)
+        if journal is not None:
+            journal.close()
+
+    migrated = sum(1 for r in results if r["action"] in ("migrated", "would_migrate"))
+    problems = sorted(
+        (r for r in results if r["action"] in ("skipped", "failed")),
+        key=lambda r: r["skill_id"],
+    )
+    for result in problems:
+        click.echo(f"  {result['action'].capitalize()} {result['skill_id']}: {result['reason']}")
 
-    click.echo(f"\n{'Would migrate' if dry_run else 'Migrated'} {migrated} skills ({skipped} skipped)")
+    skipped = sum(1 for r in problems if r["action"] == "skipped")
+    failed = len(problems) - skipped
+    counts = f"{skipped} skipped"
+    counts += f", {failed} failed" if failed else ""
+    counts += f", {len(done)} already migrated" if done else ""
+    click.echo(f"\n{'Would migrate' if dry_run else 'Migrated'} {migrated} skills ({counts})")
+    if failed:
+        click.echo("Rerun 'neoskills migrate' to retry the failed skills.")
 
     # Step 3: Update config.yaml
     if not dry_run:
@@ -3,17 +3,20 @@
 import click
 
 from neoskills.core.cellar import Cellar
+from neoskills.core.tap import TapManager
 
 
 @click.command()
 @click.option("--tap", "tap_name", default=None, help="Tap to push (default: default tap).")
-@click.option("-m", "--message", default=None, help="Commit message.")
+@click.option("-m", "--message", default=None, help="Commit message (default: summary of changes).")
+@click.option("--dry-run", is_flag=True, help="List what would be committed and pushed.")
 @click.option("--root", default=None, type=click.Path(), help="Workspace root.")
-def push(tap_name: str | None, message: str | None, root: str | None) -> None:
+def push(tap_name: str | None, message: str | None, dry_run: bool, root: str | None) -> None:
     """Commit and push tap changes to GitHub."""
-    import git
     from pathlib import Path
 
+    import git
+
     cellar = Cellar(Path(root) if root else None)
     tap_name = tap_name or cellar.default_tap
     tap_dir = cellar.tap_dir(tap_name)
@@ -22,27 +25,33 @@ def push(tap_name: str | None, message: str | None, root: str | None) -> None:
         click.echo(f"Tap '{tap_name}' not found.")
         raise SystemExit(1)
 
+    mgr = TapManager(cellar)
     try:
-        repo = git.Repo(tap_dir)
+        pending = mgr.pending_changes(tap_name)
     except git.InvalidGitRepositoryError:
         click.echo(f"Tap '{tap_name}' is not a git repository.")
         raise SystemExit(1)
 
     # Check for changes
-    if not repo.is_dirty(untracked_files=True):
+    if pending.empty:
         click.echo(f"No changes in {tap_name}.")
         return
 
-    # Stage all changes in skills/ and plugins/
-    repo.git.add("skills/", "plugins/", "tap.yaml", "README.md", catch_exceptions=False)
+    msg = message or pending.commit_message()
+    if dry_run:
+        click.echo(f"Would commit {len(pending.paths)} path(s) in {tap_name}:")
+        for path in pending.paths:
+            click.echo(f"  {path}")
+        click.echo(f"Message: {msg.splitlines()[0]}")
+        return
 
-    # Commit
-    msg = message or f"Update skills in {tap_name}"
-    repo.index.commit(msg)
-    click.echo(f"Committed: {msg}")
+    # Stage only the changed paths, in one index update, and commit
+    mgr.commit_pending(pending, msg)
+    click.echo(f"Committed: {msg.splitlines()[0]}")
 
     # Push
     try:
+        repo = git.Repo(tap_dir)
         origin = repo.remotes.origin
         origin.push()
         click.echo(f"Pushed {tap_name} to {origin.url}")
@@ -1,10 +1,11 @@
-"""CLI commands: tap, untap — manage tap repositories."""
+"""CLI commands: tap (add, pack), untap — manage tap repositories."""
 
 import re
 
 import click
 
 from neoskills.core.cellar import Cellar
+from neoskills.core.store import BlobStore
 from neoskills.core.tap import TapManager
 
 
@@ -15,24 +16,64 @@ def _name_from_url(url: str) -> str:
     return match.group(1) if match else "unknown"
 
 
-@click.command()
-@click.argument("url")
+class _TapGroup(click.Group):
+    """``neoskills tap <url>`` is shorthand for ``neoskills tap add <url>``."""
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        if args and args[0] not in self.commands and args[0] not in ("--help", "-h"):
+            args = ["add", *args]
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=_TapGroup)
+def tap() -> None:
+    """Register, pack and provision taps (skill repositories)."""
+
+
+@tap.command("add")
+@click.argument("url", required=False)
 @click.option("--name", default=None, help="Tap name (derived from URL if omitted).")
 @click.option("--branch", default="main", help="Git branch.")
+@click.option(
+    "--shared/--no-shared",
+    default=None,
+    help="Borrow git objects from the shared store (default: config 'shared_objects').",
+)
+@click.option(
+    "--bundle",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Provision from a bundle made by 'tap pack' instead of cloning.",
+)
+@click.option("--verify", is_flag=True, help="With --bundle: re-hash skills against the bundle.")
 @click.option("--root", default=None, type=click.Path(), help="Workspace root.")
-def tap(url: str, name: str | None, branch: str, root: str | None) -> None:
-    """Register a tap (clone a skill repository)."""
+def tap_add(
+    url: str | None,
+    name: str | None,
+    branch: str,
+    shared: bool | None,
+    bundle: str | None,
+    verify: bool,
+    root: str | None,
+) -> None:
+    """Register a tap (clone a skill repository, or unpack a bundle)."""
     from pathlib import Path
 
     cellar = Cellar(Path(root) if root else None)
     if not cellar.is_initialized:
         cellar.initialize()
 
+    if bundle:
+        _add_bundle(cellar, bundle, name, verify)
+        return
+    if url is None:
+        raise click.UsageError("Missing argument 'URL' (or pass --bundle).")
+
     tap_name = name or _name_from_url(url)
     mgr = TapManager(cellar)
 
     try:
-        tap_dir = mgr.add(tap_name, url, branch)
+        tap_dir = mgr.add(tap_name, url, branch, shared=shared)
         skills = mgr.list_skills(tap_name)
         click.echo(f"Tapped {tap_name} ({url}) → {tap_dir}")
         click.echo(f"  {len(skills)} skills available")
@@ -44,6 +85,58 @@ def tap(url: str, name: str | None, branch: str, root: str | None) -> None:
         raise SystemExit(1)
 
 
+def _add_bundle(cellar: Cellar, bundle: str, name: str | None, verify: bool) -> None:
+    from pathlib import Path
+
+    from neoskills.core.tap_bundle import unpack_tap
+
+    try:
+        result = unpack_tap(cellar, Path(bundle), name, verify=verify)
+    except FileExistsError as exc:
+        click.echo(f"{exc}. Use 'neoskills untap' first.")
+        raise SystemExit(1)
+    except Exception as exc:
+        click.echo(f"Failed to unpack {bundle}: {exc}")
+        raise SystemExit(1)
+    commit = result.manifest.get("commit", "")
+    origin = f" @ {commit[:12]}" if commit else ""
+    click.echo(f"Unpacked {result.tap_name}{origin} → {result.tap_dir}")
+    click.echo(f"  {result.skills} skills, {result.files} files")
+
+
+@tap.command("pack")
+@click.argument("name")
+@click.option(
+    "-o",
+    "--output",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="Bundle path (default: ./<name>.tar.xz).",
+)
+@click.option(
+    "--format",
+    "fmt",
+    default=None,
+    type=click.Choice(["tar.xz", "zip"]),
+    help="Archive format (default: from the output name, else tar.xz).",
+)
+@click.option("--root", default=None, type=click.Path(), help="Workspace root.")
+def tap_pack(name: str, output: str | None, fmt: str | None, root: str | None) -> None:
+    """Pack a tap into one archive for offline provisioning."""
+    from pathlib import Path
+
+    from neoskills.core.tap_bundle import pack_tap
+
+    cellar = Cellar(Path(root) if root else None)
+    out = Path(output) if output else Path(f"{name}.{fmt or 'tar.xz'}")
+    try:
+        pack_tap(cellar, name, out, fmt)
+    except FileNotFoundError:
+        click.echo(f"Tap '{name}' not found.")
+        raise SystemExit(1)
+    click.echo(f"Packed {name} → {out} ({out.stat().st_size:,} bytes)")
+
+
 @click.command()
 @click.argument("name")
 @click.option("--root", default=None, type=click.Path(), help="Workspace root.")
@@ -56,6 +149,12 @@ def untap(name: str, root: str | None) -> None:
 
     if mgr.remove(name):
         click.echo(f"Untapped {name}")
+        if cellar.object_store_dir.exists():
+            gc = mgr.gc_object_store()
+            click.echo(f"  Pruned shared object store ({len(gc['referencing'])} tap(s) still use it)")
+        removed = BlobStore.for_cellar(cellar).gc([cellar.taps_dir])
+        if removed:
+            click.echo(f"  Removed {removed} unused blob(s) from the store")
     else:
         click.echo(f"Tap '{name}' not found.")
         raise SystemExit(1)
@@ -0,0 +1,54 @@
+"""CLI commands: trace summarize — aggregate span timings from trace files."""
+
+import json
+from dataclasses import asdict
+
+import click
+
+from neoskills.core.tracing import read_spans, summarize
+
+_SORT_KEYS = {
+    "total": "total_ms",
+    "p50": "p50_ms",
+    "p99": "p99_ms",
+    "count": "count",
+    "max": "max_ms",
+}
+
+
+@click.group()
+def trace() -> None:
+    """Inspect traces written with --trace / NEOSKILLS_TRACE."""
+
+
+@trace.command("summarize")
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option("--sort", "sort_by", type=click.Choice(list(_SORT_KEYS)), default="total")
+@click.option("--limit", type=int, default=0, help="Show only the first N span names.")
+@click.option("--json", "as_json", is_flag=True, help="Print the stats as JSON.")
+def summarize_cmd(paths: tuple[str, ...], sort_by: str, limit: int, as_json: bool) -> None:
+    """Per-span count, total and p50/p90/p99/max latency (ms)."""
+    spans = [s for path in paths for s in read_spans(path)]
+    stats = summarize(spans)
+    stats.sort(key=lambda s: getattr(s, _SORT_KEYS[sort_by]), reverse=True)
+    if limit:
+        stats = stats[:limit]
+
+    if as_json:
+        click.echo(json.dumps([asdict(s) for s in stats], indent=2))
+        return
+    if not stats:
+        click.echo("No spans found.")
+        return
+
+    width = max(len(s.name) for s in stats)
+    click.echo(
+        f"{'span':<{width}}  {'count':>7}  {'total':>10}  {'p50':>9}  {'p90':>9}  "
+        f"{'p99':>9}  {'max':>9}"
+    )
+    for s in stats:
+        click.echo(
+            f"{s.name:<{width}}  {s.count:>7}  {s.total_ms:>10.2f}  {s.p50_ms:>9.3f}  "
+            f"{s.p90_ms:>9.3f}  {s.p99_ms:>9.3f}  {s.max_ms:>9.3f}"
+        )
+    click.echo(f"{len(spans)} spans from {len(paths)} file(s); times in ms.")
@@ -20,6 +20,12 @@ def update(tap_name: str | None, root: str | None) -> None:
     updated = mgr.update(tap_name)
     if updated:
         click.echo(f"Updated {len(updated)} tap(s): {', '.join(updated)}")
+        for name, changes in mgr.last_changes.items():
+            if not changes.empty:
+                click.echo(
+                    f"  {name}: {len(changes.added)} added, {len(changes.modified)} modified, "
+                    f"{len(changes.removed)} removed"
+                )
     else:
         click.echo("No taps to update.")
 
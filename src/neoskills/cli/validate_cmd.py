@@ -0,0 +1,54 @@
+"""CLI command: validate — check skills against the validation rules."""
+
+import json
+
+import click
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.validate import Validator
+
+
+@click.command()
+@click.option("--tap", "tap_name", default=None, help="Tap to validate (default: default tap).")
+@click.option("--skill", "skill_ids", multiple=True, help="Skill to validate (repeatable).")
+@click.option("--fix", is_flag=True, help="Repair fixable findings (e.g. script exec bits).")
+@click.option("--no-cache", is_flag=True, help="Re-check every skill, ignoring cached results.")
+@click.option("--json", "as_json", is_flag=True, help="Print the report as JSON.")
+@click.option("--root", default=None, type=click.Path(), help="Workspace root.")
+def validate(
+    tap_name: str | None,
+    skill_ids: tuple[str, ...],
+    fix: bool,
+    no_cache: bool,
+    as_json: bool,
+    root: str | None,
+) -> None:
+    """Validate skills: frontmatter, names, links, file sizes and scripts."""
+    from pathlib import Path
+
+    cellar = Cellar(Path(root) if root else None)
+    tap_name = tap_name or cellar.default_tap
+    if not cellar.tap_skills_dir(tap_name).is_dir():
+        click.echo(f"Tap '{tap_name}' not found.")
+        raise SystemExit(1)
+
+    validator = Validator(cellar, use_cache=not no_cache)
+    report = validator.validate_tap(tap_name, list(skill_ids) or None, fix=fix)
+
+    if as_json:
+        click.echo(json.dumps(report.to_dict(), indent=2))
+    else:
+        for result in report.skills:
+            if not result.findings:
+                continue
+            click.echo(f"{result.skill_id}:")
+            for f in result.findings:
+                where = f" ({f.path})" if f.path else ""
+                click.echo(f"  {f.severity}: [{f.rule}] {f.message}{where}")
+        click.echo(
+            f"Validated {len(report.skills)} skills in {tap_name} "
+            f"({report.checked} checked, {len(report.skills) - report.checked} cached): "
+            f"{report.errors} error(s), {report.warnings} warning(s)."
+        )
+    if report.errors:
+        raise SystemExit(1)
@@ -0,0 +1,151 @@
+"""Catalog - cached SKILL.md frontmatter per tap.
+
+Listing a tap used to parse every SKILL.md. The catalog keeps the parsed
+fields in cache/catalog/<tap>.json, keyed by skill id and guarded by the
+SKILL.md stat fingerprint (size, mtime_ns): an unchanged skill costs one stat
+and no parsing. Tap bundles ship a precomputed catalog that is seeded here on
+unpack, and tap updates apply their ChangeSet so only changed skills are
+reparsed.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.changeset import ChangeSet
+from neoskills.core.frontmatter import parse_frontmatter
+from neoskills.core.tracing import current_span, traced
+
+CATALOG_VERSION = 1
+
+# Frontmatter fields exposed by TapManager.list_skills
+CATALOG_FIELDS = ("name", "description", "version", "author", "tags", "targets", "source")
+
+
+def catalog_fields(skill_md: Path) -> dict[str, Any]:
+    """Parse the catalog fields of a SKILL.md (JSON-normalized, as cached)."""
+    fm, _ = parse_frontmatter(skill_md.read_text())
+    if not isinstance(fm, dict):
+        fm = {}
+    fields = {k: fm[k] for k in CATALOG_FIELDS if k in fm}
+    # Round-trip so fresh and cached entries have identical types (e.g. dates)
+    return json.loads(json.dumps(fields, default=str))
+
+
+class Catalog:
+    """Per-tap skill metadata cache under cache/catalog/."""
+
+    def __init__(self, cellar: Cellar):
+        self.cellar = cellar
+
+    def path(self, tap_name: str) -> Path:
+        return self.cellar.cache_dir / "catalog" / f"{tap_name}.json"
+
+    def load(self, tap_name: str) -> dict[str, dict[str, Any]]:
+        """Raw entries: skill_id -> {"size", "mtime_ns", "fields"}."""
+        try:
+            data = json.loads(self.path(tap_name).read_text())
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CATALOG_VERSION:
+            return {}
+        return data.get("skills", {})
+
+    def save(self, tap_name: str, entries: dict[str, dict[str, Any]]) -> None:
+        path = self.path(tap_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"version": CATALOG_VERSION, "skills": entries}, separators=(",", ":"))
+        )
+        tmp.replace(path)
+
+    def drop(self, tap_name: str) -> None:
+        self.path(tap_name).unlink(missing_ok=True)
+
+    @traced("catalog.fields")
+    def fields(self, tap_name: str) -> dict[str, dict[str, Any]]:
+        """Current catalog fields for every skill in a tap, reparsing only changed SKILL.md files.
+
+        Pulls are already applied through apply_changes(); the per-skill stat
+        here catches edits made inside the tap, which no ChangeSet reports.
+        """
+        skills_dir = self.cellar.tap_skills_dir(tap_name)
+        if not skills_dir.is_dir():
+            return {}
+
+        cached = self.load(tap_name)
+        entries: dict[str, dict[str, Any]] = {}
+        parsed = 0
+        with os.scandir(skills_dir) as it:
+            for item in it:
+                if not item.is_dir():
+                    continue
+                skill_md = Path(item.path) / "SKILL.md"
+                try:
+                    st = skill_md.stat()
+                except OSError:
+                    continue
+                entry = cached.get(item.name)
+                if entry is None or (entry["size"], entry["mtime_ns"]) != (
+                    st.st_size,
+                    st.st_mtime_ns,
+                ):
+                    entry = {
+                        "size": st.st_size,
+                        "mtime_ns": st.st_mtime_ns,
+                        "fields": catalog_fields(skill_md),
+                    }
+                    parsed += 1
+                entries[item.name] = entry
+
+        current_span().set("parsed", parsed)
+        if parsed or len(entries) != len(cached):
+            self.save(tap_name, entries)
+        return {sid: entries[sid]["fields"] for sid in sorted(entries)}
+
+    def seed(self, tap_name: str, fields: dict[str, dict[str, Any]]) -> None:
+        """Install precomputed fields (e.g. from a bundle) against current SKILL.md stats."""
+        skills_dir = self.cellar.tap_skills_dir(tap_name)
+        entries = {}
+        for skill_id, skill_fields in fields.items():
+            try:
+                st = (skills_dir / skill_id / "SKILL.md").stat()
+            except OSError:
+                continue
+            entries[skill_id] = {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "fields": skill_fields,
+            }
+        self.save(tap_name, entries)
+
+    def apply_changes(self, changes: ChangeSet) -> int:
+        """Reindex only the skills in a change set. Returns the number reparsed.
+
+        Does nothing when the tap has no catalog yet; the next listing builds it.
+        """
+        if not self.path(changes.tap).exists():
+            return 0
+        entries = self.load(changes.tap)
+        skills_dir = self.cellar.tap_skills_dir(changes.tap)
+        reparsed = 0
+        for skill_id in changes.removed:
+            entries.pop(skill_id, None)
+        for skill_id in changes.changed:
+            skill_md = skills_dir / skill_id / "SKILL.md"
+            try:
+                st = skill_md.stat()
+            except OSError:
+                entries.pop(skill_id, None)
+                continue
+            entries[skill_id] = {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "fields": catalog_fields(skill_md),
+            }
+            reparsed += 1
+        self.save(changes.tap, entries)
+        return reparsed
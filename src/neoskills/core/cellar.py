@@ -5,6 +5,8 @@ from typing import Any
 
 import yaml
 
+from neoskills.core.models import TransportType
+
 
 # Default config for a fresh workspace
 _DEFAULT_CONFIG: dict[str, Any] = {
@@ -40,10 +42,19 @@ class Cellar:
     def cache_dir(self) -> Path:
         return self.root / "cache"
 
+    @property
+    def object_store_dir(self) -> Path:
+        """Bare repo whose objects are shared by tap clones via git alternates."""
+        return self.cache_dir / "objects.git"
+
     @property
     def config_file(self) -> Path:
         return self.root / "config.yaml"
 
+    @property
+    def lock_file(self) -> Path:
+        return self.root / "neoskills.lock"
+
     @property
     def gitignore_file(self) -> Path:
         return self.root / ".gitignore"
@@ -87,6 +98,25 @@ class Cellar:
         path_str = targets.get(target, {}).get("skill_path", "~/.claude/skills")
         return Path(path_str).expanduser()
 
+    def target_transport(self, target: str | None = None) -> TransportType:
+        """Resolve how skills reach a target (symlinks by default, 'rsync' for delta copies)."""
+        config = self.load_config()
+        target = target or config.get("default_target", "claude-code")
+        value = config.get("targets", {}).get(target, {}).get("transport", "local-fs")
+        try:
+            return TransportType(value)
+        except ValueError:
+            available = ", ".join(t.value for t in TransportType)
+            raise ValueError(
+                f"Unknown transport '{value}' for target '{target}'. Available: {available}"
+            ) from None
+
+    def target_agent_type(self, target: str | None = None) -> tuple[str, str | None]:
+        """(target name, its configured ``agent_type`` or None) for a target."""
+        config = self.load_config()
+        target = target or config.get("default_target", "claude-code")
+        return target, config.get("targets", {}).get(target, {}).get("agent_type")
+
     # --- Initialization ---
 
     @property
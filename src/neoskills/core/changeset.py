@@ -0,0 +1,120 @@
+"""ChangeSet - which skills a tap update added, modified or removed.
+
+TapManager.update() diffs the tap's HEAD before and after the pull with
+``git diff --name-status`` (trees only, so partial clones fetch no blobs)
+and publishes the result. The built-in caches apply it directly: the catalog
+reparses the listed skills, and the validation and digest caches drop their
+entries for them. Other code subscribes with add_change_listener().
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from neoskills.core.cellar import Cellar
+
+SKILLS_PREFIX = "skills/"
+
+
+@dataclass
+class ChangeSet:
+    """Skill-level changes in one tap between two commits."""
+
+    tap: str
+    old: str = ""
+    new: str = ""
+    added: set[str] = field(default_factory=set)
+    modified: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.modified or self.removed)
+
+    @property
+    def changed(self) -> set[str]:
+        """Skills whose content must be re-read (added or modified)."""
+        return self.added | self.modified
+
+    @classmethod
+    def from_paths(
+        cls, tap: str, entries: Iterable[tuple[str, str]], old: str = "", new: str = ""
+    ) -> "ChangeSet":
+        """Build from (status, path) pairs, status being "A", "D" or "M".
+
+        A skill whose SKILL.md appeared is added, one whose SKILL.md went
+        away is removed, and any other change under skills/<id>/ modifies it.
+        """
+        changes = cls(tap, old, new)
+        for status, path in entries:
+            if not path.startswith(SKILLS_PREFIX):
+                continue
+            skill_id, _, rel = path[len(SKILLS_PREFIX) :].partition("/")
+            if not rel:
+                continue  # a file directly under skills/
+            if rel == "SKILL.md" and status == "A":
+                changes.added.add(skill_id)
+            elif rel == "SKILL.md" and status == "D":
+                changes.removed.add(skill_id)
+            else:
+                changes.modified.add(skill_id)
+        changes.modified -= changes.added | changes.removed
+        return changes
+
+    @classmethod
+    def from_name_status(cls, tap: str, old: str, new: str, output: str) -> "ChangeSet":
+        """Build from ``git diff --name-status -z --no-renames`` output."""
+        tokens = output.split("\0")
+        return cls.from_paths(tap, zip(tokens[::2], tokens[1::2]), old, new)
+
+    def summary(self, limit: int = 5) -> str:
+        """One-line description, e.g. "add gamma; update alpha, beta (+3 more)"."""
+        parts = []
+        for verb, ids in (("add", self.added), ("update", self.modified), ("remove", self.removed)):
+            if ids:
+                shown = sorted(ids)[:limit]
+                more = f" (+{len(ids) - limit} more)" if len(ids) > limit else ""
+                parts.append(f"{verb} {', '.join(shown)}{more}")
+        return "; ".join(parts)
+
+    @classmethod
+    def between(cls, tap: str, repo, old: str, new: str) -> "ChangeSet":
+        """Diff two commits of a tap repo (a git.Repo)."""
+        if not old or old == new:
+            return cls(tap, old, new)
+        output = repo.git.diff("--name-status", "-z", "--no-renames", old, new, "--", SKILLS_PREFIX)
+        return cls.from_name_status(tap, old, new, output)
+
+
+ChangeListener = Callable[[Cellar, ChangeSet], None]
+
+_listeners: list[ChangeListener] = []
+
+
+def add_change_listener(listener: ChangeListener) -> None:
+    """Call ``listener(cellar, changes)`` after every tap update that changed skills."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_change_listener(listener: ChangeListener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def publish(cellar: Cellar, changes: ChangeSet) -> None:
+    """Apply a change set to the catalog, validation and digest caches, then notify listeners."""
+    if changes.empty:
+        return
+    from neoskills.core.catalog import Catalog
+    from neoskills.core.checksum import DigestCache
+    from neoskills.core.validate import Validator
+
+    Catalog(cellar).apply_changes(changes)
+    Validator(cellar).apply_changes(changes)
+    digests = DigestCache(cellar.cache_dir / "digests.json")
+    skills_dir = cellar.tap_skills_dir(changes.tap)
+    for skill_id in changes.changed | changes.removed:
+        digests.forget(skills_dir / skill_id)
+    digests.save()
+    for listener in _listeners.copy():  # a listener may remove itself
+        listener(cellar, changes)
@@ -1,8 +1,14 @@
 """SHA256 checksum utilities for skill content."""
 
 import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from neoskills.core.tracing import traced
+
 # Files/dirs generated by neoskills or build tools — not intrinsic skill content
 _SKIP_NAMES = {
     "metadata.yaml",
@@ -10,6 +16,7 @@ _SKIP_NAMES = {
     ".gitkeep",
     ".DS_Store",
     "__pycache__",
+    ".neoskills-manifest.json",  # delta-sync manifest (core.transport)
 }
 _SKIP_SUFFIXES = {".pyc", ".pyo"}
 
@@ -37,6 +44,25 @@ def checksum_file(filepath: Path) -> str:
     return checksum_string(filepath.read_text(encoding="utf-8"))
 
 
+def file_digest(filepath: str | Path) -> str:
+    """SHA256 hash of a file's raw bytes (the key used by the blob store)."""
+    h = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def git_blob_id(filepath: str | Path) -> str:
+    """The git blob id (sha1 of "blob <size>\\0" + content) of a file, without git."""
+    h = hashlib.sha1(usedforsecurity=False)
+    h.update(f"blob {os.path.getsize(filepath)}\0".encode())
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
 def checksum_directory(dirpath: Path) -> str:
     """SHA256 hash of intrinsic skill files in a directory.
 
@@ -51,3 +77,265 @@ def checksum_directory(dirpath: Path) -> str:
             h.update(str(rel).encode("utf-8"))
             h.update(f.read_bytes())
     return h.hexdigest()
+
+
+class DigestCache:
+    """Per-file git blob ids reused while a file's size and mtime are unchanged.
+
+    Persisted as JSON (typically cache/digests.json) so repeated verification
+    of an unchanged tree costs one stat per file and no content reads.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._entries: dict[str, list] | None = None
+        self._dirty = False
+
+    @property
+    def entries(self) -> dict[str, list]:
+        if self._entries is None:
+            self._entries = {}
+            if self.path is not None:
+                try:
+                    self._entries = json.loads(self.path.read_text())
+                except (OSError, ValueError):
+                    pass
+        return self._entries
+
+    def digest(self, filepath: str | Path, st: os.stat_result | None = None) -> str:
+        key = os.fspath(filepath)
+        st = st or os.stat(key)
+        known = self.entries.get(key)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            return known[2]
+        digest = git_blob_id(filepath)
+        self.entries[key] = [st.st_size, st.st_mtime_ns, digest]
+        self._dirty = True
+        return digest
+
+    def forget(self, dirpath: str | Path) -> int:
+        """Drop the entries of files under dirpath. Returns the number dropped."""
+        prefix = os.path.join(os.fspath(dirpath), "")
+        stale = [key for key in self.entries if key.startswith(prefix)]
+        for key in stale:
+            del self.entries[key]
+        self._dirty = self._dirty or bool(stale)
+        return len(stale)
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.entries, separators=(",", ":")))
+        tmp.replace(self.path)
+        self._dirty = False
+
+
+def is_intrinsic_rel(rel: str) -> bool:
+    """_is_intrinsic for a relative posix path string (no pathlib overhead)."""
+    parts = rel.split("/")
+    if any(part in _SKIP_NAMES or part == ".git" for part in parts):
+        return False
+    return os.path.splitext(parts[-1])[1] not in _SKIP_SUFFIXES
+
+
+def iter_intrinsic_files(dirpath: Path) -> list[tuple[str, str, os.stat_result]]:
+    """Intrinsic files under dirpath as sorted (relative posix path, absolute path, stat).
+
+    Plain strings and os.scandir keep this cheap enough to run over thousands
+    of skills on every verification.
+    """
+    files = []
+    stack = [(os.fspath(dirpath), "")]
+    while stack:
+        abs_dir, rel_dir = stack.pop()
+        with os.scandir(abs_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name in _SKIP_NAMES or name == ".git":
+                    continue
+                rel = f"{rel_dir}{name}"
+                if entry.is_dir(follow_symlinks=True):
+                    stack.append((entry.path, rel + "/"))
+                elif os.path.splitext(name)[1] not in _SKIP_SUFFIXES:
+                    files.append((rel, entry.path, entry.stat()))
+    files.sort(key=lambda item: item[0])
+    return files
+
+
+def blob_list_digest(blobs: list[tuple[str, str]]) -> str:
+    """sha256 over sorted (relative path, git blob id) pairs: the checksum_tree digest."""
+    h = hashlib.sha256()
+    for rel, blob in sorted(blobs):
+        h.update(f"{rel}\0{blob}\n".encode())
+    return h.hexdigest()
+
+
+@traced("checksum.tree")
+def checksum_tree(dirpath: Path, cache: DigestCache | None = None) -> str:
+    """Digest of a skill directory: sha256 over (path, git blob id) of intrinsic files.
+
+    Unlike checksum_directory, this can be computed from cached per-file
+    digests without reading unchanged files, and for committed content it
+    equals the digest git-backed checksums derive from ``git ls-tree``.
+    """
+    cache = cache or DigestCache()
+    return blob_list_digest(
+        [(rel, cache.digest(path, st)) for rel, path, st in iter_intrinsic_files(dirpath)]
+    )
+
+
+# --- Checksum providers ---
+
+PROVIDER_GIT = "git-blobs"  # derived from git ls-tree blob ids, no file reads
+PROVIDER_CONTENT = "content"  # hashed from file contents (checksum_tree)
+
+
+@dataclass(frozen=True)
+class SkillChecksum:
+    """A skill directory digest and the provider that produced it.
+
+    Both providers produce the same ``digest`` for the same content, so
+    checksums compare across git taps, dirty checkouts and plain directories.
+    """
+
+    digest: str
+    provider: str
+    tree: str = ""  # git tree SHA of the directory (git provider only)
+
+
+# check-attr attributes under which a checkout rewrites blob bytes
+_CONVERT_ATTRS = ("text", "eol", "filter", "ident", "working-tree-encoding")
+
+
+@dataclass
+class GitSkillIndex:
+    """Git facts for the ``skills/`` subtree of a tap, gathered in four git calls.
+
+    ``commit`` is HEAD, ``trees`` and ``blobs`` come from ``git ls-tree`` and
+    ``dirty`` holds skill ids with staged, unstaged, untracked or ignored
+    intrinsic files. ``content_only`` holds committed skills whose checked-out
+    bytes are not their blobs: symlinks (followed by the content walk),
+    submodules, and files git converts on checkout (autocrlf/eol, filters
+    such as LFS, ident, working-tree-encoding). Both sets fall back to
+    content hashing, so the two providers always agree.
+    """
+
+    commit: str = ""
+    trees: dict[str, str] = field(default_factory=dict)  # skill_id -> tree SHA
+    blobs: dict[str, list[tuple[str, str]]] = field(default_factory=dict)  # id -> [(rel, blob)]
+    dirty: set[str] = field(default_factory=set)
+    content_only: set[str] = field(default_factory=set)
+    is_git: bool = False
+
+    @classmethod
+    @traced("checksum.git_index")
+    def load(cls, tap_dir: Path, subdir: str = "skills") -> "GitSkillIndex":
+        import git
+
+        try:
+            repo = git.Repo(tap_dir)
+            commit = repo.head.commit.hexsha
+        except (git.InvalidGitRepositoryError, git.NoSuchPathError, ValueError):
+            return cls()
+
+        index = cls(commit=commit, is_git=True)
+        prefix = f"{subdir}/"
+        for entry in repo.git.ls_tree("-r", "-t", "-z", "HEAD", "--", prefix).split("\0"):
+            if not entry:
+                continue
+            meta, _, path = entry.partition("\t")
+            if not path.startswith(prefix):
+                continue  # the subdir tree itself
+            mode, kind, sha = meta.split()
+            skill_id, _, rel = path[len(prefix) :].partition("/")
+            if kind == "tree":
+                if not rel:
+                    index.trees[skill_id] = sha
+            elif not is_intrinsic_rel(rel):
+                continue
+            elif kind == "blob" and mode in ("100644", "100755"):
+                index.blobs.setdefault(skill_id, []).append((rel, sha))
+            else:
+                index.content_only.add(skill_id)  # symlink or submodule
+
+        index.content_only |= index._converted(repo, prefix)
+
+        # Ignored files count too: the content walk hashes them
+        status = repo.git.status(
+            "--porcelain", "-z", "-uall", "--ignored=traditional", "--", subdir
+        ).split("\0")
+        tokens = iter(status)
+        for token in tokens:
+            if not token:
+                continue
+            code, path = token[:2], token[3:]
+            if "R" in code or "C" in code:
+                next(tokens, None)  # rename/copy source path follows
+            if path.startswith(prefix):
+                skill_id, _, rel = path[len(prefix) :].partition("/")
+                if is_intrinsic_rel(rel.rstrip("/")):
+                    index.dirty.add(skill_id)
+        return index
+
+    def _converted(self, repo, prefix: str) -> set[str]:
+        """Skill ids with a file whose checkout differs from its blob bytes."""
+        paths = [f"{prefix}{sid}/{rel}" for sid, blobs in self.blobs.items() for rel, _ in blobs]
+        if not paths:
+            return set()
+        with repo.config_reader() as cfg:
+            autocrlf = str(cfg.get_value("core", "autocrlf", "false")).lower() == "true"
+            crlf = autocrlf or str(cfg.get_value("core", "eol", "")).lower() == "crlf"
+        with tempfile.TemporaryFile() as stdin:
+            stdin.write("".join(f"{p}\0" for p in paths).encode())
+            stdin.seek(0)
+            out = repo.git.check_attr("-z", "--stdin", *_CONVERT_ATTRS, istream=stdin)
+        converted = set()
+        fields = out.split("\0")
+        for path, attr, value in zip(fields[0::3], fields[1::3], fields[2::3], strict=False):
+            if attr == "text":
+                converts = crlf and value != "unset" and (autocrlf or value != "unspecified")
+            elif attr == "eol":
+                converts = value == "crlf"
+            else:
+                converts = value not in ("unspecified", "unset")
+            if converts:
+                converted.add(path[len(prefix) :].partition("/")[0])
+        return converted
+
+    def checksum(self, skill_id: str) -> SkillChecksum | None:
+        """Zero-read checksum for a committed, clean, unconverted skill; None otherwise."""
+        if skill_id in self.dirty or skill_id in self.content_only or skill_id not in self.trees:
+            return None
+        return SkillChecksum(
+            blob_list_digest(self.blobs.get(skill_id, [])), PROVIDER_GIT, self.trees[skill_id]
+        )
+
+
+def skill_checksum(
+    skill_dir: Path,
+    index: GitSkillIndex | None = None,
+    cache: DigestCache | None = None,
+) -> SkillChecksum:
+    """Checksum a skill directory, from git data when its tap path is clean.
+
+    Pass the tap's GitSkillIndex when checksumming many skills of one tap;
+    falls back to content hashing for dirty, untracked or non-git paths.
+    """
+    if index is not None:
+        found = index.checksum(skill_dir.name)
+        if found is not None:
+            return found
+    return SkillChecksum(checksum_tree(skill_dir, cache), PROVIDER_CONTENT)
+
+
+def tap_checksums(tap_dir: Path, cache: DigestCache | None = None) -> dict[str, SkillChecksum]:
+    """Checksum every skill in a tap's skills/ directory."""
+    skills_dir = tap_dir / "skills"
+    if not skills_dir.is_dir():
+        return {}
+    index = GitSkillIndex.load(tap_dir)
+    return {
+        d.name: skill_checksum(d, index, cache) for d in sorted(skills_dir.iterdir()) if d.is_dir()
+    }
@@ -0,0 +1,236 @@
+"""Deduplicator - find duplicate skills across taps, targets and plugin caches.
+
+Tap skills are enumerated from each tap's Catalog and checksummed from git
+(GitSkillIndex) when clean; target and plugin copies, and dirty tap skills,
+are checksummed through the shared DigestCache. A repeated scan of an
+unchanged workspace therefore parses no SKILL.md and reads no file content.
+
+Exact duplicates that live as real directories in a target are resolved by
+replacing them with links to the tap copy, one Linker batch per target.
+"""
+
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.checksum import DigestCache, GitSkillIndex, checksum_tree, skill_checksum
+from neoskills.core.linker import LinkAction, Linker
+from neoskills.core.tap import TapManager
+from neoskills.core.tracing import traced
+
+# Claude Code plugins, installed (<name>/skills) and cached (cache/.../skills)
+DEFAULT_PLUGINS_ROOT = Path("~/.claude/plugins")
+
+
+@dataclass
+class SkillCopy:
+    """One copy of a skill, in a tap, a target directory or a plugin."""
+
+    skill_id: str  # directory name
+    source: str  # "tap:<name>", "target:<name>" or "plugin:<name>"
+    path: Path
+    checksum: str
+
+    @property
+    def kind(self) -> str:
+        return self.source.partition(":")[0]
+
+    @property
+    def origin(self) -> str:
+        return self.source.partition(":")[2]
+
+
+@dataclass
+class DuplicateGroup:
+    """Copies with the same content (exact) or the same ID and differing content (diverged)."""
+
+    key: str  # checksum (exact) or skill id (diverged)
+    copies: list[SkillCopy]
+    canonical: SkillCopy | None = None  # the tap copy others should link to
+
+    @property
+    def relinkable(self) -> list[SkillCopy]:
+        """Target copies that can be replaced by a link to the canonical copy."""
+        if self.canonical is None:
+            return []
+        return [c for c in self.copies if c.kind == "target"]
+
+
+@dataclass
+class DedupReport:
+    skills: list[SkillCopy]
+    exact: list[DuplicateGroup] = field(default_factory=list)
+    diverged: list[DuplicateGroup] = field(default_factory=list)
+    sources: list[str] = field(default_factory=list)
+
+
+def plugin_skill_dirs(plugins_root: Path) -> list[tuple[str, Path]]:
+    """(source label, skills dir) of every Claude Code plugin, installed and cached."""
+    found: list[tuple[str, Path]] = []
+    if not plugins_root.is_dir():
+        return found
+    for item in sorted(plugins_root.iterdir()):
+        if not item.is_dir() or item.name.startswith("."):
+            continue
+        if item.name == "cache":
+            # cache/<plugin>/<version>/.../skills/
+            for skills_dir in sorted(item.rglob("skills")):
+                if skills_dir.is_dir():
+                    rel = skills_dir.relative_to(item)
+                    found.append((f"plugin:{'/'.join(rel.parts[:-1])}", skills_dir))
+        elif (item / "skills").is_dir():
+            found.append((f"plugin:{item.name}", item / "skills"))
+    return found
+
+
+class Deduplicator:
+    """Scans every skill location once and groups duplicates.
+
+    ``targets`` limits which configured targets are scanned (default: all);
+    ``plugins_root`` is the Claude Code plugins directory, or None to skip
+    plugins.
+    """
+
+    def __init__(
+        self,
+        cellar: Cellar,
+        targets: list[str] | None = None,
+        plugins_root: Path | None = DEFAULT_PLUGINS_ROOT,
+        max_workers: int | None = None,
+    ):
+        self.cellar = cellar
+        self.targets = targets
+        self.plugins_root = plugins_root.expanduser() if plugins_root is not None else None
+        self.max_workers = max_workers
+
+    # --- Scanning ---
+
+    def _scan_tap(self, tap_name: str, cache: DigestCache) -> list[SkillCopy]:
+        index = GitSkillIndex.load(self.cellar.tap_dir(tap_name))
+        return [
+            SkillCopy(
+                skill["skill_id"],
+                f"tap:{tap_name}",
+                skill["path"],
+                skill_checksum(skill["path"], index, cache).digest,
+            )
+            for skill in TapManager(self.cellar).list_skills(tap_name)
+        ]
+
+    def _scan_target(self, target: str, cache: DigestCache) -> list[SkillCopy]:
+        # Links (managed or not) and synced copies are not separate copies
+        return [
+            SkillCopy(
+                link["skill_id"],
+                f"target:{target}",
+                Path(link["source"]),
+                checksum_tree(Path(link["source"]), cache),
+            )
+            for link in Linker(self.cellar).list_links(target)
+            if not link["linked"]
+        ]
+
+    @staticmethod
+    def _scan_dir(source: str, skills_dir: Path, cache: DigestCache) -> list[SkillCopy]:
+        copies = []
+        with os.scandir(skills_dir) as it:
+            entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        for entry in entries:
+            path = Path(entry.path)
+            if not entry.name.startswith(".") and (path / "SKILL.md").is_file():
+                copies.append(SkillCopy(entry.name, source, path, checksum_tree(path, cache)))
+        return copies
+
+    def _targets(self, config: dict) -> list[str]:
+        targets = self.targets or list(config.get("targets", {}))
+        if not targets and config.get("default_target"):
+            targets = [config["default_target"]]
+        return targets
+
+    @traced("dedup.scan")
+    def scan(self) -> tuple[list[SkillCopy], list[str]]:
+        """Every skill copy, and the sources scanned, walking each source once in parallel."""
+        config = self.cellar.load_config()
+        cache = DigestCache(self.cellar.cache_dir / "digests.json")
+        _ = cache.entries  # load once, before the worker threads share it
+
+        taps = TapManager(self.cellar).list_taps()
+        jobs = [(f"tap:{t}", partial(self._scan_tap, t)) for t in taps]
+        jobs += [(f"target:{t}", partial(self._scan_target, t)) for t in self._targets(config)]
+        if self.plugins_root is not None:
+            jobs += [
+                (label, partial(self._scan_dir, label, skills_dir))
+                for label, skills_dir in plugin_skill_dirs(self.plugins_root)
+            ]
+
+        copies: list[SkillCopy] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(scan, cache) for _, scan in jobs]
+            for future in futures:
+                copies.extend(future.result())
+        cache.save()
+        return copies, [label for label, _ in jobs]
+
+    # --- Grouping ---
+
+    @staticmethod
+    def _canonical(copies: list[SkillCopy], default_tap: str) -> SkillCopy | None:
+        """The default tap's copy, else the first tap copy by tap name and ID."""
+        taps = sorted(
+            (c for c in copies if c.kind == "tap"),
+            key=lambda c: (c.origin != default_tap, c.origin, c.skill_id),
+        )
+        return taps[0] if taps else None
+
+    def find(self, copies: list[SkillCopy]) -> tuple[list[DuplicateGroup], list[DuplicateGroup]]:
+        """(exact, diverged) duplicate groups among ``copies``."""
+        by_checksum: dict[str, list[SkillCopy]] = defaultdict(list)
+        by_id: dict[str, list[SkillCopy]] = defaultdict(list)
+        for copy in copies:
+            by_checksum[copy.checksum].append(copy)
+            by_id[copy.skill_id].append(copy)
+        default_tap = self.cellar.default_tap
+
+        exact = [
+            DuplicateGroup(checksum, group, self._canonical(group, default_tap))
+            for checksum, group in sorted(by_checksum.items())
+            if len(group) > 1
+        ]
+        diverged = [
+            DuplicateGroup(skill_id, group, self._canonical(group, default_tap))
+            for skill_id, group in sorted(by_id.items())
+            if len({c.checksum for c in group}) > 1 and len({c.source for c in group}) > 1
+        ]
+        return exact, diverged
+
+    def run(self) -> DedupReport:
+        copies, sources = self.scan()
+        exact, diverged = self.find(copies)
+        return DedupReport(copies, exact, diverged, sources)
+
+    # --- Resolution ---
+
+    def relink_plan(self, report: DedupReport) -> dict[str, list[tuple[str, Path]]]:
+        """Per target, the (link name, tap skill path) pairs that resolve its exact duplicates."""
+        plan: dict[str, list[tuple[str, Path]]] = defaultdict(list)
+        for group in report.exact:
+            for copy in group.relinkable:
+                plan[copy.origin].append((copy.skill_id, group.canonical.path))
+        return {target: sorted(pairs) for target, pairs in sorted(plan.items())}
+
+    @traced("dedup.resolve_exact")
+    def resolve_exact(self, report: DedupReport) -> list[LinkAction]:
+        """Replace target copies of exact duplicates with links to the tap copy.
+
+        Each target is relinked in one Linker batch; the replaced directories
+        are moved to the cellar cache as backups.
+        """
+        linker = Linker(self.cellar)
+        actions = []
+        for target, pairs in self.relink_plan(report).items():
+            actions.extend(linker.link_many(pairs, target))
+        return actions
@@ -4,7 +4,19 @@ from typing import Any
 
 import yaml
 
+from neoskills.core.tracing import traced
 
+# libyaml bindings when PyYAML was built with them: same results, ~10x faster
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
+
+def load_yaml(text: str) -> Any:
+    """yaml.safe_load, through libyaml when available."""
+    return yaml.load(text, Loader=_Loader)
+
+
+@traced("frontmatter.parse")
 def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     """Parse YAML frontmatter from a markdown file.
 
@@ -24,7 +36,7 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     body = content[end_idx + 3 :].strip()
 
     try:
-        metadata = yaml.safe_load(frontmatter_str) or {}
+        metadata = load_yaml(frontmatter_str) or {}
     except yaml.YAMLError:
         return {}, content
 
@@ -33,7 +45,9 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
 
 def write_frontmatter(metadata: dict[str, Any], body: str) -> str:
     """Combine YAML frontmatter and markdown body into a SKILL.md string."""
-    frontmatter = yaml.dump(metadata, default_flow_style=False, sort_keys=False).strip()
+    frontmatter = yaml.dump(
+        metadata, Dumper=_Dumper, default_flow_style=False, sort_keys=False
+    ).strip()
     return f"---\n{frontmatter}\n---\n\n{body}\n"
 
 
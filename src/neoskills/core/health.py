@@ -0,0 +1,227 @@
+"""HealthEngine - gather workspace facts once, run health checks concurrently.
+
+``doctor`` used to list the default tap's skills and the target's links
+twice each, for one tap and one target. The engine reads config once, then
+walks every tap and every configured target exactly once on a thread pool
+(the walks are I/O bound). Checks are pure functions of those facts and also
+run concurrently; each is timed in the report.
+"""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.linker import Linker
+from neoskills.core.tap import TapManager
+
+
+@dataclass
+class HealthFacts:
+    """Everything the checks look at, gathered in one pass."""
+
+    initialized: bool
+    config: dict[str, Any]
+    taps: list[str]
+    skills: dict[str, list[dict[str, Any]]] = field(default_factory=dict)  # tap -> skills
+    links: dict[str, list[dict[str, Any]]] = field(default_factory=dict)  # target -> links
+    target_paths: dict[str, Path] = field(default_factory=dict)
+    timings: dict[str, float] = field(default_factory=dict)  # fact -> seconds
+
+    @property
+    def default_tap(self) -> str:
+        return self.config.get("default_tap", "mySkills")
+
+
+@dataclass
+class CheckResult:
+    name: str
+    status: str = "ok"  # "ok", "warning" or "error"
+    summary: str = ""
+    issues: list[str] = field(default_factory=list)  # each one counts as an issue
+    notes: list[str] = field(default_factory=list)  # informational, not issues
+    seconds: float = 0.0
+
+
+@dataclass
+class HealthReport:
+    facts: HealthFacts
+    checks: list[CheckResult]
+    gather_seconds: float
+    total_seconds: float
+
+    @property
+    def issues(self) -> int:
+        return sum(len(c.issues) for c in self.checks)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "issues": self.issues,
+            "gather_seconds": round(self.gather_seconds, 4),
+            "total_seconds": round(self.total_seconds, 4),
+            "fact_timings": {k: round(v, 4) for k, v in self.facts.timings.items()},
+            "checks": [asdict(c) for c in self.checks],
+        }
+
+
+Check = Callable[[HealthFacts], list[CheckResult]]
+
+
+def _timed(fn: Callable[[], Any]) -> tuple[Any, float]:
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+# --- Checks (pure functions of HealthFacts) ---
+
+
+def check_workspace(facts: HealthFacts) -> list[CheckResult]:
+    if facts.initialized:
+        return [CheckResult("workspace", summary="Workspace initialized")]
+    return [
+        CheckResult(
+            "workspace",
+            "warning",
+            "Workspace not initialized",
+            ["Workspace not initialized. Run 'neoskills init'."],
+        )
+    ]
+
+
+def check_config(facts: HealthFacts) -> list[CheckResult]:
+    result = CheckResult("config", summary=f"{len(facts.target_paths)} target(s) configured")
+    default_target = facts.config.get("default_target")
+    if default_target and default_target not in facts.config.get("targets", {}):
+        result.issues.append(f"default_target '{default_target}' is not a configured target")
+    if facts.taps and facts.default_tap not in facts.taps:
+        result.issues.append(f"default_tap '{facts.default_tap}' is not a registered tap")
+    for target, path in facts.target_paths.items():
+        if not path.exists():
+            result.notes.append(f"Target {target}: {path} does not exist")
+    if result.issues:
+        result.status = "warning"
+    return [result]
+
+
+def check_taps(facts: HealthFacts) -> list[CheckResult]:
+    if not facts.taps:
+        return [
+            CheckResult(
+                "taps",
+                "warning",
+                "No taps registered",
+                ["No taps registered. Run 'neoskills tap <url>'."],
+            )
+        ]
+    summary = f"Taps: {len(facts.taps)} registered ({', '.join(facts.taps)})"
+    return [CheckResult("taps", summary=summary)]
+
+
+def check_skills(facts: HealthFacts) -> list[CheckResult]:
+    results = []
+    for tap, skills in facts.skills.items():
+        missing = [s["skill_id"] for s in skills if not s["description"]]
+        result = CheckResult(f"skills:{tap}", summary=f"Skills in {tap}: {len(skills)}")
+        if missing:
+            result.status = "warning"
+            result.issues = [f"{sid}: missing description" for sid in missing]
+        results.append(result)
+    return results
+
+
+def check_links(facts: HealthFacts) -> list[CheckResult]:
+    results = []
+    default_skills = {s["skill_id"] for s in facts.skills.get(facts.default_tap, [])}
+    for target, links in facts.links.items():
+        health = Linker.summarize_links(links)
+        result = CheckResult(
+            f"links:{target}",
+            summary=f"Links: {health['total']} total, {health['healthy']} healthy",
+        )
+        result.issues = [f"broken: {b['skill_id']} → {b['source']}" for b in health["broken"]]
+        result.notes = [f"unmanaged: {u['skill_id']} → {u['source']}" for u in health["unmanaged"]]
+        if health["local"]:
+            result.notes.append(f"Local (non-symlink) skills: {len(health['local'])}")
+        unlinked = default_skills - {link["skill_id"] for link in links}
+        if unlinked:
+            result.notes.append(f"Unlinked skills in {facts.default_tap}: {len(unlinked)}")
+        if result.issues:
+            result.status = "error"
+        results.append(result)
+    return results
+
+
+DEFAULT_CHECKS: list[Check] = [
+    check_workspace,
+    check_config,
+    check_taps,
+    check_skills,
+    check_links,
+]
+
+
+class HealthEngine:
+    """Gathers facts once and runs checks concurrently.
+
+    ``targets`` limits which configured targets are inspected (default: all).
+    """
+
+    def __init__(
+        self,
+        cellar: Cellar,
+        targets: list[str] | None = None,
+        checks: list[Check] | None = None,
+        max_workers: int | None = None,
+    ):
+        self.cellar = cellar
+        self.targets = targets
+        self.checks = list(checks or DEFAULT_CHECKS)
+        self.max_workers = max_workers
+
+    def gather(self, pool: ThreadPoolExecutor) -> HealthFacts:
+        config = self.cellar.load_config() if self.cellar.config_file.exists() else {}
+        mgr = TapManager(self.cellar)
+        linker = Linker(self.cellar)
+        facts = HealthFacts(self.cellar.is_initialized, config, mgr.list_taps())
+
+        targets = self.targets or list(config.get("targets", {}))
+        if not targets and config.get("default_target"):
+            targets = [config["default_target"]]
+        for target in targets:
+            facts.target_paths[target] = self.cellar.target_path(target)
+
+        # One walk per tap and per target, all in flight at once
+        jobs = {
+            f"skills:{tap}": pool.submit(_timed, lambda t=tap: mgr.list_skills(t))
+            for tap in facts.taps
+        }
+        jobs.update(
+            {
+                f"links:{target}": pool.submit(_timed, lambda t=target: linker.list_links(t))
+                for target in targets
+            }
+        )
+        for key, future in jobs.items():
+            value, seconds = future.result()
+            kind, _, name = key.partition(":")
+            (facts.skills if kind == "skills" else facts.links)[name] = value
+            facts.timings[key] = seconds
+        return facts
+
+    def run(self) -> HealthReport:
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            facts, gather_seconds = _timed(lambda: self.gather(pool))
+            futures = [pool.submit(_timed, lambda c=check: c(facts)) for check in self.checks]
+            checks = []
+            for future in futures:
+                results, seconds = future.result()
+                for result in results:
+                    # Charge each result its share of the check plus the walk it used
+                    result.seconds = seconds / len(results) + facts.timings.get(result.name, 0.0)
+                checks.extend(results)
+        return HealthReport(facts, checks, gather_seconds, time.perf_counter() - t0)
@@ -1,10 +1,21 @@
 """Linker - manages flat per-skill symlinks from targets to tap skills."""
 
+import os
 import shutil
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
+from neoskills.adapters.base import BaseAdapter
+from neoskills.adapters.factory import get_adapter
 from neoskills.core.cellar import Cellar
+from neoskills.core.models import Target, TransportType
+from neoskills.core.tracing import traced
+from neoskills.core.transport import DeltaSync, is_synced_dir, synced_source
+from neoskills.translators.pipeline import TranslationPipeline, load_skill
+
+# The adapter and Target that a copying deploy translates SKILL.md for
+Translation = tuple[BaseAdapter, Target]
 
 
 @dataclass
@@ -14,18 +25,92 @@ class LinkAction:
     skill_id: str
     source: Path  # Tap skill path
     target: Path  # Agent skill path
-    action: str  # "linked", "unlinked", "skipped", "broken"
+    action: str  # "linked", "synced", "unlinked", "skipped", "broken"
+
+
+def _sorted_entries(directory: Path) -> list[os.DirEntry]:
+    """Directory entries by name; their is_dir()/is_symlink() need no extra stat."""
+    with os.scandir(directory) as it:
+        return sorted(it, key=lambda e: e.name)
+
+
+def _link_source(link_path: Path, parents: dict[Path, Path]) -> Path:
+    """``link_path.resolve()``, resolving each distinct parent of the link target once.
+
+    Links into one tap share a parent (its skills/ directory), so a target
+    listing costs a readlink and an lstat per link instead of a full realpath.
+    """
+    target = link_path.readlink()
+    if not target.is_absolute() or target.name in ("", ".."):
+        return link_path.resolve()
+    parent = parents.get(target.parent)
+    if parent is None:
+        parent = parents[target.parent] = target.parent.resolve()
+    source = parent / target.name
+    return source.resolve() if source.is_symlink() else source
 
 
 class Linker:
     """Manages per-skill symlinks from target directories to tap skills.
 
     No state.yaml — derives all state from filesystem inspection.
+    Targets configured with ``transport: rsync`` (e.g. a mounted remote home)
+    get delta-synced copies instead of symlinks. Their SKILL.md goes through
+    the TranslationPipeline for the target's agent type (its ``agent_type``
+    setting, else the target name) and the translation cache, so an
+    unchanged skill is neither translated nor transferred again. A symlink
+    deploys the tap file itself and is never translated.
     """
 
-    def __init__(self, cellar: Cellar):
+    def __init__(self, cellar: Cellar, pipeline: TranslationPipeline | None = None):
         self.cellar = cellar
+        self.pipeline = pipeline or TranslationPipeline.for_cellar(cellar)
+        self._taps_realpath: Path | None = None
+
+    def _transport(self, target: str | None) -> TransportType:
+        transport = self.cellar.target_transport(target)
+        if transport not in (TransportType.LOCAL_FS, TransportType.RSYNC):
+            raise ValueError(
+                f"Transport '{transport.value}' cannot be used for linking yet; "
+                "use 'local-fs' (symlinks) or 'rsync' (synced copies)"
+            )
+        return transport
+
+    def _translation(self, target: str | None, target_dir: Path) -> Translation | None:
+        """Adapter and Target to translate for, or None for an unknown implicit agent type."""
+        name, agent_type = self.cellar.target_agent_type(target)
+        try:
+            adapter = get_adapter(agent_type or name, self.cellar)
+        except ValueError:
+            if agent_type:
+                raise
+            # A target named e.g. "remote" with no agent_type is deployed as is
+            return None
+        return adapter, Target(
+            target_id=name,
+            agent_type=adapter.agent_type,
+            install_paths=[str(target_dir)],
+            transport=TransportType.RSYNC,
+        )
+
+    def _is_managed(self, source: Path | str) -> bool:
+        """True if ``source`` lies inside the cellar's taps directory."""
+        return self._in_taps(Path(source).resolve())
+
+    def _in_taps(self, resolved: Path) -> bool:
+        """True if the already resolved path lies inside the taps directory.
+
+        The taps directory itself is only resolved (once) when the plain
+        comparison fails, e.g. when the workspace root is reached through a
+        symlink.
+        """
+        if resolved.is_relative_to(self.cellar.taps_dir):
+            return True
+        if self._taps_realpath is None:
+            self._taps_realpath = self.cellar.taps_dir.resolve()
+        return resolved.is_relative_to(self._taps_realpath)
 
+    @traced("linker.link")
     def link(
         self,
         skill_id: str,
@@ -35,28 +120,75 @@ class Linker:
         """Create a symlink for one skill in the target directory."""
         target_dir = self.cellar.target_path(target)
         target_dir.mkdir(parents=True, exist_ok=True)
-        link_path = target_dir / skill_id
+        transport = self._transport(target)
+        translation = (
+            self._translation(target, target_dir) if transport == TransportType.RSYNC else None
+        )
+        return self._link(skill_id, source_path, target_dir / skill_id, transport, translation)
+
+    def _link(
+        self,
+        skill_id: str,
+        source_path: Path,
+        link_path: Path,
+        transport: TransportType,
+        translation: Translation | None = None,
+    ) -> LinkAction:
+        if transport == TransportType.RSYNC:
+            return self._sync(skill_id, source_path, link_path, translation)
 
         if link_path.is_symlink():
             # Already linked — check if pointing to same source
-            if link_path.resolve() == source_path.resolve():
+            if link_path.readlink() == source_path or (
+                link_path.resolve() == source_path.resolve()
+            ):
                 return LinkAction(skill_id, source_path, link_path, "skipped")
             link_path.unlink()
         elif link_path.exists():
             # Real directory exists — back up and replace
-            backup = self.cellar.cache_dir / f"backup_{skill_id}"
-            if backup.exists():
-                shutil.rmtree(backup)
-            shutil.move(str(link_path), str(backup))
+            self._backup(skill_id, link_path)
 
         link_path.symlink_to(source_path)
         return LinkAction(skill_id, source_path, link_path, "linked")
 
+    def _sync(
+        self,
+        skill_id: str,
+        source_path: Path,
+        link_path: Path,
+        translation: Translation | None = None,
+    ) -> LinkAction:
+        """Delta-sync a skill directory into an rsync-transport target."""
+        if link_path.is_symlink():
+            link_path.unlink()
+        elif link_path.exists() and not is_synced_dir(link_path):
+            self._backup(skill_id, link_path)
+
+        overrides = {}
+        if translation and (source_path / "SKILL.md").is_file():
+            skill = load_skill(skill_id, source_path)
+            overrides["SKILL.md"] = self.pipeline.translated_file(skill, *translation)
+        stats = DeltaSync(self.cellar.cache_dir / "manifests").sync(
+            source_path, link_path, overrides=overrides
+        )
+        action = "synced" if stats.changed or stats.files_deleted else "skipped"
+        return LinkAction(skill_id, source_path, link_path, action)
+
+    def _backup(self, skill_id: str, link_path: Path) -> None:
+        backup = self.cellar.cache_dir / f"backup_{skill_id}"
+        if backup.exists():
+            shutil.rmtree(backup)
+        shutil.move(str(link_path), str(backup))
+
+    @traced("linker.unlink")
     def unlink(self, skill_id: str, target: str | None = None) -> LinkAction:
         """Remove a symlink for one skill from the target directory."""
         target_dir = self.cellar.target_path(target)
         link_path = target_dir / skill_id
 
+        if is_synced_dir(link_path):
+            return self._unsync(skill_id, link_path)
+
         if not link_path.is_symlink():
             return LinkAction(skill_id, Path(), link_path, "skipped")
 
@@ -64,35 +196,74 @@ class Linker:
         link_path.unlink()
         return LinkAction(skill_id, source, link_path, "unlinked")
 
+    def _unsync(self, skill_id: str, link_path: Path) -> LinkAction:
+        source = Path(synced_source(link_path))
+        if not self._is_managed(source):
+            # A synced copy of something outside our taps is not ours to delete
+            return LinkAction(skill_id, source, link_path, "skipped")
+        shutil.rmtree(link_path)
+        return LinkAction(skill_id, source, link_path, "unlinked")
+
+    @traced("linker.link_many")
+    def link_many(
+        self,
+        links: Iterable[tuple[str, Path]],
+        target: str | None = None,
+    ) -> list[LinkAction]:
+        """Link each (skill_id, source_path) pair into the target in one batch."""
+        # Resolve the target once rather than re-reading config.yaml per skill
+        target_dir = self.cellar.target_path(target)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        transport = self._transport(target)
+        translation = (
+            self._translation(target, target_dir) if transport == TransportType.RSYNC else None
+        )
+        return [
+            self._link(skill_id, source_path, target_dir / skill_id, transport, translation)
+            for skill_id, source_path in links
+        ]
+
+    @traced("linker.link_all")
     def link_all(
         self,
         skills_dir: Path,
         target: str | None = None,
     ) -> list[LinkAction]:
         """Link all skills from a directory to the target."""
-        actions = []
         if not skills_dir.exists():
-            return actions
-        for skill_dir in sorted(skills_dir.iterdir()):
-            if not skill_dir.is_dir() or not (skill_dir / "SKILL.md").exists():
-                continue
-            actions.append(self.link(skill_dir.name, skill_dir, target))
-        return actions
+            return []
+        return self.link_many(
+            (
+                (entry.name, Path(entry.path))
+                for entry in _sorted_entries(skills_dir)
+                if entry.is_dir() and (Path(entry.path) / "SKILL.md").exists()
+            ),
+            target,
+        )
 
+    @traced("linker.unlink_all")
     def unlink_all(self, target: str | None = None) -> list[LinkAction]:
         """Unlink all neoskills-managed symlinks from the target."""
         actions = []
         target_dir = self.cellar.target_path(target)
         if not target_dir.exists():
             return actions
-        for item in sorted(target_dir.iterdir()):
-            if item.is_symlink():
+        parents: dict[Path, Path] = {}
+        for entry in _sorted_entries(target_dir):
+            item = Path(entry.path)
+            if entry.is_symlink():
                 # Only unlink symlinks that point into our taps
-                resolved = item.resolve()
-                if str(self.cellar.taps_dir) in str(resolved):
-                    actions.append(self.unlink(item.name, target))
+                resolved = _link_source(item, parents)
+                if self._in_taps(resolved):
+                    item.unlink()
+                    actions.append(LinkAction(entry.name, resolved, item, "unlinked"))
+            elif is_synced_dir(item):
+                action = self._unsync(entry.name, item)
+                if action.action == "unlinked":
+                    actions.append(action)
         return actions
 
+    @traced("linker.list_links")
     def list_links(self, target: str | None = None) -> list[dict]:
         """List all skills in a target directory with link status."""
         target_dir = self.cellar.target_path(target)
@@ -100,10 +271,12 @@ class Linker:
             return []
 
         results = []
-        for item in sorted(target_dir.iterdir()):
-            if item.is_symlink():
-                resolved = item.resolve()
-                managed = str(self.cellar.taps_dir) in str(resolved)
+        parents: dict[Path, Path] = {}
+        for entry in _sorted_entries(target_dir):
+            item = Path(entry.path)
+            if entry.is_symlink():
+                resolved = _link_source(item, parents)
+                managed = self._in_taps(resolved)
                 broken = not resolved.exists()
                 results.append({
                     "skill_id": item.name,
@@ -112,7 +285,16 @@ class Linker:
                     "broken": broken,
                     "source": str(resolved),
                 })
-            elif item.is_dir() and (item / "SKILL.md").exists():
+            elif is_synced_dir(item):
+                source = synced_source(item)
+                results.append({
+                    "skill_id": item.name,
+                    "linked": True,
+                    "managed": self._is_managed(source),
+                    "broken": not Path(source).exists(),
+                    "source": source,
+                })
+            elif entry.is_dir() and (item / "SKILL.md").exists():
                 results.append({
                     "skill_id": item.name,
                     "linked": False,
@@ -124,7 +306,11 @@ class Linker:
 
     def check_health(self, target: str | None = None) -> dict:
         """Check symlink health. Returns dict with issues."""
-        links = self.list_links(target)
+        return self.summarize_links(self.list_links(target))
+
+    @staticmethod
+    def summarize_links(links: list[dict]) -> dict:
+        """Classify list_links() entries into healthy, broken, unmanaged and local."""
         broken = [l for l in links if l["broken"]]
         unmanaged = [l for l in links if not l["managed"] and l["linked"]]
         healthy = [l for l in links if l["linked"] and not l["broken"] and l["managed"]]
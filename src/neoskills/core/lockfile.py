@@ -0,0 +1,193 @@
+"""Lockfile - pin tap revisions and skill contents in neoskills.lock.
+
+The lock records, for every tap that provides a linked skill, its URL, branch
+and commit SHA, and for every skill its tap, the git tree SHA of
+``skills/<id>`` at that commit and its SkillChecksum digest.
+
+Verification avoids rehashing content: per tap a GitSkillIndex answers clean
+paths from ``git ls-tree`` without reading any file. Everything else (dirty
+paths, non-git taps) is content-hashed through the per-file DigestCache, so
+unchanged files are never re-read either.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.checksum import DigestCache, GitSkillIndex, skill_checksum
+from neoskills.core.linker import LinkAction, Linker
+from neoskills.core.tap import TapManager
+
+LOCK_VERSION = 2
+
+
+@dataclass
+class LockedTap:
+    url: str
+    branch: str = "main"
+    commit: str = ""
+
+
+@dataclass
+class LockedSkill:
+    tap: str
+    tree: str = ""  # git tree SHA of skills/<id> at the locked commit
+    checksum: str = ""  # SkillChecksum digest of the skill directory
+
+
+@dataclass
+class Lockfile:
+    taps: dict[str, LockedTap] = field(default_factory=dict)
+    skills: dict[str, LockedSkill] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "Lockfile":
+        """Read a lockfile; raises ValueError when it is malformed or unsupported."""
+        try:
+            data = json.loads(path.read_text())
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path.name} is not valid JSON: {exc}") from exc
+        if not isinstance(data, dict) or data.get("version") != LOCK_VERSION:
+            version = data.get("version") if isinstance(data, dict) else None
+            raise ValueError(f"Unsupported lockfile version: {version}")
+        try:
+            return cls(
+                taps={name: LockedTap(**t) for name, t in data.get("taps", {}).items()},
+                skills={sid: LockedSkill(**s) for sid, s in data.get("skills", {}).items()},
+            )
+        except (AttributeError, TypeError) as exc:
+            raise ValueError(f"{path.name} has a malformed entry: {exc}") from exc
+
+    def save(self, path: Path) -> None:
+        data = {
+            "version": LOCK_VERSION,
+            "taps": {name: vars(t) for name, t in sorted(self.taps.items())},
+            "skills": {sid: vars(s) for sid, s in sorted(self.skills.items())},
+        }
+        path.write_text(json.dumps(data, indent=2) + "\n")
+
+
+@dataclass
+class VerifyResult:
+    skill_id: str
+    tap: str
+    status: str  # "ok", "modified", "missing"
+    via: str = ""  # checksum provider: "git-blobs" (no content read) or "content"
+
+
+def _skill_origin(taps_dir: Path, source: str) -> tuple[str, str] | None:
+    """(tap, skill_id) for a path inside taps/<tap>/skills/<id>, else None.
+
+    ``taps_dir`` must be resolved; link sources are resolved here, so a
+    workspace reached through a symlink still matches.
+    """
+    try:
+        rel = Path(source).resolve().relative_to(taps_dir)
+    except ValueError:
+        return None
+    parts = rel.parts
+    if len(parts) == 3 and parts[1] == "skills":
+        return parts[0], parts[2]
+    return None
+
+
+def generate_lock(cellar: Cellar, target: str | None = None) -> tuple[Lockfile, list[str]]:
+    """Lock every managed skill linked into a target.
+
+    Returns (lock, skill_ids with uncommitted changes). Uncommitted changes are
+    captured by the checksum but cannot be reproduced by ``install --locked``.
+    """
+    lock = Lockfile()
+    cache = DigestCache(cellar.cache_dir / "digests.json")
+    indexes: dict[str, GitSkillIndex] = {}
+    dirty: list[str] = []
+    taps_dir = cellar.taps_dir.resolve()
+
+    for link in Linker(cellar).list_links(target):
+        if not link["linked"] or link["broken"]:
+            continue
+        origin = _skill_origin(taps_dir, link["source"])
+        if origin is None:
+            continue
+        tap_name, skill_id = origin
+        tap_dir = cellar.tap_dir(tap_name)
+        if tap_name not in indexes:
+            indexes[tap_name] = GitSkillIndex.load(tap_dir)
+            url, branch = TapManager(cellar).tap_origin(tap_name)
+            lock.taps[tap_name] = LockedTap(url, branch, indexes[tap_name].commit)
+        index = indexes[tap_name]
+        checksum = skill_checksum(Path(link["source"]), index, cache)
+        if index.is_git and (skill_id in index.dirty or skill_id not in index.trees):
+            dirty.append(link["skill_id"])
+        lock.skills[link["skill_id"]] = LockedSkill(
+            tap=tap_name,
+            tree=index.trees.get(skill_id, ""),
+            checksum=checksum.digest,
+        )
+
+    cache.save()
+    return lock, dirty
+
+
+def verify_lock(cellar: Cellar, lock: Lockfile) -> list[VerifyResult]:
+    """Compare tap checkouts against the lock. Returns one result per locked skill."""
+    cache = DigestCache(cellar.cache_dir / "digests.json")
+    indexes: dict[str, GitSkillIndex] = {}
+    results = []
+
+    for skill_id, locked in sorted(lock.skills.items()):
+        skill_dir = cellar.tap_skills_dir(locked.tap) / skill_id
+        if not skill_dir.is_dir():
+            results.append(VerifyResult(skill_id, locked.tap, "missing"))
+            continue
+        if locked.tap not in indexes:
+            indexes[locked.tap] = GitSkillIndex.load(cellar.tap_dir(locked.tap))
+        checksum = skill_checksum(skill_dir, indexes[locked.tap], cache)
+        status = "ok" if checksum.digest == locked.checksum else "modified"
+        results.append(VerifyResult(skill_id, locked.tap, status, checksum.provider))
+
+    cache.save()
+    return results
+
+
+def install_locked(cellar: Cellar, lock: Lockfile, target: str | None = None) -> list[LinkAction]:
+    """Clone missing taps, check out the locked commits and link the locked skills.
+
+    Each tap's branch is moved to its locked commit. Raises ValueError rather
+    than discard commits on that branch that exist neither upstream nor in
+    the locked commit's history.
+    """
+    import git
+
+    mgr = TapManager(cellar)
+    for tap_name, locked in sorted(lock.taps.items()):
+        tap_dir = cellar.tap_dir(tap_name)
+        if not tap_dir.exists():
+            if not locked.url:
+                raise ValueError(f"Tap '{tap_name}' is missing and has no URL in the lock")
+            mgr.add(tap_name, locked.url, locked.branch)
+        if not locked.commit:
+            continue
+        repo = git.Repo(tap_dir)
+        if repo.head.is_valid() and repo.head.commit.hexsha == locked.commit:
+            continue
+        try:
+            repo.commit(locked.commit)
+        except (ValueError, git.BadName):
+            mgr.fetch_commit(tap_name, locked.commit)  # not in the clone yet
+        if locked.branch in repo.heads:
+            local = repo.git.rev_list(locked.branch, "--not", "--remotes=origin", locked.commit)
+            if local:
+                count = len(local.split())
+                raise ValueError(
+                    f"Tap '{tap_name}' has {count} local commit(s) on '{locked.branch}' "
+                    f"that the locked checkout would discard; push or move them first"
+                )
+        repo.git.checkout("-B", locked.branch, locked.commit)
+
+    linker = Linker(cellar)
+    return [
+        linker.link(skill_id, cellar.tap_skills_dir(locked.tap) / skill_id, target)
+        for skill_id, locked in sorted(lock.skills.items())
+    ]
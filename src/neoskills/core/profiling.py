@@ -0,0 +1,188 @@
+"""Profiling - cProfile around a command or tool call, written as pstats or collapsed stacks.
+
+The CLI enables it with ``neoskills --profile[=PATH] <command>``; anything
+else (the plugin runtime's MCP tools, scripts) honours the same settings
+from the environment:
+
+  NEOSKILLS_PROFILE         output path, or a directory, or "1" for the default
+  NEOSKILLS_PROFILE_FORMAT  "pstats" (default) or "collapsed" (flame graph input)
+  NEOSKILLS_PROFILE_TOP     hotspots printed to stderr (default 20, 0 = none)
+
+Collapsed output is reconstructed from cProfile's caller/callee edges, so
+stacks are attributed proportionally rather than sampled; it is meant for
+flamegraph.pl / speedscope, with values in microseconds.
+"""
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+PROFILE_ENV = "NEOSKILLS_PROFILE"
+PROFILE_FORMAT_ENV = "NEOSKILLS_PROFILE_FORMAT"
+PROFILE_TOP_ENV = "NEOSKILLS_PROFILE_TOP"
+
+FORMATS = ("pstats", "collapsed")
+_SUFFIXES = {"pstats": ".prof", "collapsed": ".folded"}
+DEFAULT_TOP = 20
+_DEFAULT_PATHS = ("", "1", "true", "yes")  # flag-style values: pick a file name
+
+# cProfile cannot nest; an inner profile() call inside an active one is a no-op
+_active = False
+
+
+def resolve_path(path: str | Path | None, fmt: str = "pstats", label: str = "neoskills") -> Path:
+    """Output file for a profile: PATH as given, or a unique file in a directory.
+
+    ``None``, "", "1", "true" and "yes" mean the current directory.
+    """
+    default = path is None or str(path).lower() in _DEFAULT_PATHS
+    if default or Path(path).is_dir():
+        directory = Path.cwd() if default else Path(path)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        return directory / f"{label}-{stamp}-{os.getpid()}{_SUFFIXES[fmt]}"
+    return Path(path)
+
+
+def _label(func: tuple[str, int, str]) -> str:
+    filename, line, name = func
+    if filename == "~":  # builtins
+        return name.strip("<>")
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def collapsed_stacks(stats: pstats.Stats, min_us: int = 1) -> list[str]:
+    """Folded stack lines ("a;b;c <microseconds>") from profile stats.
+
+    Each function's own time is spread over the call paths leading to it in
+    proportion to the cumulative time of each caller edge.
+    """
+    raw = stats.stats  # func -> (cc, nc, tt, ct, callers)
+    children: dict[Any, list[tuple[Any, float]]] = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((func, edge[3]))
+
+    totals: dict[str, float] = {}
+
+    def walk(func: Any, stack: tuple[str, ...], share: float) -> None:
+        tt = raw[func][2]
+        frame = (*stack, _label(func))
+        key = ";".join(frame)
+        totals[key] = totals.get(key, 0.0) + tt * share
+        for child, edge_ct in children.get(func, []):
+            child_ct = raw[child][3]
+            if child_ct <= 0 or _label(child) in frame or len(frame) > 200:
+                continue
+            child_share = share * min(edge_ct / child_ct, 1.0)
+            if child_share * child_ct * 1e6 >= min_us:
+                walk(child, frame, child_share)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            walk(func, (), 1.0)
+
+    return [
+        f"{stack} {round(seconds * 1e6)}"
+        for stack, seconds in sorted(totals.items())
+        if round(seconds * 1e6) >= min_us
+    ]
+
+
+def write_profile(prof: cProfile.Profile, path: Path, fmt: str = "pstats") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "collapsed":
+        lines = collapsed_stacks(pstats.Stats(prof))
+        path.write_text("\n".join(lines) + "\n" if lines else "")
+    else:
+        prof.dump_stats(path)
+
+
+def print_hotspots(prof: cProfile.Profile, top: int, stream=None) -> None:
+    """Print the ``top`` functions by own time."""
+    stream = stream or sys.stderr
+    buf = io.StringIO()
+    pstats.Stats(prof, stream=buf).strip_dirs().sort_stats("tottime").print_stats(top)
+    stream.write(buf.getvalue().strip("\n") + "\n")
+
+
+@contextmanager
+def profile(
+    path: str | Path | None = None,
+    fmt: str = "pstats",
+    top: int = DEFAULT_TOP,
+    label: str = "neoskills",
+) -> Iterator[cProfile.Profile | None]:
+    """Profile the enclosed block and write the result on exit.
+
+    Yields None (and profiles nothing) when another profile is already active.
+    """
+    global _active
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown profile format: {fmt}. Use one of: {', '.join(FORMATS)}")
+    if _active:
+        yield None
+        return
+
+    out = resolve_path(path, fmt, label)
+    prof = cProfile.Profile()
+    _active = True
+    t0 = time.perf_counter()
+    prof.enable()
+    try:
+        yield prof
+    finally:
+        prof.disable()
+        _active = False
+        elapsed = time.perf_counter() - t0
+        write_profile(prof, out, fmt)
+        if top > 0:
+            print_hotspots(prof, top)
+        print(f"Profile ({fmt}, {elapsed:.3f}s) written to {out}", file=sys.stderr)
+
+
+def enabled(path: str | None) -> bool:
+    """Whether a --profile / NEOSKILLS_PROFILE value turns profiling on."""
+    return bool(path) and path.lower() not in ("0", "false", "no")
+
+
+def env_settings() -> dict[str, Any] | None:
+    """Profile settings from NEOSKILLS_PROFILE*, or None when profiling is off."""
+    path = os.environ.get(PROFILE_ENV, "")
+    if not enabled(path):
+        return None
+    # A bad setting must not fail the call being profiled: warn and use the default
+    fmt = os.environ.get(PROFILE_FORMAT_ENV, "pstats") or "pstats"
+    if fmt not in FORMATS:
+        print(
+            f"Ignoring {PROFILE_FORMAT_ENV}={fmt!r} (use one of: {', '.join(FORMATS)})",
+            file=sys.stderr,
+        )
+        fmt = "pstats"
+    try:
+        top = int(os.environ.get(PROFILE_TOP_ENV, DEFAULT_TOP))
+    except ValueError:
+        print(f"Ignoring {PROFILE_TOP_ENV}: not an integer", file=sys.stderr)
+        top = DEFAULT_TOP
+    return {"path": path, "fmt": fmt, "top": top}
+
+
+def profiled[F: Callable[..., Any]](func: F) -> F:
+    """Profile each call of ``func`` when NEOSKILLS_PROFILE is set."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        settings = env_settings()
+        if settings is None:
+            return func(*args, **kwargs)
+        with profile(label=func.__name__, **settings):
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,222 @@
+"""Text similarity for duplicate detection: TF-IDF neighbors and MinHash signatures."""
+
+import hashlib
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # tfidf_neighbors falls back to pure Python
+    np = None
+
+# --- TF-IDF neighbors ---
+
+DENSE_TERMS = 256  # at most this many frequent terms go in the dense matrix
+MAX_BLOCK_CELLS = 1 << 21  # similarity scores held in memory at once (NumPy mode)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric terms of ``text``, single characters dropped."""
+    return [t for t in re.findall(r"[a-z0-9]+", text.lower()) if len(t) > 1]
+
+
+def tfidf_vectors(documents: list[Counter]) -> tuple[list[dict[int, float]], list[int]]:
+    """Unit-length sparse TF-IDF vectors (term index -> weight), one per document.
+
+    Term frequency is sublinear (1 + log tf) and IDF smoothed
+    (log((1 + n) / (1 + df)) + 1). Terms found in a single skill count
+    towards its vector's length but are left out of the vector, since they
+    cannot contribute to any similarity. Term indices are numbered most
+    frequent first; the second value is each indexed term's document
+    frequency. ``documents`` are term counts, e.g. Counter(tokenize(text)).
+    """
+    df = Counter(t for c in documents for t in c)
+    shared = [t for t, n in sorted(df.items(), key=lambda item: (-item[1], item[0])) if n > 1]
+    index = {t: i for i, t in enumerate(shared)}
+    n = len(documents)
+    vectors = []
+    for c in documents:
+        weights = {
+            t: (1 + math.log(tf)) * (math.log((1 + n) / (1 + df[t])) + 1) for t, tf in c.items()
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        vectors.append({index[t]: w / norm for t, w in weights.items() if t in index})
+    return vectors, [df[t] for t in shared]
+
+
+def _top_k(scores, i: int, k: int, min_similarity: float) -> list[tuple[float, int]]:
+    top = heapq.nsmallest(
+        k, ((-round(sim, 4), j) for j, sim in scores if j != i and round(sim, 4) > min_similarity)
+    )
+    return [(-neg, j) for neg, j in top]
+
+
+def _neighbors_python(vectors, k: int, min_similarity: float) -> list[list[tuple[float, int]]]:
+    postings = defaultdict(list)
+    for i, vector in enumerate(vectors):
+        for t, w in vector.items():
+            postings[t].append((i, w))
+    neighbors = []
+    for i, vector in enumerate(vectors):
+        scores: dict[int, float] = defaultdict(float)
+        for t, w in vector.items():
+            for j, wj in postings[t]:
+                scores[j] += w * wj
+        neighbors.append(_top_k(scores.items(), i, k, min_similarity))
+    return neighbors
+
+
+def _neighbors_numpy(
+    vectors, dfs: list[int], k: int, min_similarity: float, max_cells: int
+) -> list[list[tuple[float, int]]]:
+    """Blocked cosine similarities: dense matmul for frequent terms, sparse for the rest.
+
+    Frequent terms (the first DENSE_TERMS, if found in at least 1/64 of the
+    documents) form a dense matrix, multiplied block by block. Rarer
+    terms are multiplied sparsely through their posting lists, accumulated
+    with bincount. Each block of rows is sized so that its scores and its
+    sparse products stay within ``max_cells`` values.
+    """
+    n = len(vectors)
+    dense_terms = sum(1 for df in dfs[:DENSE_TERMS] if df * 64 >= n)
+    dense = np.zeros((n, dense_terms))
+    rows, terms, weights = [], [], []
+    for i, vector in enumerate(vectors):
+        for t, w in vector.items():
+            if t < dense_terms:
+                dense[i, t] = w
+            else:
+                rows.append(i)
+                terms.append(t - dense_terms)
+                weights.append(w)
+    rows = np.asarray(rows, dtype=np.int64)
+    terms = np.asarray(terms, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+    # Rows are appended in order, so the triplets are already row-major (CSR)
+    row_ptr = np.searchsorted(rows, np.arange(n + 1))
+    by_term = np.argsort(terms, kind="stable")
+    term_ptr = np.searchsorted(terms[by_term], np.arange(len(dfs) - dense_terms + 1))
+    term_rows, term_weights = rows[by_term], weights[by_term]
+    postings_len = np.diff(term_ptr)
+    row_cost = np.concatenate(([0], np.cumsum(postings_len[terms])))
+
+    neighbors = []
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        while (
+            hi < n
+            and (hi + 1 - lo) * n <= max_cells
+            and row_cost[row_ptr[hi + 1]] - row_cost[row_ptr[lo]] <= max_cells
+        ):
+            hi += 1
+        scores = dense[lo:hi] @ dense.T
+        start, end = row_ptr[lo], row_ptr[hi]
+        if end > start:
+            lengths = postings_len[terms[start:end]]
+            offsets = np.repeat(
+                term_ptr[terms[start:end]] - (np.cumsum(lengths) - lengths), lengths
+            )
+            positions = offsets + np.arange(lengths.sum())
+            cells = np.repeat(rows[start:end] - lo, lengths) * n + term_rows[positions]
+            products = np.repeat(weights[start:end], lengths) * term_weights[positions]
+            scores += np.bincount(cells, products, minlength=(hi - lo) * n).reshape(hi - lo, n)
+        scores[np.arange(hi - lo), np.arange(lo, hi)] = -1.0
+        # Everything tied with the k-th best is a candidate, so that _top_k
+        # breaks ties by index exactly as the pure-Python path does
+        take = min(k, n - 1) or 1
+        top = np.argpartition(-scores, take - 1, axis=1)[:, :take]
+        kth = scores[np.arange(hi - lo)[:, None], top].min(axis=1)
+        mask = (scores >= kth[:, None] - 1e-4) & (scores > min_similarity)
+        block_rows, cols = np.nonzero(mask)
+        bounds = np.searchsorted(block_rows, np.arange(hi - lo + 1))
+        for r in range(hi - lo):
+            candidates = cols[bounds[r] : bounds[r + 1]]
+            neighbors.append(
+                _top_k(
+                    zip(candidates.tolist(), scores[r, candidates].tolist()),
+                    lo + r,
+                    k,
+                    min_similarity,
+                )
+            )
+        lo = hi
+    return neighbors
+
+
+def tfidf_neighbors(
+    documents: list[Counter],
+    k: int = 5,
+    min_similarity: float = 0.0,
+    use_numpy: bool | None = None,
+    max_cells: int = MAX_BLOCK_CELLS,
+) -> list[list[tuple[float, int]]]:
+    """The ``k`` most TF-IDF-similar documents of every document, as (cosine, index) lists.
+
+    ``documents`` are term counts (see tfidf_vectors). With NumPy
+    (``use_numpy`` defaults to whether it is installed) similarities are
+    computed in blocked matrix multiplies whose memory is bounded by
+    ``max_cells``; without it, a pure-Python inverted-index pass gives the
+    same neighbors. Similarities are rounded to 4 places, ties go to the lower
+    index and neighbors at or below ``min_similarity`` are dropped.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    vectors, dfs = tfidf_vectors(documents)
+    if not vectors or k <= 0:
+        return [[] for _ in vectors]
+    if use_numpy:
+        return _neighbors_numpy(vectors, dfs, k, min_similarity, max_cells)
+    return _neighbors_python(vectors, k, min_similarity)
+
+
+# --- MinHash and winnowing ---
+
+SIGNATURE_SIZE = 64  # bottom-k MinHash: the k smallest shingle hashes
+SHINGLE_WORDS = 4  # words per shingle
+WINNOW_WINDOW = 4  # any shared run of SHINGLE_WORDS + WINNOW_WINDOW - 1 words is found
+
+
+def _shingle_hashes(text: str) -> list[int]:
+    """Stable 64-bit hashes (blake2b) of the word shingles of ``text``, in order."""
+    words = re.findall(r"\w+", text.lower())
+    if not words:
+        return []
+    hashes = []
+    for i in range(max(1, len(words) - SHINGLE_WORDS + 1)):
+        shingle = " ".join(words[i : i + SHINGLE_WORDS]).encode("utf-8")
+        hashes.append(int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "big"))
+    return hashes
+
+
+def winnow(hashes: list[int], window: int = WINNOW_WINDOW) -> list[int]:
+    """Winnowing fingerprints: the minimum hash of every window of ``window`` shingles."""
+    if len(hashes) <= window:
+        return sorted(set(hashes))
+    return sorted({min(hashes[i : i + window]) for i in range(len(hashes) - window + 1)})
+
+
+def content_features(text: str, size: int = SIGNATURE_SIZE) -> tuple[list[int], list[int]]:
+    """(bottom-k MinHash signature, winnowing fingerprints) of ``text``'s shingles."""
+    hashes = _shingle_hashes(text)
+    return heapq.nsmallest(size, set(hashes)), winnow(hashes)
+
+
+def minhash_signature(text: str, size: int = SIGNATURE_SIZE) -> list[int]:
+    """Bottom-k MinHash signature of the word shingles of ``text``.
+
+    The hashes are stable across runs, so signatures can be stored and
+    compared with estimate_jaccard() later.
+    """
+    return content_features(text, size)[0]
+
+
+def estimate_jaccard(a: list[int], b: list[int], size: int = SIGNATURE_SIZE) -> float:
+    """Jaccard similarity of the shingle sets behind two bottom-k signatures."""
+    if not a or not b:
+        return 0.0
+    union = heapq.nsmallest(size, set(a) | set(b))
+    both = set(a) & set(b)
+    return sum(1 for h in union if h in both) / len(union)
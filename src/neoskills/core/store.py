@@ -0,0 +1,288 @@
+"""Content-addressed blob store - one copy of each skill file across all taps.
+
+Blobs live under ``cache/blobs/<aa>/<sha256>`` keyed by ``checksum.file_digest``.
+Skill directories are materialized from the store with reflinks (FICLONE)
+where the filesystem supports them, so installing thousands of skills is
+mostly metadata work, and with plain copies elsewhere.
+
+Materialized files land in tap working trees, which users, ``validate --fix``
+and git all modify in place, so they never share an inode with a blob:
+hardlinks would let a chmod or write in one tap change the blob and every
+other tap linked to it.
+
+Without reflinks a blob is a second full copy of every file it serves, so
+callers check can_reflink() and copy directly instead. Blobs no tap file
+still has are removed by gc(), which ``untap`` runs.
+"""
+
+import errno
+import os
+import shutil
+import stat
+import threading
+from collections.abc import Collection
+from dataclasses import dataclass
+from pathlib import Path
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.checksum import file_digest
+
+try:
+    import fcntl
+except ImportError:  # Windows: no FICLONE, fall back to copies
+    fcntl = None
+
+FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+LINK_MODES = ("auto", "reflink", "copy")
+
+_SKIP_DIRS = {".git", "__pycache__"}
+
+
+@dataclass
+class MaterializeStats:
+    """How the files of a materialized tree were placed."""
+
+    files: int = 0
+    reflinked: int = 0
+    copied: int = 0
+    bytes_copied: int = 0
+    symlinks: int = 0  # dangling or looping links, recreated as links
+
+
+class BlobStore:
+    """Stores file contents once, keyed by sha256, and materializes trees from them."""
+
+    def __init__(self, root: Path, link_mode: str = "auto"):
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode '{link_mode}'. Available: {', '.join(LINK_MODES)}")
+        self.root = root
+        self.link_mode = link_mode
+        reflink_ok = fcntl is not None and link_mode in ("auto", "reflink")
+        self._can_reflink: bool | None = None if reflink_ok else False
+        self._shards: set[Path] = set()  # blob directories known to exist
+
+    @classmethod
+    def for_cellar(cls, cellar: Cellar) -> "BlobStore":
+        mode = cellar.load_config().get("store_link_mode", "auto")
+        return cls(cellar.cache_dir / "blobs", link_mode=mode)
+
+    def blob_path(self, digest: str, executable: bool = False) -> Path:
+        # Executable and plain variants are separate blobs
+        suffix = ".x" if executable else ""
+        return self.root / digest[:2] / f"{digest[2:]}{suffix}"
+
+    def can_reflink(self, dest_dir: Path) -> bool:
+        """Whether blobs can be reflinked into dest_dir, probed once with an empty file.
+
+        Without reflinks every materialized file is a full copy, so callers
+        that gain nothing from the store's own copy can copy directly instead.
+        """
+        if self._can_reflink is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            name = f".reflink-probe.{os.getpid()}.{threading.get_ident()}"
+            probe, target = self.root / name, dest_dir / name
+            try:
+                probe.touch()
+                self._reflink(probe, target)
+                self._can_reflink = True
+            except OSError as exc:
+                if exc.errno not in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL):
+                    raise
+                self._can_reflink = False
+            finally:
+                probe.unlink(missing_ok=True)
+                target.unlink(missing_ok=True)
+        return self._can_reflink
+
+    # --- Ingest ---
+
+    def add(self, path: Path, mode: int | None = None) -> tuple[str, Path]:
+        """Store a file's contents. Returns (digest, blob path).
+
+        ``mode`` is the file's st_mode when the caller has already stat'ed it.
+        """
+        digest = file_digest(path)
+        executable = bool((path.stat().st_mode if mode is None else mode) & 0o111)
+        blob = self.blob_path(digest, executable)
+        if not blob.exists():
+            if blob.parent not in self._shards:
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                self._shards.add(blob.parent)
+            tmp = blob.with_name(f"{blob.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            self._clone_or_copy(path, tmp)
+            os.chmod(tmp, 0o555 if executable else 0o444)
+            os.replace(tmp, blob)
+        return digest, blob
+
+    # --- Materialize ---
+
+    def materialize(self, blob: Path, dest: Path, stats: MaterializeStats | None = None) -> str:
+        """Place a blob at dest. Returns the method used: reflink or copy."""
+        stats = stats or MaterializeStats()
+        if dest.exists() or dest.is_symlink():
+            dest.unlink()
+        return self._place(blob, dest, stats)
+
+    def _place(self, blob: Path, dest: Path, stats: MaterializeStats) -> str:
+        if self._can_reflink is not False:
+            try:
+                self._reflink(blob, dest)
+                self._can_reflink = True
+                os.chmod(dest, 0o755 if blob.suffix == ".x" else 0o644)
+                stats.reflinked += 1
+                return "reflink"
+            except OSError as exc:
+                dest.unlink(missing_ok=True)
+                if exc.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL):
+                    self._can_reflink = False
+                else:
+                    raise
+
+        shutil.copyfile(blob, dest)
+        os.chmod(dest, 0o755 if blob.suffix == ".x" else 0o644)
+        stats.copied += 1
+        stats.bytes_copied += dest.stat().st_size
+        return "copy"
+
+    def materialize_tree(
+        self, src_dir: Path, dest_dir: Path, skip: Collection[str] = ()
+    ) -> MaterializeStats:
+        """Copy src_dir into dest_dir through the store, merging with what is there.
+
+        Files from src_dir replace files of the same name; other files in
+        dest_dir are kept. Symlinks are followed, as copytree() does, so the
+        result is self-contained; a dangling or looping symlink is recreated
+        as a symlink. ``skip`` names top-level files the caller writes itself.
+        """
+        stats = MaterializeStats()
+        dest_dir.parent.mkdir(parents=True, exist_ok=True)
+        st = src_dir.stat()
+        self._materialize_dir(src_dir, dest_dir, stats, skip, st.st_dev, {(st.st_dev, st.st_ino)})
+        return stats
+
+    def _materialize_dir(
+        self,
+        src_dir: Path,
+        dest_dir: Path,
+        stats: MaterializeStats,
+        skip: Collection[str],
+        dev: int,
+        ancestors: set[tuple[int, int]],
+    ) -> None:
+        """Mirror one directory. ``ancestors`` are the (st_dev, st_ino) of the
+        directories being copied, so a symlink to one of them is not followed.
+        """
+        try:
+            dest_dir.mkdir()
+            fresh = True  # nothing to replace, so no per-file existence checks
+        except FileExistsError:
+            if dest_dir.is_symlink() or not dest_dir.is_dir():
+                dest_dir.unlink()
+                dest_dir.mkdir()
+            fresh = False
+        # scandir's cached entry types save a stat per directory and symlink check
+        with os.scandir(src_dir) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if entry.name in skip:
+                continue
+            dest = dest_dir / entry.name
+            if entry.is_symlink():
+                try:
+                    target = entry.stat()
+                except OSError:
+                    target = None  # dangling or looping
+                if target is not None and stat.S_ISDIR(target.st_mode):
+                    key = (target.st_dev, target.st_ino)
+                    if entry.name in _SKIP_DIRS:
+                        continue
+                    if key not in ancestors:
+                        self._materialize_dir(
+                            Path(entry.path), dest, stats, (), key[0], ancestors | {key}
+                        )
+                        continue
+                    target = None  # a link to an enclosing directory
+                if not fresh:
+                    _remove(dest)
+                if target is None:
+                    os.symlink(os.readlink(entry.path), dest)
+                    stats.symlinks += 1
+                elif stat.S_ISREG(target.st_mode):
+                    _, blob = self.add(Path(entry.path), target.st_mode)
+                    self._place(blob, dest, stats)
+                    stats.files += 1
+            elif entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS:
+                    key = (dev, entry.inode())
+                    self._materialize_dir(Path(entry.path), dest, stats, (), dev, ancestors | {key})
+            elif entry.is_file(follow_symlinks=False):
+                if not fresh:
+                    _remove(dest)
+                _, blob = self.add(Path(entry.path), entry.stat(follow_symlinks=False).st_mode)
+                self._place(blob, dest, stats)
+                stats.files += 1
+
+    # --- Garbage collection ---
+
+    def gc(self, roots: Collection[Path]) -> int:
+        """Delete blobs whose content no file under ``roots`` has any more. Returns the count.
+
+        Only files whose size matches some blob are hashed, so the walk
+        costs about one stat per file.
+        """
+        if not self.root.is_dir():
+            return 0
+        blobs: dict[int, list[tuple[str, Path]]] = {}
+        for blob in self.root.glob("??/*"):
+            if blob.name.endswith(".tmp"):
+                continue
+            digest = blob.parent.name + blob.name.removesuffix(".x")
+            blobs.setdefault(blob.stat().st_size, []).append((digest, blob))
+        reachable: set[str] = set()
+        for root in roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(st.st_mode) and st.st_size in blobs:
+                        reachable.add(file_digest(path))
+        removed = 0
+        for entries in blobs.values():
+            for digest, blob in entries:
+                if digest not in reachable:
+                    blob.unlink(missing_ok=True)
+                    removed += 1
+        return removed
+
+    # --- Low-level placement ---
+
+    @staticmethod
+    def _reflink(src: Path, dest: Path) -> None:
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+    def _clone_or_copy(self, src: Path, dest: Path) -> None:
+        if self._can_reflink is not False:
+            try:
+                self._reflink(src, dest)
+                return
+            except OSError:
+                dest.unlink(missing_ok=True)
+        shutil.copyfile(src, dest)
+
+
+def _remove(path: Path) -> None:
+    """Remove whatever is at path (file, symlink or directory), if anything."""
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if stat.S_ISDIR(mode):
+        shutil.rmtree(path)
+    else:
+        path.unlink()
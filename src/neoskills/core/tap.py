@@ -1,11 +1,52 @@
 """TapManager - clone, pull, search, and list skills across taps."""
 
 import shutil
+import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from neoskills.core.catalog import Catalog
 from neoskills.core.cellar import Cellar
-from neoskills.core.frontmatter import parse_frontmatter
+from neoskills.core.changeset import ChangeSet, publish
+from neoskills.core.tracing import span, traced
+
+# Paths materialized in a tap checkout. Cone-mode sparse checkout also keeps
+# top-level files, so tap.yaml is always present.
+TAP_SPARSE_PATHS = ("skills", "plugins")
+
+# Paths `neoskills push` publishes; any of them may be absent
+TAP_PUSH_PATHS = ("skills", "plugins", "tap.yaml", "README.md")
+
+
+@dataclass
+class PendingChanges:
+    """Uncommitted changes under a tap's published paths."""
+
+    tap: str
+    paths: list[str] = field(default_factory=list)  # every path to stage (both sides of renames)
+    changes: ChangeSet | None = None  # skill-level view of the same paths
+    other: list[str] = field(default_factory=list)  # changed paths outside skills/
+
+    @property
+    def empty(self) -> bool:
+        return not self.paths
+
+    def commit_message(self) -> str:
+        """Subject summarizing changed skill ids, body listing them in full."""
+        changes = self.changes or ChangeSet(self.tap)
+        summary = changes.summary() or ", ".join(self.other[:5])
+        lines = [f"Update {self.tap}: {summary}", ""]
+        for label, ids in (
+            ("Added", changes.added),
+            ("Updated", changes.modified),
+            ("Removed", changes.removed),
+        ):
+            if ids:
+                lines.append(f"{label}: {', '.join(sorted(ids))}")
+        if self.other:
+            lines.append(f"Other: {', '.join(self.other)}")
+        return "\n".join(lines).strip()
 
 
 class TapManager:
@@ -13,29 +54,258 @@ class TapManager:
 
     def __init__(self, cellar: Cellar):
         self.cellar = cellar
+        self.last_changes: dict[str, ChangeSet] = {}  # per tap, from the last update()
 
     # --- Tap CRUD ---
 
-    def add(self, name: str, url: str, branch: str = "main") -> Path:
-        """Clone a tap repo. Returns the tap directory."""
+    @traced("tap.add")
+    def add(self, name: str, url: str, branch: str = "main", shared: bool | None = None) -> Path:
+        """Clone a tap repo. Returns the tap directory.
+
+        With ``shared`` (default: the ``shared_objects`` config key) the clone
+        borrows its objects from the shared store in the cellar cache instead
+        of keeping its own copy.
+        """
         import git
 
         tap_dir = self.cellar.tap_dir(name)
         if tap_dir.exists():
             raise FileExistsError(f"Tap '{name}' already exists at {tap_dir}")
 
-        git.Repo.clone_from(url, tap_dir, branch=branch, depth=1)
+        if shared is None:
+            shared = bool(self.cellar.load_config().get("shared_objects", False))
+
+        with span("git.clone", tap=name, shared=shared) as s:
+            try:
+                if shared:
+                    clone_mode = self._clone_shared(name, url, tap_dir, branch)
+                else:
+                    clone_mode = self._clone_sparse(url, tap_dir, branch)
+            except git.GitCommandError as exc:
+                shutil.rmtree(tap_dir, ignore_errors=True)
+                # Only a git too old for --sparse/--filter falls back; a shared
+                # clone was asked for explicitly, so its failures are reported
+                if shared or "unknown option" not in str(exc.stderr):
+                    raise
+                git.Repo.clone_from(url, tap_dir, branch=branch, depth=1)
+                clone_mode = "full"
+            s.set("mode", clone_mode)
 
         # Register in config
         config = self.cellar.load_config()
         taps = config.setdefault("taps", {})
-        taps[name] = {"url": url, "branch": branch}
+        taps[name] = {"url": url, "branch": branch, "clone": clone_mode}
         if not any(t.get("default") for t in taps.values()):
             taps[name]["default"] = True
         self.cellar.save_config(config)
 
         return tap_dir
 
+    def _clone_sparse(self, url: str, tap_dir: Path, branch: str) -> str:
+        """Blob-less shallow clone with a sparse checkout of TAP_SPARSE_PATHS.
+
+        Returns "partial" when the server honored the blob filter, or "sparse"
+        when it silently fell back to sending all blobs (older servers).
+        """
+        import git
+
+        repo = git.Repo.clone_from(
+            url, tap_dir, branch=branch, depth=1, filter="blob:none", sparse=True
+        )
+        # Blobs outside the cone are never fetched; later pulls keep the same filter
+        repo.git.sparse_checkout("set", "--cone", *TAP_SPARSE_PATHS)
+        with repo.config_reader() as cfg:
+            promisor = cfg.get_value('remote "origin"', "promisor", False)
+        return "partial" if promisor else "sparse"
+
+    # --- Shared object store (git alternates) ---
+
+    def _store(self) -> Path:
+        """Create the shared bare object store on first use."""
+        import git
+
+        store = self.cellar.object_store_dir
+        if not store.exists():
+            git.Repo.init(store, bare=True)
+        return store
+
+    def _store_fetch(self, name: str, url: str, src: str, ref: str) -> str:
+        """Fetch ``src`` (a branch ref or commit SHA) from ``url`` into the store.
+
+        Like a sparse clone the fetch is blob-less, and shallow when the store
+        has no ``ref`` yet; later fetches stop at the commits it already has,
+        so the old and new tip stay connected. The blobs the sparse cone
+        needs are then fetched in one batch, so taps check them out through
+        their alternates. Returns the SHA ``ref`` now points at.
+        """
+        import git
+
+        store = git.Repo(self._store())
+        # One promisor remote per tap: fetches by SHA and lazy blob fetches go there
+        with store.config_writer() as cfg:
+            cfg.set_value(f'remote "{name}"', "url", url)
+        args = ["--no-tags", "--filter=blob:none"]
+        try:
+            store.git.rev_parse("--verify", "--quiet", ref)
+        except git.GitCommandError:
+            args.append("--depth=1")
+        store.git.fetch(*args, name, f"+{src}:{ref}")
+        self._store_fetch_blobs(store, name, ref)
+        return store.git.rev_parse(ref)
+
+    def _store_fetch_blobs(self, store, name: str, ref: str) -> None:
+        """Fetch the blobs of ``ref`` inside the sparse cone that the store lacks."""
+        wanted = set()
+        for entry in store.git.ls_tree("-r", "-z", ref).split("\0"):
+            if not entry:
+                continue
+            meta, path = entry.split("\t", 1)
+            _, kind, oid = meta.split()
+            if kind == "blob" and ("/" not in path or path.split("/")[0] in TAP_SPARSE_PATHS):
+                wanted.add(oid)
+        listing = store.git.rev_list("--objects", "--no-walk", "--missing=print", ref)
+        missing = {line[1:] for line in listing.splitlines() if line.startswith("?")}
+        oids = sorted(wanted & missing)
+        if not oids:
+            return
+        with tempfile.TemporaryFile() as refspecs:
+            refspecs.write("".join(f"{oid}\n" for oid in oids).encode())
+            refspecs.seek(0)
+            # noop negotiation: the server sends just these blobs
+            store.git(c="fetch.negotiationAlgorithm=noop").fetch(
+                "--no-tags",
+                "--no-write-fetch-head",
+                "--filter=blob:none",
+                "--stdin",
+                name,
+                istream=refspecs,
+            )
+
+    def _store_checkout_ref(self, repo, sha: str, ref: str) -> None:
+        """Point ``ref`` in a shared tap at a store commit, sharing its shallow boundary."""
+        store_shallow = self.cellar.object_store_dir / "shallow"
+        if store_shallow.exists():
+            shallow = Path(repo.git_dir) / "shallow"
+            boundary = set(shallow.read_text().split()) if shallow.exists() else set()
+            boundary |= set(store_shallow.read_text().split())
+            shallow.write_text("".join(f"{oid}\n" for oid in sorted(boundary)))
+        repo.git.update_ref(ref, sha)
+
+    def _uses_store(self, tap_dir: Path) -> bool:
+        alternates = tap_dir / ".git" / "objects" / "info" / "alternates"
+        if not alternates.exists():
+            return False
+        store_objects = str(self.cellar.object_store_dir / "objects")
+        return store_objects in alternates.read_text().splitlines()
+
+    def _clone_shared(self, name: str, url: str, tap_dir: Path, branch: str) -> str:
+        """Clone a tap whose object database borrows from the shared store."""
+        import git
+
+        sha = self._store_fetch(name, url, f"refs/heads/{branch}", f"refs/taps/{name}/{branch}")
+        store = self.cellar.object_store_dir
+
+        repo = git.Repo.init(tap_dir, initial_branch=branch)
+        info = tap_dir / ".git" / "objects" / "info"
+        info.mkdir(parents=True, exist_ok=True)
+        (info / "alternates").write_text(f"{store / 'objects'}\n")
+
+        repo.create_remote("origin", url)
+        with repo.config_writer() as cfg:
+            # Same filter as the store: blobs outside the cone are fetched on demand
+            cfg.set_value("core", "repositoryformatversion", 1)
+            cfg.set_value("extensions", "partialClone", "origin")
+            cfg.set_value('remote "origin"', "promisor", True)
+            cfg.set_value('remote "origin"', "partialclonefilter", "blob:none")
+        repo.git.sparse_checkout("set", "--cone", *TAP_SPARSE_PATHS)
+        # Every object is already reachable through the alternate: nothing is copied
+        self._store_checkout_ref(repo, sha, f"refs/remotes/origin/{branch}")
+        repo.git.checkout("-B", branch, "--track", f"origin/{branch}")
+        return "shared"
+
+    def _update_shared(self, tap_name: str, repo) -> None:
+        """Pull a shared tap: fetch into the store, then fast-forward from it."""
+        import git
+
+        branch = self.cellar.load_config().get("taps", {}).get(tap_name, {}).get("branch")
+        branch = branch or repo.active_branch.name
+        sha = self._store_fetch(
+            tap_name,
+            repo.remotes.origin.url,
+            f"refs/heads/{branch}",
+            f"refs/taps/{tap_name}/{branch}",
+        )
+        self._store_checkout_ref(repo, sha, f"refs/remotes/origin/{branch}")
+        try:
+            repo.git.merge("--ff-only", f"origin/{branch}")
+        except git.GitCommandError:
+            repo.remotes.origin.pull()  # Local commits: fall back to a regular merge
+
+    def fetch_commit(self, name: str, commit: str) -> None:
+        """Make ``commit`` available in a tap, through the store for shared taps."""
+        import git
+
+        tap_dir = self.cellar.tap_dir(name)
+        repo = git.Repo(tap_dir)
+        if self._uses_store(tap_dir):
+            ref = f"refs/taps/{name}/pinned/{commit}"
+            sha = self._store_fetch(name, repo.remotes.origin.url, commit, ref)
+            self._store_checkout_ref(repo, sha, f"refs/neoskills/pinned/{commit}")
+            return
+        # Servers fetch by SHA; a shallow clone stays shallow
+        args = ["origin", commit]
+        if (Path(repo.git_dir) / "shallow").exists():
+            args.insert(0, "--depth=1")
+        repo.git.fetch(*args)
+
+    def gc_object_store(self) -> dict[str, Any]:
+        """Prune store objects that no tap can reach any more.
+
+        Refs of taps that no longer borrow from the store are dropped. For each
+        tap that still does, every ref (branches, remote-tracking refs, tags,
+        stash), HEAD and every commit in its reflogs is fetched into the store
+        first, so nothing the tap can still name is pruned, including commits
+        made inside the tap. Returns the referencing taps and the number of
+        refs dropped.
+        """
+        import git
+
+        store_dir = self.cellar.object_store_dir
+        if not store_dir.exists():
+            return {"referencing": [], "dropped_refs": 0}
+
+        store = git.Repo(store_dir)
+        referencing = [t for t in self.list_taps() if self._uses_store(self.cellar.tap_dir(t))]
+
+        dropped = 0
+        refs = store.git.for_each_ref("--format=%(refname)", "refs/taps/").splitlines()
+        for ref in refs:
+            tap_name = ref.split("/")[2]
+            if tap_name not in referencing:
+                store.git.update_ref("-d", ref)
+                dropped += 1
+            elif ref.startswith(f"refs/taps/{tap_name}/keep/"):
+                store.git.update_ref("-d", ref)  # re-fetched below
+
+        for tap_name in referencing:
+            tap_dir = self.cellar.tap_dir(tap_name)
+            keep = f"refs/taps/{tap_name}/keep"
+            reflog = git.Repo(tap_dir).git.rev_list("--reflog", "--no-walk").split()
+            store.git.fetch(
+                "--no-tags",
+                "--update-shallow",
+                # Reflog entries are not advertised; let the tap serve them by SHA
+                "--upload-pack=git -c uploadpack.allowAnySHA1InWant=true upload-pack",
+                str(tap_dir),
+                f"+refs/*:{keep}/*",
+                f"+HEAD:{keep}/HEAD",
+                *(f"+{sha}:{keep}/reflog/{sha}" for sha in sorted(set(reflog))),
+            )
+
+        # Blob-less packs lack full closure, so a bitmap index cannot be written
+        store.git(c="repack.writeBitmaps=false").gc("--quiet", "--prune=now")
+        return {"referencing": referencing, "dropped_refs": dropped}
+
     def remove(self, name: str) -> bool:
         """Remove a tap repo and unregister it."""
         tap_dir = self.cellar.tap_dir(name)
@@ -43,17 +313,34 @@ class TapManager:
             return False
 
         shutil.rmtree(tap_dir)
+        Catalog(self.cellar).drop(name)
+
+        store_dir = self.cellar.object_store_dir
+        if store_dir.exists():
+            # Objects stay until gc_object_store(); only the tap's refs go now
+            import git
+
+            store = git.Repo(store_dir)
+            for ref in store.git.for_each_ref("--format=%(refname)", f"refs/taps/{name}/").split():
+                store.git.update_ref("-d", ref)
 
         config = self.cellar.load_config()
         config.get("taps", {}).pop(name, None)
         self.cellar.save_config(config)
         return True
 
+    @traced("tap.update")
     def update(self, name: str | None = None) -> list[str]:
-        """Git pull one or all taps. Returns list of updated tap names."""
+        """Git pull one or all taps. Returns list of updated tap names.
+
+        Each pull's ChangeSet (skills added, modified or removed between the
+        old and new HEAD) is published to the catalog and change listeners,
+        and kept in ``self.last_changes``.
+        """
         import git
 
         updated = []
+        self.last_changes = {}
         taps = self.list_taps() if name is None else [name]
 
         for tap_name in taps:
@@ -62,17 +349,80 @@ class TapManager:
                 continue
             try:
                 repo = git.Repo(tap_dir)
-                origin = repo.remotes.origin
-                info = origin.pull()
-                if info and info[0].flags != info[0].HEAD_UPTODATE:
-                    updated.append(tap_name)
-                else:
-                    updated.append(tap_name)  # still counts as "checked"
+                old = repo.head.commit.hexsha if repo.head.is_valid() else ""
+                with span("git.pull", tap=tap_name):
+                    if self._uses_store(tap_dir):
+                        self._update_shared(tap_name, repo)
+                    else:
+                        # Partial/sparse clones keep their filter and cone on pull
+                        repo.remotes.origin.pull()
+                changes = ChangeSet.between(tap_name, repo, old, repo.head.commit.hexsha)
             except Exception:
-                pass  # skip taps with git issues
+                continue  # skip taps with git issues (unborn HEAD, failed pull or diff)
+            updated.append(tap_name)  # pulled or already up to date
+
+            with span("tap.reindex", tap=tap_name) as s:
+                self.last_changes[tap_name] = changes
+                publish(self.cellar, changes)
+                s.set("changed", len(changes.changed | changes.removed))
 
         return updated
 
+    # --- Publishing ---
+
+    @traced("tap.pending_changes")
+    def pending_changes(self, name: str) -> PendingChanges:
+        """Changed paths under TAP_PUSH_PATHS, from one pathspec-limited git status.
+
+        Status reuses git's index stat cache (and the untracked cache), so
+        only the published paths are scanned and unchanged files are not read.
+        """
+        import git
+
+        repo = git.Repo(self.cellar.tap_dir(name))
+        output = repo.git(c="core.untrackedCache=true").status(
+            "--porcelain", "-z", "-uall", "--", *TAP_PUSH_PATHS
+        )
+        pending = PendingChanges(name)
+        entries = []
+        tokens = iter(output.split("\0"))
+        for token in tokens:
+            if not token:
+                continue
+            code, path = token[:2], token[3:]
+            if code[0] in "RC":
+                source = next(tokens, "")
+                entries.append(("D" if code[0] == "R" else "M", source))
+                entries.append(("A", path))
+            elif code == "??" or "A" in code:
+                entries.append(("A", path))
+            elif "D" in code:
+                entries.append(("D", path))
+            else:
+                entries.append(("M", path))
+
+        pending.paths = sorted({path for _, path in entries})
+        pending.changes = ChangeSet.from_paths(name, entries)
+        pending.other = [p for p in pending.paths if not p.startswith("skills/")]
+        return pending
+
+    @traced("tap.commit")
+    def commit_pending(self, pending: PendingChanges, message: str | None = None) -> str:
+        """Stage exactly the pending paths in one index update and commit. Returns the SHA."""
+        import git
+
+        repo = git.Repo(self.cellar.tap_dir(pending.tap))
+        pathspec_file = Path(repo.git_dir) / "NEOSKILLS_PUSH_PATHS"
+        pathspec_file.write_text("\0".join(pending.paths))
+        try:
+            repo.git(literal_pathspecs=True).add(
+                "-A", f"--pathspec-from-file={pathspec_file}", "--pathspec-file-nul"
+            )
+        finally:
+            pathspec_file.unlink(missing_ok=True)
+        repo.git.commit("-q", "-m", message or pending.commit_message())
+        return repo.head.commit.hexsha
+
     # --- Query ---
 
     def list_taps(self) -> list[str]:
@@ -85,24 +435,33 @@ class TapManager:
             if d.is_dir() and not d.name.startswith(".")
         )
 
+    def tap_origin(self, name: str) -> tuple[str, str]:
+        """(url, branch) a tap was added from, per config or its origin remote."""
+        entry = self.cellar.load_config().get("taps", {}).get(name, {})
+        url, branch = entry.get("url", ""), entry.get("branch", "main")
+        if not url:
+            import git
+
+            try:
+                url = git.Repo(self.cellar.tap_dir(name)).remotes.origin.url
+            except (git.InvalidGitRepositoryError, git.NoSuchPathError, AttributeError):
+                url = ""
+        return url, branch
+
+    @traced("tap.list_skills")
     def list_skills(self, tap_name: str | None = None) -> list[dict[str, Any]]:
-        """List all skills in a tap (or default tap). Returns list of SkillSpec-like dicts."""
+        """List all skills in a tap (or default tap). Returns list of SkillSpec-like dicts.
+
+        Frontmatter comes from the tap's Catalog, so only SKILL.md files that
+        changed since the last listing are parsed.
+        """
         tap_name = tap_name or self.cellar.default_tap
         skills_dir = self.cellar.tap_skills_dir(tap_name)
-        if not skills_dir.exists():
-            return []
-
         results = []
-        for skill_dir in sorted(skills_dir.iterdir()):
-            if not skill_dir.is_dir():
-                continue
-            skill_md = skill_dir / "SKILL.md"
-            if not skill_md.exists():
-                continue
-            fm, _ = parse_frontmatter(skill_md.read_text())
+        for skill_id, fm in Catalog(self.cellar).fields(tap_name).items():
             results.append({
-                "skill_id": skill_dir.name,
-                "name": fm.get("name", skill_dir.name),
+                "skill_id": skill_id,
+                "name": fm.get("name", skill_id),
                 "description": fm.get("description", ""),
                 "version": fm.get("version", ""),
                 "author": fm.get("author", ""),
@@ -110,7 +469,7 @@ class TapManager:
                 "targets": fm.get("targets", []),
                 "source": fm.get("source", tap_name),
                 "tap": tap_name,
-                "path": skill_dir,
+                "path": skills_dir / skill_id,
             })
         return results
 
@@ -0,0 +1,222 @@
+"""Tap bundles - pack a tap into one archive and provision it offline.
+
+A bundle is a tar.xz (or zip) holding the tap's tap.yaml, skills/ and
+plugins/ trees. Its first member is ``neoskills-bundle.json``: the tap's
+origin (url, branch, commit), its precomputed catalog and per-skill
+checksums. Unpacking streams the archive straight to disk and seeds the
+Catalog from the manifest, so the first ``list`` parses nothing.
+"""
+
+import io
+import json
+import os
+import shutil
+import tarfile
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from neoskills.core.catalog import Catalog
+from neoskills.core.cellar import Cellar
+from neoskills.core.checksum import DigestCache, GitSkillIndex, checksum_tree, skill_checksum
+from neoskills.core.tap import TAP_SPARSE_PATHS, TapManager
+
+BUNDLE_MANIFEST = "neoskills-bundle.json"
+BUNDLE_VERSION = 1
+BUNDLE_FORMATS = ("tar.xz", "zip")
+
+
+@dataclass
+class UnpackResult:
+    tap_name: str
+    tap_dir: Path
+    skills: int
+    files: int
+    manifest: dict[str, Any]
+
+
+def bundle_format(path: Path) -> str:
+    """Archive format of a bundle, from its name."""
+    return "zip" if path.name.endswith(".zip") else "tar.xz"
+
+
+def _bundle_files(tap_dir: Path) -> list[tuple[str, Path]]:
+    """(archive name, path) for every file that belongs in a bundle."""
+    files = []
+    if (tap_dir / "tap.yaml").is_file():
+        files.append(("tap.yaml", tap_dir / "tap.yaml"))
+    for top in TAP_SPARSE_PATHS:
+        for dirpath, dirnames, filenames in os.walk(tap_dir / top):
+            dirnames[:] = sorted(d for d in dirnames if d not in (".git", "__pycache__"))
+            base = Path(dirpath)
+            for name in sorted(filenames):
+                path = base / name
+                files.append((path.relative_to(tap_dir).as_posix(), path))
+    return files
+
+
+def build_manifest(cellar: Cellar, tap_name: str) -> dict[str, Any]:
+    """Origin, catalog and checksums for a tap, as embedded in its bundle."""
+    tap_dir = cellar.tap_dir(tap_name)
+    url, branch = TapManager(cellar).tap_origin(tap_name)
+    index = GitSkillIndex.load(tap_dir)
+    cache = DigestCache(cellar.cache_dir / "digests.json")
+    catalog = Catalog(cellar).fields(tap_name)
+    checksums = {}
+    for skill_id in catalog:
+        found = skill_checksum(cellar.tap_skills_dir(tap_name) / skill_id, index, cache)
+        checksums[skill_id] = {"digest": found.digest, "provider": found.provider}
+    cache.save()
+    return {
+        "version": BUNDLE_VERSION,
+        "tap": tap_name,
+        "url": url,
+        "branch": branch,
+        "commit": index.commit,
+        "created": int(time.time()),
+        "catalog": catalog,
+        "checksums": checksums,
+    }
+
+
+def pack_tap(cellar: Cellar, tap_name: str, out: Path, fmt: str | None = None) -> Path:
+    """Write a bundle of a tap to ``out`` (format from ``fmt`` or the file name)."""
+    tap_dir = cellar.tap_dir(tap_name)
+    if not tap_dir.is_dir():
+        raise FileNotFoundError(f"Tap '{tap_name}' not found at {tap_dir}")
+    fmt = fmt or bundle_format(out)
+    if fmt not in BUNDLE_FORMATS:
+        raise ValueError(f"Unknown bundle format '{fmt}' (expected one of {BUNDLE_FORMATS})")
+
+    manifest = json.dumps(build_manifest(cellar, tap_name), indent=1).encode("utf-8")
+    files = _bundle_files(tap_dir)
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    if fmt == "zip":
+        with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(BUNDLE_MANIFEST, manifest)
+            for arcname, path in files:
+                zf.write(path, arcname)
+    else:
+        with tarfile.open(out, "w:xz") as tf:
+            info = tarfile.TarInfo(BUNDLE_MANIFEST)
+            info.size = len(manifest)
+            info.mtime = int(time.time())
+            tf.addfile(info, io.BytesIO(manifest))
+            for arcname, path in files:
+                tf.add(path, arcname, recursive=False)
+    return out
+
+
+def read_manifest(bundle: Path) -> dict[str, Any]:
+    """Read a bundle's manifest without extracting anything else."""
+    if bundle_format(bundle) == "zip":
+        with zipfile.ZipFile(bundle) as zf:
+            return json.loads(zf.read(BUNDLE_MANIFEST))
+    with tarfile.open(bundle, "r|xz") as tf:
+        return _tar_manifest(tf, bundle)
+
+
+def _check_name(value: Any, what: str) -> str:
+    """Return ``value`` if it is a single, plain path component; raise ValueError otherwise."""
+    if (
+        not isinstance(value, str)
+        or value in ("", ".", "..")
+        or value.startswith(".")
+        or any(sep in value for sep in ("/", "\\", "\0"))
+    ):
+        raise ValueError(f"Invalid {what} {value!r} in bundle: must be a single path component")
+    return value
+
+
+def _check_manifest(manifest: dict[str, Any], name: str | None) -> str:
+    """Validate the names a manifest turns into paths. Returns the tap name."""
+    if manifest.get("version") != BUNDLE_VERSION:
+        raise ValueError(f"Unsupported bundle version: {manifest.get('version')}")
+    for skill_id in [*manifest.get("checksums", {}), *manifest.get("catalog", {})]:
+        _check_name(skill_id, "skill id")
+    return _check_name(name or manifest.get("tap"), "tap name")
+
+
+def _tar_manifest(tf: tarfile.TarFile, bundle: Path) -> dict[str, Any]:
+    first = tf.next()
+    if first is None or first.name != BUNDLE_MANIFEST:
+        raise ValueError(f"{bundle} is not a neoskills bundle (no leading {BUNDLE_MANIFEST})")
+    return json.loads(tf.extractfile(first).read())
+
+
+def unpack_tap(
+    cellar: Cellar, bundle: Path, name: str | None = None, verify: bool = False
+) -> UnpackResult:
+    """Provision a tap from a bundle and register it. Returns what was unpacked.
+
+    The archive is read in a single streaming pass (tar members are written
+    as they are decompressed). The tap name and skill ids in the manifest
+    must be plain path components, and are checked before anything is
+    extracted. With ``verify`` every skill is re-hashed and compared to the
+    manifest checksums.
+    """
+    staging = cellar.taps_dir / f".unpack-{os.getpid()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    try:
+        if bundle_format(bundle) == "zip":
+            with zipfile.ZipFile(bundle) as zf:
+                manifest = json.loads(zf.read(BUNDLE_MANIFEST))
+                tap_name = _check_manifest(manifest, name)
+                files = 0
+                for info in zf.infolist():
+                    if info.filename == BUNDLE_MANIFEST:
+                        continue
+                    # zipfile sanitizes member paths; chmod the path it wrote
+                    path = zf.extract(info, staging)
+                    if not info.is_dir():
+                        files += 1
+                        if (info.external_attr >> 16) & 0o111:
+                            os.chmod(path, 0o755)
+        else:
+            with tarfile.open(bundle, "r|xz") as tf:
+                manifest = _tar_manifest(tf, bundle)
+                tap_name = _check_manifest(manifest, name)
+                files = 0
+                for member in tf:  # re-yields the manifest member first
+                    if member.name == BUNDLE_MANIFEST:
+                        continue
+                    tf.extract(member, staging, filter="data")
+                    files += member.isfile()
+
+        tap_dir = cellar.tap_dir(tap_name)
+        if tap_dir.exists():
+            raise FileExistsError(f"Tap '{tap_name}' already exists at {tap_dir}")
+        staging.rename(tap_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    if verify:
+        cache = DigestCache()
+        bad = sorted(
+            sid
+            for sid, expected in manifest["checksums"].items()
+            if checksum_tree(cellar.tap_skills_dir(tap_name) / sid, cache) != expected["digest"]
+        )
+        if bad:
+            shutil.rmtree(tap_dir)
+            raise ValueError(f"Bundle checksum mismatch for: {', '.join(bad)}")
+
+    Catalog(cellar).seed(tap_name, manifest["catalog"])
+
+    config = cellar.load_config()
+    taps = config.setdefault("taps", {})
+    taps[tap_name] = {
+        "url": manifest.get("url", ""),
+        "branch": manifest.get("branch", "main"),
+        "clone": "bundle",
+        "commit": manifest.get("commit", ""),
+    }
+    if not any(t.get("default") for t in taps.values()):
+        taps[tap_name]["default"] = True
+    cellar.save_config(config)
+
+    return UnpackResult(tap_name, tap_dir, len(manifest["catalog"]), files, manifest)
@@ -0,0 +1,330 @@
+"""Tracing - lightweight spans with attributes and monotonic timings.
+
+    with span("tap.update", tap=name) as s:
+        ...
+        s.set("changed", len(changes))
+
+    @traced("linker.link")
+    def link(...): ...
+
+Tracing is off unless an entry point configures it: the CLI from
+``neoskills --trace PATH`` (or NEOSKILLS_TRACE=PATH, NEOSKILLS_TRACE_FORMAT=
+jsonl|otlp), other entry points such as the plugin runtime through
+configure_from_env(). Importing this module never starts a tracer. While off,
+span() returns a shared no-op and traced() adds one global check per call.
+
+Finished spans are buffered and appended to PATH on shutdown (and every
+FLUSH_EVERY spans): "jsonl" writes one span per line, "otlp" writes one
+OTLP/JSON ExportTraceServiceRequest per flush, the OpenTelemetry file
+exporter format. Parents are tracked per thread/context with contextvars,
+so spans started on worker threads are roots. ``neoskills trace summarize``
+aggregates either format into per-span latency percentiles.
+"""
+
+import atexit
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Self
+
+TRACE_ENV = "NEOSKILLS_TRACE"
+TRACE_FORMAT_ENV = "NEOSKILLS_TRACE_FORMAT"
+FORMATS = ("jsonl", "otlp")
+FLUSH_EVERY = 1000
+
+
+@dataclass
+class SpanRecord:
+    """A finished span."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str
+    start_ns: int  # wall clock (time.time_ns)
+    duration_ns: int  # monotonic (perf_counter_ns)
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str = ""
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> bool:
+        return False
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+_current: ContextVar["Span | None"] = ContextVar("neoskills_span", default=None)
+
+
+class Span:
+    """An active span; use as a context manager."""
+
+    __slots__ = (
+        "_start",
+        "_token",
+        "attributes",
+        "name",
+        "parent_id",
+        "span_id",
+        "start_ns",
+        "tracer",
+    )
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = ""
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def __enter__(self) -> Self:
+        parent = _current.get()
+        self.parent_id = parent.span_id if parent is not None else ""
+        self._token = _current.set(self)
+        self.start_ns = time.time_ns()
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: object
+    ) -> bool:
+        duration = time.perf_counter_ns() - self._start
+        _current.reset(self._token)
+        error = f"{exc_type.__name__}: {exc}" if exc_type is not None else ""
+        self.tracer.record(
+            SpanRecord(
+                self.name,
+                self.tracer.trace_id,
+                self.span_id,
+                self.parent_id,
+                self.start_ns,
+                duration,
+                self.attributes,
+                error,
+            )
+        )
+        return False
+
+
+class Tracer:
+    """Buffers finished spans and appends them to a trace file."""
+
+    def __init__(self, path: str | Path, fmt: str = "jsonl"):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown trace format: {fmt}. Use one of: {', '.join(FORMATS)}")
+        self.path = Path(path)
+        self.fmt = fmt
+        self.trace_id = secrets.token_hex(16)
+        self._spans: list[SpanRecord] = []
+        self._lock = threading.Lock()
+
+    def record(self, record: SpanRecord) -> None:
+        with self._lock:
+            self._spans.append(record)
+            full = len(self._spans) >= FLUSH_EVERY
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        # Write under the lock too: concurrent flushes append whole batches, in order
+        with self._lock:
+            spans, self._spans = self._spans, []
+            if not spans:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.fmt == "otlp":
+                lines = [json.dumps(to_otlp(spans), separators=(",", ":"))]
+            else:
+                lines = [json.dumps(asdict(s), default=str, separators=(",", ":")) for s in spans]
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+
+_tracer: Tracer | None = None
+
+
+def span(name: str, **attributes: Any) -> Span | _NoopSpan:
+    """A span named ``name`` (a no-op when tracing is off)."""
+    if _tracer is None:
+        return _NOOP
+    return Span(_tracer, name, attributes)
+
+
+def traced[F: Callable[..., Any]](name: str) -> Callable[[F], F]:
+    """Decorator: run each call of the function inside span(name)."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with Span(_tracer, name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def current_span() -> Span | _NoopSpan:
+    """The innermost active span, for adding attributes from nested code."""
+    return _current.get() or _NOOP
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def configure(path: str | Path, fmt: str = "jsonl") -> Tracer:
+    """Start recording spans to ``path`` (replacing any active tracer)."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.flush()
+    _tracer = Tracer(path, fmt)
+    return _tracer
+
+
+def shutdown() -> None:
+    """Flush buffered spans and turn tracing off."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.flush()
+        _tracer = None
+
+
+def configure_from_env() -> Tracer | None:
+    """Configure from NEOSKILLS_TRACE(_FORMAT); for entry points other than the CLI."""
+    path = os.environ.get(TRACE_ENV, "")
+    if not path or path.lower() in ("0", "false", "no"):
+        return None
+    return configure(path, os.environ.get(TRACE_FORMAT_ENV, "jsonl") or "jsonl")
+
+
+atexit.register(shutdown)
+
+
+# --- OTLP/JSON ---
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: Iterable[SpanRecord]) -> dict[str, Any]:
+    """An OTLP/JSON ExportTraceServiceRequest holding ``spans``."""
+    out = []
+    for s in spans:
+        otlp: dict[str, Any] = {
+            "traceId": s.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.start_ns + s.duration_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in s.attributes.items()],
+            "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+        }
+        if s.parent_id:
+            otlp["parentSpanId"] = s.parent_id
+        out.append(otlp)
+    from neoskills import __version__
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": "neoskills"}}]
+                },
+                "scopeSpans": [
+                    {"scope": {"name": "neoskills", "version": __version__}, "spans": out}
+                ],
+            }
+        ]
+    }
+
+
+# --- Reading and summarizing ---
+
+
+def read_spans(path: str | Path) -> list[tuple[str, int]]:
+    """(name, duration_ns) of every span in a jsonl or OTLP/JSON trace file."""
+    spans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            if "resourceSpans" not in data:
+                spans.append((data["name"], int(data["duration_ns"])))
+                continue
+            for resource in data["resourceSpans"]:
+                for scope in resource.get("scopeSpans", []):
+                    for s in scope.get("spans", []):
+                        duration = int(s["endTimeUnixNano"]) - int(s["startTimeUnixNano"])
+                        spans.append((s["name"], duration))
+    return spans
+
+
+@dataclass
+class SpanStats:
+    name: str
+    count: int
+    total_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+def _percentile(sorted_values: list[int], pct: float) -> int:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, -(-len(sorted_values) * pct // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(spans: Iterable[tuple[str, int]]) -> list[SpanStats]:
+    """Per-name latency stats, slowest total first."""
+    by_name: dict[str, list[int]] = {}
+    for name, duration in spans:
+        by_name.setdefault(name, []).append(duration)
+    stats = []
+    for name, durations in by_name.items():
+        durations.sort()
+        stats.append(
+            SpanStats(
+                name,
+                len(durations),
+                sum(durations) / 1e6,
+                _percentile(durations, 50) / 1e6,
+                _percentile(durations, 90) / 1e6,
+                _percentile(durations, 99) / 1e6,
+                durations[-1] / 1e6,
+            )
+        )
+    stats.sort(key=lambda s: s.total_ms, reverse=True)
+    return stats
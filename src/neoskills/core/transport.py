@@ -0,0 +1,458 @@
+"""Delta-sync transport - rsync-style directory sync for TransportType.RSYNC targets.
+
+Works on any destination path, including NFS/sshfs mounts standing in for a
+remote agent home. Both sides keep a per-file manifest (size, mtime, sha256);
+only files whose hash differs are transferred. For large files the
+destination manifest also records rsync-style block signatures (a rolling
+weak checksum and an md5 per block) of the content last written there, so a
+changed file is diffed against the destination copy without reading it back.
+The rolling checksum matches blocks at any offset, so content shifted by an
+insertion is still reused; when the delta would write as much as the whole
+file, the file is copied whole instead. SyncStats counts the bytes actually
+read from and written to the destination.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from itertools import accumulate
+from pathlib import Path
+
+MANIFEST_NAME = ".neoskills-manifest.json"
+
+BLOCK_SIZE = 4096
+DELTA_MIN_SIZE = 64 * 1024  # Smaller changed files are sent whole
+
+_MOD = 1 << 16
+_RECORD_SIZE = 20  # one block signature: 4-byte weak checksum + 16-byte md5
+_NO_COPY_RANGE = (errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL, errno.EBADF)
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """Manifest record for one file."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    blocks: str = ""  # block_signatures() of the content, destination manifests only
+
+
+Manifest = dict[str, FileEntry]
+
+
+@dataclass
+class SyncStats:
+    """Outcome of one sync run."""
+
+    files_total: int = 0
+    files_unchanged: int = 0
+    files_copied: int = 0  # sent whole (new or small)
+    files_delta: int = 0  # only changed blocks rewritten
+    files_deleted: int = 0
+    bytes_total: int = 0  # size of the source tree (= cost of a full copy)
+    bytes_read: int = 0  # block signatures read from the destination manifest
+    bytes_written: int = 0  # bytes written to the destination
+    bytes_reused: int = 0  # matched blocks copied within the destination
+    changed: list[str] = field(default_factory=list)
+
+    @property
+    def bytes_moved(self) -> int:
+        """Destination I/O of the sync: what crosses the wire on a remote mount."""
+        return self.bytes_read + self.bytes_written
+
+    def merge(self, other: "SyncStats") -> None:
+        for name in (
+            "files_total",
+            "files_unchanged",
+            "files_copied",
+            "files_delta",
+            "files_deleted",
+            "bytes_total",
+            "bytes_read",
+            "bytes_written",
+            "bytes_reused",
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.changed.extend(other.changed)
+
+
+# --- Manifests ---
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def build_manifest(
+    root: Path, previous: Manifest | None = None, overrides: dict[str, Path] | None = None
+) -> Manifest:
+    """Stat every file under root; hash only files whose size/mtime changed.
+
+    ``previous`` supplies known hashes; an entry is reused when its size and
+    mtime still match, so an unchanged tree costs one stat per file.
+    ``overrides`` maps relative paths to files that stand in for them, e.g.
+    a translated SKILL.md.
+    """
+    previous = previous or {}
+    overrides = overrides or {}
+    manifest: Manifest = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d != ".git")
+        base = Path(dirpath)
+        for name in sorted(filenames):
+            if name == MANIFEST_NAME:
+                continue
+            path = base / name
+            rel = path.relative_to(root).as_posix()
+            path = overrides.get(rel, path)
+            st = path.stat()
+            known = previous.get(rel)
+            if known and known.size == st.st_size and known.mtime_ns == st.st_mtime_ns:
+                manifest[rel] = known
+            else:
+                manifest[rel] = FileEntry(st.st_size, st.st_mtime_ns, _sha256_file(path))
+    return manifest
+
+
+def load_manifest(path: Path) -> tuple[str, Manifest]:
+    """Load a manifest file. Returns (recorded source, entries)."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return "", {}
+    files = {rel: FileEntry(*entry) for rel, entry in data.get("files", {}).items()}
+    return data.get("source", ""), files
+
+
+def save_manifest(path: Path, manifest: Manifest, source: str = "") -> None:
+    data = {
+        "source": source,
+        "files": {
+            rel: [e.size, e.mtime_ns, e.sha256, *([e.blocks] if e.blocks else [])]
+            for rel, e in manifest.items()
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, separators=(",", ":")))
+
+
+# --- Rolling-checksum block diff ---
+
+
+def _weak(block: bytes) -> tuple[int, int]:
+    """Adler-style weak checksum of a block, returned as (a, b)."""
+    a = sum(block) % _MOD
+    b = sum(accumulate(block)) % _MOD
+    return a, b
+
+
+def _strong(block: bytes) -> bytes:
+    return hashlib.md5(block, usedforsecurity=False).digest()
+
+
+def block_signatures(data: bytes, block_size: int = BLOCK_SIZE) -> str:
+    """Encoded weak and strong checksums of each block of ``data``.
+
+    The result is stored with the file's destination manifest entry, so a
+    later sync can diff against the destination copy without reading it.
+    """
+    records = []
+    for offset in range(0, len(data), block_size):
+        block = data[offset : offset + block_size]
+        a, b = _weak(block)
+        records.append((a | (b << 16)).to_bytes(4, "big") + _strong(block))
+    return f"{block_size}:{b''.join(records).hex()}"
+
+
+def _signature_table(encoded: str) -> tuple[int, dict[int, list[tuple[bytes, int]]]]:
+    """Decode block_signatures() into (block size, weak -> [(strong digest, block index)])."""
+    size, _, hexdata = encoded.partition(":")
+    raw = bytes.fromhex(hexdata)
+    table: dict[int, list[tuple[bytes, int]]] = {}
+    for idx, offset in enumerate(range(0, len(raw), _RECORD_SIZE)):
+        weak = int.from_bytes(raw[offset : offset + 4], "big")
+        table.setdefault(weak, []).append((raw[offset + 4 : offset + _RECORD_SIZE], idx))
+    return int(size), table
+
+
+def compute_delta(
+    signatures: dict[int, list[tuple[bytes, int]]],
+    data: bytes,
+    block_size: int = BLOCK_SIZE,
+    max_literal: int | None = None,
+) -> list[int | bytes] | None:
+    """Express ``data`` as block references into the basis plus literal bytes.
+
+    Returns a list of ops: an ``int`` copies that basis block, ``bytes`` is
+    literal data. The window rolls one byte at a time on a miss, so content
+    shifted by insertions or deletions is still matched. Returns None as
+    soon as the literal bytes reach ``max_literal``.
+    """
+    ops: list[int | bytes] = []
+    n = len(data)
+    limit = n + 1 if max_literal is None else max_literal
+    literal = 0  # literal bytes already emitted
+    literal_start = 0
+    i = 0
+    a = b = 0
+    fresh = True
+
+    while i + block_size <= n:
+        if literal + i - literal_start >= limit:
+            return None
+        if fresh:
+            a, b = _weak(data[i : i + block_size])
+            fresh = False
+        candidates = signatures.get(a | (b << 16))
+        if candidates:
+            strong = _strong(data[i : i + block_size])
+            match = next((idx for digest, idx in candidates if digest == strong), None)
+            if match is not None:
+                if literal_start < i:
+                    ops.append(data[literal_start:i])
+                    literal += i - literal_start
+                ops.append(match)
+                i += block_size
+                literal_start = i
+                fresh = True
+                continue
+        # Roll the window forward by one byte
+        out_byte = data[i]
+        if i + block_size < n:
+            in_byte = data[i + block_size]
+            a = (a - out_byte + in_byte) % _MOD
+            b = (b - block_size * out_byte + a) % _MOD
+        i += 1
+
+    # The trailing partial block of the basis can only match an identical tail
+    tail = data[i:]
+    if tail:
+        a, b = _weak(tail)
+        candidates = signatures.get(a | (b << 16), [])
+        strong = _strong(tail)
+        match = next((idx for digest, idx in candidates if digest == strong), None)
+        if match is not None:
+            if literal_start < i:
+                ops.append(data[literal_start:i])
+                literal += i - literal_start
+            ops.append(match)
+            literal_start = n
+    literal += n - literal_start
+    if literal >= limit:
+        return None
+    if literal_start < n:
+        ops.append(data[literal_start:])
+    return ops
+
+
+def _copy_range(src_fd: int, dst_fd: int, src_offset: int, dst_offset: int, length: int) -> bool:
+    """Copy a byte range between two files inside the kernel. False if unsupported.
+
+    On NFS 4.2 and SMB mounts this is a server-side copy, so the bytes never
+    cross the wire.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+    done = 0
+    while done < length:
+        try:
+            copied = os.copy_file_range(
+                src_fd, dst_fd, length - done, src_offset + done, dst_offset + done
+            )
+        except OSError as exc:
+            if exc.errno not in _NO_COPY_RANGE:
+                raise
+            return False
+        if copied == 0:
+            return False
+        done += copied
+    return True
+
+
+def write_changed_blocks(path: Path, new: bytes, signatures: str) -> tuple[int, int] | None:
+    """Turn ``path`` into ``new`` given block_signatures() of its current content.
+
+    Returns (bytes written, bytes reused), or None, leaving the file alone,
+    when the delta would write as many bytes as a whole copy. If every
+    matched block is still at its own offset (in-place edits, appends) only
+    the literal ranges are written. Otherwise (content was inserted or
+    removed) the file is rebuilt next to ``path``: matched blocks are copied
+    from the old file with copy_file_range() and reused, literals are
+    written. Where that is unsupported a matched block is written from
+    ``new`` instead, so a delta never writes more than the file's size.
+    """
+    block_size, table = _signature_table(signatures)
+    ops = compute_delta(table, new, block_size, max_literal=len(new))
+    if ops is None:
+        return None
+    old_size = path.stat().st_size
+    plan = []  # (offset in new, basis offset or None for literal, length)
+    offset = 0
+    for op in ops:
+        if isinstance(op, int):
+            length = min(block_size, old_size - op * block_size)
+            plan.append((offset, op * block_size, length))
+        else:
+            length = len(op)
+            plan.append((offset, None, length))
+        offset += length
+
+    written = reused = 0
+    if all(basis is None or basis == at for at, basis, _ in plan):
+        with open(path, "r+b") as f:
+            for at, basis, length in plan:
+                if basis is None:
+                    f.seek(at)
+                    f.write(new[at : at + length])
+                    written += length
+            f.truncate(len(new))
+        return written, reused
+
+    tmp = path.with_name(f".{path.name}.neoskills-tmp")
+    try:
+        with open(path, "rb") as old, open(tmp, "wb") as out:
+            for at, basis, length in plan:
+                if basis is not None and _copy_range(old.fileno(), out.fileno(), basis, at, length):
+                    reused += length
+                else:
+                    os.pwrite(out.fileno(), new[at : at + length], at)
+                    written += length
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return written, reused
+
+
+# --- Directory sync ---
+
+
+class DeltaSync:
+    """Synchronizes a source directory into a destination directory.
+
+    The destination manifest is stored inside the destination as
+    ``.neoskills-manifest.json`` so any host mounting the directory sees it.
+    Source manifests are cached under ``cache_dir`` when one is given.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        block_size: int = BLOCK_SIZE,
+        delta_threshold: int = DELTA_MIN_SIZE,
+    ):
+        self.cache_dir = cache_dir
+        self.block_size = block_size
+        self.delta_threshold = delta_threshold
+
+    def _source_cache(self, source: Path) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256(str(source.resolve()).encode("utf-8")).hexdigest()[:24]
+        return self.cache_dir / f"{key}.json"
+
+    def sync(
+        self,
+        source: Path,
+        dest: Path,
+        delete: bool = True,
+        overrides: dict[str, Path] | None = None,
+    ) -> SyncStats:
+        """Make ``dest`` mirror ``source``, moving as few bytes as possible.
+
+        ``overrides`` maps paths relative to ``source`` to files whose content
+        is deployed in their place (see build_manifest).
+        """
+        stats = SyncStats()
+        overrides = overrides or {}
+        src_cache = self._source_cache(source)
+        src_manifest = build_manifest(
+            source, load_manifest(src_cache)[1] if src_cache else None, overrides
+        )
+        if src_cache:
+            save_manifest(src_cache, src_manifest, str(source))
+
+        dest.mkdir(parents=True, exist_ok=True)
+        dest_manifest_file = dest / MANIFEST_NAME
+        _, recorded = load_manifest(dest_manifest_file)
+        dest_manifest = build_manifest(dest, recorded)
+
+        for rel, entry in src_manifest.items():
+            stats.files_total += 1
+            stats.bytes_total += entry.size
+            have = dest_manifest.get(rel)
+            if have and have.sha256 == entry.sha256:
+                stats.files_unchanged += 1
+                continue
+            src = overrides.get(rel, source / rel)
+            blocks = self._transfer(src, dest / rel, entry, have, stats)
+            stats.changed.append(rel)
+            st = (dest / rel).stat()
+            dest_manifest[rel] = FileEntry(st.st_size, st.st_mtime_ns, entry.sha256, blocks)
+
+        if delete:
+            for rel in sorted(set(dest_manifest) - set(src_manifest), reverse=True):
+                (dest / rel).unlink(missing_ok=True)
+                dest_manifest.pop(rel)
+                stats.files_deleted += 1
+            _prune_empty_dirs(dest)
+
+        save_manifest(dest_manifest_file, dest_manifest, str(source))
+        return stats
+
+    def _transfer(
+        self, src: Path, dst: Path, entry: FileEntry, have: FileEntry | None, stats: SyncStats
+    ) -> str:
+        """Bring ``dst`` up to date with ``src``. Returns the new block signatures, if any."""
+        data = src.read_bytes()
+        delta = None
+        if have and have.blocks and dst.is_file() and not dst.is_symlink():
+            stats.bytes_read += len(have.blocks)
+            delta = write_changed_blocks(dst, data, have.blocks)
+        if delta is not None:
+            stats.bytes_written += delta[0]
+            stats.bytes_reused += delta[1]
+            stats.files_delta += 1
+        else:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            if dst.is_symlink() or (dst.exists() and not dst.is_file()):
+                _remove(dst)
+            dst.write_bytes(data)
+            stats.bytes_written += len(data)
+            stats.files_copied += 1
+        shutil.copymode(src, dst)
+        os.utime(dst, ns=(entry.mtime_ns, entry.mtime_ns))
+        return block_signatures(data, self.block_size) if entry.size >= self.delta_threshold else ""
+
+
+def is_synced_dir(path: Path) -> bool:
+    """True if ``path`` is a directory maintained by DeltaSync."""
+    return not path.is_symlink() and (path / MANIFEST_NAME).is_file()
+
+
+def synced_source(path: Path) -> str:
+    """The source directory recorded in a synced directory's manifest."""
+    return load_manifest(path / MANIFEST_NAME)[0]
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+
+def _prune_empty_dirs(root: Path) -> None:
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        if Path(dirpath) != root and not os.listdir(dirpath):
+            try:
+                os.rmdir(dirpath)
+            except OSError:
+                pass
@@ -0,0 +1,387 @@
+"""Skill validation - pluggable rules, run in parallel, cached by skill checksum.
+
+Each Rule inspects one skill and returns Findings. The Validator runs the
+rule set over a tap's skills on a thread pool and caches each skill's
+findings in cache/validate/<tap>.json under a key made of the skill's
+checksum (git tree for clean committed skills, content and exec bits
+otherwise) and the rule set's names and versions. An unchanged tap
+revalidates with no file reads; only edited skills are re-checked.
+"""
+
+import hashlib
+import json
+import os
+import re
+import stat
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, ClassVar
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.changeset import ChangeSet
+from neoskills.core.checksum import DigestCache, GitSkillIndex, iter_intrinsic_files
+from neoskills.core.frontmatter import parse_frontmatter
+
+VALIDATE_CACHE_VERSION = 1
+
+MAX_FILE_BYTES = 512 * 1024
+
+
+@dataclass
+class Finding:
+    rule: str
+    severity: str  # "error" or "warning"
+    message: str
+    path: str = ""  # relative to the skill directory
+
+
+@dataclass
+class SkillContext:
+    """One skill as seen by the rules; files and frontmatter are read lazily."""
+
+    skill_id: str
+    skill_dir: Path
+
+    @cached_property
+    def files(self) -> list[tuple[str, str, os.stat_result]]:
+        """Intrinsic files as (relative posix path, absolute path, stat)."""
+        return iter_intrinsic_files(self.skill_dir)
+
+    @cached_property
+    def skill_md(self) -> str | None:
+        try:
+            return (self.skill_dir / "SKILL.md").read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    @cached_property
+    def parsed(self) -> tuple[dict[str, Any], str]:
+        fm, body = parse_frontmatter(self.skill_md or "")
+        return (fm if isinstance(fm, dict) else {}), body
+
+
+class Rule(ABC):
+    """A validation check over one skill.
+
+    Rules must be pure functions of the skill's files so results can be
+    cached by checksum. Bump ``version`` whenever a rule's findings change.
+    """
+
+    name: str = ""
+    version: str = "1"
+    severity: str = "error"
+
+    @abstractmethod
+    def check(self, ctx: SkillContext) -> list[Finding]:
+        """Return the findings for one skill (empty when it passes)."""
+
+    def finding(self, message: str, path: str = "") -> Finding:
+        return Finding(self.name, self.severity, message, path)
+
+
+# --- Built-in rules ---
+
+
+class FrontmatterRule(Rule):
+    """SKILL.md exists and its frontmatter has the expected fields and types."""
+
+    name = "frontmatter"
+
+    REQUIRED = ("name", "description")
+    TYPES: ClassVar[dict[str, type | tuple[type, ...]]] = {
+        "name": str,
+        "description": str,
+        "version": (str, int, float),
+        "author": str,
+        "tags": list,
+        "targets": list,
+    }
+
+    def check(self, ctx: SkillContext) -> list[Finding]:
+        if ctx.skill_md is None:
+            return [self.finding("SKILL.md is missing or unreadable", "SKILL.md")]
+        fm, _ = ctx.parsed
+        if not fm:
+            return [self.finding("no YAML frontmatter", "SKILL.md")]
+        findings = []
+        for key in self.REQUIRED:
+            if not fm.get(key):
+                findings.append(self.finding(f"missing '{key}'", "SKILL.md"))
+        for key, expected in self.TYPES.items():
+            if fm.get(key) is not None and not isinstance(fm[key], expected):
+                findings.append(
+                    self.finding(f"'{key}' has type {type(fm[key]).__name__}", "SKILL.md")
+                )
+        return findings
+
+
+class NameMatchRule(Rule):
+    """Frontmatter name matches the skill directory name."""
+
+    name = "name-mismatch"
+    severity = "warning"
+
+    def check(self, ctx: SkillContext) -> list[Finding]:
+        name = ctx.parsed[0].get("name")
+        if isinstance(name, str) and name and name != ctx.skill_id:
+            return [self.finding(f"name '{name}' does not match directory '{ctx.skill_id}'")]
+        return []
+
+
+class RelativeLinksRule(Rule):
+    """Relative markdown links in SKILL.md point at files inside the skill."""
+
+    name = "broken-links"
+
+    _LINK = re.compile(r"!?\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+\"[^\"]*\")?\s*\)")
+    _CODE = re.compile(r"```.*?```|`[^`\n]*`", re.DOTALL)
+
+    def check(self, ctx: SkillContext) -> list[Finding]:
+        body = ctx.parsed[1]
+        findings = []
+        root = ctx.skill_dir.resolve()
+        for target in self._LINK.findall(self._CODE.sub("", body)):
+            if "://" in target or target.startswith(("#", "mailto:", "/")):
+                continue
+            rel = target.split("#", 1)[0].split("?", 1)[0]
+            if not rel:
+                continue
+            resolved = (ctx.skill_dir / rel).resolve()
+            if not resolved.is_relative_to(root):
+                findings.append(self.finding(f"link leaves the skill: {target}", "SKILL.md"))
+            elif not resolved.exists():
+                findings.append(self.finding(f"broken link: {target}", "SKILL.md"))
+        return findings
+
+
+class FileSizeRule(Rule):
+    """No file in the skill exceeds max_bytes."""
+
+    name = "oversized"
+    severity = "warning"
+
+    def __init__(self, max_bytes: int = MAX_FILE_BYTES):
+        self.max_bytes = max_bytes
+        self.version = f"1:{max_bytes}"
+
+    def check(self, ctx: SkillContext) -> list[Finding]:
+        return [
+            self.finding(f"{st.st_size} bytes (limit {self.max_bytes})", rel)
+            for rel, _, st in ctx.files
+            if st.st_size > self.max_bytes
+        ]
+
+
+class ScriptExecRule(Rule):
+    """Files with a shebang under scripts/ are executable."""
+
+    name = "script-exec"
+
+    def check(self, ctx: SkillContext) -> list[Finding]:
+        findings = []
+        for rel, path, st in ctx.files:
+            if not rel.startswith("scripts/") or st.st_mode & stat.S_IXUSR:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    shebang = f.read(2) == b"#!"
+            except OSError:
+                continue
+            if shebang:
+                findings.append(self.finding("script is not executable", rel))
+        return findings
+
+    @staticmethod
+    def fix(ctx: SkillContext, finding: Finding) -> None:
+        path = ctx.skill_dir / finding.path
+        path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+def default_rules() -> list[Rule]:
+    return [
+        FrontmatterRule(),
+        NameMatchRule(),
+        RelativeLinksRule(),
+        FileSizeRule(),
+        ScriptExecRule(),
+    ]
+
+
+# --- Cache and runner ---
+
+
+def ruleset_key(rules: list[Rule]) -> str:
+    """Identity of a rule set: changes whenever a rule is added, removed or bumped."""
+    chain = "\n".join(f"{r.name}@{r.version}" for r in rules)
+    return hashlib.sha256(chain.encode("utf-8")).hexdigest()[:16]
+
+
+def content_key(skill_dir: Path, cache: DigestCache) -> str:
+    """Checksum of a skill's files including exec bits (for uncommitted skills)."""
+    h = hashlib.sha256()
+    for rel, path, st in iter_intrinsic_files(skill_dir):
+        mode = "x" if st.st_mode & stat.S_IXUSR else "-"
+        h.update(f"{rel}\0{cache.digest(path, st)}\0{mode}\n".encode())
+    return h.hexdigest()
+
+
+@dataclass
+class SkillValidation:
+    skill_id: str
+    findings: list[Finding] = field(default_factory=list)
+    cached: bool = False
+
+    @property
+    def errors(self) -> int:
+        return sum(1 for f in self.findings if f.severity == "error")
+
+
+@dataclass
+class ValidationReport:
+    tap: str
+    skills: list[SkillValidation] = field(default_factory=list)
+
+    @property
+    def errors(self) -> int:
+        return sum(s.errors for s in self.skills)
+
+    @property
+    def warnings(self) -> int:
+        return sum(len(s.findings) - s.errors for s in self.skills)
+
+    @property
+    def checked(self) -> int:
+        """Skills whose rules actually ran (not served from cache)."""
+        return sum(1 for s in self.skills if not s.cached)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "tap": self.tap,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "checked": self.checked,
+            "skills": {
+                s.skill_id: [asdict(f) for f in s.findings] for s in self.skills if s.findings
+            },
+        }
+
+
+class Validator:
+    """Runs a rule set over the skills of a tap, reusing cached results."""
+
+    def __init__(
+        self,
+        cellar: Cellar,
+        rules: list[Rule] | None = None,
+        use_cache: bool = True,
+        max_workers: int | None = None,
+    ):
+        self.cellar = cellar
+        self.rules = rules if rules is not None else default_rules()
+        self.use_cache = use_cache
+        self.max_workers = max_workers
+        self.ruleset = ruleset_key(self.rules)
+
+    def cache_path(self, tap_name: str) -> Path:
+        return self.cellar.cache_dir / "validate" / f"{tap_name}.json"
+
+    def _load_cache(self, tap_name: str) -> dict[str, dict[str, Any]]:
+        if not self.use_cache:
+            return {}
+        try:
+            data = json.loads(self.cache_path(tap_name).read_text())
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != VALIDATE_CACHE_VERSION or data.get("ruleset") != self.ruleset:
+            return {}
+        return data.get("skills", {})
+
+    def _save_cache(self, tap_name: str, entries: dict[str, dict[str, Any]]) -> None:
+        path = self.cache_path(tap_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        payload = {"version": VALIDATE_CACHE_VERSION, "ruleset": self.ruleset, "skills": entries}
+        tmp.write_text(json.dumps(payload, separators=(",", ":")))
+        tmp.replace(path)
+
+    def apply_changes(self, changes: ChangeSet) -> int:
+        """Drop cached results of the skills in a change set. Returns the number dropped."""
+        entries = self._load_cache(changes.tap)
+        stale = [sid for sid in changes.changed | changes.removed if sid in entries]
+        for skill_id in stale:
+            del entries[skill_id]
+        if stale:
+            self._save_cache(changes.tap, entries)
+        return len(stale)
+
+    def check_skill(self, skill_id: str, skill_dir: Path) -> list[Finding]:
+        """Run every rule over one skill (uncached)."""
+        ctx = SkillContext(skill_id, skill_dir)
+        findings = []
+        for rule in self.rules:
+            findings.extend(rule.check(ctx))
+        return findings
+
+    def validate_tap(
+        self, tap_name: str, skill_ids: list[str] | None = None, fix: bool = False
+    ) -> ValidationReport:
+        """Validate a tap's skills (or just ``skill_ids``).
+
+        With ``fix``, findings whose rule has a ``fix`` method are repaired
+        and the skill is re-checked.
+        """
+        skills_dir = self.cellar.tap_skills_dir(tap_name)
+        report = ValidationReport(tap_name)
+        if not skills_dir.is_dir():
+            return report
+        on_disk = sorted(d.name for d in os.scandir(skills_dir) if d.is_dir())
+        if skill_ids is None:
+            present = on_disk
+        else:
+            known = set(on_disk)
+            present = [sid for sid in skill_ids if sid in known]
+
+        index = GitSkillIndex.load(self.cellar.tap_dir(tap_name))
+        digests = DigestCache(self.cellar.cache_dir / "digests.json")
+        cached = self._load_cache(tap_name)
+        fixers = {r.name: r for r in self.rules if hasattr(r, "fix")}
+
+        def validate(skill_id: str) -> tuple[SkillValidation, str]:
+            skill_dir = skills_dir / skill_id
+            found = index.checksum(skill_id)
+            # The tree SHA covers file modes too, which script-exec depends on.
+            # It is only used when the files the rules see are exactly the
+            # tree: skills with untracked or ignored files get no git checksum
+            key = f"tree:{found.tree}" if found else content_key(skill_dir, digests)
+            entry = cached.get(skill_id)
+            if entry is not None and entry["key"] == key:
+                findings = [Finding(**f) for f in entry["findings"]]
+                return SkillValidation(skill_id, findings, cached=True), key
+            findings = self.check_skill(skill_id, skill_dir)
+            if fix and any(f.rule in fixers for f in findings):
+                ctx = SkillContext(skill_id, skill_dir)
+                for f in findings:
+                    if f.rule in fixers:
+                        fixers[f.rule].fix(ctx, f)
+                findings = self.check_skill(skill_id, skill_dir)
+                key = content_key(skill_dir, digests)
+            return SkillValidation(skill_id, findings), key
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(validate, present))
+
+        # Keep entries for skills not validated this time; drop deleted skills
+        entries = {sid: cached[sid] for sid in on_disk if sid in cached}
+        for result, key in results:
+            report.skills.append(result)
+            entries[result.skill_id] = {
+                "key": key,
+                "findings": [asdict(f) for f in result.findings],
+            }
+        if self.use_cache and (report.checked or len(entries) != len(cached)):
+            self._save_cache(tap_name, entries)
+        digests.save()
+        return report
@@ -3,6 +3,7 @@
 from typing import Any
 
 from neoskills.core.auth import AuthResolver
+from neoskills.core.tracing import span, traced
 
 ENHANCE_OPERATIONS = {
     "normalize": "Normalize this skill to follow best practices: add proper YAML frontmatter "
@@ -28,6 +29,7 @@ class Enhancer:
     def available(self) -> bool:
         return self.auth.mode != "disabled"
 
+    @traced("enhancer.enhance")
     def enhance(
         self,
         content: str,
@@ -62,11 +64,12 @@ class Enhancer:
 
     def _call_llm(self, prompt: str) -> str:
         """Call Claude via API key or SDK."""
-        if self.auth.mode == "api_key":
-            return self._call_via_api(prompt)
-        elif self.auth.mode == "sdk":
-            return self._call_via_sdk(prompt)
-        raise RuntimeError("No LLM backend available")
+        with span("llm.call", backend=self.auth.mode, prompt_chars=len(prompt)):
+            if self.auth.mode == "api_key":
+                return self._call_via_api(prompt)
+            elif self.auth.mode == "sdk":
+                return self._call_via_sdk(prompt)
+            raise RuntimeError("No LLM backend available")
 
     def _call_via_api(self, prompt: str) -> str:
         """Call Claude via Anthropic API."""
@@ -3,17 +3,25 @@
 These tools are exposed via the MCP protocol so Claude Code can invoke
 neoskills operations directly as tool calls. In plugin mode, results
 are namespace-qualified to avoid collisions with host agent skills.
+Set NEOSKILLS_PROFILE to profile each tool call (see core.profiling), and
+NEOSKILLS_TRACE to record their spans (see core.tracing).
 """
 
+from neoskills.core import tracing
 from neoskills.core.cellar import Cellar
 from neoskills.core.linker import Linker
 from neoskills.core.mode import detect_mode
 from neoskills.core.namespace import NamespaceManager
+from neoskills.core.profiling import profiled
 from neoskills.core.tap import TapManager
 
 _ns = NamespaceManager(mode=detect_mode())
 
+# This module is the plugin runtime's entry point; the CLI reads --trace instead
+tracing.configure_from_env()
 
+
+@profiled
 def neoskills_list(query: str = "") -> dict:
     """List skills in taps, optionally filtered by query.
 
@@ -57,6 +65,7 @@ def neoskills_list(query: str = "") -> dict:
     }
 
 
+@profiled
 def neoskills_scan(target: str | None = None) -> dict:
     """Scan a target for linked skills.
 
@@ -80,6 +89,7 @@ def neoskills_scan(target: str | None = None) -> dict:
     }
 
 
+@profiled
 def neoskills_deploy(skill_id: str, target: str | None = None) -> dict:
     """Link a skill from the default tap to a target.
 
@@ -108,6 +118,7 @@ def neoskills_deploy(skill_id: str, target: str | None = None) -> dict:
     }
 
 
+@profiled
 def neoskills_enhance(skill_id: str, operation: str = "audit") -> dict:
     """Enhance a skill using Claude.
 
@@ -144,6 +155,7 @@ def neoskills_enhance(skill_id: str, operation: str = "audit") -> dict:
         return {"error": str(e)}
 
 
+@profiled
 def neoskills_capabilities() -> dict:
     """List available capability groups in the current execution mode.
 
@@ -0,0 +1,20 @@
+"""Base translator ABC - one step of a per-target translation pipeline."""
+
+from abc import ABC, abstractmethod
+
+from neoskills.core.models import Target
+
+
+class Translator(ABC):
+    """Rewrites skill content for a target agent (frontmatter, tool names, ...).
+
+    Translators must be pure functions of (content, target) so their output can
+    be cached. Bump ``version`` whenever the output for the same input changes.
+    """
+
+    name: str = ""
+    version: str = "1"
+
+    @abstractmethod
+    def translate(self, content: str, target: Target) -> str:
+        """Return the translated content."""
@@ -0,0 +1,126 @@
+"""Translation pipeline - adapter.translate() plus pluggable translators, cached."""
+
+import hashlib
+from pathlib import Path
+
+from neoskills.adapters.base import BaseAdapter
+from neoskills.core.cellar import Cellar
+from neoskills.core.checksum import checksum_string
+from neoskills.core.frontmatter import parse_frontmatter
+from neoskills.core.models import Skill, SkillMetadata, Target
+from neoskills.translators.base import Translator
+
+
+def load_skill(skill_id: str, skill_dir: Path) -> Skill:
+    """A Skill for the SKILL.md of a tap skill directory."""
+    content = (skill_dir / "SKILL.md").read_text(encoding="utf-8")
+    meta, _ = parse_frontmatter(content)
+    if not isinstance(meta, dict):
+        meta = {}
+    metadata = SkillMetadata(
+        name=str(meta.get("name") or skill_id),
+        description=str(meta.get("description") or ""),
+    )
+    return Skill(skill_id=skill_id, metadata=metadata, content=content, source_path=skill_dir)
+
+
+class TranslationCache:
+    """Content-addressed store of translated outputs under cache/translations/."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.md"
+
+    def get(self, key: str) -> str | None:
+        try:
+            return self.path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, content: str) -> Path:
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(content, encoding="utf-8")
+        tmp.replace(path)
+        return path
+
+
+class TranslationPipeline:
+    """Runs an adapter's translate() followed by the translators registered for it.
+
+    Outputs are cached by (content checksum, target, adapter translate_version,
+    translator versions), so deploying an unchanged skill to a target does no
+    translation work.
+    """
+
+    def __init__(self, cache: TranslationCache | None = None):
+        self.cache = cache
+        self._translators: dict[str, list[Translator]] = {}
+
+    @classmethod
+    def for_cellar(cls, cellar: Cellar) -> "TranslationPipeline":
+        return cls(TranslationCache(cellar.cache_dir / "translations"))
+
+    # --- Registry ---
+
+    def register(self, agent_type: str, translator: Translator) -> None:
+        """Append a translator to the pipeline for an agent type."""
+        self._translators.setdefault(agent_type, []).append(translator)
+
+    def translators_for(self, agent_type: str) -> list[Translator]:
+        return list(self._translators.get(agent_type, []))
+
+    # --- Translation ---
+
+    def cache_key(self, skill: Skill, adapter: BaseAdapter, target: Target) -> str:
+        """Content address of a translated variant.
+
+        The source is identified by the checksum of the content being
+        translated, never by ``skill.checksum``, which may describe a whole
+        skill tree or be stale.
+        """
+        chain = [f"{adapter.agent_type}@{adapter.translate_version}"]
+        chain += [
+            f"{t.name or type(t).__name__}@{t.version}"
+            for t in self.translators_for(adapter.agent_type)
+        ]
+        key = "\n".join([checksum_string(skill.content), target.target_id, *chain])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _run(self, skill: Skill, adapter: BaseAdapter, target: Target) -> str:
+        content = adapter.translate(skill, target)
+        for translator in self.translators_for(adapter.agent_type):
+            content = translator.translate(content, target)
+        return content
+
+    def translate(self, skill: Skill, adapter: BaseAdapter, target: Target) -> str:
+        """Translate a skill for a target, reusing a cached variant when possible."""
+        if self.cache is None:
+            return self._run(skill, adapter, target)
+        key = self.cache_key(skill, adapter, target)
+        cached = self.cache.get(key)
+        if cached is None:
+            cached = self._run(skill, adapter, target)
+            self.cache.put(key, cached)
+        return cached
+
+    def translated_file(self, skill: Skill, adapter: BaseAdapter, target: Target) -> Path:
+        """The cache file holding a skill's translation for a target, translated on a miss.
+
+        An existing entry is never rewritten, so its mtime stays put and a
+        DeltaSync of an unchanged skill sees an unchanged file.
+        """
+        if self.cache is None:
+            raise ValueError("translated_file() needs a pipeline with a TranslationCache")
+        key = self.cache_key(skill, adapter, target)
+        path = self.cache.path(key)
+        if not path.is_file():
+            path = self.cache.put(key, self._run(skill, adapter, target))
+        return path
+
+    def deploy(self, skill: Skill, adapter: BaseAdapter, target: Target) -> Path:
+        """Translate (cached) and install a skill to a target. Returns installed path."""
+        return adapter.install(target, skill.skill_id, self.translate(skill, adapter, target))
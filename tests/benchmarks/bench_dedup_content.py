@@ -0,0 +1,68 @@
+"""Benchmark: skill-dedup content similarity (shingling + winnowing) on N skills.
+
+Generates a synthetic tap (tests.benchmarks.synth) in which a share of skills
+are near-copies of earlier ones under new IDs, scans it with the dedup
+script's find_skills, then times the content-similarity stage and reports how
+many near-copies it found.
+
+Run with:  python -m tests.benchmarks.bench_dedup_content [--skills 20000]
+"""
+
+import argparse
+import importlib.util
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from tests.benchmarks.synth import TapSpec, generate_tap
+
+_DEDUP_SCAN = (
+    Path(__file__).resolve().parents[2] / "skills" / "skill-dedup" / "scripts" / "dedup_scan.py"
+)
+
+
+def _load_dedup():
+    spec = importlib.util.spec_from_file_location("dedup_scan", _DEDUP_SCAN)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills", type=int, default=20000)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.05)
+    args = parser.parse_args()
+
+    dedup = _load_dedup()
+    with tempfile.TemporaryDirectory() as tmp:
+        tap = Path(tmp) / "tap"
+        spec = TapSpec(skills=args.skills, duplicate_ratio=args.duplicate_ratio, body_words=200)
+        _, generate_s = _timed(lambda: generate_tap(tap, spec))
+        skills, scan_s = _timed(lambda: dedup.find_skills(tap / "skills"))
+        pairs, content_s = _timed(lambda: dedup.content_similar_pairs(skills))
+
+    print(
+        json.dumps(
+            {
+                "skills": len(skills),
+                "generate_s": round(generate_s, 2),
+                "scan_s": round(scan_s, 2),
+                "content_similar_s": round(content_s, 3),
+                "pairs_found": len(pairs),
+                "near_copies_expected": round(args.skills * args.duplicate_ratio),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
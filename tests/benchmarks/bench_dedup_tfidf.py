@@ -0,0 +1,48 @@
+"""Benchmark: skill-dedup TF-IDF top-k neighbors on N skills.
+
+Generates a synthetic tap (tests.benchmarks.synth), scans it with the dedup
+script's find_skills, then times tfidf_neighbors in NumPy mode and, with
+--python, in the pure-Python fallback (quadratic in practice on the
+synthetic vocabulary, so keep N small for it).
+
+Run with:  python -m tests.benchmarks.bench_dedup_tfidf [--skills 10000] [--python]
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from neoskills.core import similarity
+from tests.benchmarks.bench_dedup_content import _load_dedup, _timed
+from tests.benchmarks.synth import TapSpec, generate_tap
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills", type=int, default=10000)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--python", action="store_true", help="Also time the pure-Python path")
+    args = parser.parse_args()
+
+    dedup = _load_dedup()
+    with tempfile.TemporaryDirectory() as tmp:
+        tap = Path(tmp) / "tap"
+        _, generate_s = _timed(lambda: generate_tap(tap, TapSpec(skills=args.skills)))
+        skills, scan_s = _timed(lambda: dedup.find_skills(tap / "skills"))
+
+    found = None
+    result = {"skills": len(skills), "generate_s": round(generate_s, 2), "scan_s": round(scan_s, 2)}
+    if similarity.np is not None:
+        found, numpy_s = _timed(lambda: dedup.tfidf_neighbors(skills, args.k, use_numpy=True))
+        result["tfidf_numpy_s"] = round(numpy_s, 2)
+    if args.python:
+        found, python_s = _timed(lambda: dedup.tfidf_neighbors(skills, args.k, use_numpy=False))
+        result["tfidf_python_s"] = round(python_s, 2)
+    if found is not None:
+        result["neighbors"] = sum(len(f) for f in found)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
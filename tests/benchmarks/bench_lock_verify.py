@@ -0,0 +1,80 @@
+"""Benchmark: `neoskills verify` against a lock of N skills.
+
+Builds a git tap with N skills (plus a non-git tap of the same size), links
+them all, writes the lock, then times verification of the unchanged tree:
+cold (empty digest cache) and warm.
+
+Run with:  python -m tests.benchmarks.bench_lock_verify [--skills 5000]
+"""
+
+import argparse
+import json
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.linker import Linker
+from neoskills.core.lockfile import generate_lock, verify_lock
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@neoskills.invalid", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _make_tap(skills_dir: Path, prefix: str, n: int) -> None:
+    for i in range(n):
+        d = skills_dir / f"{prefix}-{i:05d}"
+        (d / "scripts").mkdir(parents=True)
+        (d / "SKILL.md").write_text(f"---\nname: {prefix}-{i:05d}\n---\n\n# Skill {i}\n")
+        (d / "scripts" / "run.sh").write_text(f"echo {i}\n")
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        cellar = Cellar(root / ".neoskills")
+        cellar.initialize()
+        config = cellar.load_config()
+        config["targets"] = {"bench": {"skill_path": str(root / "agent" / "skills")}}
+        config["default_target"] = "bench"
+        cellar.save_config(config)
+
+        report = {"skills": args.skills}
+        for tap, is_git in (("gitTap", True), ("plainTap", False)):
+            _make_tap(cellar.tap_skills_dir(tap), tap.lower(), args.skills)
+            if is_git:
+                _git(cellar.tap_dir(tap), "init", "-q", "-b", "main")
+                _git(cellar.tap_dir(tap), "add", "-A")
+                _git(cellar.tap_dir(tap), "commit", "-q", "-m", "bench")
+            Linker(cellar).link_all(cellar.tap_skills_dir(tap))
+            (lock, _), lock_s = _timed(lambda: generate_lock(cellar))
+            results, verify_s = _timed(lambda lock=lock: verify_lock(cellar, lock))
+            assert all(r.status == "ok" for r in results)
+            report[tap] = {
+                "lock_seconds": round(lock_s, 3),
+                "verify_seconds": round(verify_s, 3),
+                "via": sorted({r.via for r in results}),
+            }
+            Linker(cellar).unlink_all()
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
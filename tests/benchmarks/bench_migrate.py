@@ -0,0 +1,86 @@
+"""Benchmark: v0.2 → v0.3 migration of a bank of N skills.
+
+Generates a synthetic tap (tests.benchmarks.synth) and rearranges it into the
+v0.2 bank layout (LTM/bank/skills/<id>/canonical/ with metadata.yaml and
+provenance.yaml), then times `neoskills migrate` on it, and a rerun that
+resumes from the journal.
+
+Run with:  python -m tests.benchmarks.bench_migrate [--skills 10000] [--jobs 8]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from neoskills.cli.main import cli
+from tests.benchmarks.synth import TapSpec, generate_tap
+
+
+def build_bank(root: Path, spec: TapSpec) -> list[str]:
+    """Write a v0.2 bank of ``spec.skills`` skills under ``root``."""
+    staging = root / "staging"
+    ids = generate_tap(staging, spec)
+    bank = root / "LTM" / "bank" / "skills"
+    bank.mkdir(parents=True)
+    for sid in ids:
+        skill_dir = bank / sid
+        skill_dir.mkdir()
+        (staging / "skills" / sid).rename(skill_dir / "canonical")
+        (skill_dir / "metadata.yaml").write_text(
+            f"version: 0.2.0\nauthor: bench\ntags: [{sid}]\nformat: canonical\n"
+        )
+        (skill_dir / "provenance.yaml").write_text("source_type: local\n")
+    (root / "config.yaml").write_text("version: 0.2.0\ndefault_target: bench-user\n")
+    return ids
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills", type=int, default=10000)
+    parser.add_argument("--jobs", type=int, default=None)
+    args = parser.parse_args()
+
+    runner = CliRunner()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "ws"
+        _, generate_s = _timed(lambda: build_bank(root, TapSpec(skills=args.skills)))
+        config = (root / "config.yaml").read_text()
+        (root / "config.yaml").write_text(
+            config + f"targets:\n  bench:\n    skill_path: {Path(tmp) / 'target'}\n"
+        )
+        argv = ["migrate", "--root", str(root)]
+        if args.jobs:
+            argv += ["--jobs", str(args.jobs)]
+
+        first, migrate_s = _timed(lambda: runner.invoke(cli, argv))
+        assert first.exit_code == 0, first.output
+        rerun, rerun_s = _timed(lambda: runner.invoke(cli, argv))
+        assert rerun.exit_code == 0, rerun.output
+        migrated = sum(1 for _ in (root / "taps" / "mySkills" / "skills").iterdir())
+
+    print(
+        json.dumps(
+            {
+                "skills": args.skills,
+                "migrated": migrated,
+                "generate_s": round(generate_s, 2),
+                "migrate_s": round(migrate_s, 2),
+                "rerun_s": round(rerun_s, 2),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark: `neoskills push` staging on a large tap with one edited skill.
+
+Builds a git tap with N skills, edits one, and times the two ways of
+preparing the commit:
+- legacy: repo.is_dirty(untracked_files=True), `git add` over the whole
+  skills/ and plugins/ trees, then repo.index.commit();
+- scoped: TapManager.pending_changes() + commit_pending() (one pathspec-limited
+  status, one batched add of the changed paths, `git commit`).
+
+Run with:  python -m tests.benchmarks.bench_push [--skills 10000]
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.tap import TapManager
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@neoskills.invalid", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _make_tap(tap_dir: Path, skills: int) -> None:
+    for i in range(skills):
+        d = tap_dir / "skills" / f"skill-{i:05d}"
+        (d / "scripts").mkdir(parents=True)
+        (d / "SKILL.md").write_text(f"---\nname: skill-{i:05d}\n---\n\n# Skill {i}\n")
+        (d / "scripts" / "run.sh").write_text(f"echo {i}\n")
+    (tap_dir / "plugins").mkdir()
+    (tap_dir / "plugins" / "README.md").write_text("# Plugins\n")
+    (tap_dir / "tap.yaml").write_text("name: bench\n")
+    (tap_dir / "README.md").write_text("# Bench tap\n")
+    _git(tap_dir, "init", "-q", "-b", "main")
+    _git(tap_dir, "config", "user.name", "bench")
+    _git(tap_dir, "config", "user.email", "bench@neoskills.invalid")
+    _git(tap_dir, "add", "-A")
+    _git(tap_dir, "commit", "-q", "-m", "bench tap")
+
+
+def _edit(tap_dir: Path, n: int) -> None:
+    skill_md = tap_dir / "skills" / "skill-00042" / "SKILL.md"
+    skill_md.write_text(skill_md.read_text() + f"\nedit {n}\n")
+
+
+def _legacy(tap_dir: Path) -> None:
+    import git
+
+    repo = git.Repo(tap_dir)
+    assert repo.is_dirty(untracked_files=True)
+    repo.git.add("skills/", "plugins/", "tap.yaml", "README.md")
+    repo.index.commit("Update skills in bench")
+
+
+def _scoped(cellar: Cellar) -> None:
+    mgr = TapManager(cellar)
+    pending = mgr.pending_changes("bench")
+    assert pending.paths == ["skills/skill-00042/SKILL.md"]
+    mgr.commit_pending(pending)
+
+
+def _best_of(runs: int, prepare, fn) -> float:
+    best = float("inf")
+    for n in range(runs):
+        prepare(n)
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cellar = Cellar(Path(tmp) / ".neoskills")
+        cellar.initialize()
+        tap_dir = cellar.tap_dir("bench")
+        _make_tap(tap_dir, args.skills)
+        _git(tap_dir, "status", "--porcelain")  # warm the index stat cache for both sides
+
+        legacy = _best_of(args.runs, lambda n: _edit(tap_dir, n), lambda: _legacy(tap_dir))
+        scoped = _best_of(args.runs, lambda n: _edit(tap_dir, 100 + n), lambda: _scoped(cellar))
+        shutil.rmtree(tap_dir)
+
+    print(
+        json.dumps(
+            {
+                "skills": args.skills,
+                "legacy_seconds": round(legacy, 3),
+                "scoped_seconds": round(scoped, 3),
+                "speedup": round(legacy / scoped, 1),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark: disk use and clone time of related taps with and without the shared store.
+
+Creates an upstream skill collection plus N forks (each with one extra
+commit) as local bare repositories, taps all of them into two workspaces -
+one with per-tap object databases, one sharing objects through alternates -
+and reports total bytes under .git (plus the store) and wall time.
+
+Run with:  python -m tests.benchmarks.bench_tap_alternates [--skills 2000] [--forks 5]
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.tap import TapManager
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@neoskills.invalid", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _disk_usage(path: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            total += os.lstat(os.path.join(dirpath, name)).st_size
+    return total
+
+
+def _make_remotes(root: Path, skills: int, forks: int) -> list[str]:
+    rng = random.Random(11)
+    work = root / "upstream"
+    for i in range(skills):
+        d = work / "skills" / f"skill-{i:05d}"
+        (d / "scripts").mkdir(parents=True)
+        (d / "SKILL.md").write_text(f"---\nname: skill-{i:05d}\n---\n\n# Skill {i}\n")
+        (d / "scripts" / "helper.py").write_text(rng.randbytes(2048).hex())
+    (work / "tap.yaml").write_text("name: upstream\n")
+    _git(work, "init", "-q", "-b", "main")
+    _git(work, "add", "-A")
+    _git(work, "commit", "-q", "-m", "upstream")
+    _git(root, "clone", "-q", "--bare", str(work), str(root / "upstream.git"))
+
+    urls = [(root / "upstream.git").as_uri()]
+    for n in range(forks):
+        fork_work = root / f"fork{n}"
+        _git(root, "clone", "-q", str(root / "upstream.git"), str(fork_work))
+        (fork_work / "skills" / f"fork-{n}").mkdir()
+        (fork_work / "skills" / f"fork-{n}" / "SKILL.md").write_text(f"# Fork {n}\n")
+        _git(fork_work, "add", "-A")
+        _git(fork_work, "commit", "-q", "-m", f"fork {n}")
+        _git(root, "clone", "-q", "--bare", str(fork_work), str(root / f"fork{n}.git"))
+        urls.append((root / f"fork{n}.git").as_uri())
+    return urls
+
+
+def _tap_all(root: Path, urls: list[str], shared: bool) -> tuple[float, int]:
+    cellar = Cellar(root)
+    cellar.initialize()
+    mgr = TapManager(cellar)
+    t0 = time.perf_counter()
+    for i, url in enumerate(urls):
+        mgr.add(f"tap{i}", url, shared=shared)
+    elapsed = time.perf_counter() - t0
+    git_bytes = sum(_disk_usage(cellar.tap_dir(t) / ".git") for t in mgr.list_taps())
+    if cellar.object_store_dir.exists():
+        git_bytes += _disk_usage(cellar.object_store_dir)
+    return elapsed, git_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills", type=int, default=2000)
+    parser.add_argument("--forks", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        urls = _make_remotes(root, args.skills, args.forks)
+        separate_s, separate_bytes = _tap_all(root / "separate", urls, shared=False)
+        shared_s, shared_bytes = _tap_all(root / "shared", urls, shared=True)
+        print(
+            json.dumps(
+                {
+                    "skills": args.skills,
+                    "taps": len(urls),
+                    "separate_s": round(separate_s, 3),
+                    "shared_s": round(shared_s, 3),
+                    "separate_git_bytes": separate_bytes,
+                    "shared_git_bytes": shared_bytes,
+                    "disk_saved_ratio": round(1 - shared_bytes / separate_bytes, 4),
+                },
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark: sparse partial tap clone vs full shallow clone.
+
+Builds a local bare "marketplace" repository with N skills plus bulky docs,
+images and CI assets, then clones it both ways and reports bytes on disk and
+wall time.
+
+Run with:  python -m tests.benchmarks.bench_tap_clone [--skills 2000] [--assets-mb 50]
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.tap import TapManager
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@neoskills.invalid", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _disk_usage(path: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            total += os.lstat(os.path.join(dirpath, name)).st_size
+    return total
+
+
+def _make_remote(root: Path, skills: int, assets_mb: int) -> str:
+    rng = random.Random(7)
+    work = root / "work"
+    for i in range(skills):
+        d = work / "skills" / f"skill-{i:05d}"
+        d.mkdir(parents=True)
+        (d / "SKILL.md").write_text(f"---\nname: skill-{i:05d}\n---\n\n# Skill {i}\n")
+    (work / "plugins").mkdir()
+    (work / "plugins" / "README.md").write_text("# Plugins\n")
+    (work / "tap.yaml").write_text("name: bench\n")
+    for sub in ("docs/images", ".github/assets"):
+        (work / sub).mkdir(parents=True)
+    for i in range(assets_mb):
+        sub = "docs/images" if i % 2 else ".github/assets"
+        (work / sub / f"asset-{i}.bin").write_bytes(rng.randbytes(1 << 20))
+
+    _git(work, "init", "-q", "-b", "main")
+    _git(work, "add", "-A")
+    _git(work, "commit", "-q", "-m", "bench tap")
+    bare = root / "remote.git"
+    _git(root, "clone", "-q", "--bare", str(work), str(bare))
+    _git(bare, "config", "uploadpack.allowFilter", "true")
+    return bare.as_uri()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills", type=int, default=2000)
+    parser.add_argument("--assets-mb", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        url = _make_remote(root, args.skills, args.assets_mb)
+
+        import git
+
+        full_dir = root / "full"
+        t0 = time.perf_counter()
+        git.Repo.clone_from(url, full_dir, branch="main", depth=1)
+        full_s = time.perf_counter() - t0
+
+        cellar = Cellar(root / ".neoskills")
+        cellar.initialize()
+        t0 = time.perf_counter()
+        sparse_dir = TapManager(cellar).add("bench", url)
+        sparse_s = time.perf_counter() - t0
+        mode = cellar.load_config()["taps"]["bench"]["clone"]
+
+        full_bytes, sparse_bytes = _disk_usage(full_dir), _disk_usage(sparse_dir)
+        print(
+            json.dumps(
+                {
+                    "skills": args.skills,
+                    "assets_mb": args.assets_mb,
+                    "clone_mode": mode,
+                    "full_clone_s": round(full_s, 3),
+                    "sparse_clone_s": round(sparse_s, 3),
+                    "full_clone_bytes": full_bytes,
+                    "sparse_clone_bytes": sparse_bytes,
+                    "bytes_saved_ratio": round(1 - sparse_bytes / full_bytes, 4),
+                },
+                indent=2,
+            )
+        )
+        shutil.rmtree(full_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: `neoskills validate` over a tap of N skills.
+
+Builds a git tap and a non-git tap with N skills each, then times a cold
+validation (every rule runs), a warm revalidation of the unchanged tap
+(served from the cache) and a revalidation after editing one skill.
+
+Run with:  python -m tests.benchmarks.bench_validate [--skills 5000]
+"""
+
+import argparse
+import json
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.validate import Validator
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@neoskills.invalid", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _make_tap(skills_dir: Path, prefix: str, n: int) -> None:
+    for i in range(n):
+        d = skills_dir / f"{prefix}-{i:05d}"
+        (d / "scripts").mkdir(parents=True)
+        (d / "SKILL.md").write_text(
+            f"---\nname: {prefix}-{i:05d}\ndescription: Skill {i}\n---\n\n"
+            f"# Skill {i}\n\nRun [the script](scripts/run.sh).\n"
+        )
+        script = d / "scripts" / "run.sh"
+        script.write_text(f"#!/bin/sh\necho {i}\n")
+        script.chmod(0o755)
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--skills", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cellar = Cellar(Path(tmp) / ".neoskills")
+        cellar.initialize()
+
+        report = {"skills": args.skills}
+        for tap, is_git in (("gitTap", True), ("plainTap", False)):
+            _make_tap(cellar.tap_skills_dir(tap), tap.lower(), args.skills)
+            if is_git:
+                _git(cellar.tap_dir(tap), "init", "-q", "-b", "main")
+                _git(cellar.tap_dir(tap), "add", "-A")
+                _git(cellar.tap_dir(tap), "commit", "-q", "-m", "bench")
+
+            cold, cold_s = _timed(lambda t=tap: Validator(cellar).validate_tap(t))
+            warm, warm_s = _timed(lambda t=tap: Validator(cellar).validate_tap(t))
+            edited = cellar.tap_skills_dir(tap) / f"{tap.lower()}-00000" / "SKILL.md"
+            edited.write_text(edited.read_text() + "\nEdited.\n")
+            edit, edit_s = _timed(lambda t=tap: Validator(cellar).validate_tap(t))
+            assert cold.errors == warm.errors == edit.errors == 0
+            report[tap] = {
+                "cold_seconds": round(cold_s, 3),
+                "warm_seconds": round(warm_s, 3),
+                "one_edit_seconds": round(edit_s, 3),
+                "checked": [cold.checked, warm.checked, edit.checked],
+            }
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""Benchmark suite: core commands against synthetic taps at several scales.
+
+For each scale a workspace is built with one synthetic tap (tests.benchmarks
+.synth) and every case is timed --repeat times; the median is reported.
+Results are JSON, written to --out and/or stdout. With --baseline, each case
+is compared to a stored result and the run fails (exit 1) when a case is
+slower than baseline by more than --tolerance (and by more than 5 ms).
+Cases too slow to run in full (quadratic ones) time a fixed sample at every
+scale and also report the sampled fraction and an extrapolated full time.
+
+Run with:
+    python -m tests.benchmarks.suite --scales 1k,10k --out bench.json
+    python -m tests.benchmarks.suite --scales 1k --baseline bench.json
+    python -m tests.benchmarks.suite --scales 50k --cases list,doctor --git
+"""
+
+import argparse
+import functools
+import importlib.util
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from neoskills.cli.main import cli
+from neoskills.core.cellar import Cellar
+from neoskills.core.checksum import DigestCache, tap_checksums
+from neoskills.core.linker import Linker
+from tests.benchmarks.synth import TapSpec, commit_all, generate_tap, skill_id
+
+RESULTS_VERSION = 1
+NOISE_FLOOR_SECONDS = 0.005
+TAP = "mySkills"
+TARGET = "bench"
+NAME_PAIR_BUDGET = 20_000  # "dedup names" compares at most this many pairs (~200 skills)
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_DEDUP_SCAN = _REPO_ROOT / "skills" / "skill-dedup" / "scripts" / "dedup_scan.py"
+
+
+@dataclass
+class BenchEnv:
+    cellar: Cellar
+    skills: int
+    runner: CliRunner = field(default_factory=CliRunner)
+    dedup_skills: list[dict] | None = None  # dedup_scan.find_skills result, scanned once
+    name_sample: list[dict] | None = None  # evenly spaced subset of dedup_skills
+
+    def neoskills(self, *args: str) -> None:
+        result = self.runner.invoke(cli, [*args, "--root", str(self.cellar.root)])
+        if result.exception and not isinstance(result.exception, SystemExit):
+            raise result.exception
+
+    @property
+    def skills_dir(self) -> Path:
+        return self.cellar.tap_skills_dir(TAP)
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable[[BenchEnv], object]
+    setup: Callable[[BenchEnv], object] | None = None  # untimed, before every run
+    # (work timed, full work) for cases that time a sample; the result then
+    # also carries the sampled fraction and the full run's extrapolated time
+    sampled: Callable[[BenchEnv], tuple[int, int]] | None = None
+
+
+def _link_all(env: BenchEnv) -> None:
+    Linker(env.cellar).link_all(env.skills_dir, TARGET)
+
+
+def _unlink_all(env: BenchEnv) -> None:
+    Linker(env.cellar).unlink_all(TARGET)
+
+
+@functools.cache
+def _dedup_scan():
+    spec = importlib.util.spec_from_file_location("dedup_scan", _DEDUP_SCAN)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _scan_skills(env: BenchEnv) -> list[dict]:
+    skills = _dedup_scan().find_skills(env.skills_dir)
+    for s in skills:
+        s["source"] = TAP
+    return skills
+
+
+def _scanned(env: BenchEnv) -> None:
+    if env.dedup_skills is None:
+        env.dedup_skills = _scan_skills(env)
+
+
+def _dedup_exact(env: BenchEnv) -> None:
+    # Scan plus the exact/diverged grouping, without name-similar pairs
+    _dedup_scan().find_duplicates(_scan_skills(env), edges={})
+
+
+def _pairs(n: int) -> int:
+    return n * (n - 1) // 2
+
+
+def _name_sample(env: BenchEnv) -> None:
+    _scanned(env)
+    if env.name_sample is None:
+        skills = env.dedup_skills
+        size = min(len(skills), (1 + math.isqrt(1 + 8 * NAME_PAIR_BUDGET)) // 2)
+        env.name_sample = [skills[i * len(skills) // size] for i in range(size)]
+
+
+def _name_pairs(env: BenchEnv) -> tuple[int, int]:
+    return _pairs(len(env.name_sample)), _pairs(len(env.dedup_skills))
+
+
+def _dedup_names(env: BenchEnv) -> None:
+    _dedup_scan().name_similar_edges(env.name_sample, 0.75)
+
+
+def _dedup_tfidf(env: BenchEnv) -> None:
+    _dedup_scan().tfidf_neighbors(env.dedup_skills, 5)
+
+
+CASES = [
+    Case("list", lambda env: env.neoskills("list", "--available")),
+    Case("search", lambda env: env.neoskills("search", "tag-7")),
+    Case("info", lambda env: env.neoskills("info", skill_id(env.skills // 2))),
+    Case("link --all", lambda env: env.neoskills("link", "--all"), setup=_unlink_all),
+    Case("unlink --all", lambda env: env.neoskills("unlink", "--all"), setup=_link_all),
+    Case("doctor", lambda env: env.neoskills("doctor"), setup=_link_all),
+    Case("checksum", lambda env: tap_checksums(env.cellar.tap_dir(TAP), DigestCache())),
+    Case("dedup exact", _dedup_exact),
+    # A full name-similarity pass runs difflib on every pair (~107 s at 1k);
+    # the dedup script only pays that once, DedupDB recompares changed skills.
+    # Timed on at most NAME_PAIR_BUDGET pairs, extrapolated to the full scale
+    Case("dedup names", _dedup_names, setup=_name_sample, sampled=_name_pairs),
+    Case("dedup tfidf", _dedup_tfidf, setup=_scanned),
+    Case("neoskills dedup", lambda env: env.neoskills("dedup", "--no-plugins")),
+]
+
+
+def parse_scale(text: str) -> int:
+    text = text.strip().lower()
+    if text.endswith("k"):
+        return int(float(text[:-1]) * 1000)
+    return int(text)
+
+
+def build_env(root: Path, skills: int, use_git: bool, seed: int) -> BenchEnv:
+    cellar = Cellar(root / ".neoskills")
+    cellar.initialize()
+    config = cellar.load_config()
+    config["targets"] = {TARGET: {"skill_path": str(root / "agent" / "skills")}}
+    config["default_target"] = TARGET
+    config["default_tap"] = TAP
+    cellar.save_config(config)
+    generate_tap(cellar.tap_dir(TAP), TapSpec(skills=skills, seed=seed))
+    if use_git:
+        commit_all(cellar.tap_dir(TAP))
+    return BenchEnv(cellar, skills)
+
+
+def run_case(env: BenchEnv, case: Case, repeat: int) -> dict:
+    runs = []
+    for _ in range(repeat):
+        if case.setup:
+            case.setup(env)
+        t0 = time.perf_counter()
+        case.run(env)
+        runs.append(time.perf_counter() - t0)
+    result = {
+        "median_s": round(statistics.median(runs), 4),
+        "min_s": round(min(runs), 4),
+        "runs": len(runs),
+    }
+    if case.sampled:
+        done, total = case.sampled(env)
+        result["sampled"] = round(done / total, 4) if total else 1.0
+        result["estimated_s"] = round(statistics.median(runs) * total / done, 4) if done else 0.0
+    return result
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[dict]:
+    """Per-case comparison rows; ``regressed`` marks cases over tolerance."""
+    rows = []
+    for scale, cases in results["scales"].items():
+        for name, current in cases.items():
+            base = baseline.get("scales", {}).get(scale, {}).get(name)
+            if base is None:
+                continue
+            ratio = current["median_s"] / base["median_s"] if base["median_s"] else float("inf")
+            slower = current["median_s"] - base["median_s"]
+            rows.append(
+                {
+                    "scale": scale,
+                    "case": name,
+                    "baseline_s": base["median_s"],
+                    "current_s": current["median_s"],
+                    "ratio": round(ratio, 3),
+                    "regressed": ratio > 1 + tolerance and slower > NOISE_FLOOR_SECONDS,
+                }
+            )
+    return rows
+
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--scales", default="1k", help="Comma-separated skill counts (1k,10k,50k).")
+    parser.add_argument("--cases", default="", help="Comma-separated case names (default: all).")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--git", action="store_true", help="Commit the tap to git first.")
+    parser.add_argument("--out", type=Path, help="Write results JSON here.")
+    parser.add_argument("--baseline", type=Path, help="Compare against a stored results JSON.")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed slowdown (0.2 = 20%%)."
+    )
+    args = parser.parse_args(argv)
+
+    selected = [c.strip() for c in args.cases.split(",") if c.strip()]
+    unknown = set(selected) - {c.name for c in CASES}
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+    cases = [c for c in CASES if not selected or c.name in selected]
+
+    results = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+            "git_tap": args.git,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "scales": {},
+    }
+    for scale in (parse_scale(s) for s in args.scales.split(",")):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = build_env(Path(tmp), scale, args.git, args.seed)
+            scale_results = results["scales"][str(scale)] = {}
+            for case in cases:
+                result = scale_results[case.name] = run_case(env, case, args.repeat)
+                line = f"{scale:>7} {case.name:<16} {result['median_s']:.4f}s"
+                if "sampled" in result:
+                    line += (
+                        f" ({result['sampled']:.2%} sampled, ~{result['estimated_s']:.1f}s full)"
+                    )
+                print(line, file=sys.stderr)
+
+    if args.out:
+        args.out.write_text(json.dumps(results, indent=2) + "\n")
+    if not args.baseline:
+        if not args.out:
+            print(json.dumps(results, indent=2))
+        return 0
+
+    rows = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    print(json.dumps({"comparison": rows}, indent=2))
+    regressed = [r for r in rows if r["regressed"]]
+    for r in regressed:
+        print(
+            f"REGRESSION {r['scale']} {r['case']}: {r['baseline_s']}s -> {r['current_s']}s (x{r['ratio']})",
+            file=sys.stderr,
+        )
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
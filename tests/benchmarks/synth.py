@@ -0,0 +1,119 @@
+"""Deterministic synthetic taps for benchmarks.
+
+generate_tap() writes N skills whose shape is set by a TapSpec: frontmatter
+size, tag distribution (Zipf-like, so a few tags are very common), asset
+files in nested directories, executable scripts and a share of near-duplicate
+skills for dedup. The same spec and seed always produce byte-identical trees,
+so timings are comparable across runs and machines.
+
+    from tests.benchmarks.synth import TapSpec, commit_all, generate_tap
+    ids = generate_tap(cellar.tap_dir("mySkills"), TapSpec(skills=10_000))
+    commit_all(cellar.tap_dir("mySkills"))
+"""
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+from tests.gitrepo import run_git
+
+_WORDS = (  # noqa: SIM905
+    "agent api audit build cache check cli cloud code config data debug deploy diff "
+    "doc docker eval file format git graph http image index infra lint log markdown "
+    "model monitor notebook parse pdf plan prompt python query refactor release "
+    "report review schema search security shell spec sql style sync task test "
+    "trace translate type ui upgrade validate web workflow yaml"
+).split()
+
+
+@dataclass(frozen=True)
+class TapSpec:
+    """Shape of a synthetic tap."""
+
+    skills: int = 1000
+    seed: int = 0
+    frontmatter_bytes: int = 300  # approximate size of the YAML frontmatter
+    body_words: int = 120
+    tag_pool: int = 50
+    tags_per_skill: int = 3
+    assets_per_skill: int = 2  # files besides SKILL.md
+    asset_bytes: int = 512
+    nested_depth: int = 2  # asset directories nest this deep (references/a/b/...)
+    script_ratio: float = 0.25  # share of skills with an executable scripts/run.sh
+    duplicate_ratio: float = 0.05  # share of skills that near-copy an earlier one
+
+
+def skill_id(i: int) -> str:
+    return f"skill-{i:05d}"
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _frontmatter(sid: str, description: str, tags: list[str], size: int) -> str:
+    lines = [
+        f"name: {sid}",
+        f"description: {description}",
+        "version: 1.0.0",
+        "author: bench",
+        f"tags: [{', '.join(tags)}]",
+    ]
+    pad = size - sum(len(line) + 1 for line in lines)
+    if pad > 10:
+        lines.append(f"notes: {'x' * (pad - 8)}")
+    return "---\n" + "\n".join(lines) + "\n---\n"
+
+
+def generate_tap(tap_dir: Path, spec: TapSpec | None = None) -> list[str]:
+    """Write spec.skills skills under tap_dir/skills. Returns the skill ids."""
+    spec = spec or TapSpec()
+    rng = random.Random(spec.seed)
+    tags = [f"tag-{i}" for i in range(spec.tag_pool)]
+    weights = [1 / (rank + 1) for rank in range(spec.tag_pool)]
+    skills_dir = tap_dir / "skills"
+    skills_dir.mkdir(parents=True, exist_ok=True)
+
+    ids = []
+    descriptions: list[str] = []
+    bodies: list[str] = []
+    for i in range(spec.skills):
+        sid = skill_id(i)
+        if descriptions and rng.random() < spec.duplicate_ratio:
+            # Near-copy of an earlier skill: same text with one word changed
+            j = rng.randrange(len(descriptions))
+            description = descriptions[j]
+            body = bodies[j].replace(rng.choice(_WORDS), rng.choice(_WORDS), 1)
+        else:
+            description = _sentence(rng, 12).capitalize()
+            body = _sentence(rng, spec.body_words)
+        descriptions.append(description)
+        bodies.append(body)
+
+        skill_tags = sorted(set(rng.choices(tags, weights, k=spec.tags_per_skill)))
+        d = skills_dir / sid
+        d.mkdir(exist_ok=True)
+        fm = _frontmatter(sid, description, skill_tags, spec.frontmatter_bytes)
+        (d / "SKILL.md").write_text(f"{fm}\n# {sid}\n\n{body}\n")
+
+        for a in range(spec.assets_per_skill):
+            nested = Path("references", *(f"level{k}" for k in range(a % (spec.nested_depth + 1))))
+            (d / nested).mkdir(parents=True, exist_ok=True)
+            asset = rng.randbytes((spec.asset_bytes + 1) // 2).hex()[: spec.asset_bytes]
+            (d / nested / f"asset-{a}.md").write_text(asset)
+
+        if rng.random() < spec.script_ratio:
+            (d / "scripts").mkdir(exist_ok=True)
+            script = d / "scripts" / "run.sh"
+            script.write_text(f"#!/bin/sh\necho {sid}\n")
+            script.chmod(0o755)
+        ids.append(sid)
+    return ids
+
+
+def commit_all(repo_dir: Path, message: str = "bench") -> None:
+    """git init (if needed), add everything and commit."""
+    if not (repo_dir / ".git").exists():
+        run_git(repo_dir, "init", "-q")
+    run_git(repo_dir, "add", "-A")
+    run_git(repo_dir, "commit", "-q", "-m", message)
@@ -1,9 +1,11 @@
 """Shared fixtures for neoskills tests."""
 
-import pytest
 from pathlib import Path
 
+import pytest
+
 from neoskills.core.cellar import Cellar
+from tests.gitrepo import run_git
 
 
 @pytest.fixture
@@ -14,6 +16,39 @@ def tmp_cellar(tmp_path: Path) -> Cellar:
     return cellar
 
 
+@pytest.fixture
+def tap_remote(tmp_path: Path) -> tuple[str, Path]:
+    """A bare tap repository served over file:// plus its working copy.
+
+    The tap has skills/, plugins/, tap.yaml and a bulky docs/ directory that
+    sparse tap clones should never materialize. Returns (url, work_dir); commit
+    in work_dir and ``git push origin main`` to publish upstream changes.
+    """
+    work = tmp_path / "tap_src"
+    for sid in ["alpha", "beta"]:
+        d = work / "skills" / sid
+        d.mkdir(parents=True)
+        (d / "SKILL.md").write_text(
+            f"---\nname: {sid}\ndescription: {sid.title()} skill\n---\n\n# {sid}\n"
+        )
+    (work / "plugins" / "helper").mkdir(parents=True)
+    (work / "plugins" / "helper" / "plugin.yaml").write_text("name: helper\n")
+    (work / "tap.yaml").write_text("name: remoteTap\nversion: 1.0.0\n")
+    (work / "docs").mkdir()
+    (work / "docs" / "screenshot.bin").write_bytes(bytes(range(256)) * 4096)
+
+    run_git(work, "init", "-q")
+    run_git(work, "add", "-A")
+    run_git(work, "commit", "-q", "-m", "Initial tap")
+
+    bare = tmp_path / "tap_remote.git"
+    run_git(tmp_path, "clone", "-q", "--bare", str(work), str(bare))
+    run_git(bare, "config", "uploadpack.allowFilter", "true")
+    run_git(bare, "config", "uploadpack.allowAnySHA1InWant", "true")
+    run_git(work, "remote", "add", "origin", str(bare))
+    return bare.as_uri(), work
+
+
 @pytest.fixture
 def mock_claude_skills(tmp_path: Path) -> Path:
     """Create mock Claude Code skills directory."""
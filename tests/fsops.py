@@ -0,0 +1,102 @@
+"""Count filesystem operations made in-process, for fs-op budget tests.
+
+Most neoskills cost is stat/open/readdir calls, and regressions show up as
+extra syscalls long before they show up as CPU. count_fs_ops() interposes on
+the ``os`` functions that pathlib, os.path and shutil call at run time, plus
+``open``, and counts each call by operation:
+
+    with count_fs_ops() as ops:
+        TapManager(cellar).list_skills("mySkills")
+    assert ops["open"] <= 2
+    assert ops.stats <= skills + 10
+
+Path.exists/is_dir/is_file count as "stat", is_symlink as "lstat", iterdir
+and os.scandir as "scandir", resolve as the lstat/readlink calls realpath
+makes. DirEntry.is_dir() and friends use the d_type from the directory read
+and are (correctly) free. Work done by subprocesses such as git is not
+counted.
+"""
+
+import builtins
+import io
+import os
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+# os functions interposed on, counted under their own name
+OS_OPS = (
+    "stat",
+    "lstat",
+    "scandir",
+    "listdir",
+    "readlink",
+    "mkdir",
+    "rmdir",
+    "unlink",
+    "rename",
+    "replace",
+    "symlink",
+    "chmod",
+    "utime",
+)
+
+
+class FsOps:
+    """Per-operation call counts, plus the paths touched with ``record_paths``."""
+
+    def __init__(self, record_paths: bool = False):
+        self.counts: Counter[str] = Counter()
+        self.paths: list[tuple[str, str]] = []
+        self._record_paths = record_paths
+        self._lock = threading.Lock()
+
+    def add(self, op: str, path: object) -> None:
+        with self._lock:
+            self.counts[op] += 1
+            if self._record_paths:
+                if isinstance(path, (str, bytes, os.PathLike)):
+                    path = os.fspath(path)
+                self.paths.append((op, "" if path is None else str(path)))  # fds as "3"
+
+    def __getitem__(self, op: str) -> int:
+        return self.counts[op]
+
+    @property
+    def stats(self) -> int:
+        """stat + lstat calls (exists, is_dir, is_symlink, resolve, ...)."""
+        return self.counts["stat"] + self.counts["lstat"]
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def __repr__(self) -> str:
+        return f"FsOps({dict(sorted(self.counts.items()))})"
+
+
+def _counting(ops: FsOps, op: str, func):
+    def wrapper(*args, **kwargs):
+        ops.add(op, args[0] if args else None)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def count_fs_ops(record_paths: bool = False) -> Iterator[FsOps]:
+    """Count filesystem calls made by any thread while the block runs."""
+    ops = FsOps(record_paths)
+    originals = {name: getattr(os, name) for name in OS_OPS}
+    original_open = io.open
+    try:
+        for name, func in originals.items():
+            setattr(os, name, _counting(ops, name, func))
+        counted_open = _counting(ops, "open", original_open)
+        io.open = builtins.open = counted_open
+        yield ops
+    finally:
+        for name, func in originals.items():
+            setattr(os, name, func)
+        io.open = builtins.open = original_open
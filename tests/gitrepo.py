@@ -0,0 +1,31 @@
+"""Run git in test repositories with a fixed identity and defaults.
+
+    from tests.gitrepo import run_git
+    run_git(work, "commit", "-q", "-m", "skills")
+"""
+
+import subprocess
+from pathlib import Path
+
+
+def run_git(cwd: Path, *args: str) -> str:
+    """Run a git command with a fixed identity; returns stdout."""
+    result = subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=neoskills-test",
+            "-c",
+            "user.email=test@neoskills.invalid",
+            "-c",
+            "init.defaultBranch=main",
+            "-c",
+            "protocol.file.allow=always",
+            *args,
+        ],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout
@@ -0,0 +1,133 @@
+"""Tests for neoskills.adapters.factory — lazy, entry-point based adapter registry."""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+_ADAPTER_MODULES = [
+    "neoskills.adapters.claude.adapter",
+    "neoskills.adapters.opencode.adapter",
+    "neoskills.adapters.openclaw.adapter",
+]
+
+
+def _run(code: str, env_extra: dict[str, str] | None = None) -> dict:
+    """Run code in a fresh interpreter and return the JSON it prints."""
+    env = dict(os.environ, **(env_extra or {}))
+    out = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+_REPORT = f"""
+import json, sys
+print(json.dumps({{m: m in sys.modules for m in {_ADAPTER_MODULES!r} + ["fake_adapter"]}}))
+"""
+
+
+@pytest.fixture
+def plugin_env(tmp_path: Path) -> dict[str, str]:
+    """A site dir with a third-party adapter advertised via entry points."""
+    site = tmp_path / "site"
+    dist = site / "fake_agent-1.0.dist-info"
+    dist.mkdir(parents=True)
+    (dist / "METADATA").write_text("Metadata-Version: 2.1\nName: fake-agent\nVersion: 1.0\n")
+    (dist / "entry_points.txt").write_text(
+        "[neoskills.adapters]\nfake-agent = fake_adapter:FakeAdapter\n"
+    )
+    (site / "fake_adapter.py").write_text(
+        textwrap.dedent(
+            """
+            from neoskills.adapters.claude.adapter import ClaudeCodeAdapter
+
+            class FakeAdapter(ClaudeCodeAdapter):
+                @property
+                def agent_type(self):
+                    return "fake-agent"
+            """
+        )
+    )
+    home = tmp_path / "home"
+    (home / ".neoskills" / "cache").mkdir(parents=True)
+    return {"PYTHONPATH": str(site), "HOME": str(home)}
+
+
+class TestLazyLoading:
+    def test_import_factory_loads_no_adapters(self):
+        loaded = _run("import neoskills.adapters.factory" + _REPORT)
+        assert not any(loaded.values())
+
+    def test_get_adapter_imports_only_that_module(self):
+        loaded = _run(
+            "from neoskills.adapters.factory import get_adapter\n"
+            "assert get_adapter('opencode').agent_type == 'opencode'" + _REPORT
+        )
+        assert loaded["neoskills.adapters.opencode.adapter"] is True
+        assert loaded["neoskills.adapters.claude.adapter"] is False
+        assert loaded["neoskills.adapters.openclaw.adapter"] is False
+
+
+class TestEntryPoints:
+    def test_listing_discovers_without_importing(self, plugin_env):
+        code = (
+            "from neoskills.adapters.factory import list_adapter_types\n"
+            "assert 'fake-agent' in list_adapter_types()" + _REPORT
+        )
+        loaded = _run(code, plugin_env)
+        assert not any(loaded.values())
+
+        cache = Path(plugin_env["HOME"]) / ".neoskills" / "cache" / "adapters.json"
+        assert json.loads(cache.read_text())["adapters"] == {
+            "fake-agent": "fake_adapter:FakeAdapter"
+        }
+
+    def test_scan_is_cached_in_the_callers_cellar(self, plugin_env, tmp_path: Path):
+        root = tmp_path / "workspace"
+        (root / "cache").mkdir(parents=True)
+        code = (
+            "from pathlib import Path\n"
+            "from neoskills.adapters.factory import list_adapter_types\n"
+            "from neoskills.core.cellar import Cellar\n"
+            f"assert 'fake-agent' in list_adapter_types(Cellar(Path({str(root)!r})))" + _REPORT
+        )
+        _run(code, plugin_env)
+
+        assert (root / "cache" / "adapters.json").is_file()
+        assert not (Path(plugin_env["HOME"]) / ".neoskills" / "cache" / "adapters.json").exists()
+
+    def test_unwritable_cache_still_lists_adapters(self, tmp_path: Path, monkeypatch):
+        from neoskills.adapters import factory
+        from neoskills.core.cellar import Cellar
+
+        cellar = Cellar(tmp_path / "workspace")
+        # A directory where the cache file should be: reading and writing it fail
+        (cellar.cache_dir / "adapters.json").mkdir(parents=True)
+        monkeypatch.setattr(factory, "_entry_points", None)
+        assert factory.list_adapter_types(cellar)[:3] == list(factory._BUILTIN_ADAPTERS)
+
+    def test_third_party_adapter_loads_on_demand(self, plugin_env):
+        code = (
+            "from neoskills.adapters.factory import get_adapter\n"
+            "assert get_adapter('fake-agent').agent_type == 'fake-agent'" + _REPORT
+        )
+        loaded = _run(code, plugin_env)
+        assert loaded["fake_adapter"] is True
+        assert loaded["neoskills.adapters.opencode.adapter"] is False
+
+    def test_unknown_type_raises(self, tmp_path: Path, monkeypatch):
+        from neoskills.adapters import factory
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(factory, "_entry_points", None)
+        with pytest.raises(ValueError, match="No adapter for agent type"):
+            factory.get_adapter("no-such-agent")
@@ -0,0 +1,127 @@
+"""Tests for neoskills.core.checksum — git-backed and content checksum providers."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from neoskills.core import checksum
+from neoskills.core.checksum import (
+    PROVIDER_CONTENT,
+    PROVIDER_GIT,
+    GitSkillIndex,
+    checksum_tree,
+    git_blob_id,
+    skill_checksum,
+    tap_checksums,
+)
+from tests.gitrepo import run_git
+
+
+@pytest.fixture
+def git_tap(tap_remote) -> Path:
+    _, work = tap_remote
+    (work / "skills" / "alpha" / "metadata.yaml").write_text("generated: true\n")
+    run_git(work, "add", "-A")
+    run_git(work, "commit", "-q", "-m", "Add metadata")
+    return work
+
+
+class TestChecksumProviders:
+    def test_blob_id_matches_git(self, git_tap: Path):
+        skill_md = git_tap / "skills" / "alpha" / "SKILL.md"
+        assert git_blob_id(skill_md) == run_git(git_tap, "hash-object", str(skill_md)).strip()
+
+    def test_clean_skills_are_checksummed_without_reading(self, git_tap: Path, monkeypatch):
+        monkeypatch.setattr(checksum, "git_blob_id", lambda p: pytest.fail(f"read {p}"))
+        sums = tap_checksums(git_tap)
+        assert set(sums) == {"alpha", "beta"}
+        assert {s.provider for s in sums.values()} == {PROVIDER_GIT}
+        tree = run_git(git_tap, "rev-parse", "HEAD:skills/alpha").strip()
+        assert sums["alpha"].tree == tree
+
+    def test_providers_agree_on_identical_content(self, git_tap: Path, tmp_path: Path):
+        copy = tmp_path / "plain" / "alpha"
+        shutil.copytree(git_tap / "skills" / "alpha", copy)
+        from_git = tap_checksums(git_tap)["alpha"]
+        from_content = skill_checksum(copy)
+        assert from_content.provider == PROVIDER_CONTENT
+        assert from_content.digest == from_git.digest == checksum_tree(copy)
+
+    def test_dirty_and_untracked_paths_fall_back_to_content(self, git_tap: Path):
+        (git_tap / "skills" / "alpha" / "SKILL.md").write_text("# edited\n")
+        (git_tap / "skills" / "beta" / "notes.md").write_text("untracked\n")
+        index = GitSkillIndex.load(git_tap)
+        assert index.dirty == {"alpha", "beta"}
+
+        alpha = skill_checksum(git_tap / "skills" / "alpha", index)
+        assert alpha.provider == PROVIDER_CONTENT
+        assert alpha.digest == checksum_tree(git_tap / "skills" / "alpha")
+
+    def test_non_git_directory(self, tmp_path: Path):
+        index = GitSkillIndex.load(tmp_path)
+        assert not index.is_git
+        (tmp_path / "skills" / "solo").mkdir(parents=True)
+        (tmp_path / "skills" / "solo" / "SKILL.md").write_text("# solo\n")
+        assert tap_checksums(tmp_path)["solo"].provider == PROVIDER_CONTENT
+
+    def test_ignored_files_fall_back_to_content(self, git_tap: Path):
+        (git_tap / ".gitignore").write_text("*.log\n__pycache__/\n")
+        run_git(git_tap, "add", ".gitignore")
+        run_git(git_tap, "commit", "-q", "-m", "Ignore logs")
+        (git_tap / "skills" / "alpha" / "run.log").write_text("ignored but hashed\n")
+        (git_tap / "skills" / "beta" / "__pycache__").mkdir()
+        (git_tap / "skills" / "beta" / "__pycache__" / "x.pyc").write_bytes(b"\0")
+
+        index = GitSkillIndex.load(git_tap)
+        assert index.dirty == {"alpha"}  # __pycache__ is not intrinsic content
+        alpha = skill_checksum(git_tap / "skills" / "alpha", index)
+        assert alpha.digest == checksum_tree(git_tap / "skills" / "alpha")
+        assert skill_checksum(git_tap / "skills" / "beta", index).provider == PROVIDER_GIT
+
+    def test_symlinks_fall_back_to_content(self, git_tap: Path):
+        (git_tap / "skills" / "beta" / "README.md").symlink_to("SKILL.md")
+        run_git(git_tap, "add", "-A")
+        run_git(git_tap, "commit", "-q", "-m", "Link readme")
+
+        index = GitSkillIndex.load(git_tap)
+        assert index.dirty == set()
+        assert index.content_only == {"beta"}
+        beta = skill_checksum(git_tap / "skills" / "beta", index)
+        assert beta.provider == PROVIDER_CONTENT
+        assert beta.digest == checksum_tree(git_tap / "skills" / "beta")
+
+    @pytest.mark.parametrize(
+        ("config", "attributes", "converted"),
+        [
+            # autocrlf applies to every text file, so beta falls back too
+            ({"core.autocrlf": "true"}, "", {"alpha", "beta"}),
+            ({}, "skills/alpha/notes.md eol=crlf\n", {"alpha"}),
+            (
+                {"filter.shout.smudge": "tr a-z A-Z", "filter.shout.clean": "tr A-Z a-z"},
+                "skills/alpha/notes.md filter=shout\n",
+                {"alpha"},
+            ),
+        ],
+        ids=["autocrlf", "eol", "filter"],
+    )
+    def test_checkout_conversions_fall_back_to_content(
+        self, git_tap: Path, config, attributes, converted
+    ):
+        notes = git_tap / "skills" / "alpha" / "notes.md"
+        notes.write_text("lower case notes\n")
+        if attributes:
+            (git_tap / ".gitattributes").write_text(attributes)
+        run_git(git_tap, "add", "-A")
+        run_git(git_tap, "commit", "-q", "-m", "Add notes")
+        for key, value in config.items():
+            run_git(git_tap, "config", key, value)
+        notes.unlink()
+        run_git(git_tap, "checkout", "--", str(notes))
+        assert notes.read_bytes() != run_git(git_tap, "show", "HEAD:skills/alpha/notes.md").encode()
+
+        index = GitSkillIndex.load(git_tap)
+        assert index.dirty == set()  # git itself sees no change
+        assert index.content_only == converted
+        alpha = skill_checksum(git_tap / "skills" / "alpha", index)
+        assert alpha.digest == checksum_tree(git_tap / "skills" / "alpha")
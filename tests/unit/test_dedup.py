@@ -0,0 +1,149 @@
+"""Tests for neoskills.core.dedup and the dedup command."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from neoskills.cli.main import cli
+from neoskills.core.cellar import Cellar
+from neoskills.core.dedup import Deduplicator
+from neoskills.core.linker import Linker
+from tests.fsops import count_fs_ops
+from tests.gitrepo import run_git
+
+
+def _write_skill(d: Path, body: str) -> Path:
+    d.mkdir(parents=True)
+    (d / "SKILL.md").write_text(f"---\nname: {d.name}\ndescription: {body}\n---\n\n{body}\n")
+    return d
+
+
+@pytest.fixture
+def dedup_env(tmp_path: Path):
+    """A git tap, a second tap, a target with local copies and a plugin directory.
+
+    - pdf: in mySkills, copied unchanged into the agent target and a plugin
+    - git-review: in mySkills and otherTap, identical
+    - notes: in mySkills, a diverged copy in the agent target
+    - linked: in mySkills, linked (not copied) into the agent target
+    """
+    cellar = Cellar(tmp_path / ".neoskills")
+    cellar.initialize()
+    target = tmp_path / "agent" / "skills"
+    config = cellar.load_config()
+    config["targets"] = {"agent": {"skill_path": str(target)}}
+    config["default_target"] = "agent"
+    cellar.save_config(config)
+
+    my = cellar.tap_skills_dir("mySkills")
+    for sid in ("pdf", "git-review", "notes", "linked"):
+        _write_skill(my / sid, f"The {sid} skill")
+    run_git(cellar.tap_dir("mySkills"), "init", "-q")
+    run_git(cellar.tap_dir("mySkills"), "add", "-A")
+    run_git(cellar.tap_dir("mySkills"), "commit", "-q", "-m", "skills")
+    _write_skill(cellar.tap_skills_dir("otherTap") / "git-review", "The git-review skill")
+
+    shutil.copytree(my / "pdf", target / "pdf")
+    _write_skill(target / "notes", "My own notes skill")
+    Linker(cellar).link("linked", my / "linked", "agent")
+
+    plugins = tmp_path / "plugins"
+    shutil.copytree(my / "pdf", plugins / "docs-plugin" / "skills" / "pdf")
+    return cellar, target, plugins
+
+
+class TestDeduplicator:
+    def test_groups_exact_and_diverged_copies(self, dedup_env):
+        cellar, _, plugins = dedup_env
+        report = Deduplicator(cellar, plugins_root=plugins).run()
+
+        assert report.sources == [
+            "tap:mySkills",
+            "tap:otherTap",
+            "target:agent",
+            "plugin:docs-plugin",
+        ]
+        assert len(report.skills) == 8  # the linked skill is not a copy
+        exact = {g.copies[0].skill_id: g for g in report.exact}
+        assert sorted(exact) == ["git-review", "pdf"]
+        assert [c.source for c in exact["pdf"].copies] == [
+            "tap:mySkills",
+            "target:agent",
+            "plugin:docs-plugin",
+        ]
+        assert exact["pdf"].canonical.source == "tap:mySkills"
+        assert exact["git-review"].canonical.source == "tap:mySkills"
+        assert [(g.key, [c.source for c in g.copies]) for g in report.diverged] == [
+            ("notes", ["tap:mySkills", "target:agent"])
+        ]
+
+    def test_git_checksums_match_content_checksums(self, dedup_env):
+        cellar, _, plugins = dedup_env
+        copies, _ = Deduplicator(cellar, plugins_root=plugins).scan()
+        pdf = {c.source: c.checksum for c in copies if c.skill_id == "pdf"}
+        # The committed tap copy is checksummed from git, the others from content
+        assert len(set(pdf.values())) == 1
+
+    def test_rescan_reads_no_content(self, dedup_env):
+        cellar, _, plugins = dedup_env
+        Deduplicator(cellar, plugins_root=plugins).run()
+        with count_fs_ops(record_paths=True) as ops:
+            Deduplicator(cellar, plugins_root=plugins).run()
+        opened = {Path(path).name for op, path in ops.paths if op == "open"}
+        assert "SKILL.md" not in opened, ops
+
+    def test_resolve_relinks_target_copies_in_one_batch(self, dedup_env, monkeypatch):
+        cellar, target, plugins = dedup_env
+        deduplicator = Deduplicator(cellar, plugins_root=plugins)
+        report = deduplicator.run()
+        batches = []
+        link_many = Linker.link_many
+        monkeypatch.setattr(
+            Linker,
+            "link_many",
+            lambda self, links, t=None: batches.append(t) or link_many(self, links, t),
+        )
+
+        actions = deduplicator.resolve_exact(report)
+        assert batches == ["agent"]
+        assert [(a.skill_id, a.action) for a in actions] == [("pdf", "linked")]
+        assert (target / "pdf").resolve() == cellar.tap_skills_dir("mySkills") / "pdf"
+        assert (cellar.cache_dir / "backup_pdf" / "SKILL.md").exists()
+        # The diverged copy and the plugin copy are left alone
+        assert not (target / "notes").is_symlink()
+        assert (plugins / "docs-plugin" / "skills" / "pdf").is_dir()
+
+        rescan = Deduplicator(cellar, plugins_root=plugins)
+        assert rescan.relink_plan(rescan.run()) == {}
+
+
+class TestDedupCommand:
+    def _dedup(self, cellar, plugins, *args):
+        result = CliRunner().invoke(
+            cli, ["dedup", "--plugins-dir", str(plugins), "--root", str(cellar.root), *args]
+        )
+        assert result.exit_code == 0, result.output
+        return result.output
+
+    def test_report_and_dry_run(self, dedup_env):
+        cellar, target, plugins = dedup_env
+        output = self._dedup(cellar, plugins, "--resolve", "--dry-run")
+        assert "Exact duplicates (2 groups)" in output
+        assert "Diverged copies (1 skills)" in output
+        assert "Would relink 1 target copy" in output
+        assert not (target / "pdf").is_symlink()
+
+        report = json.loads(self._dedup(cellar, plugins, "--json", "--no-plugins"))
+        assert report["total_skills"] == 7
+        assert report["relink_plan"] == {
+            "agent": [{"skill_id": "pdf", "source": str(cellar.tap_skills_dir("mySkills") / "pdf")}]
+        }
+
+    def test_resolve(self, dedup_env):
+        cellar, target, plugins = dedup_env
+        output = self._dedup(cellar, plugins, "--resolve")
+        assert "Relinked 1 skill(s)" in output
+        assert (target / "pdf").is_symlink()
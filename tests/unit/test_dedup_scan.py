@@ -0,0 +1,360 @@
+"""Tests for skills/skill-dedup/scripts/dedup_scan.py (loaded by path)."""
+
+import importlib.util
+import threading
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from neoskills.core.checksum import checksum_tree
+from tests.gitrepo import run_git
+
+_SCRIPT = (
+    Path(__file__).resolve().parents[2] / "skills" / "skill-dedup" / "scripts" / "dedup_scan.py"
+)
+
+
+@pytest.fixture(scope="module")
+def dedup():
+    spec = importlib.util.spec_from_file_location("dedup_scan", _SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _skill(base: Path, sid: str, description: str = "", body: str = "", **files: str) -> Path:
+    d = base / sid
+    d.mkdir(parents=True)
+    (d / "SKILL.md").write_text(f"---\nname: {sid}\ndescription: {description}\n---\n\n{body}\n")
+    for rel, text in files.items():
+        path = d / rel.replace("__", "/")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return d
+
+
+class TestScan:
+    def test_scan_dir_matches_core_checksum(self, dedup, tmp_path):
+        d = _skill(tmp_path, "alpha", "A", "body", **{"refs__a.md": "a", "refs__deep__b.md": "b"})
+        (d / "__pycache__").mkdir()
+        (d / "__pycache__" / "x.pyc").write_bytes(b"\0")
+        (d / ".DS_Store").write_text("junk")
+        (d / "metadata.yaml").write_text("generated: true\n")
+        (d / ".neoskills-manifest.json").write_text("{}\n")
+        (tmp_path / "shared").mkdir()
+        (tmp_path / "shared" / "c.md").write_text("c")
+        (d / "linked").symlink_to(tmp_path / "shared", target_is_directory=True)
+
+        assert dedup.scan_dir(d) == (checksum_tree(d), 4)
+        (alpha,) = dedup.find_skills(tmp_path)
+        assert alpha["checksum"] == checksum_tree(d)
+
+    def test_find_skills_dirs_and_standalone_files(self, dedup, tmp_path):
+        _skill(tmp_path, "alpha", "First", **{"scripts__run.sh": "echo"})
+        (tmp_path / "solo.md").write_text("# Solo\n")
+        (tmp_path / ".hidden").mkdir()
+
+        alpha, solo = dedup.find_skills(tmp_path)
+        assert (alpha["id"], alpha["file_count"], alpha["is_dir"]) == ("alpha", 2, True)
+        assert alpha["description"] == "First"
+        assert (solo["id"], solo["name"], solo["file_count"]) == ("solo", "solo.md", 1)
+        assert solo["checksum"] == dedup.sha256("# Solo\n")
+
+    def test_scan_sources_runs_concurrently_in_source_order(self, dedup, tmp_path):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def source(n):
+            def scan():
+                barrier.wait()  # only passes if all three sources run at once
+                return [{"id": f"s{n}"}]
+
+            return scan
+
+        def broken():
+            barrier.wait()
+            raise OSError("unreadable")
+
+        results = dedup.scan_sources([("a", source(1)), ("bad", broken), ("c", source(3))])
+        assert [label for label, _ in results] == ["a", "bad", "c"]
+        assert results[0][1] == [{"id": "s1", "source": "a"}]
+        assert results[1][1] == []
+
+
+def _report(dedup, skills, edges=None):
+    exact, diverged, similar = dedup.find_duplicates(skills, 0.8, edges)
+    return (
+        sorted(sorted(s["dir_path"] for s in g) for g in exact.values()),
+        sorted(diverged),
+        {cid: [s["dir_path"] for s in g] for cid, g in similar.items()},
+    )
+
+
+def _record(sid: str, source: str = "bank", path: str = "") -> dict:
+    path = path or f"/{source}/{sid}"
+    return {"id": sid, "source": source, "dir_path": path, "checksum": path, "description": ""}
+
+
+class TestNameClusters:
+    def _groups(self, dedup, skills, edges, known=None):
+        keyed = {s["dir_path"]: dedup._skill_key(s) for s in skills}
+        edges = {(keyed[a], keyed[b]): {} for a, b in edges}
+        similar = dedup.find_duplicates(skills, 0.8, edges, known)[2]
+        return {cid: [s["dir_path"] for s in g] for cid, g in similar.items()}
+
+    def _known(self, dedup, skills, groups):
+        keyed = {s["dir_path"]: dedup._skill_key(s) for s in skills}
+        return {keyed[path]: cid for cid, paths in groups.items() for path in paths}
+
+    def test_transitive_and_order_independent(self, dedup):
+        skills = [_record(sid) for sid in ("pdf", "pdfs", "pdf-tool", "git", "gits", "lone")]
+        edges = [("/bank/pdf", "/bank/pdfs"), ("/bank/pdfs", "/bank/pdf-tool")]
+        edges.append(("/bank/gits", "/bank/git"))
+        groups = self._groups(dedup, skills, edges)
+        assert sorted(groups.values()) == [
+            ["/bank/git", "/bank/gits"],
+            ["/bank/pdf", "/bank/pdf-tool", "/bank/pdfs"],
+        ]
+        assert self._groups(dedup, skills[::-1], edges[::-1]) == groups
+
+    def test_cluster_ids_are_stable(self, dedup):
+        skills = [_record("pdf"), _record("pdfs"), _record("git"), _record("gits")]
+        edges = [("/bank/pdf", "/bank/pdfs"), ("/bank/git", "/bank/gits")]
+        groups = self._groups(dedup, skills, edges)
+        assert all(cid.startswith("ns-") for cid in groups)
+
+        # A new member and an unrelated group leave existing IDs alone
+        skills += [_record("pdfz"), _record("lint"), _record("lints")]
+        edges += [("/bank/pdfs", "/bank/pdfz"), ("/bank/lint", "/bank/lints")]
+        grown = self._groups(dedup, skills, edges)
+        assert len(grown) == 3 and set(groups) < set(grown)
+        pdf_cluster = dedup.cluster_id(dedup._skill_key(skills[0]))
+        assert grown[pdf_cluster] == ["/bank/pdf", "/bank/pdfs", "/bank/pdfz"]
+
+    def test_known_ids_survive_new_anchors_and_merges(self, dedup):
+        skills = [_record(sid) for sid in ("pdf", "pdfs", "pdfz", "git", "gits")]
+        edges = [("/bank/pdf", "/bank/pdfs"), ("/bank/pdfs", "/bank/pdfz")]
+        edges.append(("/bank/git", "/bank/gits"))
+        groups = self._groups(dedup, skills, edges)
+        known = self._known(dedup, skills, groups)
+        pdf_cluster = next(cid for cid, paths in groups.items() if "/bank/pdf" in paths)
+        git_cluster = next(cid for cid, paths in groups.items() if "/bank/git" in paths)
+
+        # A member sorting before every other joins: without known IDs the group is renamed
+        skills.append(_record("apdf"))
+        edges.append(("/bank/apdf", "/bank/pdf"))
+        assert pdf_cluster not in self._groups(dedup, skills, edges)
+        grown = self._groups(dedup, skills, edges, known)
+        assert grown[pdf_cluster][0] == "/bank/apdf" and grown[git_cluster]
+
+        # Two groups merge: the larger one's ID survives, and it does not move
+        edges.append(("/bank/gits", "/bank/pdfz"))
+        merged = self._groups(dedup, skills, edges, self._known(dedup, skills, grown))
+        assert list(merged) == [pdf_cluster] and len(merged[pdf_cluster]) == 6
+
+        # The group splits again: each part gets a distinct ID
+        split = self._groups(dedup, skills, edges[:-1], self._known(dedup, skills, merged))
+        assert set(split) == {pdf_cluster, git_cluster}
+
+    def test_same_id_from_one_source_is_kept(self, dedup):
+        # Two plugin directories can share a label; neither copy is dropped
+        first = _record("pdf", "plugin:x", "/cache/pdf")
+        second = _record("pdf", "plugin:x", "/plugins/pdf")
+        skills = [first, second, _record("pdf-tool", "plugin:x")]
+        edges = [("/cache/pdf", "/plugin:x/pdf-tool"), ("/plugins/pdf", "/plugin:x/pdf-tool")]
+        (group,) = self._groups(dedup, skills, edges).values()
+        assert len(group) == 3
+
+    def test_exact_and_diverged_skills_are_left_out(self, dedup):
+        skills = [_record("pdf"), _record("pdf", "claude"), _record("pdfs"), _record("pdfz")]
+        skills[3]["checksum"] = skills[2]["checksum"]
+        edges = [("/bank/pdfs", "/claude/pdf"), ("/bank/pdfz", "/bank/pdf")]
+        assert self._groups(dedup, skills, edges) == {}
+
+
+class TestDedupDB:
+    def _scan(self, dedup, roots, db):
+        cache = db.scan_cache()
+        sources = [(label, partial(dedup.find_skills, root, cache=cache)) for label, root in roots]
+        return [s for _, found in dedup.scan_sources(sources) for s in found]
+
+    def test_incremental_runs_match_a_full_scan(self, dedup, tmp_path, monkeypatch):
+        bank, target = tmp_path / "bank", tmp_path / "target"
+        _skill(bank, "pdf-tools", "Read and write PDF files", "extract text from pdf")
+        _skill(bank, "pdf-tool", "Read and write PDF documents", "extract text from pdfs")
+        _skill(bank, "git-review", "Review git diffs")
+        _skill(target, "git-review", "Review git diffs")
+        _skill(target, "pdf-tools", "Something else entirely")
+        _skill(bank, "code-lint", "Lint code with ruff")
+        _skill(target, "code-lints", "Lint code with ruff", "and more")
+        roots = [("bank", bank), ("target", target)]
+        db = dedup.DedupDB(tmp_path / "dedup.sqlite3")
+
+        skills = self._scan(dedup, roots, db)
+        first = _report(dedup, skills, db.update(skills, 0.8))
+        assert first == _report(dedup, skills)
+        assert first[1] == ["pdf-tools"]
+        assert [len(g) for g in first[2].values()] == [2]
+
+        # Unchanged: nothing is re-hashed and no pair is recompared
+        hashed, compared = [], []
+        checksum, similarity = dedup._checksum, dedup.compute_similarity
+        monkeypatch.setattr(dedup, "_checksum", lambda *a: hashed.append(a) or checksum(*a))
+        monkeypatch.setattr(
+            dedup, "compute_similarity", lambda a, b: compared.append(a) or similarity(a, b)
+        )
+        skills = self._scan(dedup, roots, dedup.DedupDB(tmp_path / "dedup.sqlite3"))
+        assert _report(dedup, skills, db.update(skills, 0.8)) == first
+        assert hashed == compared == []
+
+        # One skill renamed in place, one removed, one added
+        (target / "pdf-tools" / "SKILL.md").write_text(
+            "---\nname: pdf-tools\ndescription: Read and write PDF files\n---\n\nv2\n"
+        )
+        (bank / "git-review" / "SKILL.md").unlink()
+        _skill(target, "pdf-toolz", "Read and write PDF files")
+        skills = self._scan(dedup, roots, db)
+        incremental = _report(dedup, skills, db.update(skills, 0.8))
+        assert len(hashed) == 2
+        assert incremental == _report(dedup, skills)
+        assert incremental != first
+
+    def test_cluster_ids_are_kept_between_runs(self, dedup, tmp_path):
+        db = dedup.DedupDB(tmp_path / "dedup.sqlite3")
+        db.save_clusters({"ns-1": [_record("pdf"), _record("pdfs")]})
+        db.close()
+        db = dedup.DedupDB(tmp_path / "dedup.sqlite3")
+        assert db.cluster_ids() == {"bank|/bank/pdf": "ns-1", "bank|/bank/pdfs": "ns-1"}
+
+    def test_threshold_change_recompares_everything(self, dedup, tmp_path):
+        _skill(tmp_path / "a", "pdf-tools", "Read and write PDF files")
+        _skill(tmp_path / "a", "pdf-tool", "Read and write PDF files too")
+        db = dedup.DedupDB(tmp_path / "dedup.sqlite3")
+        skills = self._scan(dedup, [("a", tmp_path / "a")], db)
+        assert len(db.update(skills, 0.8)) == 1
+        assert db.update(skills, 0.99) == {}
+
+
+class TestContentSimilarity:
+    def test_fork_and_rename_is_found(self, dedup, tmp_path):
+        words = [f"w{i % 97}x{i % 13}" for i in range(400)]
+        body = " ".join(words)
+        script = "\n".join(f"echo step {i}" for i in range(40))
+        _skill(tmp_path, "pdf-extract", "Extract PDF text", body, **{"scripts__run.sh": script})
+        forked = body.replace(words[200], "tweaked", 1)
+        _skill(tmp_path, "docs-reader", "Reads documents", forked, **{"scripts__run.sh": script})
+        _skill(tmp_path, "unrelated", "Other", " ".join(reversed(words)))
+        _skill(tmp_path, "tiny", "Short", "hello")
+        _skill(tmp_path, "small", "Brief", "hello")
+
+        skills = dedup.find_skills(tmp_path)
+        ((similarity, a, b),) = dedup.content_similar_pairs(skills)
+        assert {a["id"], b["id"]} == {"pdf-extract", "docs-reader"}
+        assert 0.9 <= similarity <= 1.0
+        # Name and description similarity alone never pair these two
+        assert dedup.find_duplicates(skills)[2] == {}
+
+    def test_scripts_count_as_content(self, dedup, tmp_path):
+        script = "\n".join(f"run command number {i} with flags" for i in range(60))
+        _skill(tmp_path, "one", "A", "Intro one", **{"scripts__go.py": script})
+        _skill(tmp_path, "two", "B", "Intro two", **{"scripts__go.py": script})
+        skills = dedup.find_skills(tmp_path)
+        assert [(a["id"], b["id"]) for _, a, b in dedup.content_similar_pairs(skills)] == [
+            ("one", "two")
+        ]
+        assert dedup.content_similar_pairs(skills, threshold=1.01) == []
+
+
+class TestTfidfNeighbors:
+    def test_neighbors_by_id_description_and_body(self, dedup, tmp_path):
+        _skill(tmp_path, "pdf-extract", "Extract text from PDF files", "pdfminer layout pages")
+        _skill(tmp_path, "pdf-reader", "Read PDF files", "pdfminer pages and layout")
+        _skill(tmp_path, "git-review", "Review git diffs", "comment on pull requests")
+        _skill(tmp_path, "git-blame", "Explain git history", "blame log pull requests")
+        _skill(tmp_path, "lonely", "Nothing shared", "zebra")
+        skills = dedup.find_skills(tmp_path)
+        ids = [s["id"] for s in skills]
+
+        neighbors = dedup.tfidf_neighbors(skills, k=2)
+        top = {ids[i]: [ids[j] for _, j in found] for i, found in enumerate(neighbors)}
+        assert top["pdf-extract"] == ["pdf-reader"]
+        assert top["git-review"] == ["git-blame"]
+        assert top["lonely"] == []
+        assert all(0 < sim <= 1 for found in neighbors for sim, _ in found)
+
+
+@pytest.fixture
+def skills_remote(tmp_path):
+    """A bare repo (file:// URL) with nested skills, plus its working copy."""
+    work = tmp_path / "work"
+    _skill(work / "tools", "pdf", "PDF tools", "read pdfs", **{"scripts__run.sh": "echo pdf"})
+    _skill(work, "notes", "Notes", "take notes", **{"refs__deep__a.md": "a"})
+    (work / "README.md").write_text("not a skill\n")
+    run_git(work, "init", "-q")
+    run_git(work, "add", "-A")
+    run_git(work, "commit", "-q", "-m", "skills")
+    bare = tmp_path / "remote.git"
+    run_git(tmp_path, "clone", "-q", "--bare", str(work), str(bare))
+    run_git(work, "remote", "add", "origin", str(bare))
+    return bare.as_uri(), work
+
+
+class TestRepoMirrors:
+    def _git_calls(self, dedup, monkeypatch):
+        calls = []
+        git = dedup._git
+        monkeypatch.setattr(dedup, "_git", lambda *a, **kw: calls.append(a) or git(*a, **kw))
+        return calls
+
+    def test_reads_skills_from_a_bare_shallow_mirror(self, dedup, skills_remote, tmp_path):
+        url, work = skills_remote
+        skills = dedup.find_repo_skills(url, tmp_path / "mirrors")
+
+        assert [(s["id"], s["display"], s["file_count"]) for s in skills] == [
+            ("notes", "notes", 2),
+            ("pdf", "tools/pdf", 2),
+        ]
+        # Same checksums as scanning a checkout
+        assert skills[0]["checksum"] == dedup.scan_dir(work / "notes")[0]
+        assert skills[1]["checksum"] == dedup.scan_dir(work / "tools" / "pdf")[0]
+        assert skills[1]["description"] == "PDF tools"
+        (mirror,) = (tmp_path / "mirrors").iterdir()
+        assert (mirror / "shallow").exists()
+        assert not list(mirror.rglob("SKILL.md"))  # nothing checked out
+
+    def test_rerun_fetches_instead_of_cloning(self, dedup, skills_remote, tmp_path, monkeypatch):
+        url, work = skills_remote
+        mirrors = tmp_path / "mirrors"
+        first = dedup.find_repo_skills(url, mirrors, cache={}, ttl=0)
+        cache = {s["dir_path"]: s for s in first}
+
+        (work / "notes" / "SKILL.md").write_text("---\nname: notes\ndescription: v2\n---\n")
+        run_git(work, "commit", "-q", "-am", "v2")
+        run_git(work, "push", "-q", "origin", "HEAD")
+
+        # Within the TTL the mirror is used as is
+        calls = self._git_calls(dedup, monkeypatch)
+        stale = dedup.find_repo_skills(url, mirrors, cache=cache)
+        assert [c[0] for c in calls] == ["-C"] and "ls-tree" in calls[0]
+        assert stale == first
+
+        calls.clear()
+        read = []
+        read_blobs = dedup.read_blobs
+        monkeypatch.setattr(
+            dedup, "read_blobs", lambda d, shas: read.append(shas) or read_blobs(d, shas)
+        )
+        fresh = dedup.find_repo_skills(url, mirrors, cache=cache, ttl=0)
+        commands = [next(arg for arg in c if not arg.startswith(("-", "/"))) for c in calls]
+        assert "clone" not in commands and "fetch" in commands
+        assert fresh[0]["description"] == "v2"
+        assert fresh[0]["checksum"] == dedup.scan_dir(work / "notes")[0]
+        # The unchanged skill comes from the cache; of the changed one only SKILL.md is read
+        assert fresh[1] == first[1]
+        assert [len(shas) for shas in read] == [1]
+
+    def test_unreachable_repo_is_skipped(self, dedup, tmp_path, capsys):
+        missing = (tmp_path / "missing.git").as_uri()
+        assert dedup.find_repo_skills(missing, tmp_path / "mirrors") == []
+        assert "failed to clone" in capsys.readouterr().err
+        assert not list((tmp_path / "mirrors").iterdir())
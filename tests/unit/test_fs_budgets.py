@@ -0,0 +1,141 @@
+"""Filesystem-operation budgets for the TapManager, Linker and Cellar hot paths.
+
+Budgets are per skill plus a constant (SLACK), so an extra stat or open per
+skill fails here long before it is visible in timings. See tests/fsops.py.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from neoskills.cli.main import cli
+from neoskills.core.cellar import Cellar
+from neoskills.core.linker import Linker
+from neoskills.core.tap import TapManager
+from tests.fsops import count_fs_ops
+
+SKILLS = 1000
+SLACK = 10  # the O(1) part: config.yaml, catalog, directory listings
+
+
+@pytest.fixture
+def big_tap(tmp_path: Path) -> Cellar:
+    """A workspace whose default tap has SKILLS skills and an empty target."""
+    cellar = Cellar(tmp_path / ".neoskills")
+    cellar.initialize()
+    config = cellar.load_config()
+    config["targets"] = {"agent": {"skill_path": str(tmp_path / "agent" / "skills")}}
+    config["default_target"] = "agent"
+    cellar.save_config(config)
+
+    skills_dir = cellar.tap_skills_dir("mySkills")
+    for i in range(SKILLS):
+        d = skills_dir / f"skill-{i:04d}"
+        d.mkdir(parents=True)
+        (d / "SKILL.md").write_text(
+            f"---\nname: skill-{i:04d}\ndescription: Skill {i}\ntags: [t{i % 7}]\n---\n\n# {i}\n"
+        )
+    return cellar
+
+
+def _neoskills(cellar: Cellar, *args: str) -> None:
+    result = CliRunner().invoke(cli, [*args, "--root", str(cellar.root)])
+    assert result.exit_code == 0, result.output
+
+
+class TestHarness:
+    def test_counts_and_restores(self, tmp_path):
+        original_stat = os.stat
+        with count_fs_ops(record_paths=True) as ops:
+            (tmp_path / "f").write_text("x")
+            (tmp_path / "f").exists()
+            (tmp_path / "f").is_symlink()
+            list(tmp_path.iterdir())
+        assert ops["open"] == 1
+        assert ops.stats == 2
+        assert ops["scandir"] == 1
+        assert ("open", str(tmp_path / "f")) in ops.paths
+        assert os.stat is original_stat
+
+
+class TestTapManagerBudgets:
+    def test_list_cold_then_warm(self, big_tap):
+        with count_fs_ops() as cold:
+            _neoskills(big_tap, "list", "--available")
+        # Building the catalog reads each SKILL.md once
+        assert cold["open"] <= SKILLS + SLACK, cold
+        assert cold.stats <= SKILLS + SLACK, cold
+
+        with count_fs_ops() as warm:
+            _neoskills(big_tap, "list", "--available")
+        # Unchanged skills cost one stat and no open
+        assert warm["open"] <= SLACK, warm
+        assert warm.stats <= SKILLS + SLACK, warm
+
+    def test_search(self, big_tap):
+        TapManager(big_tap).list_skills()
+        with count_fs_ops() as ops:
+            TapManager(big_tap).search("t3")
+        assert ops["open"] <= SLACK, ops
+        assert ops.stats <= SKILLS + SLACK, ops
+
+    def test_get_skill_path_is_independent_of_tap_size(self, big_tap):
+        with count_fs_ops() as ops:
+            assert TapManager(big_tap).get_skill_path("skill-0500")
+        assert ops.total <= SLACK, ops
+
+
+class TestLinkerBudgets:
+    def test_link_all(self, big_tap):
+        skills_dir = big_tap.tap_skills_dir("mySkills")
+        with count_fs_ops() as ops:
+            Linker(big_tap).link_all(skills_dir)
+        assert ops["symlink"] == SKILLS
+        # Target and transport are resolved once, not per skill
+        assert ops["open"] <= SLACK, ops
+        assert ops["mkdir"] <= SLACK, ops
+        assert ops.stats <= 3 * SKILLS + SLACK, ops
+
+        with count_fs_ops() as relink:
+            Linker(big_tap).link_all(skills_dir)
+        assert relink["symlink"] == 0
+        assert relink["open"] <= SLACK, relink
+        assert relink.stats + relink["readlink"] <= 3 * SKILLS + SLACK, relink
+
+    def test_list_links_and_unlink_all(self, big_tap):
+        linker = Linker(big_tap)
+        linker.link_all(big_tap.tap_skills_dir("mySkills"))
+
+        # Link sources are resolved per distinct parent, not per path component
+        with count_fs_ops() as ops:
+            links = linker.list_links()
+        assert len(links) == SKILLS
+        assert all(link["managed"] and not link["broken"] for link in links)
+        assert ops.stats + ops["readlink"] <= 3 * SKILLS + SLACK, ops
+
+        with count_fs_ops() as ops:
+            assert len(linker.unlink_all()) == SKILLS
+        assert ops["unlink"] == SKILLS
+        assert ops.stats + ops["readlink"] <= 2 * SKILLS + SLACK, ops
+
+        with count_fs_ops() as cli_ops:
+            _neoskills(big_tap, "link", "--all")
+        assert cli_ops["open"] <= SLACK, cli_ops
+
+
+class TestCellarBudgets:
+    def test_config_lookups(self, big_tap):
+        with count_fs_ops() as ops:
+            big_tap.target_path()
+            assert big_tap.default_tap == "mySkills"
+        assert ops["open"] <= 2, ops
+        assert ops.stats <= 2, ops
+
+    def test_initialize_existing_workspace_writes_nothing(self, big_tap):
+        with count_fs_ops() as ops:
+            big_tap.initialize()
+        assert ops["open"] == 0, ops
+        assert ops["mkdir"] == 0, ops
+        assert ops.stats <= 5, ops
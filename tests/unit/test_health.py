@@ -0,0 +1,137 @@
+"""Tests for neoskills.core.health — single-pass HealthEngine behind doctor."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.frontmatter import write_frontmatter
+from neoskills.core.health import HealthEngine
+from neoskills.core.linker import Linker
+from neoskills.core.tap import TapManager
+
+
+@pytest.fixture
+def health_env(tmp_path: Path):
+    """Two taps and two targets, with one skill linked into each target."""
+    cellar = Cellar(tmp_path / ".neoskills")
+    cellar.initialize()
+
+    targets = {}
+    for target in ("agent-a", "agent-b"):
+        d = tmp_path / target
+        d.mkdir()
+        targets[target] = {"skill_path": str(d)}
+    config = cellar.load_config()
+    config["targets"] = targets
+    config["default_target"] = "agent-a"
+    config["default_tap"] = "mySkills"
+    cellar.save_config(config)
+
+    for tap in ("mySkills", "otherTap"):
+        for sid in ("one", "two"):
+            d = cellar.tap_skills_dir(tap) / f"{tap}-{sid}"
+            d.mkdir(parents=True)
+            description = "" if sid == "two" and tap == "otherTap" else f"{sid} skill"
+            (d / "SKILL.md").write_text(
+                write_frontmatter({"name": d.name, "description": description}, "# x\n")
+            )
+
+    linker = Linker(cellar)
+    for target in targets:
+        linker.link("mySkills-one", cellar.tap_skills_dir("mySkills") / "mySkills-one", target)
+    return cellar, tmp_path
+
+
+class TestHealthEngine:
+    def test_walks_each_tap_and_target_once(self, health_env, monkeypatch):
+        cellar, _ = health_env
+        calls: list[tuple[str, str]] = []
+        list_skills = TapManager.list_skills
+        list_links = Linker.list_links
+
+        def counting_skills(self, tap_name=None):
+            calls.append(("skills", tap_name))
+            return list_skills(self, tap_name)
+
+        def counting_links(self, target=None):
+            calls.append(("links", target))
+            return list_links(self, target)
+
+        monkeypatch.setattr(TapManager, "list_skills", counting_skills)
+        monkeypatch.setattr(Linker, "list_links", counting_links)
+
+        report = HealthEngine(cellar).run()
+        assert sorted(calls) == [
+            ("links", "agent-a"),
+            ("links", "agent-b"),
+            ("skills", "mySkills"),
+            ("skills", "otherTap"),
+        ]
+        names = [c.name for c in report.checks]
+        assert "skills:otherTap" in names
+        assert "links:agent-b" in names
+
+    def test_reports_missing_descriptions(self, health_env):
+        cellar, _ = health_env
+        report = HealthEngine(cellar).run()
+        checks = {c.name: c for c in report.checks}
+        assert checks["skills:mySkills"].status == "ok"
+        assert checks["skills:otherTap"].issues == ["otherTap-two: missing description"]
+
+    def test_reports_broken_links(self, health_env):
+        cellar, tmp_path = health_env
+        (tmp_path / "agent-b" / "gone").symlink_to(cellar.tap_skills_dir("mySkills") / "gone")
+
+        report = HealthEngine(cellar).run()
+        checks = {c.name: c for c in report.checks}
+        assert checks["links:agent-a"].status == "ok"
+        assert checks["links:agent-b"].status == "error"
+        assert len(checks["links:agent-b"].issues) == 1
+        assert "Unlinked skills in mySkills: 1" in checks["links:agent-a"].notes
+        assert report.issues == 2  # broken link + missing description
+
+    def test_target_filter(self, health_env):
+        cellar, _ = health_env
+        report = HealthEngine(cellar, targets=["agent-b"]).run()
+        assert set(report.facts.links) == {"agent-b"}
+
+    def test_timings_recorded(self, health_env):
+        cellar, _ = health_env
+        report = HealthEngine(cellar).run()
+        assert set(report.facts.timings) == {
+            "skills:mySkills",
+            "skills:otherTap",
+            "links:agent-a",
+            "links:agent-b",
+        }
+        checks = {c.name: c for c in report.checks}
+        assert checks["links:agent-a"].seconds >= report.facts.timings["links:agent-a"]
+        assert report.total_seconds >= report.gather_seconds
+
+
+class TestDoctorCommand:
+    def test_json_report(self, health_env):
+        from neoskills.cli.main import cli
+
+        cellar, _ = health_env
+        result = CliRunner().invoke(cli, ["doctor", "--json", "--root", str(cellar.root)])
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["issues"] == 1
+        assert {c["name"] for c in data["checks"]} >= {"taps", "links:agent-a", "links:agent-b"}
+
+    def test_text_report_with_timings(self, health_env):
+        from neoskills.cli.main import cli
+
+        cellar, _ = health_env
+        result = CliRunner().invoke(
+            cli, ["doctor", "--timings", "--target", "agent-a", "--root", str(cellar.root)]
+        )
+        assert result.exit_code == 0, result.output
+        assert "agent-a: Links: 1 total, 1 healthy" in result.output
+        assert "agent-b" not in result.output
+        assert "Gathered facts in" in result.output
+        assert "1 issue(s) found." in result.output
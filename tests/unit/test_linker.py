@@ -182,6 +182,27 @@ class TestListLinks:
         linker = Linker(cellar)
         assert linker.list_links("test-agent") == []
 
+    def test_sibling_of_taps_dir_is_not_managed(self, link_env):
+        cellar, target_dir = link_env
+        # A path that merely starts with the taps directory's name
+        lookalike = cellar.root / "taps-old" / "skill-c"
+        lookalike.mkdir(parents=True)
+        (target_dir / "skill-c").symlink_to(lookalike)
+
+        links = Linker(cellar).list_links("test-agent")
+        assert [link["managed"] for link in links] == [False]
+        assert Linker(cellar).unlink_all("test-agent") == []
+        assert (target_dir / "skill-c").is_symlink()
+
+    def test_symlinked_root_is_managed(self, link_env, tmp_path: Path):
+        cellar, target_dir = link_env
+        alias = tmp_path / "alias"
+        alias.symlink_to(cellar.root)
+        linker = Linker(Cellar(alias))
+        linker.link("skill-a", cellar.tap_skills_dir("mySkills") / "skill-a", "test-agent")
+
+        assert [link["managed"] for link in linker.list_links("test-agent")] == [True]
+
 
 class TestCheckHealth:
     def test_healthy_system(self, link_env):
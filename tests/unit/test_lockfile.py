@@ -0,0 +1,171 @@
+"""Tests for neoskills.core.lockfile — neoskills.lock, install --locked, verify."""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from neoskills.cli.main import cli
+from neoskills.core.cellar import Cellar
+from neoskills.core.checksum import DigestCache, checksum_tree
+from neoskills.core.linker import Linker
+from neoskills.core.lockfile import Lockfile, generate_lock, install_locked, verify_lock
+from neoskills.core.tap import TapManager
+from tests.gitrepo import run_git
+
+
+@pytest.fixture
+def locked_env(tmp_path: Path, tap_remote):
+    url, work = tap_remote
+    cellar = Cellar(tmp_path / ".neoskills")
+    cellar.initialize()
+    config = cellar.load_config()
+    config["targets"] = {"test": {"skill_path": str(tmp_path / "agent" / "skills")}}
+    config["default_target"] = "test"
+    cellar.save_config(config)
+
+    TapManager(cellar).add("remote", url)
+    linker = Linker(cellar)
+    for sid in ("alpha", "beta"):
+        linker.link(sid, cellar.tap_skills_dir("remote") / sid)
+    return cellar, url, work
+
+
+class TestDigestCache:
+    def test_unchanged_files_are_not_reread(self, tmp_path: Path, monkeypatch):
+        d = tmp_path / "skill"
+        d.mkdir()
+        (d / "SKILL.md").write_text("# Skill\n")
+        cache = DigestCache(tmp_path / "digests.json")
+        first = checksum_tree(d, cache)
+        cache.save()
+
+        from neoskills.core import checksum
+
+        monkeypatch.setattr(checksum, "git_blob_id", lambda p: pytest.fail(f"re-read {p}"))
+        assert checksum_tree(d, DigestCache(tmp_path / "digests.json")) == first
+
+
+class TestLockfile:
+    def test_lock_records_commit_tree_and_checksum(self, locked_env):
+        cellar, url, work = locked_env
+        lock, dirty = generate_lock(cellar)
+        lock.save(cellar.lock_file)
+
+        loaded = Lockfile.load(cellar.lock_file)
+        head = run_git(work, "rev-parse", "HEAD").strip()
+        assert loaded.taps["remote"].url == url
+        assert loaded.taps["remote"].commit == head
+        assert set(loaded.skills) == {"alpha", "beta"}
+        alpha_tree = run_git(work, "rev-parse", "HEAD:skills/alpha").strip()
+        assert loaded.skills["alpha"].tree == alpha_tree
+        assert dirty == []
+
+    def test_clean_taps_verify_without_reading_content(self, locked_env, monkeypatch):
+        cellar, _, _ = locked_env
+        lock, _ = generate_lock(cellar)
+
+        from neoskills.core import checksum
+
+        monkeypatch.setattr(checksum, "git_blob_id", lambda p: pytest.fail(f"read {p}"))
+        results = verify_lock(cellar, lock)
+        assert [(r.status, r.via) for r in results] == [("ok", "git-blobs")] * 2
+
+    def test_local_edit_is_reported(self, locked_env):
+        cellar, _, _ = locked_env
+        lock, _ = generate_lock(cellar)
+        (cellar.tap_skills_dir("remote") / "beta" / "SKILL.md").write_text("# edited\n")
+
+        status = {r.skill_id: r.status for r in verify_lock(cellar, lock)}
+        assert status == {"alpha": "ok", "beta": "modified"}
+
+    def test_install_locked_restores_pinned_commit(self, locked_env):
+        cellar, _, work = locked_env
+        lock, _ = generate_lock(cellar)
+        pinned = lock.taps["remote"].commit
+
+        (work / "skills" / "alpha" / "SKILL.md").write_text("---\nname: alpha\n---\n\n# v2\n")
+        run_git(work, "commit", "-q", "-am", "Update alpha")
+        run_git(work, "push", "-q", "origin", "main")
+        TapManager(cellar).update("remote")
+        assert {r.skill_id: r.status for r in verify_lock(cellar, lock)}["alpha"] == "modified"
+
+        install_locked(cellar, lock)
+        tap_head = run_git(cellar.tap_dir("remote"), "rev-parse", "HEAD").strip()
+        assert tap_head == pinned
+        assert all(r.status == "ok" for r in verify_lock(cellar, lock))
+
+    def test_install_locked_clones_missing_tap(self, locked_env):
+        import shutil
+
+        cellar, _, _ = locked_env
+        lock, _ = generate_lock(cellar)
+        Linker(cellar).unlink_all()
+        shutil.rmtree(cellar.tap_dir("remote"))
+
+        actions = install_locked(cellar, lock)
+        assert [a.action for a in actions] == ["linked", "linked"]
+        assert all(r.status == "ok" for r in verify_lock(cellar, lock))
+
+    def test_install_locked_refuses_to_discard_local_commits(self, locked_env):
+        cellar, _, _ = locked_env
+        lock, _ = generate_lock(cellar)
+        tap_dir = cellar.tap_dir("remote")
+
+        (tap_dir / "skills" / "alpha" / "SKILL.md").write_text("# local work\n")
+        run_git(tap_dir, "commit", "-q", "-am", "Local work")
+        local = run_git(tap_dir, "rev-parse", "HEAD").strip()
+
+        with pytest.raises(ValueError, match="1 local commit"):
+            install_locked(cellar, lock)
+        assert run_git(tap_dir, "rev-parse", "HEAD").strip() == local
+
+
+    def test_lock_through_a_symlinked_root(self, locked_env, tmp_path: Path):
+        cellar, _, _ = locked_env
+        alias = tmp_path / "alias"
+        alias.symlink_to(cellar.root)
+        lock, _ = generate_lock(Cellar(alias))
+        assert set(lock.skills) == {"alpha", "beta"}
+
+
+class TestLockCli:
+    def test_lock_then_verify(self, locked_env):
+        cellar, _, _ = locked_env
+        runner = CliRunner()
+        root = str(cellar.root)
+
+        result = runner.invoke(cli, ["lock", "--root", root])
+        assert result.exit_code == 0, result.output
+        assert "Locked 2 skills from 1 taps" in result.output
+
+        result = runner.invoke(cli, ["verify", "--root", root])
+        assert result.exit_code == 0, result.output
+
+        (cellar.tap_skills_dir("remote") / "alpha" / "SKILL.md").write_text("# edited\n")
+        result = runner.invoke(cli, ["verify", "--root", root])
+        assert result.exit_code == 1
+        assert "modified: alpha" in result.output
+
+    def test_install_locked_without_lockfile(self, tmp_cellar: Cellar):
+        result = CliRunner().invoke(cli, ["install", "--locked", "--root", str(tmp_cellar.root)])
+        assert result.exit_code == 1
+        assert "No neoskills.lock" in result.output
+
+    @pytest.mark.parametrize("command", [["verify"], ["install", "--locked"]])
+    def test_malformed_lockfile_is_reported(self, tmp_cellar: Cellar, command):
+        tmp_cellar.lock_file.write_text('{"version": 2, "taps": ')
+        result = CliRunner().invoke(cli, [*command, "--root", str(tmp_cellar.root)])
+        assert result.exit_code == 1
+        assert "neoskills.lock is not valid JSON" in result.output
+
+    def test_install_locked_reports_git_failures(self, locked_env):
+        cellar, _, _ = locked_env
+        lock, _ = generate_lock(cellar)
+        lock.taps["remote"].commit = "f" * 40  # not on the remote
+        lock.save(cellar.lock_file)
+
+        result = CliRunner().invoke(cli, ["install", "--locked", "--root", str(cellar.root)])
+        assert result.exit_code == 1
+        assert "Error: Failed to install locked skills:" in result.output
+        assert isinstance(result.exception, SystemExit)  # reported, not a traceback
@@ -0,0 +1,197 @@
+"""Tests for the v0.2 → v0.3 migrate command and its journal."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from neoskills.cli import migrate_cmd
+from neoskills.cli.main import cli
+from neoskills.cli.migrate_cmd import JOURNAL_FILE, MigrationJournal
+from neoskills.core.frontmatter import parse_frontmatter
+
+SKILLS = ("alpha", "beta", "gamma")
+
+
+@pytest.fixture
+def v02_root(tmp_path: Path) -> Path:
+    """A v0.2 workspace with three bank skills, one with metadata and provenance."""
+    root = tmp_path / ".neoskills"
+    bank = root / "LTM" / "bank" / "skills"
+    for sid in SKILLS:
+        canonical = bank / sid / "canonical"
+        (canonical / "references").mkdir(parents=True)
+        (canonical / "SKILL.md").write_text(f"---\nname: {sid}\n---\n\n# {sid}\n")
+        (canonical / "references" / "notes.md").write_text(f"{sid} notes\n")
+    (bank / "alpha" / "metadata.yaml").write_text("version: 0.2.0\nauthor: me\ntags: [pdf]\n")
+    (bank / "alpha" / "provenance.yaml").write_text("source_type: local\n")
+    (root / "config.yaml").write_text(
+        f"version: 0.2.0\ndefault_target: test-user\n"
+        f"targets:\n  test:\n    skill_path: {tmp_path / 'agent'}\n"
+    )
+    return root
+
+
+def _migrate(root: Path, *args: str, exit_code: int = 0) -> str:
+    result = CliRunner().invoke(cli, ["migrate", "--root", str(root), *args])
+    assert result.exit_code == exit_code, result.output
+    return result.output
+
+
+def _journal(root: Path) -> list[dict]:
+    lines = (root / "cache" / JOURNAL_FILE).read_text().splitlines()
+    return [json.loads(line) for line in lines]
+
+
+class TestMigrate:
+    def test_migrates_bank_into_tap(self, v02_root: Path):
+        output = _migrate(v02_root, "--jobs", "2")
+        assert "Migrated 3 skills (0 skipped)" in output
+
+        skills_dir = v02_root / "taps" / "mySkills" / "skills"
+        assert sorted(p.name for p in skills_dir.iterdir()) == list(SKILLS)
+        fm, body = parse_frontmatter((skills_dir / "alpha" / "SKILL.md").read_text())
+        assert fm == {
+            "name": "alpha",
+            "version": "0.2.0",
+            "author": "me",
+            "tags": ["pdf"],
+            "source": "local",
+        }
+        assert body == "# alpha"
+        assert (skills_dir / "beta" / "references" / "notes.md").read_text() == "beta notes\n"
+        # The bank is untouched: SKILL.md was rewritten, not written through a link
+        bank_md = v02_root / "LTM" / "bank" / "skills" / "alpha" / "canonical" / "SKILL.md"
+        assert bank_md.read_text() == "---\nname: alpha\n---\n\n# alpha\n"
+
+        journal = _journal(v02_root)
+        assert journal[0] == {"tap": "mySkills"}
+        assert sorted(e["skill"] for e in journal if e.get("state") == "done") == list(SKILLS)
+
+    def test_dry_run_writes_nothing(self, v02_root: Path):
+        output = _migrate(v02_root, "--dry-run")
+        assert "Would migrate 3 skills" in output
+        assert not (v02_root / "taps").exists()
+        assert not (v02_root / "cache" / JOURNAL_FILE).exists()
+
+    def test_rerun_skips_completed_skills(self, v02_root: Path):
+        _migrate(v02_root)
+        edited = v02_root / "taps" / "mySkills" / "skills" / "beta" / "SKILL.md"
+        edited.unlink()
+        edited.write_text("---\nname: beta\n---\n\nEdited after migration\n")
+
+        output = _migrate(v02_root)
+        assert "Resuming: 3 skills already migrated, 0 interrupted" in output
+        assert "Migrated 0 skills (0 skipped, 3 already migrated)" in output
+        assert "Edited after migration" in edited.read_text()
+
+    def test_restart_ignores_the_journal(self, v02_root: Path):
+        _migrate(v02_root)
+        edited = v02_root / "taps" / "mySkills" / "skills" / "beta" / "SKILL.md"
+        edited.write_text("---\nname: beta\n---\n\nEdited after migration\n")
+
+        output = _migrate(v02_root, "--restart")
+        assert "Resuming:" not in output
+        assert "Migrated 3 skills (0 skipped)" in output
+        assert "Edited after migration" not in edited.read_text()
+        assert [e.get("state") for e in _journal(v02_root)].count("done") == 3
+
+    def test_skill_is_journaled_when_its_worker_starts(self, v02_root: Path, monkeypatch):
+        migrate_skill = migrate_cmd._migrate_skill
+        started_at_call = {}
+
+        def spy(skill_id, *args):
+            entries = _journal(v02_root)
+            started_at_call[skill_id] = [e["skill"] for e in entries if e.get("state") == "started"]
+            return migrate_skill(skill_id, *args)
+
+        monkeypatch.setattr(migrate_cmd, "_migrate_skill", spy)
+        _migrate(v02_root, "--jobs", "1")
+        assert started_at_call == {
+            "alpha": ["alpha"],
+            "beta": ["alpha", "beta"],
+            "gamma": ["alpha", "beta", "gamma"],
+        }
+
+    def test_failed_skill_is_retried_on_rerun(self, v02_root: Path, monkeypatch):
+        migrate_skill = migrate_cmd._migrate_skill
+
+        def flaky(skill_id, *args):
+            if skill_id == "beta":
+                raise OSError("disk full")
+            return migrate_skill(skill_id, *args)
+
+        monkeypatch.setattr(migrate_cmd, "_migrate_skill", flaky)
+        output = _migrate(v02_root)
+        assert "Failed beta: disk full" in output
+        assert "Migrated 2 skills (0 skipped, 1 failed)" in output
+        skills_dir = v02_root / "taps" / "mySkills" / "skills"
+        assert not (skills_dir / "beta").exists()
+
+        monkeypatch.setattr(migrate_cmd, "_migrate_skill", migrate_skill)
+        output = _migrate(v02_root)
+        assert "Resuming: 2 skills already migrated, 1 interrupted" in output
+        assert "Migrated 1 skills (0 skipped, 2 already migrated)" in output
+        assert sorted(p.name for p in skills_dir.iterdir()) == list(SKILLS)
+
+    def test_unreadable_skill_fails_alone(self, v02_root: Path):
+        bank = v02_root / "LTM" / "bank" / "skills"
+        (bank / "beta" / "canonical" / "SKILL.md").write_bytes(b"---\nname: b\xe9ta\n---\n")
+        (bank / "gamma" / "canonical" / "__pycache__").mkdir()
+        (bank / "gamma" / "canonical" / "__pycache__" / "x.pyc").write_bytes(b"\0")
+
+        output = _migrate(v02_root, "--jobs", "2")
+        assert "Failed beta: UnicodeDecodeError:" in output
+        assert "Migrated 2 skills (0 skipped, 1 failed)" in output
+        skills_dir = v02_root / "taps" / "mySkills" / "skills"
+        assert sorted(p.name for p in skills_dir.iterdir()) == ["alpha", "gamma"]
+        assert sorted(p.name for p in (skills_dir / "gamma").iterdir()) == [
+            "SKILL.md",
+            "references",
+        ]
+
+    def test_interrupted_migration_resumes(self, v02_root: Path, monkeypatch):
+        migrate_skill = migrate_cmd._migrate_skill
+
+        def interrupted(skill_id, old_skill_dir, new_skills_dir, *args):
+            if skill_id == "gamma":
+                # Killed while building the skill in staging
+                (new_skills_dir / ".gamma.migrating").mkdir()
+                raise KeyboardInterrupt
+            return migrate_skill(skill_id, old_skill_dir, new_skills_dir, *args)
+
+        monkeypatch.setattr(migrate_cmd, "_migrate_skill", interrupted)
+        _migrate(v02_root, "--jobs", "1", exit_code=1)
+        skills_dir = v02_root / "taps" / "mySkills" / "skills"
+        assert not (skills_dir / "gamma").exists()
+
+        monkeypatch.setattr(migrate_cmd, "_migrate_skill", migrate_skill)
+        output = _migrate(v02_root)
+        assert "Resuming:" in output
+        assert sorted(p.name for p in skills_dir.iterdir()) == list(SKILLS)
+        assert (skills_dir / "gamma" / "references" / "notes.md").exists()
+
+
+class TestMigrationJournal:
+    def test_journal_for_another_tap_is_ignored(self, tmp_path: Path):
+        path = tmp_path / JOURNAL_FILE
+        journal = MigrationJournal(path, "otherTap")
+        journal.open(resume=False)
+        journal.record("alpha", "started")
+        journal.record("alpha", "done")
+        journal.close()
+
+        assert MigrationJournal(path, "otherTap").load() == ({"alpha"}, set())
+        assert MigrationJournal(path, "mySkills").load() == (set(), set())
+
+    def test_torn_last_line_is_ignored(self, tmp_path: Path):
+        path = tmp_path / JOURNAL_FILE
+        path.write_text(
+            '{"tap": "mySkills"}\n'
+            '{"skill": "alpha", "state": "started"}\n'
+            '{"skill": "alpha", "state": "done"}\n'
+            '{"skill": "beta", "state": "started"}\n'
+            '{"skill": "beta", "sta'
+        )
+        assert MigrationJournal(path, "mySkills").load() == ({"alpha"}, {"beta"})
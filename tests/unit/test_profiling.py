@@ -0,0 +1,131 @@
+"""Tests for neoskills.core.profiling and the global --profile option."""
+
+import cProfile
+import pstats
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from neoskills.core import profiling
+from neoskills.core.profiling import collapsed_stacks, profile, profiled
+
+
+def _inner() -> int:
+    return sum(i * i for i in range(20000))
+
+
+def _outer() -> int:
+    return _inner() + _inner()
+
+
+class TestCollapsedStacks:
+    def test_nested_frames(self):
+        prof = cProfile.Profile()
+        prof.enable()
+        _outer()
+        prof.disable()
+
+        lines = collapsed_stacks(pstats.Stats(prof))
+        stacks = [line.rsplit(" ", 1)[0] for line in lines]
+        outer, inner = _outer.__code__.co_firstlineno, _inner.__code__.co_firstlineno
+        assert any(
+            s.endswith(f"_outer (test_profiling.py:{outer});_inner (test_profiling.py:{inner})")
+            for s in stacks
+        )
+        assert all(int(line.rsplit(" ", 1)[1]) >= 1 for line in lines)
+
+
+class TestProfile:
+    def test_writes_pstats_and_hotspots(self, tmp_path, capsys):
+        out = tmp_path / "run.prof"
+        with profile(out, top=3):
+            _outer()
+        assert "_inner" in str(pstats.Stats(str(out)).stats)
+        err = capsys.readouterr().err
+        assert "restriction <3>" in err
+        assert f"written to {out}" in err
+
+    def test_directory_gets_unique_file(self, tmp_path):
+        with profile(tmp_path, fmt="collapsed", top=0, label="unit"):
+            _outer()
+        (written,) = tmp_path.iterdir()
+        assert written.name.startswith("unit-")
+        assert written.suffix == ".folded"
+
+    def test_nested_profile_is_noop(self, tmp_path):
+        with (
+            profile(tmp_path / "a.prof", top=0) as outer,
+            profile(tmp_path / "b.prof", top=0) as inner,
+        ):
+            _inner()
+        assert outer is not None
+        assert inner is None
+        assert not (tmp_path / "b.prof").exists()
+
+    def test_profiled_follows_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(profiling.PROFILE_ENV, str(tmp_path))
+        monkeypatch.setenv(profiling.PROFILE_TOP_ENV, "0")
+        assert profiled(_outer)() == _outer()
+        assert [p.name.startswith("_outer-") for p in tmp_path.iterdir()] == [True]
+
+        monkeypatch.setenv(profiling.PROFILE_ENV, "0")
+        profiled(_outer)()
+        assert len(list(tmp_path.iterdir())) == 1
+
+    def test_invalid_env_format_falls_back(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv(profiling.PROFILE_ENV, str(tmp_path))
+        monkeypatch.setenv(profiling.PROFILE_FORMAT_ENV, "svg")
+        monkeypatch.setenv(profiling.PROFILE_TOP_ENV, "0")
+        assert profiled(_outer)() == _outer()
+        assert [p.suffix for p in tmp_path.iterdir()] == [".prof"]
+        assert "Ignoring NEOSKILLS_PROFILE_FORMAT='svg'" in capsys.readouterr().err
+
+
+class TestProfileOption:
+    def test_bare_flag_before_command(self, tmp_path, monkeypatch):
+        from neoskills.cli.main import cli
+
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(
+            cli, ["--profile", "--profile-top", "0", "doctor", "--root", str(tmp_path / "ws")]
+        )
+        assert result.exit_code == 0, result.output
+        (written,) = Path(tmp_path).glob("neoskills-doctor-*.prof")
+        assert pstats.Stats(str(written)).total_calls > 0
+
+    @pytest.mark.parametrize("spelling", ["--profile={out}", "--profile {out}"])
+    def test_path_spellings(self, tmp_path, spelling):
+        from neoskills.cli.main import cli
+
+        out = tmp_path / "doctor.prof"
+        argv = [*spelling.format(out=out).split(" "), "--profile-top", "0", "doctor"]
+        result = CliRunner().invoke(cli, [*argv, "--root", str(tmp_path / "ws")])
+        assert result.exit_code == 0, result.output
+        assert pstats.Stats(str(out)).total_calls > 0
+
+    def test_invalid_env_format_is_rejected(self, tmp_path, monkeypatch):
+        from neoskills.cli.main import cli
+
+        monkeypatch.setenv(profiling.PROFILE_FORMAT_ENV, "svg")
+        result = CliRunner().invoke(cli, ["--profile", "doctor", "--root", str(tmp_path)])
+        assert result.exit_code == 2
+        assert "Invalid value for '--profile-format'" in result.output
+
+    def test_collapsed_path(self, tmp_path):
+        from neoskills.cli.main import cli
+
+        out = tmp_path / "doctor.folded"
+        result = CliRunner().invoke(
+            cli,
+            [
+                f"--profile={out}",
+                "--profile-format",
+                "collapsed",
+                "doctor",
+                "--root",
+                str(tmp_path / "ws"),
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert any("doctor (doctor_cmd.py" in line for line in out.read_text().splitlines())
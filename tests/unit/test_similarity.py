@@ -0,0 +1,45 @@
+"""Tests for neoskills.core.similarity — TF-IDF neighbors and MinHash signatures."""
+
+from collections import Counter
+
+import pytest
+
+from neoskills.core.similarity import (
+    estimate_jaccard,
+    minhash_signature,
+    tfidf_neighbors,
+    tokenize,
+)
+
+
+class TestTfidfNeighbors:
+    def test_numpy_blocks_match_pure_python(self):
+        pytest.importorskip("numpy")
+        common = [f"c{i}" for i in range(40)]
+        rare = [f"r{i}" for i in range(2000)]
+        documents = []
+        for i in range(300):
+            words = [common[(i * 7 + n) % 40] for n in range(30)]
+            words += [rare[(i * 13 + n * n) % 2000] for n in range(20)]
+            documents.append(Counter(tokenize(" ".join([f"s-{i % 150}", rare[i], *words]))))
+
+        expected = tfidf_neighbors(documents, k=4, use_numpy=False)
+        assert tfidf_neighbors(documents, k=4, use_numpy=True) == expected
+        # Blocks of a few rows each give the same answer
+        assert tfidf_neighbors(documents, k=4, use_numpy=True, max_cells=1000) == expected
+
+    def test_tokenize_drops_single_characters(self):
+        assert tokenize("Read a PDF, v2 of x-ray") == ["read", "pdf", "v2", "of", "ray"]
+
+
+class TestMinHash:
+    def test_minhash_estimates_jaccard(self):
+        base = " ".join(f"word{i}" for i in range(300))
+        one_edit = base.replace("word150 ", "changed ")
+        many_edits = " ".join(f"word{i}" if i % 10 else "x" for i in range(300))
+        a = minhash_signature(base)
+        assert minhash_signature(base) == a
+        assert estimate_jaccard(a, a) == 1.0
+        assert estimate_jaccard(a, minhash_signature(one_edit)) >= 0.9
+        assert 0.2 < estimate_jaccard(a, minhash_signature(many_edits)) < 0.8
+        assert estimate_jaccard(a, minhash_signature("unrelated text here")) == 0.0
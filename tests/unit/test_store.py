@@ -0,0 +1,210 @@
+"""Tests for neoskills.core.store — content-addressed blob store."""
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from neoskills.cli.main import cli
+from neoskills.core.cellar import Cellar
+from neoskills.core.checksum import checksum_directory
+from neoskills.core.frontmatter import parse_frontmatter, write_frontmatter
+from neoskills.core.store import BlobStore
+
+
+@pytest.fixture
+def skill_dir(tmp_path: Path) -> Path:
+    d = tmp_path / "tapA" / "skills" / "shared-skill"
+    (d / "scripts").mkdir(parents=True)
+    (d / "SKILL.md").write_text(write_frontmatter({"name": "shared-skill"}, "# Shared\n"))
+    (d / "scripts" / "run.sh").write_text("#!/bin/sh\necho run\n")
+    os.chmod(d / "scripts" / "run.sh", 0o755)
+    (d / "__pycache__").mkdir()
+    (d / "__pycache__" / "x.pyc").write_bytes(b"\0")
+    return d
+
+
+class TestBlobStore:
+    def test_identical_files_are_stored_once(self, tmp_path: Path, skill_dir: Path):
+        store = BlobStore(tmp_path / "blobs")
+        copy = tmp_path / "copy.md"
+        copy.write_bytes((skill_dir / "SKILL.md").read_bytes())
+
+        d1, blob1 = store.add(skill_dir / "SKILL.md")
+        d2, blob2 = store.add(copy)
+        assert d1 == d2 and blob1 == blob2
+        assert not os.access(blob1, os.W_OK) or os.geteuid() == 0
+        assert len(list((tmp_path / "blobs").rglob("*"))) == 2  # one fan-out dir + one blob
+
+    def test_materialize_tree_reproduces_content(self, tmp_path: Path, skill_dir: Path):
+        store = BlobStore(tmp_path / "blobs")
+        dest = tmp_path / "tapB" / "skills" / "shared-skill"
+        stats = store.materialize_tree(skill_dir, dest)
+
+        assert stats.files == 2
+        assert stats.reflinked + stats.copied == 2
+        assert checksum_directory(dest) == checksum_directory(skill_dir)
+        assert os.access(dest / "scripts" / "run.sh", os.X_OK)
+        assert not (dest / "__pycache__").exists()
+
+    def test_materialized_files_never_share_the_blob_inode(self, tmp_path: Path, skill_dir: Path):
+        store = BlobStore(tmp_path / "blobs")
+        dest = tmp_path / "dest"
+        store.materialize_tree(skill_dir, dest)
+
+        _, blob = store.add(skill_dir / "scripts" / "run.sh")
+        placed = dest / "scripts" / "run.sh"
+        assert placed.stat().st_ino != blob.stat().st_ino
+        assert placed.stat().st_nlink == 1 and blob.stat().st_nlink == 1
+        placed.write_text("#!/bin/sh\necho changed\n")
+        assert blob.read_text() == "#!/bin/sh\necho run\n"
+
+    def test_materialize_tree_skips_top_level_names(self, tmp_path: Path, skill_dir: Path):
+        (skill_dir / "scripts" / "SKILL.md").write_text("nested\n")
+        store = BlobStore(tmp_path / "blobs")
+        dest = tmp_path / "dest"
+        stats = store.materialize_tree(skill_dir, dest, skip={"SKILL.md"})
+
+        assert stats.files == 2
+        assert sorted(p.name for p in dest.iterdir()) == ["scripts"]
+        assert (dest / "scripts" / "SKILL.md").read_text() == "nested\n"
+
+    def test_materialize_tree_merges_into_existing_dir(self, tmp_path: Path, skill_dir: Path):
+        dest = tmp_path / "dest"
+        (dest / "scripts" / "run.sh").mkdir(parents=True)  # replaced by the file
+        (dest / "SKILL.md").write_text("old\n")
+        (dest / "local.md").write_text("mine\n")
+        BlobStore(tmp_path / "blobs").materialize_tree(skill_dir, dest)
+
+        assert (dest / "SKILL.md").read_text() == (skill_dir / "SKILL.md").read_text()
+        assert (dest / "scripts" / "run.sh").read_text() == "#!/bin/sh\necho run\n"
+        assert (dest / "local.md").read_text() == "mine\n"
+
+    def test_materialize_tree_follows_symlinks(self, tmp_path: Path, skill_dir: Path):
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        (shared / "lib.sh").write_text("lib\n")
+        (skill_dir / "lib").symlink_to(shared, target_is_directory=True)
+        (skill_dir / "run.sh").symlink_to("scripts/run.sh")
+        (skill_dir / "dangling").symlink_to("missing.md")
+        (skill_dir / "scripts" / "up").symlink_to("..", target_is_directory=True)
+        dest = tmp_path / "dest"
+        stats = BlobStore(tmp_path / "blobs").materialize_tree(skill_dir, dest)
+
+        assert not (dest / "lib").is_symlink()
+        assert (dest / "lib" / "lib.sh").read_text() == "lib\n"
+        assert not (dest / "run.sh").is_symlink()
+        assert os.access(dest / "run.sh", os.X_OK)
+        # Links that cannot be followed are kept as links
+        assert os.readlink(dest / "dangling") == "missing.md"
+        assert os.readlink(dest / "scripts" / "up") == ".."
+        assert stats.files == 4 and stats.symlinks == 2
+
+    def test_copy_mode_never_links(self, tmp_path: Path, skill_dir: Path):
+        store = BlobStore(tmp_path / "blobs", link_mode="copy")
+        stats = store.materialize_tree(skill_dir, tmp_path / "dest")
+        assert stats.copied == 2
+        assert (tmp_path / "dest" / "SKILL.md").stat().st_nlink == 1
+
+    def test_can_reflink_probe_leaves_nothing_behind(self, tmp_path: Path):
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        store = BlobStore(tmp_path / "blobs")
+        assert store.can_reflink(dest) in (True, False)
+        assert list(dest.iterdir()) == list((tmp_path / "blobs").iterdir()) == []
+        assert BlobStore(tmp_path / "blobs", link_mode="copy").can_reflink(dest) is False
+
+    def test_gc_removes_blobs_no_tap_file_has(self, tmp_path: Path, skill_dir: Path):
+        store = BlobStore(tmp_path / "blobs")
+        dest = tmp_path / "tapB" / "skills" / "shared-skill"
+        store.materialize_tree(skill_dir, dest)
+        _, orphan = store.add(tmp_path / "tapB" / "skills" / "shared-skill" / "SKILL.md")
+        (dest / "SKILL.md").write_text("edited\n")
+        (skill_dir / "SKILL.md").unlink()
+
+        assert store.gc([tmp_path / "tapA", tmp_path / "tapB"]) == 1
+        assert not orphan.exists()
+        _, kept = store.add(skill_dir / "scripts" / "run.sh")
+        assert kept.exists()
+        assert [p for p in (tmp_path / "blobs").rglob("*") if p.is_file()] == [kept]
+
+    def test_unknown_mode_rejected(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="Unknown link mode"):
+            BlobStore(tmp_path, link_mode="hardlink")
+
+
+class TestInstallFromTap:
+    @pytest.mark.parametrize("reflink", [True, False])
+    def test_install_from_other_tap_leaves_store_intact(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, reflink: bool
+    ):
+        # Reflinks are faked: the store falls back to copies where they fail
+        monkeypatch.setattr(BlobStore, "can_reflink", lambda self, dest_dir: reflink)
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        config = cellar.load_config()
+        config["targets"] = {"test": {"skill_path": str(tmp_path / "agent")}}
+        config["default_target"] = "test"
+        cellar.save_config(config)
+
+        src = cellar.tap_skills_dir("community") / "helper"
+        src.mkdir(parents=True)
+        original = write_frontmatter({"name": "helper"}, "# Helper\n")
+        (src / "SKILL.md").write_text(original)
+        cellar.tap_skills_dir("mySkills").mkdir(parents=True)
+
+        result = CliRunner().invoke(
+            cli, ["install", "helper", "--from", "community", "--root", str(cellar.root)]
+        )
+        assert result.exit_code == 0, result.output
+
+        installed = cellar.tap_skills_dir("mySkills") / "helper" / "SKILL.md"
+        fm, _ = parse_frontmatter(installed.read_text())
+        assert fm["source"] == "community"
+        # The frontmatter rewrite must not leak into the shared blob or the source tap
+        assert (src / "SKILL.md").read_text() == original
+        # Without reflinks the store is bypassed: it would only hold a second copy
+        blobs = [p for p in (cellar.cache_dir / "blobs").rglob("*") if p.is_file()]
+        assert [b.read_text() for b in blobs] == ([original] if reflink else [])
+
+    def test_validate_fix_leaves_store_blob_unchanged(self, tmp_path: Path):
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        src = cellar.tap_skills_dir("community") / "helper"
+        (src / "scripts").mkdir(parents=True)
+        (src / "SKILL.md").write_text(
+            write_frontmatter({"name": "helper", "description": "Helps"}, "# Helper\n")
+        )
+        (src / "scripts" / "run.sh").write_text("#!/bin/sh\necho run\n")
+        os.chmod(src / "scripts" / "run.sh", 0o644)
+        cellar.tap_skills_dir("mySkills").mkdir(parents=True)
+
+        runner = CliRunner()
+        root = ["--root", str(cellar.root)]
+        result = runner.invoke(cli, ["install", "helper", "--from", "community", *root])
+        assert result.exit_code == 0, result.output
+        result = runner.invoke(cli, ["validate", "--tap", "mySkills", "--fix", *root])
+        assert result.exit_code == 0, result.output
+
+        installed = cellar.tap_skills_dir("mySkills") / "helper" / "scripts" / "run.sh"
+        assert installed.stat().st_mode & 0o111
+        # The chmod reached neither the blob nor the source tap
+        _, blob = BlobStore.for_cellar(cellar).add(src / "scripts" / "run.sh")
+        assert stat.S_IMODE(blob.stat().st_mode) == 0o444
+        assert not (src / "scripts" / "run.sh").stat().st_mode & 0o111
+
+    def test_untap_removes_its_blobs(self, tmp_path: Path):
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        src = cellar.tap_skills_dir("community") / "helper"
+        src.mkdir(parents=True)
+        (src / "SKILL.md").write_text(write_frontmatter({"name": "helper"}, "# Helper\n"))
+        store = BlobStore.for_cellar(cellar)
+        _, blob = store.add(src / "SKILL.md")
+
+        result = CliRunner().invoke(cli, ["untap", "community", "--root", str(cellar.root)])
+        assert result.exit_code == 0, result.output
+        assert "Removed 1 unused blob(s)" in result.output
+        assert not blob.exists()
@@ -0,0 +1,29 @@
+"""Tests for tests.benchmarks.synth — the synthetic tap generator."""
+
+from pathlib import Path
+
+from tests.benchmarks.synth import TapSpec, generate_tap
+
+
+def _snapshot(root: Path) -> dict[str, tuple[bytes, int]]:
+    return {
+        p.relative_to(root).as_posix(): (p.read_bytes(), p.stat().st_mode & 0o777)
+        for p in root.rglob("*")
+        if p.is_file()
+    }
+
+
+class TestGenerateTap:
+    def test_same_seed_gives_identical_trees(self, tmp_path: Path):
+        spec = TapSpec(skills=40, seed=7, duplicate_ratio=0.3, script_ratio=0.5)
+        ids_a = generate_tap(tmp_path / "a", spec)
+        ids_b = generate_tap(tmp_path / "b", spec)
+
+        assert ids_a == ids_b
+        assert _snapshot(tmp_path / "a") == _snapshot(tmp_path / "b")
+
+    def test_different_seed_gives_different_content(self, tmp_path: Path):
+        generate_tap(tmp_path / "a", TapSpec(skills=40, seed=7))
+        generate_tap(tmp_path / "b", TapSpec(skills=40, seed=8))
+
+        assert _snapshot(tmp_path / "a") != _snapshot(tmp_path / "b")
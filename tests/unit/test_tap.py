@@ -8,6 +8,7 @@ import yaml
 from neoskills.core.cellar import Cellar
 from neoskills.core.frontmatter import write_frontmatter
 from neoskills.core.tap import TapManager
+from tests.gitrepo import run_git
 
 
 @pytest.fixture
@@ -147,3 +148,362 @@ class TestRemoveTap:
     def test_remove_nonexistent(self, tap_env: Cellar):
         mgr = TapManager(tap_env)
         assert mgr.remove("nonexistent") is False
+
+
+class TestSparseClone:
+    def test_add_checks_out_only_skills_plugins_and_root_files(self, tmp_path, tap_remote):
+        url, _ = tap_remote
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        mgr = TapManager(cellar)
+
+        tap_dir = mgr.add("remoteTap", url)
+        assert (tap_dir / "skills" / "alpha" / "SKILL.md").exists()
+        assert (tap_dir / "plugins" / "helper" / "plugin.yaml").exists()
+        assert (tap_dir / "tap.yaml").exists()
+        assert not (tap_dir / "docs").exists()
+        assert cellar.load_config()["taps"]["remoteTap"]["clone"] == "partial"
+        assert len(mgr.list_skills("remoteTap")) == 2
+
+    def test_update_honors_sparse_filter(self, tmp_path, tap_remote):
+
+        url, work = tap_remote
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        mgr = TapManager(cellar)
+        tap_dir = mgr.add("remoteTap", url)
+
+        (work / "skills" / "gamma").mkdir()
+        (work / "skills" / "gamma" / "SKILL.md").write_text("---\nname: gamma\n---\n")
+        (work / "docs" / "guide.md").write_text("# Guide\n")
+        run_git(work, "add", "-A")
+        run_git(work, "commit", "-q", "-m", "Add gamma")
+        run_git(work, "push", "-q", "origin", "main")
+
+        assert mgr.update("remoteTap") == ["remoteTap"]
+        assert (tap_dir / "skills" / "gamma" / "SKILL.md").exists()
+        assert not (tap_dir / "docs").exists()
+
+    def test_falls_back_to_full_clone(self, tmp_path, tap_remote, monkeypatch):
+        import git
+
+        def unsupported(*args, **kwargs):
+            raise git.GitCommandError("clone", 129, b"error: unknown option `sparse'")
+
+        url, _ = tap_remote
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        mgr = TapManager(cellar)
+        monkeypatch.setattr(mgr, "_clone_sparse", unsupported)
+
+        tap_dir = mgr.add("remoteTap", url)
+        assert (tap_dir / "docs").exists()
+        assert cellar.load_config()["taps"]["remoteTap"]["clone"] == "full"
+
+
+class TestSharedObjectStore:
+    @pytest.fixture
+    def shared_env(self, tmp_path, tap_remote):
+
+        url, work = tap_remote
+        fork = tmp_path / "fork.git"
+        run_git(tmp_path, "clone", "-q", "--bare", url, str(fork))
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        config = cellar.load_config()
+        config["shared_objects"] = True
+        cellar.save_config(config)
+        return cellar, url, fork.as_uri(), work
+
+    def test_related_taps_borrow_objects_from_store(self, shared_env):
+        cellar, url, fork_url, _ = shared_env
+        mgr = TapManager(cellar)
+        upstream = mgr.add("upstream", url)
+        fork = mgr.add("fork", fork_url)
+
+        store_objects = str(cellar.object_store_dir / "objects")
+        for tap_dir in (upstream, fork):
+            alternates = tap_dir / ".git" / "objects" / "info" / "alternates"
+            assert alternates.read_text().strip() == store_objects
+            assert not list((tap_dir / ".git" / "objects" / "pack").glob("*.pack"))
+            assert not (tap_dir / "docs").exists()
+        assert cellar.load_config()["taps"]["fork"]["clone"] == "shared"
+        assert len(mgr.list_skills("fork")) == 2
+
+    def test_store_is_blobless_and_shallow(self, shared_env):
+        cellar, url, _, work = shared_env
+        TapManager(cellar).add("upstream", url)
+
+        store = cellar.object_store_dir
+        docs_blob = run_git(work, "rev-parse", "HEAD:docs/screenshot.bin").strip()
+        skill_blob = run_git(work, "rev-parse", "HEAD:skills/alpha/SKILL.md").strip()
+        missing = run_git(store, "rev-list", "--objects", "--all", "--missing=print")
+        assert f"?{docs_blob}" in missing.split()
+        assert f"?{skill_blob}" not in missing.split()
+        assert (store / "shallow").exists()
+
+    def test_shared_clone_failure_is_not_hidden_by_full_clone(self, shared_env, monkeypatch):
+        import git
+
+        def broken(*args, **kwargs):
+            raise git.GitCommandError("fetch", 128, b"fatal: could not read from remote")
+
+        cellar, url, _, _ = shared_env
+        mgr = TapManager(cellar)
+        monkeypatch.setattr(mgr, "_clone_shared", broken)
+        with pytest.raises(git.GitCommandError):
+            mgr.add("upstream", url)
+        assert not cellar.tap_dir("upstream").exists()
+        assert "upstream" not in cellar.load_config().get("taps", {})
+
+    def test_fetch_commit_goes_through_store(self, shared_env):
+        cellar, url, _, work = shared_env
+        mgr = TapManager(cellar)
+        tap_dir = mgr.add("upstream", url)
+
+        (work / "skills" / "alpha" / "SKILL.md").write_text("---\nname: alpha\n---\n\n# v2\n")
+        run_git(work, "commit", "-q", "-am", "Update alpha")
+        run_git(work, "push", "-q", "origin", "main")
+        sha = run_git(work, "rev-parse", "HEAD").strip()
+
+        mgr.fetch_commit("upstream", sha)
+        run_git(tap_dir, "checkout", "-q", sha)
+        assert "# v2" in (tap_dir / "skills" / "alpha" / "SKILL.md").read_text()
+        assert not list((tap_dir / ".git" / "objects" / "pack").glob("*.pack"))
+        run_git(cellar.object_store_dir, "cat-file", "-e", sha)
+
+    def test_update_fast_forwards_through_store(self, shared_env):
+
+        cellar, url, _, work = shared_env
+        mgr = TapManager(cellar)
+        tap_dir = mgr.add("upstream", url)
+
+        (work / "skills" / "alpha" / "SKILL.md").write_text("---\nname: alpha\n---\n\n# v2\n")
+        run_git(work, "commit", "-q", "-am", "Update alpha")
+        run_git(work, "push", "-q", "origin", "main")
+
+        assert mgr.update("upstream") == ["upstream"]
+        assert "# v2" in (tap_dir / "skills" / "alpha" / "SKILL.md").read_text()
+
+    def test_gc_keeps_referenced_objects_and_drops_removed_taps(self, shared_env):
+        import git
+
+        cellar, url, fork_url, _ = shared_env
+        mgr = TapManager(cellar)
+        mgr.add("upstream", url)
+        fork_dir = mgr.add("fork", fork_url)
+
+        # A commit made inside the tap lives only in the tap's own object db
+        (fork_dir / "skills" / "local").mkdir()
+        (fork_dir / "skills" / "local" / "SKILL.md").write_text("---\nname: local\n---\n")
+        run_git(fork_dir, "add", "-A")
+        run_git(fork_dir, "commit", "-q", "-m", "Local skill")
+
+        mgr.remove("upstream")
+        result = mgr.gc_object_store()
+        assert result["referencing"] == ["fork"]
+        assert result["dropped_refs"] == 0  # remove() already dropped upstream's refs
+
+        store = git.Repo(cellar.object_store_dir)
+        refs = store.git.for_each_ref("--format=%(refname)").split()
+        assert not any(r.startswith("refs/taps/upstream/") for r in refs)
+        run_git(fork_dir, "fsck", "--no-dangling")
+
+    def test_gc_keeps_commits_only_in_tap_reflogs(self, shared_env):
+        cellar, url, _, work = shared_env
+        mgr = TapManager(cellar)
+        tap_dir = mgr.add("upstream", url)
+        first = run_git(work, "rev-parse", "HEAD").strip()
+
+        (work / "skills" / "alpha" / "SKILL.md").write_text("---\nname: alpha\n---\n\n# v2\n")
+        run_git(work, "commit", "-q", "-am", "Update alpha")
+        run_git(work, "push", "-q", "origin", "main")
+        second = run_git(work, "rev-parse", "HEAD").strip()
+        mgr.update("upstream")
+
+        # Upstream rewinds; the tap now names `second` only through its reflog
+        run_git(work, "push", "-q", "--force", "origin", f"{first}:main")
+        run_git(tap_dir, "reset", "-q", "--hard", first)
+        mgr.update("upstream")
+
+        mgr.gc_object_store()
+        store = cellar.object_store_dir
+        run_git(store, "rev-parse", "--verify", f"refs/taps/upstream/keep/reflog/{second}")
+        run_git(store, "cat-file", "-e", second)
+        run_git(tap_dir, "fsck", "--no-dangling")
+
+
+class TestUpdateChangeSet:
+    @pytest.fixture
+    def upstream_change(self, tmp_path, tap_remote):
+        """A cellar tapping the remote, plus an upstream commit touching three skills."""
+
+        url, work = tap_remote
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        mgr = TapManager(cellar)
+        mgr.add("remote", url)
+        mgr.list_skills("remote")  # build the catalog
+
+        (work / "skills" / "alpha" / "SKILL.md").write_text(
+            "---\nname: alpha\ndescription: Alpha v2\n---\n"
+        )
+        run_git(work, "rm", "-q", "-r", "skills/beta")
+        (work / "skills" / "gamma").mkdir()
+        (work / "skills" / "gamma" / "SKILL.md").write_text(
+            "---\nname: gamma\ndescription: New\n---\n"
+        )
+        (work / "docs" / "notes.md").write_text("not a skill\n")
+        run_git(work, "add", "-A")
+        run_git(work, "commit", "-q", "-m", "Upstream changes")
+        run_git(work, "push", "-q", "origin", "main")
+        return cellar, mgr
+
+    def test_update_publishes_skill_changes(self, upstream_change):
+        from neoskills.core.changeset import add_change_listener, remove_change_listener
+
+        _, mgr = upstream_change
+        received = []
+
+        def listener(cellar, changes):
+            received.append(changes)
+
+        add_change_listener(listener)
+        try:
+            mgr.update("remote")
+        finally:
+            remove_change_listener(listener)
+
+        changes = mgr.last_changes["remote"]
+        assert (changes.added, changes.modified, changes.removed) == (
+            {"gamma"},
+            {"alpha"},
+            {"beta"},
+        )
+        assert received == [changes]
+
+    def test_catalog_reindexes_only_changed_skills(self, upstream_change, monkeypatch):
+        from neoskills.core import catalog
+
+        _, mgr = upstream_change
+        parsed = []
+        real = catalog.catalog_fields
+        monkeypatch.setattr(catalog, "catalog_fields", lambda p: parsed.append(p) or real(p))
+
+        mgr.update("remote")
+        assert sorted(p.parent.name for p in parsed) == ["alpha", "gamma"]
+
+        parsed.clear()
+        skills = {s["skill_id"]: s for s in mgr.list_skills("remote")}
+        assert parsed == []  # catalog already current
+        assert set(skills) == {"alpha", "gamma"}
+        assert skills["alpha"]["description"] == "Alpha v2"
+
+    def test_update_drops_validation_and_digest_entries(self, upstream_change):
+        from neoskills.core.checksum import DigestCache, checksum_tree
+        from neoskills.core.validate import Validator
+
+        cellar, mgr = upstream_change
+        skills_dir = cellar.tap_skills_dir("remote")
+        Validator(cellar).validate_tap("remote")
+        digests = DigestCache(cellar.cache_dir / "digests.json")
+        for sid in ("alpha", "beta"):
+            checksum_tree(skills_dir / sid, digests)
+        digests.save()
+
+        mgr.update("remote")
+        validator = Validator(cellar)
+        assert validator._load_cache("remote") == {}
+        entries = DigestCache(cellar.cache_dir / "digests.json").entries
+        assert not [k for k in entries if "/alpha/" in k or "/beta/" in k]
+
+    def test_diff_failure_does_not_abort_other_taps(self, upstream_change, tap_remote, monkeypatch):
+        import git
+
+        from neoskills.core import tap as tap_module
+
+        _, mgr = upstream_change
+        mgr.add("other", tap_remote[0])
+        between = tap_module.ChangeSet.between
+
+        def failing(tap, repo, old, new):
+            if tap == "remote":
+                raise git.GitCommandError("diff", 128, b"fatal: bad object")
+            return between(tap, repo, old, new)
+
+        monkeypatch.setattr(tap_module.ChangeSet, "between", failing)
+        assert mgr.update() == ["other"]
+        assert list(mgr.last_changes) == ["other"]
+
+    def test_no_upstream_change_is_empty(self, tmp_path, tap_remote):
+        url, _ = tap_remote
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        mgr = TapManager(cellar)
+        mgr.add("remote", url)
+        mgr.update("remote")
+        assert mgr.last_changes["remote"].empty
+
+
+def _make_skill(skills_dir: Path, sid: str) -> None:
+    (skills_dir / sid).mkdir(parents=True)
+    (skills_dir / sid / "SKILL.md").write_text(write_frontmatter({"name": sid}, f"# {sid}\n"))
+
+
+class TestPush:
+    @pytest.fixture
+    def local_tap(self, tmp_path):
+        """A git tap without plugins/ or README.md, with one committed skill."""
+
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        tap_dir = cellar.tap_dir("mine")
+        _make_skill(tap_dir / "skills", "alpha")
+        run_git(tap_dir, "init", "-q")
+        run_git(tap_dir, "add", "-A")
+        run_git(tap_dir, "commit", "-q", "-m", "init")
+        run_git(tap_dir, "config", "user.name", "neoskills-test")
+        run_git(tap_dir, "config", "user.email", "test@neoskills.invalid")
+        return cellar, tap_dir
+
+    def test_pending_changes_are_scoped_to_published_paths(self, local_tap):
+        cellar, tap_dir = local_tap
+        (tap_dir / "skills" / "alpha" / "SKILL.md").write_text("---\nname: alpha\n---\n\n# v2\n")
+        _make_skill(tap_dir / "skills", "beta")
+        (tap_dir / "scratch.txt").write_text("not published\n")
+
+        pending = TapManager(cellar).pending_changes("mine")
+        assert pending.paths == ["skills/alpha/SKILL.md", "skills/beta/SKILL.md"]
+        assert pending.changes.added == {"beta"}
+        assert pending.changes.modified == {"alpha"}
+        assert pending.commit_message().splitlines()[0] == "Update mine: add beta; update alpha"
+
+    def test_commit_stages_only_pending_paths(self, local_tap):
+        import shutil
+
+        cellar, tap_dir = local_tap
+        mgr = TapManager(cellar)
+        shutil.rmtree(tap_dir / "skills" / "alpha")
+        (tap_dir / "scratch.txt").write_text("not published\n")
+
+        mgr.commit_pending(mgr.pending_changes("mine"))
+        log = run_git(tap_dir, "log", "-1", "--name-status", "--format=%s")
+        assert log.splitlines()[0] == "Update mine: remove alpha"
+        assert "D\tskills/alpha/SKILL.md" in log
+        assert "scratch.txt" in run_git(tap_dir, "status", "--porcelain")
+        assert mgr.pending_changes("mine").empty
+
+    def test_push_dry_run_lists_changes(self, local_tap):
+        from click.testing import CliRunner
+
+        from neoskills.cli.main import cli
+
+        cellar, tap_dir = local_tap
+        _make_skill(tap_dir / "skills", "gamma")
+        result = CliRunner().invoke(
+            cli, ["push", "--tap", "mine", "--dry-run", "--root", str(cellar.root)]
+        )
+        assert result.exit_code == 0, result.output
+        assert "skills/gamma/SKILL.md" in result.output
+        assert "Update mine: add gamma" in result.output
+        assert not TapManager(cellar).pending_changes("mine").empty
@@ -0,0 +1,144 @@
+"""Tests for the skill catalog and offline tap bundles."""
+
+import json
+import os
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from neoskills.cli.main import cli
+from neoskills.core import catalog
+from neoskills.core.cellar import Cellar
+from neoskills.core.tap import TapManager
+from neoskills.core.tap_bundle import BUNDLE_MANIFEST, pack_tap, read_manifest, unpack_tap
+
+
+@pytest.fixture
+def source_cellar(tmp_path: Path, tap_remote) -> Cellar:
+    url, _ = tap_remote
+    cellar = Cellar(tmp_path / "source")
+    cellar.initialize()
+    TapManager(cellar).add("remote", url)
+    script = cellar.tap_skills_dir("remote") / "alpha" / "run.sh"
+    script.write_text("#!/bin/sh\necho alpha\n")
+    os.chmod(script, 0o755)
+    return cellar
+
+
+class TestCatalog:
+    def test_unchanged_skills_are_not_reparsed(self, source_cellar: Cellar, monkeypatch):
+        mgr = TapManager(source_cellar)
+        first = mgr.list_skills("remote")
+
+        monkeypatch.setattr(catalog, "parse_frontmatter", lambda c: pytest.fail("parsed"))
+        assert mgr.list_skills("remote") == first
+
+    def test_edited_skill_is_reparsed(self, source_cellar: Cellar):
+        mgr = TapManager(source_cellar)
+        mgr.list_skills("remote")
+        skill_md = source_cellar.tap_skills_dir("remote") / "beta" / "SKILL.md"
+        skill_md.write_text("---\nname: beta\ndescription: Rewritten for the catalog\n---\n")
+
+        beta = {s["skill_id"]: s for s in mgr.list_skills("remote")}["beta"]
+        assert beta["description"] == "Rewritten for the catalog"
+
+
+class TestTapBundle:
+    @pytest.mark.parametrize("name", ["remote.tar.xz", "remote.zip"])
+    def test_roundtrip(self, source_cellar: Cellar, tmp_path: Path, monkeypatch, name):
+        bundle = pack_tap(source_cellar, "remote", tmp_path / name)
+        manifest = read_manifest(bundle)
+        assert set(manifest["catalog"]) == {"alpha", "beta"}
+        assert manifest["commit"]
+
+        target = Cellar(tmp_path / "airgapped")
+        target.initialize()
+        result = unpack_tap(target, bundle, verify=True)
+        assert result.tap_name == "remote"
+        assert result.skills == 2
+
+        tap_dir = target.tap_dir("remote")
+        assert (tap_dir / "tap.yaml").exists()
+        assert not (tap_dir / "docs").exists()
+        assert not (tap_dir / ".git").exists()
+        assert os.access(tap_dir / "skills" / "alpha" / "run.sh", os.X_OK)
+
+        # Seeded catalog: the first listing parses nothing
+        monkeypatch.setattr(catalog, "parse_frontmatter", lambda c: pytest.fail("parsed"))
+        skills = TapManager(target).list_skills("remote")
+        assert [s["skill_id"] for s in skills] == ["alpha", "beta"]
+        assert skills[0]["description"] == "Alpha skill"
+        assert target.load_config()["taps"]["remote"]["clone"] == "bundle"
+
+    def test_manifest_is_first_tar_member(self, source_cellar: Cellar, tmp_path: Path):
+        bundle = pack_tap(source_cellar, "remote", tmp_path / "remote.tar.xz")
+        with tarfile.open(bundle, "r|xz") as tf:
+            assert tf.next().name == BUNDLE_MANIFEST
+
+    def test_existing_tap_is_not_overwritten(self, source_cellar: Cellar, tmp_path: Path):
+        bundle = pack_tap(source_cellar, "remote", tmp_path / "remote.tar.xz")
+        with pytest.raises(FileExistsError):
+            unpack_tap(source_cellar, bundle)
+        assert not list(source_cellar.taps_dir.glob(".unpack-*"))
+
+    @pytest.mark.parametrize("tap", ["../escaped", "a/b", "..", ".hidden", 7])
+    def test_unsafe_tap_name_is_rejected(self, tmp_path: Path, tap):
+        bundle = _zip_bundle(tmp_path / "evil.zip", {"tap": tap})
+        cellar = Cellar(tmp_path / "target")
+        cellar.initialize()
+        with pytest.raises(ValueError, match="Invalid tap name"):
+            unpack_tap(cellar, bundle)
+        assert sorted(p.name for p in cellar.taps_dir.iterdir()) == []
+        assert not (tmp_path / "target" / "escaped").exists()
+
+    def test_escaping_zip_member_is_sanitized(self, tmp_path: Path):
+        bundle = _zip_bundle(tmp_path / "evil.zip", {"tap": "evil"}, "../../outside.sh")
+        cellar = Cellar(tmp_path / "target")
+        cellar.initialize()
+        result = unpack_tap(cellar, bundle)
+
+        assert result.files == 1
+        assert os.access(result.tap_dir / "outside.sh", os.X_OK)
+        assert not (tmp_path / "outside.sh").exists()
+
+
+def _zip_bundle(path: Path, manifest: dict, member: str = "skills/x/SKILL.md") -> Path:
+    """A hand-built zip bundle with one executable member."""
+    manifest = {"version": 1, "catalog": {}, "checksums": {}, **manifest}
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(BUNDLE_MANIFEST, json.dumps(manifest))
+        info = zipfile.ZipInfo(member)
+        info.external_attr = 0o755 << 16
+        zf.writestr(info, "#!/bin/sh\n")
+    return path
+
+
+class TestTapCli:
+    def test_pack_and_add_bundle(self, source_cellar: Cellar, tmp_path: Path):
+        runner = CliRunner()
+        out = tmp_path / "out.zip"
+        result = runner.invoke(
+            cli, ["tap", "pack", "remote", "-o", str(out), "--root", str(source_cellar.root)]
+        )
+        assert result.exit_code == 0, result.output
+        assert out.exists()
+
+        root = str(tmp_path / "provisioned")
+        result = runner.invoke(
+            cli, ["tap", "add", "--bundle", str(out), "--name", "offline", "--root", root]
+        )
+        assert result.exit_code == 0, result.output
+        assert "2 skills" in result.output
+
+        result = runner.invoke(cli, ["list", "--root", root])
+        assert result.exit_code == 0, result.output
+
+    def test_url_shorthand_still_adds(self, tmp_path: Path, tap_remote):
+        url, _ = tap_remote
+        root = str(tmp_path / "ws")
+        result = CliRunner().invoke(cli, ["tap", url, "--name", "short", "--root", root])
+        assert result.exit_code == 0, result.output
+        assert "Tapped short" in result.output
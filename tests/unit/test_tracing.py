@@ -0,0 +1,152 @@
+"""Tests for neoskills.core.tracing and the trace CLI."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from neoskills.core import tracing
+from neoskills.core.frontmatter import write_frontmatter
+from neoskills.core.tap import TapManager
+from neoskills.core.tracing import read_spans, span, summarize, traced
+
+
+@pytest.fixture(autouse=True)
+def _tracing_off():
+    tracing.shutdown()
+    yield
+    tracing.shutdown()
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@traced("unit.work")
+def _work(x: int) -> int:
+    with span("unit.inner", x=x) as s:
+        s.set("doubled", x * 2)
+    return x * 2
+
+
+class TestSpans:
+    def test_disabled_is_noop(self, tmp_path):
+        assert span("a") is span("b")
+        assert _work(2) == 4
+        tracing.shutdown()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_jsonl_nesting_and_attributes(self, tmp_path):
+        out = tmp_path / "trace.jsonl"
+        tracing.configure(out)
+        assert _work(3) == 6
+        tracing.shutdown()
+
+        inner, outer = _records(out)
+        assert (inner["name"], outer["name"]) == ("unit.inner", "unit.work")
+        assert inner["parent_id"] == outer["span_id"]
+        assert outer["parent_id"] == ""
+        assert inner["trace_id"] == outer["trace_id"]
+        assert inner["attributes"] == {"x": 3, "doubled": 6}
+        assert 0 < inner["duration_ns"] <= outer["duration_ns"]
+
+    def test_errors_are_recorded(self, tmp_path):
+        out = tmp_path / "trace.jsonl"
+        tracing.configure(out)
+        with pytest.raises(ValueError), span("unit.fail"):
+            raise ValueError("boom")
+        tracing.shutdown()
+        assert _records(out)[0]["error"] == "ValueError: boom"
+
+    def test_otlp_format(self, tmp_path):
+        out = tmp_path / "trace.otlp.json"
+        tracing.configure(out, "otlp")
+        _work(1)
+        tracing.shutdown()
+
+        (request,) = _records(out)
+        spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        inner, outer = spans
+        assert inner["parentSpanId"] == outer["spanId"]
+        assert len(outer["traceId"]) == 32
+        assert {"key": "x", "value": {"intValue": "1"}} in inner["attributes"]
+        assert sorted(name for name, _ in read_spans(out)) == ["unit.inner", "unit.work"]
+
+    def test_concurrent_flushes_write_whole_batches(self, tmp_path, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        monkeypatch.setattr(tracing, "FLUSH_EVERY", 10)
+        out = tmp_path / "trace.otlp.json"
+        tracing.configure(out, "otlp")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(_work, range(400)))
+        tracing.shutdown()
+        assert len(read_spans(out)) == 800
+
+    def test_import_does_not_configure(self, tmp_path):
+        import os
+        import subprocess
+        import sys
+
+        out = tmp_path / "trace.jsonl"
+        code = "from neoskills.core import tracing; print(tracing.enabled())"
+        env = {**os.environ, tracing.TRACE_ENV: str(out)}
+        result = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_summarize_percentiles(self):
+        spans = [("a", ms * 1_000_000) for ms in range(1, 101)] + [("b", 5_000_000)]
+        stats = {s.name: s for s in summarize(spans)}
+        assert stats["a"].count == 100
+        assert (stats["a"].p50_ms, stats["a"].p90_ms, stats["a"].p99_ms) == (50, 90, 99)
+        assert stats["a"].max_ms == 100
+        assert stats["b"].total_ms == 5
+        assert [s.name for s in summarize(spans)] == ["a", "b"]
+
+
+class TestInstrumentation:
+    def test_list_skills_spans(self, tmp_cellar, tmp_path):
+        d = tmp_cellar.tap_skills_dir("mySkills") / "alpha"
+        d.mkdir(parents=True)
+        (d / "SKILL.md").write_text(write_frontmatter({"name": "alpha"}, "# a"))
+
+        out = tmp_path / "trace.jsonl"
+        tracing.configure(out)
+        TapManager(tmp_cellar).list_skills("mySkills")
+        tracing.shutdown()
+
+        records = {r["name"]: r for r in _records(out)}
+        assert records["catalog.fields"]["attributes"] == {"parsed": 1}
+        assert records["catalog.fields"]["parent_id"] == records["tap.list_skills"]["span_id"]
+        assert records["frontmatter.parse"]["parent_id"] == records["catalog.fields"]["span_id"]
+
+
+class TestTraceCommand:
+    def test_trace_then_summarize(self, tmp_cellar, tmp_path):
+        from neoskills.cli.main import cli
+
+        out = tmp_path / "doctor.jsonl"
+        result = CliRunner().invoke(
+            cli, ["--trace", str(out), "doctor", "--root", str(tmp_cellar.root)]
+        )
+        assert result.exit_code == 0, result.output
+        names = {r["name"] for r in _records(out)}
+        assert {"cli.doctor", "linker.list_links"} <= names
+
+        env_out = tmp_path / "env.jsonl"
+        result = CliRunner().invoke(
+            cli, ["doctor", "--root", str(tmp_cellar.root)], env={tracing.TRACE_ENV: str(env_out)}
+        )
+        assert result.exit_code == 0, result.output
+        assert "cli.doctor" in {r["name"] for r in _records(env_out)}
+
+        result = CliRunner().invoke(cli, ["trace", "summarize", str(out), "--sort", "count"])
+        assert result.exit_code == 0, result.output
+        assert result.output.splitlines()[0].split()[:2] == ["span", "count"]
+        assert "cli.doctor" in result.output
+
+        result = CliRunner().invoke(cli, ["trace", "summarize", str(out), "--json", "--limit", "1"])
+        (top,) = json.loads(result.output)
+        assert top["name"] == "cli.doctor"
@@ -0,0 +1,137 @@
+"""Tests for neoskills.translators — cached translation pipeline."""
+
+from pathlib import Path
+
+import pytest
+
+from neoskills.adapters.claude.adapter import ClaudeCodeAdapter
+from neoskills.core.cellar import Cellar
+from neoskills.core.frontmatter import write_frontmatter
+from neoskills.core.linker import Linker
+from neoskills.core.models import Skill, SkillMetadata, Target
+from neoskills.translators.base import Translator
+from neoskills.translators.pipeline import TranslationCache, TranslationPipeline
+
+
+class UpperTitle(Translator):
+    name = "upper-title"
+
+    def __init__(self):
+        self.calls = 0
+
+    def translate(self, content: str, target: Target) -> str:
+        self.calls += 1
+        return content.replace("# Demo", "# DEMO")
+
+
+class CountingAdapter(ClaudeCodeAdapter):
+    calls = 0
+
+    def translate(self, skill: Skill, target: Target) -> str:
+        CountingAdapter.calls += 1
+        return super().translate(skill, target)
+
+
+def _skill(content: str = "# Demo\n") -> Skill:
+    return Skill(skill_id="demo", metadata=SkillMetadata(name="demo"), content=content)
+
+
+def _target(tmp_path: Path) -> Target:
+    return Target(
+        target_id="local",
+        agent_type="claude-code",
+        install_paths=[str(tmp_path / "installed")],
+    )
+
+
+class TestTranslationPipeline:
+    def test_translators_run_in_order(self, tmp_path: Path):
+        pipeline = TranslationPipeline()
+        pipeline.register("claude-code", UpperTitle())
+        out = pipeline.translate(_skill(), ClaudeCodeAdapter(), _target(tmp_path))
+        assert out == "# DEMO\n"
+
+    def test_unchanged_skill_does_no_translation_work(self, tmp_path: Path):
+        translator = UpperTitle()
+        pipeline = TranslationPipeline(TranslationCache(tmp_path / "cache"))
+        pipeline.register("claude-code", translator)
+        adapter = CountingAdapter()
+        CountingAdapter.calls = 0
+
+        first = pipeline.deploy(_skill(), adapter, _target(tmp_path))
+        pipeline.deploy(_skill(), adapter, _target(tmp_path))
+        assert translator.calls == 1
+        assert CountingAdapter.calls == 1
+        assert first.read_text() == "# DEMO\n"
+
+    def test_changed_source_or_version_misses_cache(self, tmp_path: Path):
+        translator = UpperTitle()
+        pipeline = TranslationPipeline(TranslationCache(tmp_path / "cache"))
+        pipeline.register("claude-code", translator)
+        adapter, target = ClaudeCodeAdapter(), _target(tmp_path)
+
+        pipeline.translate(_skill(), adapter, target)
+        pipeline.translate(_skill("# Demo\nmore\n"), adapter, target)
+        assert translator.calls == 2
+
+        translator.version = "2"
+        pipeline.translate(_skill(), adapter, target)
+        assert translator.calls == 3
+
+    def test_key_is_content_checksum_and_translate_version(self, tmp_path: Path):
+        pipeline = TranslationPipeline(TranslationCache(tmp_path / "cache"))
+        adapter, target = ClaudeCodeAdapter(), _target(tmp_path)
+        stale = _skill()
+        stale.checksum = "0" * 64
+        key = pipeline.cache_key(_skill(), adapter, target)
+        assert pipeline.cache_key(stale, adapter, target) == key
+
+        adapter.translate_version = "2"
+        assert pipeline.cache_key(_skill(), adapter, target) != key
+
+
+class TestTranslatedDeploy:
+    def _cellar(self, tmp_path: Path, agent_type: str | None) -> Cellar:
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        config = cellar.load_config()
+        settings = {"skill_path": str(tmp_path / "remote"), "transport": "rsync"}
+        if agent_type:
+            settings["agent_type"] = agent_type
+        config["targets"] = {"remote": settings}
+        config["default_target"] = "remote"
+        cellar.save_config(config)
+        source = cellar.tap_skills_dir("mySkills") / "demo"
+        source.mkdir(parents=True)
+        (source / "SKILL.md").write_text(write_frontmatter({"name": "demo"}, "# Demo\n"))
+        (source / "notes.txt").write_text("notes\n")
+        return cellar
+
+    def test_rsync_link_deploys_the_cached_translation(self, tmp_path: Path):
+        cellar = self._cellar(tmp_path, "claude-code")
+        source = cellar.tap_skills_dir("mySkills") / "demo"
+        translator = UpperTitle()
+        pipeline = TranslationPipeline.for_cellar(cellar)
+        pipeline.register("claude-code", translator)
+        linker = Linker(cellar, pipeline)
+
+        assert linker.link("demo", source).action == "synced"
+        deployed = tmp_path / "remote" / "demo"
+        assert "# DEMO" in (deployed / "SKILL.md").read_text()
+        assert (deployed / "notes.txt").read_text() == "notes\n"
+        assert "# Demo" in (source / "SKILL.md").read_text()
+
+        # Unchanged skill: no translation work and nothing transferred
+        assert linker.link("demo", source).action == "skipped"
+        assert translator.calls == 1
+
+        (source / "SKILL.md").write_text(write_frontmatter({"name": "demo"}, "# Demo\nv2\n"))
+        assert linker.link("demo", source).action == "synced"
+        assert translator.calls == 2
+        assert "v2" in (deployed / "SKILL.md").read_text()
+
+    def test_unknown_configured_agent_type_is_an_error(self, tmp_path: Path):
+        cellar = self._cellar(tmp_path, "no-such-agent")
+        source = cellar.tap_skills_dir("mySkills") / "demo"
+        with pytest.raises(ValueError, match="No adapter for agent type 'no-such-agent'"):
+            Linker(cellar).link("demo", source)
@@ -0,0 +1,216 @@
+"""Tests for neoskills.core.transport — delta-sync transport."""
+
+import os
+import random
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from neoskills.cli.main import cli
+from neoskills.core.cellar import Cellar
+from neoskills.core.frontmatter import write_frontmatter
+from neoskills.core.linker import Linker
+from neoskills.core.transport import (
+    MANIFEST_NAME,
+    DeltaSync,
+    block_signatures,
+    write_changed_blocks,
+)
+
+
+def _random_bytes(n: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(n)
+
+
+class TestChangedBlocks:
+    def _delta(self, tmp_path: Path, data: bytes, new: bytes) -> tuple[Path, tuple | None]:
+        path = tmp_path / "f.bin"
+        path.write_bytes(data)
+        return path, write_changed_blocks(path, new, block_signatures(data, 512))
+
+    def test_in_place_edit_rewrites_one_block(self, tmp_path: Path):
+        data = _random_bytes(20_000)
+        new = data[:7_000] + b"X" + data[7_001:]
+        path, delta = self._delta(tmp_path, data, new)
+        assert path.read_bytes() == new
+        assert delta == (512, 0)
+
+    def test_append_writes_only_the_tail(self, tmp_path: Path):
+        data = _random_bytes(20_480)
+        path, delta = self._delta(tmp_path, data, data + b"appended")
+        assert path.read_bytes() == data + b"appended"
+        assert delta == (len(b"appended"), 0)
+
+    def test_shifted_blocks_are_matched_by_the_rolling_checksum(self, tmp_path: Path):
+        data = _random_bytes(100_000)
+        new = data[:30_000] + b"INSERTED" + data[30_000:]
+        path, delta = self._delta(tmp_path, data, new)
+        assert path.read_bytes() == new
+        written, reused = delta
+        assert written + reused == len(new)
+        # Only the block around the insertion point is written as literal
+        # data, unless copy_file_range() is unavailable here
+        assert written <= 512 + len(b"INSERTED") or reused == 0
+        assert not list(tmp_path.glob(".*neoskills-tmp"))
+
+    def test_shifted_blocks_without_copy_range_are_written_from_new(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+        data = _random_bytes(100_000)
+        new = b"INSERTED" + data
+        path, delta = self._delta(tmp_path, data, new)
+        assert path.read_bytes() == new
+        assert delta == (len(new), 0)
+
+    def test_unrelated_content_is_left_for_a_whole_copy(self, tmp_path: Path):
+        data = _random_bytes(20_000)
+        path, delta = self._delta(tmp_path, data, _random_bytes(20_000, seed=1))
+        assert delta is None
+        assert path.read_bytes() == data
+
+
+@pytest.fixture
+def skill_tree(tmp_path: Path) -> Path:
+    src = tmp_path / "src"
+    (src / "scripts").mkdir(parents=True)
+    (src / "SKILL.md").write_text("---\nname: demo\n---\n\n# Demo\n")
+    (src / "scripts" / "run.sh").write_text("#!/bin/sh\necho hi\n")
+    os.chmod(src / "scripts" / "run.sh", 0o755)
+    (src / "reference.bin").write_bytes(_random_bytes(200_000))
+    return src
+
+
+class TestDeltaSync:
+    def test_initial_sync_copies_everything(self, skill_tree: Path, tmp_path: Path):
+        dest = tmp_path / "dest"
+        stats = DeltaSync().sync(skill_tree, dest)
+        assert stats.files_copied == 3
+        assert stats.bytes_written == stats.bytes_total
+        assert (dest / "reference.bin").read_bytes() == (skill_tree / "reference.bin").read_bytes()
+        assert os.access(dest / "scripts" / "run.sh", os.X_OK)
+        assert (dest / MANIFEST_NAME).exists()
+
+    def test_resync_unchanged_moves_nothing(self, skill_tree: Path, tmp_path: Path):
+        dest = tmp_path / "dest"
+        sync = DeltaSync(cache_dir=tmp_path / "manifests")
+        sync.sync(skill_tree, dest)
+        stats = sync.sync(skill_tree, dest)
+        assert stats.files_unchanged == 3
+        assert stats.bytes_moved == 0
+        assert stats.changed == []
+
+    def test_large_file_change_is_sent_as_delta(self, skill_tree: Path, tmp_path: Path):
+        dest = tmp_path / "dest"
+        DeltaSync().sync(skill_tree, dest)
+
+        big = skill_tree / "reference.bin"
+        data = big.read_bytes()
+        big.write_bytes(data[:50_000] + b"patch" + data[50_005:])
+
+        stats = DeltaSync().sync(skill_tree, dest)
+        assert stats.files_delta == 1
+        assert stats.changed == ["reference.bin"]
+        assert stats.bytes_written <= 2 * 4096
+        # Only the block signatures are read, never the old file itself
+        assert 0 < stats.bytes_read < len(data) // 50
+        assert (dest / "reference.bin").read_bytes() == big.read_bytes()
+
+    def test_insertion_is_sent_as_delta(self, skill_tree: Path, tmp_path: Path):
+        dest = tmp_path / "dest"
+        DeltaSync().sync(skill_tree, dest)
+
+        big = skill_tree / "reference.bin"
+        data = big.read_bytes()
+        big.write_bytes(data[:50_000] + b"inserted" + data[50_000:])
+
+        stats = DeltaSync().sync(skill_tree, dest)
+        assert stats.files_delta == 1
+        assert stats.bytes_written + stats.bytes_reused == len(data) + len(b"inserted")
+        assert (dest / "reference.bin").read_bytes() == big.read_bytes()
+        # The signatures recorded for the new content support the next delta:
+        # an append rewrites the old partial last block and the new bytes
+        big.write_bytes(big.read_bytes() + b"appended")
+        stats = DeltaSync().sync(skill_tree, dest)
+        assert stats.files_delta == 1
+        assert stats.bytes_written <= 4096 + len(b"appended")
+
+    def test_removed_files_are_deleted(self, skill_tree: Path, tmp_path: Path):
+        dest = tmp_path / "dest"
+        DeltaSync().sync(skill_tree, dest)
+        (skill_tree / "scripts" / "run.sh").unlink()
+
+        stats = DeltaSync().sync(skill_tree, dest)
+        assert stats.files_deleted == 1
+        assert not (dest / "scripts").exists()
+
+
+class TestRsyncTarget:
+    def test_link_syncs_instead_of_symlinking(self, tmp_path: Path):
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        remote = tmp_path / "remote_home" / "skills"
+        config = cellar.load_config()
+        config["targets"] = {"remote": {"skill_path": str(remote), "transport": "rsync"}}
+        config["default_target"] = "remote"
+        cellar.save_config(config)
+
+        source = cellar.tap_skills_dir("mySkills") / "skill-a"
+        source.mkdir(parents=True)
+        (source / "SKILL.md").write_text(write_frontmatter({"name": "skill-a"}, "# A\n"))
+
+        linker = Linker(cellar)
+        assert linker.link("skill-a", source).action == "synced"
+        assert not (remote / "skill-a").is_symlink()
+        assert linker.link("skill-a", source).action == "skipped"
+
+        links = linker.list_links()
+        assert links[0]["managed"] is True
+        assert linker.check_health()["healthy"] == 1
+
+        assert linker.unlink("skill-a").action == "unlinked"
+        assert not (remote / "skill-a").exists()
+
+    def _rsync_cellar(self, tmp_path: Path, transport: str) -> Cellar:
+        cellar = Cellar(tmp_path / ".neoskills")
+        cellar.initialize()
+        config = cellar.load_config()
+        config["targets"] = {
+            "remote": {"skill_path": str(tmp_path / "remote"), "transport": transport}
+        }
+        config["default_target"] = "remote"
+        cellar.save_config(config)
+        source = cellar.tap_skills_dir("mySkills") / "skill-a"
+        source.mkdir(parents=True)
+        (source / "SKILL.md").write_text(write_frontmatter({"name": "skill-a"}, "# A\n"))
+        return cellar
+
+    def test_unknown_transport_is_a_clear_error(self, tmp_path: Path):
+        cellar = self._rsync_cellar(tmp_path, "ftp")
+        with pytest.raises(ValueError, match="Unknown transport 'ftp' for target 'remote'"):
+            cellar.target_transport()
+
+        result = CliRunner().invoke(cli, ["link", "skill-a", "--root", str(cellar.root)])
+        assert result.exit_code == 1
+        assert "Failed to link: Unknown transport 'ftp'" in result.output
+
+    @pytest.mark.parametrize("transport", ["ssh", "zip"])
+    def test_unsupported_transports_are_rejected(self, tmp_path: Path, transport: str):
+        cellar = self._rsync_cellar(tmp_path, transport)
+        source = cellar.tap_skills_dir("mySkills") / "skill-a"
+        with pytest.raises(ValueError, match=f"Transport '{transport}' cannot be used"):
+            Linker(cellar).link("skill-a", source)
+        assert not (tmp_path / "remote" / "skill-a").exists()
+
+    def test_unlink_keeps_synced_copies_of_foreign_sources(self, tmp_path: Path):
+        cellar = self._rsync_cellar(tmp_path, "rsync")
+        foreign = tmp_path / "elsewhere" / "skill-b"
+        foreign.mkdir(parents=True)
+        (foreign / "SKILL.md").write_text(write_frontmatter({"name": "skill-b"}, "# B\n"))
+        DeltaSync().sync(foreign, tmp_path / "remote" / "skill-b")
+
+        linker = Linker(cellar)
+        assert linker.unlink("skill-b").action == "skipped"
+        assert linker.unlink_all() == []
+        assert (tmp_path / "remote" / "skill-b" / "SKILL.md").exists()
@@ -0,0 +1,215 @@
+"""Tests for neoskills.core.validate — rules, parallel runner and result cache."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from neoskills.core.cellar import Cellar
+from neoskills.core.frontmatter import write_frontmatter
+from neoskills.core.validate import FileSizeRule, Rule, Validator, default_rules
+from tests.gitrepo import run_git
+
+
+def _write_skill(skills_dir: Path, sid: str, fm: dict | None = None, body: str = "# x") -> Path:
+    d = skills_dir / sid
+    d.mkdir(parents=True, exist_ok=True)
+    fm = fm if fm is not None else {"name": sid, "description": f"{sid} skill"}
+    (d / "SKILL.md").write_text(write_frontmatter(fm, body))
+    return d
+
+
+@pytest.fixture
+def cellar(tmp_cellar: Cellar) -> Cellar:
+    skills = tmp_cellar.tap_skills_dir("mySkills")
+    _write_skill(skills, "good", body="See [ref](references/guide.md).")
+    (skills / "good" / "references").mkdir()
+    (skills / "good" / "references" / "guide.md").write_text("guide\n")
+    return tmp_cellar
+
+
+def _findings(report, skill_id):
+    return {
+        (f.rule, f.message) for s in report.skills if s.skill_id == skill_id for f in s.findings
+    }
+
+
+class TestRules:
+    def test_clean_skill_passes(self, cellar):
+        report = Validator(cellar).validate_tap("mySkills")
+        assert report.errors == 0
+        assert report.warnings == 0
+
+    def test_frontmatter_and_name(self, cellar):
+        skills = cellar.tap_skills_dir("mySkills")
+        _write_skill(skills, "nodesc", {"name": "nodesc", "tags": "a,b"})
+        _write_skill(skills, "renamed", {"name": "other", "description": "x"})
+        (skills / "nomd").mkdir()
+
+        report = Validator(cellar).validate_tap("mySkills")
+        assert ("frontmatter", "missing 'description'") in _findings(report, "nodesc")
+        assert ("frontmatter", "'tags' has type str") in _findings(report, "nodesc")
+        assert _findings(report, "renamed") == {
+            ("name-mismatch", "name 'other' does not match directory 'renamed'")
+        }
+        assert ("frontmatter", "SKILL.md is missing or unreadable") in _findings(report, "nomd")
+
+    def test_broken_relative_links(self, cellar):
+        skills = cellar.tap_skills_dir("mySkills")
+        body = (
+            "[ok](#anchor) [web](https://example.com) [gone](scripts/run.sh)\n"
+            "[out](../good/SKILL.md)\n\n```\n[code](ignored.md)\n```\n"
+        )
+        _write_skill(skills, "links", body=body)
+
+        found = _findings(Validator(cellar).validate_tap("mySkills"), "links")
+        assert found == {
+            ("broken-links", "broken link: scripts/run.sh"),
+            ("broken-links", "link leaves the skill: ../good/SKILL.md"),
+        }
+
+    def test_oversized_and_scripts(self, cellar):
+        skills = cellar.tap_skills_dir("mySkills")
+        d = _write_skill(skills, "tools")
+        (d / "scripts").mkdir()
+        (d / "scripts" / "run.sh").write_text("#!/bin/sh\necho hi\n")
+        (d / "scripts" / "data.txt").write_text("not a script\n")
+        (d / "big.bin").write_bytes(b"\0" * 2048)
+
+        rules = [r for r in default_rules() if r.name != "oversized"] + [FileSizeRule(1024)]
+        found = _findings(Validator(cellar, rules).validate_tap("mySkills"), "tools")
+        assert found == {
+            ("oversized", "2048 bytes (limit 1024)"),
+            ("script-exec", "script is not executable"),
+        }
+
+    def test_fix_script_exec(self, cellar):
+        skills = cellar.tap_skills_dir("mySkills")
+        d = _write_skill(skills, "tools")
+        (d / "scripts").mkdir()
+        (d / "scripts" / "run.sh").write_text("#!/bin/sh\necho hi\n")
+
+        report = Validator(cellar).validate_tap("mySkills", fix=True)
+        assert report.errors == 0
+        assert (d / "scripts" / "run.sh").stat().st_mode & 0o100
+        again = Validator(cellar).validate_tap("mySkills")
+        assert again.checked == 0
+        assert again.errors == 0
+
+
+class _CountingRule(Rule):
+    name = "counting"
+
+    def __init__(self):
+        self.seen: list[str] = []
+
+    def check(self, ctx):
+        self.seen.append(ctx.skill_id)
+        return []
+
+
+class TestCache:
+    def test_unchanged_skills_are_not_rechecked(self, cellar):
+        skills = cellar.tap_skills_dir("mySkills")
+        _write_skill(skills, "other")
+        rule = _CountingRule()
+
+        first = Validator(cellar, [rule]).validate_tap("mySkills")
+        assert first.checked == 2
+        rule.seen.clear()
+
+        second = Validator(cellar, [rule]).validate_tap("mySkills")
+        assert second.checked == 0
+        assert rule.seen == []
+
+        (skills / "other" / "SKILL.md").write_text("---\nname: other\n---\n\n# edited\n")
+        third = Validator(cellar, [rule]).validate_tap("mySkills")
+        assert rule.seen == ["other"]
+        assert third.checked == 1
+
+    def test_cached_findings_are_replayed(self, cellar):
+        _write_skill(cellar.tap_skills_dir("mySkills"), "bad", {"name": "bad"})
+        first = Validator(cellar).validate_tap("mySkills")
+        second = Validator(cellar).validate_tap("mySkills")
+        assert second.checked == 0
+        assert _findings(second, "bad") == _findings(first, "bad")
+
+    def test_ruleset_change_invalidates(self, cellar):
+        rule = _CountingRule()
+        Validator(cellar, [rule]).validate_tap("mySkills")
+        rule.version = "2"
+        rule.seen.clear()
+        report = Validator(cellar, [rule]).validate_tap("mySkills")
+        assert report.checked == 1
+        assert rule.seen == ["good"]
+
+    def test_exec_bit_change_invalidates(self, cellar):
+        skills = cellar.tap_skills_dir("mySkills")
+        d = _write_skill(skills, "tools")
+        (d / "scripts").mkdir()
+        script = d / "scripts" / "run.sh"
+        script.write_text("#!/bin/sh\n")
+        script.chmod(0o755)
+        assert Validator(cellar).validate_tap("mySkills").errors == 0
+
+        script.chmod(0o644)
+        assert Validator(cellar).validate_tap("mySkills").errors == 1
+
+    def test_git_clean_skills_use_tree_keys(self, cellar, monkeypatch):
+        tap_dir = cellar.tap_dir("mySkills")
+        run_git(tap_dir, "init", "-q")
+        run_git(tap_dir, "add", "-A")
+        run_git(tap_dir, "commit", "-q", "-m", "skills")
+        Validator(cellar).validate_tap("mySkills")
+
+        import neoskills.core.validate as validate_mod
+
+        def no_reads(*args, **kwargs):
+            raise AssertionError("clean git skills should not be hashed")
+
+        monkeypatch.setattr(validate_mod, "content_key", no_reads)
+        report = Validator(cellar).validate_tap("mySkills")
+        assert report.checked == 0
+
+    @pytest.mark.parametrize("ignored", [False, True])
+    def test_untracked_files_invalidate_tree_keys(self, cellar, ignored):
+        tap_dir = cellar.tap_dir("mySkills")
+        if ignored:
+            (tap_dir / ".gitignore").write_text("*.bin\n")
+        run_git(tap_dir, "init", "-q")
+        run_git(tap_dir, "add", "-A")
+        run_git(tap_dir, "commit", "-q", "-m", "skills")
+        rules = [r for r in default_rules() if r.name != "oversized"] + [FileSizeRule(1024)]
+        assert Validator(cellar, rules).validate_tap("mySkills").warnings == 0
+
+        (cellar.tap_skills_dir("mySkills") / "good" / "blob.bin").write_bytes(b"\0" * 2048)
+        found = _findings(Validator(cellar, rules).validate_tap("mySkills"), "good")
+        assert found == {("oversized", "2048 bytes (limit 1024)")}
+
+    def test_subset_keeps_other_entries(self, cellar):
+        skills = cellar.tap_skills_dir("mySkills")
+        _write_skill(skills, "other")
+        validator = Validator(cellar)
+        validator.validate_tap("mySkills")
+        report = validator.validate_tap("mySkills", ["other"])
+        assert [s.skill_id for s in report.skills] == ["other"]
+        cached = json.loads(validator.cache_path("mySkills").read_text())["skills"]
+        assert set(cached) == {"good", "other"}
+
+
+class TestValidateCommand:
+    def test_exit_code_and_output(self, cellar):
+        from neoskills.cli.main import cli
+
+        _write_skill(cellar.tap_skills_dir("mySkills"), "bad", {"name": "bad"})
+        result = CliRunner().invoke(cli, ["validate", "--root", str(cellar.root)])
+        assert result.exit_code == 1
+        assert "error: [frontmatter] missing 'description' (SKILL.md)" in result.output
+        assert "Validated 2 skills in mySkills (2 checked, 0 cached)" in result.output
+
+        result = CliRunner().invoke(
+            cli, ["validate", "--skill", "good", "--json", "--root", str(cellar.root)]
+        )
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["errors"] == 0